@@ -1,53 +1,39 @@
 """
 Automatically compute region adjacency from geographic boundary data.
 Determines which regions border each other and in which cardinal direction.
+
+Raw per-region results (neighbors and contained areas) are kept in
+data/.cache/adjacency_state.json together with a fingerprint of each region's
+geometry and bounds. When regions are added, changed or removed, only the
+affected rows are recomputed (see update_adjacency_incremental).
 """
 from pathlib import Path
+import hashlib
 import json
 import gzip
+import os
 import geopandas as gpd
-from shapely.geometry import Point
+import shapely
 from src.borders import get_border_manager
 from src.region_config import list_regions, get_region
 from src.types import RegionType
-import math
+from src.adjacency_engine import find_contained, find_neighbors
 
-def get_cardinal_direction(from_centroid, to_centroid):
-    """
-    Determine cardinal direction from one point to another.
-    Returns: 'north', 'south', 'east', or 'west'
-    
-    Each direction gets a 90-degree sector:
-    - East: -45 to 45 degrees
-    - North: 45 to 135 degrees
-    - West: 135 to 225 degrees (or -135 to -225)
-    - South: 225 to 315 degrees (or -45 to -135)
-    """
-    dx = to_centroid.x - from_centroid.x
-    dy = to_centroid.y - from_centroid.y
-    
-    # Calculate angle in degrees (0 = east, 90 = north, etc.)
-    angle = math.degrees(math.atan2(dy, dx))
-    
-    # Normalize to 0-360
-    if angle < 0:
-        angle += 360
-    
-    # Map to cardinal directions (90-degree sectors)
-    # -45 to 45: east, 45 to 135: north, 135 to 225: west, 225 to 315: south
-    if angle >= 315 or angle < 45:
-        return 'east'
-    elif 45 <= angle < 135:
-        return 'north'
-    elif 135 <= angle < 225:
-        return 'west'
-    else:  # 225 <= angle < 315
-        return 'south'
+# Per-region fingerprints and raw results of the last computation
+ADJACENCY_STATE_PATH = Path('data/.cache/adjacency_state.json')
+
+# Bump when the adjacency rules change (forces a full recompute)
+ADJACENCY_STATE_VERSION = 1
+
+ADJACENCY_OUTPUT_FILE = Path('generated/regions/region_adjacency.json')
 
-def compute_adjacency():
+def collect_region_geometries():
     """
-    Compute adjacency relationships from actual geographic boundaries.
-    Also detects containment - when area-type regions are within other regions.
+    Load the boundary geometry of every configured region.
+    
+    Returns:
+        Tuple of (region_geometries, area_regions): region_id -> dict with
+        'geometry', 'name', 'type' (and 'bounds' for boundary regions)
     """
     print("Computing region adjacency from geographic boundaries...")
     
@@ -126,6 +112,24 @@ def compute_adjacency():
     print(f"\nFound geometries for {len(region_geometries)} regions")
     print(f"Found {len(area_regions)} AREA regions for containment checks")
     
+    return region_geometries, area_regions
+
+def assemble_adjacency(region_geometries, area_regions, neighbors, contained, verbose=True):
+    """
+    Build the adjacency JSON structure from per-region results.
+    
+    Args:
+        region_geometries: region_id -> region dict (see collect_region_geometries)
+        area_regions: area_id -> AREA region dict
+        neighbors: region_id -> list of (other_id, direction, border_length) (see find_neighbors)
+        contained: region_id -> list of (area_id, reason) (see find_contained)
+        verbose: Print per-region details
+        
+    Returns:
+        Adjacency dict as written to region_adjacency.json
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+    
     # Compute adjacency
     adjacency = {}
     
@@ -136,7 +140,7 @@ def compute_adjacency():
         }
     
     for region_id, region_data in region_geometries.items():
-        print(f"\nProcessing {region_data['name']} ({region_id})...")
+        log(f"\nProcessing {region_data['name']} ({region_id})...")
         adjacency[region_id] = {
             'north': [],
             'south': [],
@@ -145,76 +149,24 @@ def compute_adjacency():
             'contained': []  # AREA regions within this region
         }
         
-        geom = region_data['geometry']
-        centroid = geom.centroid
-        
         # Find neighbors (regions that share a border)
-        for other_id, other_data in region_geometries.items():
-            if other_id == region_id:
+        for other_id, direction, border_length in neighbors[region_id]:
+            other_data = region_geometries[other_id]
+            if direction is None:
+                log(f"  Skipping {other_data['name']} (point-only touch)")
                 continue
             
-            other_geom = other_data['geometry']
-            
-            # Check if they share a border (touches or intersects)
-            if geom.touches(other_geom) or (geom.intersects(other_geom) and not geom.equals(other_geom)):
-                # Compute the intersection to check if it's more than a point
-                intersection = geom.intersection(other_geom)
-                
-                # Exclude single-point touches (quadripoints like Four Corners)
-                # Only count as adjacent if they share a line segment or area
-                if intersection.geom_type in ['Point', 'MultiPoint']:
-                    print(f"  Skipping {other_data['name']} (point-only touch)")
-                    continue
-                
-                # Calculate shared border length (for informational purposes)
-                if hasattr(intersection, 'length'):
-                    border_length = intersection.length
-                else:
-                    border_length = 0
-                
-                # Determine direction (pure cardinal only - each gets 90-degree sector)
-                other_centroid = other_geom.centroid
-                direction = get_cardinal_direction(centroid, other_centroid)
-                
-                # Add to adjacency list
-                adjacency[region_id][direction].append(other_id)
-                print(f"  {direction}: {other_data['name']} (border length: {border_length:.4f})")
+            # Add to adjacency list
+            adjacency[region_id][direction].append(other_id)
+            log(f"  {direction}: {other_data['name']} (border length: {border_length:.4f})")
         
         # Check for contained AREA regions
-        for area_id, area_data in area_regions.items():
-            area_geom = area_data['geometry']
-            
-            # Check if the area is contained or intersects with this region
-            # Three conditions (in order of preference):
-            # 1. Centroid is within the region geometry (fully contained)
-            # 2. Bounding box intersects the region geometry (partial overlap)
-            # 3. Area's bounding box is completely within region's bounding box (fallback for small islands/water features)
-            centroid_inside = geom.contains(area_data['centroid'])
-            bbox_intersects = geom.intersects(area_geom) and not geom.touches(area_geom)
-            
-            # Fallback: bounds-based check (for small islands/water features where geometry might not include them)
-            bounds_contained = False
-            if 'bounds' in region_data:
-                reg_west, reg_south, reg_east, reg_north = region_data['bounds']
-                area_west, area_south, area_east, area_north = area_data['geometry'].bounds
-                # Check if area's bounding box is completely within region's bounding box
-                bounds_contained = (area_west >= reg_west and area_east <= reg_east and 
-                                   area_south >= reg_south and area_north <= reg_north)
-            
-            if centroid_inside or bbox_intersects or bounds_contained:
-                # Add to this region's contained list
-                adjacency[region_id]['contained'].append(area_id)
-                # Add reverse relationship - this region contains the area
-                adjacency[area_id]['within'].append(region_id)
-                
-                if centroid_inside and bbox_intersects:
-                    print(f"  contained: {area_data['name']} (centroid + overlap)")
-                elif centroid_inside:
-                    print(f"  contained: {area_data['name']} (centroid)")
-                elif bbox_intersects:
-                    print(f"  contained: {area_data['name']} (intersects)")
-                else:
-                    print(f"  contained: {area_data['name']} (bounds check)")
+        for area_id, reason in contained[region_id]:
+            # Add to this region's contained list
+            adjacency[region_id]['contained'].append(area_id)
+            # Add reverse relationship - this region contains the area
+            adjacency[area_id]['within'].append(region_id)
+            log(f"  contained: {area_regions[area_id]['name']} ({reason})")
         
         # Clean up empty directions
         adjacency[region_id] = {
@@ -232,7 +184,7 @@ def compute_adjacency():
     
     # Clean up AREA regions
     for area_id in area_regions.keys():
-        print(f"\nProcessing AREA: {area_regions[area_id]['name']} ({area_id})...")
+        log(f"\nProcessing AREA: {area_regions[area_id]['name']} ({area_id})...")
         # Clean up empty directions
         adjacency[area_id] = {
             k: v if len(v) > 1 else (v[0] if len(v) == 1 else None)
@@ -246,18 +198,27 @@ def compute_adjacency():
         # If no relationships at all, remove the entry
         if not adjacency[area_id]:
             del adjacency[area_id]
-            print(f"  (no relationships - removed from adjacency data)")
+            log(f"  (no relationships - removed from adjacency data)")
         else:
             if 'within' in adjacency[area_id]:
                 within_list = adjacency[area_id]['within']
                 if isinstance(within_list, list):
-                    print(f"  within: {', '.join(within_list)}")
+                    log(f"  within: {', '.join(within_list)}")
                 else:
-                    print(f"  within: {within_list}")
+                    log(f"  within: {within_list}")
+    
+    return adjacency
+
+def write_adjacency(adjacency):
+    """
+    Write region_adjacency.json and its gzipped copy.
     
+    Args:
+        adjacency: Adjacency dict (see assemble_adjacency)
+    """
     # Write output
-    output_file = Path('generated/regions/region_adjacency.json')
-    output_file_gz = Path('generated/regions/region_adjacency.json.gz')
+    output_file = ADJACENCY_OUTPUT_FILE
+    output_file_gz = ADJACENCY_OUTPUT_FILE.with_suffix('.json.gz')
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Write uncompressed JSON
@@ -293,12 +254,163 @@ def compute_adjacency():
     )
     print(f"[SUCCESS] Total contained areas: {contained_count}")
 
+def compute_adjacency(workers: int = 1):
+    """
+    Compute adjacency relationships from actual geographic boundaries.
+    Also detects containment - when area-type regions are within other regions.
+    
+    Candidate pairs come from a spatial index (src/adjacency_engine.py), so only
+    regions that actually meet are compared exactly.
+    
+    Args:
+        workers: Processes used for the neighbor search (1 = no process pool)
+    """
+    region_geometries, area_regions = collect_region_geometries()
+    
+    # Candidate pairs from spatial indices; exact tests only where regions meet
+    geometries = {region_id: data['geometry'] for region_id, data in region_geometries.items()}
+    neighbors = find_neighbors(geometries, workers=workers)
+    contained = find_contained(
+        geometries,
+        {region_id: data['bounds'] for region_id, data in region_geometries.items() if 'bounds' in data},
+        {area_id: data['geometry'] for area_id, data in area_regions.items()}
+    )
+    
+    adjacency = assemble_adjacency(region_geometries, area_regions, neighbors, contained)
+    save_adjacency_state(region_geometries, area_regions, neighbors, contained)
+    write_adjacency(adjacency)
+
+def region_fingerprint(region_data):
+    """
+    Fingerprint everything a region's adjacency depends on (geometry and configured bounds).
+    
+    Args:
+        region_data: Region dict (see collect_region_geometries)
+        
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256(shapely.to_wkb(region_data['geometry']))
+    digest.update(json.dumps(list(region_data.get('bounds') or [])).encode('utf-8'))
+    return digest.hexdigest()
+
+def load_adjacency_state():
+    """Load the saved per-region adjacency state, or None if missing or outdated."""
+    if not ADJACENCY_STATE_PATH.exists():
+        return None
+    try:
+        with open(ADJACENCY_STATE_PATH, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+    if state.get('version') != ADJACENCY_STATE_VERSION:
+        return None
+    return state
+
+def save_adjacency_state(region_geometries, area_regions, neighbors, contained):
+    """
+    Save per-region fingerprints and raw results for incremental updates.
+    
+    Args:
+        region_geometries: region_id -> region dict
+        area_regions: area_id -> AREA region dict
+        neighbors: region_id -> list of (other_id, direction, border_length)
+        contained: region_id -> list of (area_id, reason)
+    """
+    state = {
+        'version': ADJACENCY_STATE_VERSION,
+        'regions': {region_id: region_fingerprint(data) for region_id, data in region_geometries.items()},
+        'areas': {area_id: region_fingerprint(data) for area_id, data in area_regions.items()},
+        'neighbors': {region_id: [list(entry) for entry in entries] for region_id, entries in neighbors.items()},
+        'contained': {region_id: [list(entry) for entry in entries] for region_id, entries in contained.items()},
+    }
+    ADJACENCY_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = ADJACENCY_STATE_PATH.with_suffix('.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, ADJACENCY_STATE_PATH)
+
+def update_adjacency_incremental(workers: int = 1) -> bool:
+    """
+    Bring adjacency up to date, recomputing only the regions a config change affects.
+    
+    Neighbors are recomputed for new/changed regions and for every region that was
+    or is a neighbor of a changed or removed region. Containment is recomputed for
+    changed regions (against all areas) and for changed or removed areas (against
+    all regions). Falls back to compute_adjacency when there is no saved state.
+    
+    Args:
+        workers: Processes used for the neighbor search
+        
+    Returns:
+        True if the adjacency output changed
+    """
+    state = load_adjacency_state()
+    if state is None or not ADJACENCY_OUTPUT_FILE.exists():
+        compute_adjacency(workers=workers)
+        return True
+    
+    region_geometries, area_regions = collect_region_geometries()
+    fingerprints = {region_id: region_fingerprint(data) for region_id, data in region_geometries.items()}
+    area_fingerprints = {area_id: region_fingerprint(data) for area_id, data in area_regions.items()}
+    
+    changed = [r for r, fp in fingerprints.items() if state['regions'].get(r) != fp]
+    removed = [r for r in state['regions'] if r not in fingerprints]
+    changed_areas = [a for a, fp in area_fingerprints.items() if state['areas'].get(a) != fp]
+    stale_areas = set(changed_areas) | {a for a in state['areas'] if a not in area_fingerprints}
+    if not (changed or removed or stale_areas):
+        # Config touched without affecting any geometry - just mark the output current
+        os.utime(ADJACENCY_OUTPUT_FILE)
+        return False
+    
+    geometries = {region_id: data['geometry'] for region_id, data in region_geometries.items()}
+    bounds = {region_id: data['bounds'] for region_id, data in region_geometries.items() if 'bounds' in data}
+    areas = {area_id: data['geometry'] for area_id, data in area_regions.items()}
+    neighbors = {r: [tuple(e) for e in entries] for r, entries in state['neighbors'].items() if r in geometries}
+    contained = {r: [tuple(e) for e in entries] for r, entries in state['contained'].items() if r in geometries}
+    
+    # Neighbor rows: changed regions, plus old and new neighbors of changed/removed regions
+    neighbors.update(find_neighbors(geometries, workers=workers, subset=changed))
+    affected = set()
+    for region_id in changed + removed:
+        affected.update(other for other, _, _ in state['neighbors'].get(region_id, []))
+    for region_id in changed:
+        affected.update(other for other, _, _ in neighbors[region_id])
+    affected = [r for r in geometries if r in affected and r not in changed]
+    neighbors.update(find_neighbors(geometries, workers=workers, subset=affected))
+    
+    # Containment: rows of changed regions, columns of changed/removed areas
+    contained.update(find_contained({r: geometries[r] for r in changed}, bounds, areas))
+    if stale_areas:
+        area_order = {area_id: k for k, area_id in enumerate(areas)}
+        unchanged = {r: geom for r, geom in geometries.items() if r not in changed}
+        column = find_contained(unchanged, bounds, {a: areas[a] for a in changed_areas})
+        for region_id, entries in column.items():
+            kept = [e for e in contained.get(region_id, []) if e[0] not in stale_areas]
+            contained[region_id] = sorted(kept + entries, key=lambda e: area_order[e[0]])
+    
+    print(f"  Adjacency: {len(changed)} changed, {len(removed)} removed, "
+          f"{len(affected)} neighbors and {len(stale_areas)} areas recomputed", flush=True)
+    
+    adjacency = assemble_adjacency(region_geometries, area_regions, neighbors, contained, verbose=False)
+    save_adjacency_state(region_geometries, area_regions, neighbors, contained)
+    
+    # Rewrite the outputs only if their content changed
+    with open(ADJACENCY_OUTPUT_FILE, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+    if json.dumps(current, indent=2) == json.dumps(adjacency, indent=2):
+        os.utime(ADJACENCY_OUTPUT_FILE)
+        return False
+    write_adjacency(adjacency)
+    return True
+
 def update_adjacency_if_needed(force: bool = False) -> bool:
     """
     Update adjacency data if needed.
     
     Checks if adjacency file exists and is up-to-date with region_config.py.
-    If force=True, always updates regardless of file timestamps.
+    When the config is newer, only regions whose geometry or bounds changed (and
+    their neighbors) are recomputed. If force=True, always recomputes everything.
     
     Args:
         force: If True, always recompute adjacency even if file exists
@@ -336,9 +448,9 @@ def update_adjacency_if_needed(force: bool = False) -> bool:
         adjacency_mtime = adjacency_file.stat().st_mtime
         
         if config_mtime > adjacency_mtime:
-            print(f"  Regions config updated, recomputing adjacency...")
+            print(f"  Regions config updated, updating adjacency for changed regions...")
             try:
-                compute_adjacency()
+                update_adjacency_incremental()
                 return True
             except Exception as e:
                 print(f"  Warning: Could not update adjacency: {e}")
@@ -349,5 +461,16 @@ def update_adjacency_if_needed(force: bool = False) -> bool:
 
 
 if __name__ == '__main__':
-    compute_adjacency()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Compute region adjacency from boundary data')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Processes for the neighbor search (default: 1)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only recompute regions whose geometry or bounds changed since the last run')
+    args = parser.parse_args()
+    if args.incremental:
+        update_adjacency_incremental(workers=args.workers)
+    else:
+        compute_adjacency(workers=args.workers)
 
@@ -25,7 +25,7 @@ def download_all_borders(border_resolution='110m'):
     try:
         countries = border_manager.load_borders(border_resolution=border_resolution, force_reload=False)
         print(f"   OK: Loaded {len(countries)} countries")
-        print(f"   Cache: data/.cache/borders/ne_{border_resolution}_countries.pkl")
+        print(f"   Cache: {border_manager.store.store_path(border_resolution, 'countries')}")
     except Exception as e:
         print(f"   ERROR: Failed to download countries: {e}")
         return False
@@ -37,7 +37,7 @@ def download_all_borders(border_resolution='110m'):
     try:
         states = border_manager.load_state_borders(border_resolution=border_resolution, force_reload=False)
         print(f"   OK: Loaded {len(states)} states/provinces/territories")
-        print(f"   Cache: data/.cache/borders/ne_{border_resolution}_admin_1.pkl")
+        print(f"   Cache: {border_manager.store.store_path(border_resolution, 'admin_1')}")
         
         # Show some stats
         us_states = states[states['admin'] == 'United States of America']
@@ -98,8 +98,8 @@ Examples:
     # If forcing, clear cache first
     if args.force:
         print("\nForce re-download enabled, clearing cache...")
-        cache_dir = Path("data/.cache/borders")
-        for cache_file in cache_dir.glob(f"ne_{args.resolution}_*.pkl"):
+        cache_dir = Path("data/borders")
+        for cache_file in [*cache_dir.glob(f"ne_{args.resolution}_*.parquet"), *cache_dir.glob(f"ne_{args.resolution}_*.pkl")]:
             cache_file.unlink()
             print(f"   Deleted: {cache_file}")
     
@@ -69,6 +69,7 @@ from src.validation import (
 from src.status import (
     summarize_pipeline_status,
     check_export_version,
+    region_export_status,
     verify_and_auto_fix
 )
 
@@ -156,10 +157,41 @@ def _iter_all_region_ids() -> list[str]:
         return []
 
 
-def process_region(region_id: str, raw_path: Path, source: str, force: bool, region_type: RegionType, region_info: Dict, border_resolution: str = '10m') -> Tuple[bool, Dict]:
+def report_stale_regions(region_ids: list[str]) -> int:
+    """
+    Print regions whose export is missing, changed on disk or in an old format.
+
+    Answered from the status index (manifest synced first) without scanning
+    generated/regions.
+
+    Args:
+        region_ids: Regions to check
+
+    Returns:
+        Exit code: 0 if every region is current, 2 if any is stale
+    """
+    from src.status_index import get_status_index
+
+    index = get_status_index()
+    index.sync_manifest(Path("generated/regions/regions_manifest.json"))
+    stale = index.stale_regions(region_ids)
+    print("\n" + "="*70)
+    if not stale:
+        print(f"All {len(region_ids)} region(s) are current.")
+        return 0
+    print(f"Stale regions ({len(stale)} of {len(region_ids)}):")
+    for rid, reason in stale:
+        print(f"  - {rid}: {reason}")
+    return 2
+
+
+def process_region(region_id: str, raw_path: Path, source: str, force: bool, region_type: RegionType, region_info: Dict,
+                   border_resolution: str = '10m', tiled_export: bool = False) -> Tuple[bool, Dict]:
     """
     Run the pipeline on a region and return (success, result_paths).
     
+    tiled_export=True also writes the quadtree tile export for the tile-streaming viewer.
+    
     CRITICAL: Uses RegionType enum for all decisions (see tech/DATA_PIPELINE.md).
     Checks all three cases exhaustively with ValueError for unknown types.
     """
@@ -233,7 +265,8 @@ def process_region(region_id: str, raw_path: Path, source: str, force: bool, reg
             skip_clip=(boundary_name is None),  # Skip boundary clipping if no boundary_name
             border_resolution=border_resolution,
             bounds=crop_bounds,  # Always crop AREA regions; crop others if not clipping
-            region_type=region_type  # Pass region type so pipeline knows AREA always crops
+            region_type=region_type,  # Pass region type so pipeline knows AREA always crops
+            tiled_export=tiled_export
         )
         return success, result_paths
 
@@ -293,8 +326,9 @@ def process_single_region(region_id: str, args) -> int:
     
     summarize_pipeline_status(region_id, region_type, region_info)
 
-    # Check if pipeline is already complete
-    if not args.force_reprocess and check_pipeline_complete(region_id):
+    # Check if pipeline is already complete (tiled runs always go through the
+    # pipeline; its stage cache skips everything but missing tiles)
+    if not args.force_reprocess and not args.tiled and check_pipeline_complete(region_id):
         print(f"\n  Region '{region_id}' is already complete and ready!")
         print(f"\n  To view:")
         print(f"    python serve_viewer.py")
@@ -553,7 +587,8 @@ def process_single_region(region_id: str, args) -> int:
     # Step 3: Process the region
     # Always use 10m borders for accurate clipping (see .cursorrules - Border Resolution section)
     success, result_paths = process_region(region_id, raw_path, source,
-                                          args.force_reprocess, region_type, region_info, '10m')
+                                          args.force_reprocess, region_type, region_info, '10m',
+                                          tiled_export=args.tiled)
 
     if success:
         # Post-validate and auto-fix if needed
@@ -608,6 +643,13 @@ Examples:
   # Update adjacency after adding a new region
     python ensure_region.py montana --update-adjacency  # Add Montana and update neighbors
 
+  # List regions whose export is missing, changed or in an old format
+    python ensure_region.py --stale  # All regions (exit code 2 if any are stale)
+    python ensure_region.py ohio iowa --stale  # Only these regions
+
+  # Full-resolution tiles for large regions (streamed by the viewer as you zoom)
+    python ensure_region.py alaska --tiled
+
 This script will:
     1. Detect region type (US state or international)
     2. Check if raw data exists
@@ -622,14 +664,25 @@ This script will:
                         help='Force reprocessing even if files exist')
     parser.add_argument('--check-only', action='store_true',
                         help='Only check status, do not download or process')
+    parser.add_argument('--stale', action='store_true',
+                        help='List regions whose export is missing, changed or in an old format (all regions if none given)')
     parser.add_argument('--list-regions', action='store_true',
                         help='List all available regions')
     parser.add_argument('--yes', action='store_true',
                         help='Auto-accept lower quality data prompts')
     parser.add_argument('--update-adjacency', action='store_true',
                         help='Regenerate adjacency data after processing (run after adding new regions)')
+    parser.add_argument('--tiled', action='store_true',
+                        help='Also export full-resolution quadtree tiles for the tile-streaming viewer (large regions)')
 
     args = parser.parse_args()
+
+    # Handle --stale (status index only; no downloads or processing)
+    if args.stale:
+        region_ids = args.region_id
+        if not region_ids or [r.strip().lower() for r in region_ids] == ["all"]:
+            region_ids = _iter_all_region_ids()
+        return report_stale_regions([r.strip().lower().replace(' ', '_').replace('-', '_') for r in region_ids])
     
     # Pseudo-region: all
     # Allows: python ensure_region.py all --check-only
@@ -639,13 +692,14 @@ This script will:
             print("No regions found in configuration.")
             return 1
         print("\nRUNNING FOR ALL REGIONS\n" + "="*70)
+        from src.status_index import get_status_index
+        index_synced = get_status_index().sync_manifest(Path("generated/regions/regions_manifest.json"))
         problems: list[tuple[str, str]] = []
         processed_count = 0
         for rid in all_ids:
             processed_count += 1
-            # Summary line per region
-            has_valid = check_pipeline_complete(rid)
-            version_ok, found_v, expected_v = check_export_version(rid)
+            # Summary line per region (status index first; directory checks only when it can't answer)
+            has_valid, version_ok, found_v, expected_v = region_export_status(rid, index_synced)
             status = []
             if has_valid:
                 status.append("export_present")
@@ -707,7 +761,8 @@ This script will:
                         continue
                 success, result_paths = process_region(rid, raw_path, source,
                                                       True if args.force_reprocess else False,
-                                                      region_type, region_info, '10m')
+                                                      region_type, region_info, '10m',
+                                                      tiled_export=args.tiled)
                 if success:
                     _ = verify_and_auto_fix(rid, result_paths, source,
                                             region_type, region_info, '10m')
@@ -728,8 +783,16 @@ This script will:
     # Handle --list-regions
     if args.list_regions:
         from src.region_config import US_STATES, COUNTRIES, REGIONS, check_region_data_available
+        from src.status_index import get_status_index
+
+        # Manifest membership from the status index (manifest parsed at most once)
+        index = get_status_index()
+        ready_ids = index.manifest_regions() if index.sync_manifest(
+            Path("generated/regions/regions_manifest.json")) else None
 
         def _status_tag(rid: str) -> str:
+            if ready_ids is not None:
+                return "[ready]" if rid in ready_ids else "[not ready]"
             try:
                 st = check_region_data_available(rid)
                 return "[ready]" if st.get('in_manifest') else "[not ready]"
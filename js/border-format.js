@@ -0,0 +1,82 @@
+/**
+ * Border Format Decoding
+ * Decodes _borders.json files written by export_borders_for_viewer (src/pipeline.py)
+ *
+ * borders_v2: each segment is a base64 string of unsigned LEB128 varints holding
+ * zigzag-encoded, interleaved x/y deltas of coordinates quantized to `scale`:
+ *   x = origin[0] + cumsum(dx) * scale,  y = origin[1] + cumsum(dy) * scale
+ * Older files store segments as {lon: [...], lat: [...]} and pass through unchanged.
+ */
+
+const BORDER_FORMAT_V2 = 'borders_v2';
+
+/**
+ * Decode one borders_v2 segment
+ * @param {string} segment - Base64 varint string
+ * @param {Object} encoding - {scale, origin: [x, y]} from the borders file
+ * @returns {{lon: Float64Array, lat: Float64Array}} Coordinates in the raster CRS
+ */
+function decodeBorderSegment(segment, encoding) {
+    const binary = atob(segment);
+    const count = binary.length;
+    // At most one value per byte; trimmed below
+    const xs = new Float64Array(count >> 1);
+    const ys = new Float64Array(count >> 1);
+    const scale = encoding.scale;
+    let qx = 0, qy = 0;
+    let value = 0, shift = 0, index = 0;
+    for (let i = 0; i < count; i++) {
+        const byte = binary.charCodeAt(i);
+        value += (byte & 0x7f) * Math.pow(2, shift);
+        if (byte & 0x80) {
+            shift += 7;
+            continue;
+        }
+        // Zigzag decode (values stay well inside 2^53)
+        const delta = (value % 2) ? -(value + 1) / 2 : value / 2;
+        if (index % 2 === 0) {
+            qx += delta;
+            xs[index >> 1] = encoding.origin[0] + qx * scale;
+        } else {
+            qy += delta;
+            ys[index >> 1] = encoding.origin[1] + qy * scale;
+        }
+        index++;
+        value = 0;
+        shift = 0;
+    }
+    const points = index >> 1;
+    return { lon: xs.subarray(0, points), lat: ys.subarray(0, points) };
+}
+
+/**
+ * Decode a parsed borders file so every segment is {lon, lat}
+ * @param {Object} data - Parsed _borders.json
+ * @returns {Object} Same object with decoded segments
+ */
+function decodeBorders(data) {
+    if (data.format !== BORDER_FORMAT_V2) return data;
+    for (const country of data.countries) {
+        country.segments = country.segments.map(segment => decodeBorderSegment(segment, data.encoding));
+    }
+    return data;
+}
+
+/**
+ * Fetch and decode a borders file
+ * @param {string} url - URL of a _borders.json file
+ * @returns {Promise<Object>} Decoded borders data
+ */
+async function loadBorders(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`HTTP ${response.status} ${response.statusText} for ${url}`);
+    }
+    return decodeBorders(await response.json());
+}
+
+window.BorderFormat = {
+    decodeBorderSegment: decodeBorderSegment,
+    decodeBorders: decodeBorders,
+    loadBorders: loadBorders
+};
@@ -852,8 +852,8 @@ class JumpingScheme extends CameraScheme {
         if (!idx) return 0;
 
         const { i, j } = idx;
-        const elevation = processedData.elevation[i] && processedData.elevation[i][j];
-        if (elevation === null || elevation === undefined) return 0;
+        const elevation = processedData.elevationValues[i * processedData.width + j];
+        if (!(elevation === elevation)) return 0; // NaN = no data
 
         // Return TOP of terrain/bar (elevation * vertical exaggeration)
         // This is the top surface of the bar (solid collision)
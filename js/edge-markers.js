@@ -73,7 +73,7 @@ function createEdgeMarkers() {
 
     // Calculate actual coordinate extents - only bars mode is supported
     // Bars use UNIFORM 2D grid - same spacing in X and Z (no aspect ratio)
-    const bucketMultiplier = params.bucketSize;
+    const bucketMultiplier = getGridCellSize();
     const xExtent = (gridWidth - 1) * bucketMultiplier / 2;
     const zExtent = (gridHeight - 1) * bucketMultiplier / 2; // NO aspect ratio scaling!
     const avgSize = (xExtent + zExtent);
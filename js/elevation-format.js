@@ -0,0 +1,133 @@
+/**
+ * Elevation Export Format Decoding
+ * Decodes the binary export_v3 format written by src/export_binary.py
+ *
+ * Layout (after gzip decompression):
+ *   [0..4)   magic 'AMX3'
+ *   [4..8)   uint32 LE header length
+ *   [8..)    UTF-8 JSON header (space-padded so payload is 8-byte aligned)
+ *   payload  bands x height x width, row-major, little-endian int16 or float16
+ *
+ * value = raw * scale + offset; int16 raw === nodata (or float16 NaN) means no data.
+ */
+
+const EXPORT_V3_MAGIC = 'AMX3';
+
+/**
+ * Convert an IEEE 754 half-precision value (as uint16 bits) to a float
+ * @param {number} bits - 16-bit half float
+ * @returns {number} Float value
+ */
+function halfToFloat(bits) {
+    const sign = (bits & 0x8000) ? -1 : 1;
+    const exponent = (bits >> 10) & 0x1f;
+    const fraction = bits & 0x03ff;
+    if (exponent === 0) {
+        return sign * Math.pow(2, -14) * (fraction / 1024);
+    }
+    if (exponent === 0x1f) {
+        return fraction ? NaN : sign * Infinity;
+    }
+    return sign * Math.pow(2, exponent - 15) * (1 + fraction / 1024);
+}
+
+/**
+ * Check whether a decompressed buffer is an export_v3 binary export
+ * @param {ArrayBuffer} buffer - Decompressed file contents
+ * @returns {boolean} True if the magic matches
+ */
+function isBinaryElevationExport(buffer) {
+    if (buffer.byteLength < 8) return false;
+    const magic = new Uint8Array(buffer, 0, 4);
+    return String.fromCharCode(magic[0], magic[1], magic[2], magic[3]) === EXPORT_V3_MAGIC;
+}
+
+/**
+ * Decode one payload band into a Float32Array (NaN = no data)
+ * @param {ArrayBuffer} buffer - Decompressed file contents
+ * @param {number} byteOffset - Start of the band in the buffer
+ * @param {number} count - Number of values (width * height)
+ * @param {Object} encoding - {dtype, scale, offset, nodata}
+ * @returns {Float32Array} Decoded values
+ */
+function decodeBinaryBand(buffer, byteOffset, count, encoding) {
+    const values = new Float32Array(count);
+    const scale = encoding.scale;
+    const offset = encoding.offset;
+    if (encoding.dtype === 'int16') {
+        const raw = new Int16Array(buffer, byteOffset, count);
+        const nodata = encoding.nodata;
+        for (let i = 0; i < count; i++) {
+            const v = raw[i];
+            values[i] = (v === nodata) ? NaN : v * scale + offset;
+        }
+    } else if (encoding.dtype === 'float16') {
+        const raw = new Uint16Array(buffer, byteOffset, count);
+        for (let i = 0; i < count; i++) {
+            values[i] = halfToFloat(raw[i]) * scale + offset;
+        }
+    } else {
+        throw new Error(`Unsupported export_v3 dtype: ${encoding.dtype}`);
+    }
+    return values;
+}
+
+/**
+ * Convert nested row arrays (export_v2 JSON, null = no data) to row-major values
+ * @param {Array<Array<number|null>>} rows - elevation[row][col]
+ * @param {number} width - Grid width
+ * @param {number} height - Grid height
+ * @returns {Float32Array} Row-major values (NaN = no data)
+ */
+function rowsToValues(rows, width, height) {
+    const values = new Float32Array(width * height).fill(NaN);
+    for (let y = 0; y < height; y++) {
+        const row = rows[y];
+        if (!row) continue;
+        const base = y * width;
+        for (let x = 0; x < width; x++) {
+            const v = row[x];
+            if (v !== null && v !== undefined) values[base + x] = v;
+        }
+    }
+    return values;
+}
+
+/**
+ * Decode a decompressed export_v3 buffer into the viewer's elevation data object
+ * Returns the header fields (width, height, bounds, stats, ...) plus typed arrays:
+ * elevationValues (first band, row-major, NaN = no data) and bandValues (all bands by name).
+ * The grid is indexed as elevationValues[row * width + col]; no nested rows are built.
+ * @param {ArrayBuffer} buffer - Decompressed file contents
+ * @returns {Object} Elevation data object
+ */
+function decodeBinaryElevation(buffer) {
+    if (!isBinaryElevationExport(buffer)) {
+        throw new Error('Not an export_v3 binary file (bad magic)');
+    }
+    const headerLength = new DataView(buffer).getUint32(4, true);
+    const headerText = new TextDecoder('utf-8').decode(new Uint8Array(buffer, 8, headerLength));
+    const header = JSON.parse(headerText);
+
+    const width = header.width;
+    const height = header.height;
+    const count = width * height;
+    const encodings = header.band_encodings || [header.encoding];
+    const bandNames = header.bands || ['elevation'];
+
+    const bandValues = {};
+    let byteOffset = 8 + headerLength;
+    for (let b = 0; b < bandNames.length; b++) {
+        bandValues[bandNames[b]] = decodeBinaryBand(buffer, byteOffset, count, encodings[b]);
+        byteOffset += count * 2;
+    }
+
+    const data = Object.assign({}, header);
+    data.elevationValues = bandValues[bandNames[0]];
+    data.bandValues = bandValues;
+    return data;
+}
+
+window.decodeBinaryElevation = decodeBinaryElevation;
+window.isBinaryElevationExport = isBinaryElevationExport;
+window.rowsToValues = rowsToValues;
@@ -0,0 +1,54 @@
+/**
+ * Elevation Pyramid Levels
+ * Pre-aggregated bucket levels written by src/pyramid.py (export_v3, bands max/mean/min).
+ *
+ * The manifest lists them per region:
+ *   "pyramid": [{"factor": 2, "file": "..._x2_v3.bin.gz", "width", "height", "bands"}, ...]
+ *
+ * A level with factor N holds exactly what computeBucketedData(N) produces on the
+ * client (max aggregation, buckets with < 50% valid pixels are null), so it can be
+ * dropped straight into the bucketed data cache.
+ *
+ * Depends on: loadElevationData (viewer-advanced.js), decodeBinaryElevation (elevation-format.js)
+ */
+
+/**
+ * Get the pyramid levels listed for a region, coarsest first
+ * @param {Object} regionInfo - Manifest entry for the region
+ * @returns {Array<Object>} Level entries sorted by descending factor
+ */
+function getPyramidLevels(regionInfo) {
+    const levels = (regionInfo && Array.isArray(regionInfo.pyramid)) ? regionInfo.pyramid : [];
+    return [...levels].sort((a, b) => b.factor - a.factor);
+}
+
+/**
+ * Convert a decoded pyramid level into the bucketed data object used by the renderer
+ * @param {Object} levelData - Decoded export_v3 level (from loadElevationData)
+ * @param {number} factor - Bucket factor of the level
+ * @param {Object} scale - Real-world scale of the base data ({metersPerPixelX, metersPerPixelY})
+ * @param {Object} stats - Stats of the base data
+ * @param {string} [band='max'] - Band to render (max, mean or min)
+ * @returns {Object} Processed data with bucketed elevation grid
+ */
+function pyramidLevelToBucketedData(levelData, factor, scale, stats, band = 'max') {
+    const width = levelData.width;
+    const height = levelData.height;
+    const values = levelData.bandValues[band];
+    if (!values) {
+        throw new Error(`Pyramid level x${factor} has no '${band}' band`);
+    }
+    return {
+        width: width,
+        height: height,
+        elevationValues: values,
+        stats: stats,
+        bucketSizeMetersX: scale.metersPerPixelX * factor,
+        bucketSizeMetersY: scale.metersPerPixelY * factor
+    };
+}
+
+window.ElevationPyramid = {
+    getLevels: getPyramidLevels,
+    toBucketedData: pyramidLevelToBucketedData
+};
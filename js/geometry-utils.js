@@ -82,6 +82,18 @@ function raycastToWorld(screenX, screenY) {
     return null;
 }
 
+/**
+ * Spacing of the rendered grid in world units
+ * The bucket size, unless processedData carries its own cell size (a cached bucket
+ * size shown while the selected one loads, or a streamed tile view)
+ * Depends on globals: processedData, params
+ * 
+ * @returns {number} Cell size in world units
+ */
+function getGridCellSize() {
+    return (processedData && processedData.cellSize) || params.bucketSize || 1;
+}
+
 /**
  * Convert world coordinates (3D scene) to lon/lat (geographic)
  * Depends on globals: rawElevationData, processedData, params
@@ -99,7 +111,7 @@ function worldToLonLat(worldX, worldZ) {
     let colNorm, rowNorm;
 
     // Only bars mode is supported
-    const bucket = params.bucketSize;
+    const bucket = getGridCellSize();
     const xMin = -(w - 1) * bucket / 2;
     const zMin = -(h - 1) * bucket / 2;
     const xMax = (w - 1) * bucket / 2;
@@ -126,7 +138,7 @@ function worldToGridIndex(worldX, worldZ) {
     const w = processedData.width;
     const h = processedData.height;
     // Only bars mode is supported
-    const bucket = params.bucketSize;
+    const bucket = getGridCellSize();
     const originX = terrainMesh ? terrainMesh.position.x : -(w - 1) * bucket / 2;
     const originZ = terrainMesh ? terrainMesh.position.z : -(h - 1) * bucket / 2;
     let j = Math.round((worldX - originX) / bucket);
@@ -145,8 +157,8 @@ function worldToGridIndex(worldX, worldZ) {
 function getMetersScalePerWorldUnit() {
     if (!processedData) return { mx: 1, mz: 1 };
     // Only bars mode is supported
-    const mx = (processedData.bucketSizeMetersX || 1) / (params.bucketSize || 1);
-    const mz = (processedData.bucketSizeMetersY || 1) / (params.bucketSize || 1);
+    const mx = (processedData.bucketSizeMetersX || 1) / getGridCellSize();
+    const mz = (processedData.bucketSizeMetersY || 1) / getGridCellSize();
     return { mx, mz };
 }
 
@@ -190,7 +202,7 @@ function isWorldInsideData(worldX, worldZ) {
     const w = processedData.width;
     const h = processedData.height;
     // Only bars mode is supported
-    const bucket = params.bucketSize;
+    const bucket = getGridCellSize();
     const xMin = -(w - 1) * bucket / 2;
     const xMax = (w - 1) * bucket / 2;
     const zMin = -(h - 1) * bucket / 2;
@@ -201,6 +213,7 @@ function isWorldInsideData(worldX, worldZ) {
 // Export to window for global access
 window.GeometryUtils = {
     calculateRealWorldScale,
+    getGridCellSize,
     raycastToWorld,
     worldToLonLat,
     worldToGridIndex,
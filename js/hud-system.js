@@ -452,7 +452,7 @@
         const idx = window.GeometryUtils.worldToGridIndex(world.x, world.z);
         if (!idx) return;
 
-        const zCell = (window.processedData.elevation[idx.i] && window.processedData.elevation[idx.i][idx.j]);
+        const zCell = window.processedData.elevationValues[idx.i * window.processedData.width + idx.j];
         const hasData = (zCell != null) && isFinite(zCell);
         if (!hasData) {
             if (geocodeEl) geocodeEl.textContent = '--';
@@ -215,8 +215,8 @@
                 for (let i = 0; i < count; i++) {
                     const row = window.barsIndexToRow[i];
                     const col = window.barsIndexToCol[i];
-                    let z = (window.processedData.elevation[row] && window.processedData.elevation[row][col]);
-                    if (z === null || z === undefined) z = 0;
+                    let z = window.processedData.elevationValues[row * window.processedData.width + col];
+                    if (!(z === z)) z = 0; // NaN = no data
                     const c = getColor(z, row, col);
                     const idx = i * 3;
                     arr[idx] = c.r;
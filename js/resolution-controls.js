@@ -21,8 +21,9 @@
  * - Logarithmic mapping makes the slider feel natural across huge range
  * 
  * DEPENDS ON:
- * - Global: params, rawElevationData, processedData, scene, edgeMarkers, pendingBucketTimeout
- * - Functions: rebucketData(), recreateTerrain(), updateStats(), updateURLParameter(), appendActivityLog()
+ * - Global: params, rawElevationData, processedData, scene, edgeMarkers, pendingBucketTimeout, currentRegionId
+ * - Functions: rebucketData(), recreateTerrain(), updateStats(), updateURLParameter(), appendActivityLog(),
+ *   getRegionPyramidLevels()
  */
 
 // Track ongoing recalculation timeout for cancellation support
@@ -498,6 +499,14 @@ function autoAdjustBucketSize(preserveTransform = true) {
     // Clamp to valid range [1, 500]
     optimalSize = Math.max(1, Math.min(500, optimalSize));
 
+    // Region opened from its coarsest pyramid level: prefer the next coarser level (still
+    // within the bucket budget), which is downloaded as is instead of the full grid
+    if (!rawElevationData.elevationValues && typeof getRegionPyramidLevels === 'function') {
+        const levelFactors = getRegionPyramidLevels(currentRegionId).map(level => level.factor);
+        const coarser = levelFactors.filter(factor => factor >= optimalSize);
+        if (coarser.length > 0) optimalSize = Math.min(...coarser);
+    }
+
     // Recalculate final bucket count with clamped size
     bucketedWidth = Math.floor(width / optimalSize);
     bucketedHeight = Math.floor(height / optimalSize);
@@ -445,7 +445,7 @@ function createConnectivityLabels() {
     console.log(`[Connectivity] Creating labels for ${currentRegionId} with grid: ${gridWidth}x${gridHeight}`);
 
     // Calculate extents - only bars mode is supported
-    const bucketMultiplier = params.bucketSize;
+    const bucketMultiplier = getGridCellSize();
     const xExtent = (gridWidth - 1) * bucketMultiplier / 2;
     const zExtent = (gridHeight - 1) * bucketMultiplier / 2;
     const avgSize = (xExtent + zExtent);
@@ -45,6 +45,17 @@
         return;
     }
 
+    // True if the current terrain was placed at processedData.worldOrigin (tile view)
+    let lastCreatedAtOrigin = false;
+
+    /**
+     * Grid spacing in world units (1 unit = 1 base grid pixel), see getGridCellSize()
+     * @returns {number} Cell size
+     */
+    function gridCellSize() {
+        return window.GeometryUtils.getGridCellSize();
+    }
+
     /**
      * Create terrain (bars mode only)
      */
@@ -94,7 +105,7 @@
             window.terrainGroup = window.terrainGroup;
         }
 
-        const { width, height, elevation } = window.processedData;
+        const { width, height, elevationValues } = window.processedData;
 
         // Calculate real-world scale
         let scale;
@@ -107,15 +118,24 @@
         }
 
         // Only bars mode is supported
-        createBars(width, height, elevation, scale);
+        createBars(width, height, elevationValues, scale);
+
+        // Streamed tile views cover part of the region: placed where they sit in the full grid
+        const worldOrigin = window.processedData.worldOrigin || null;
+        lastCreatedAtOrigin = worldOrigin !== null;
 
         // Center terrain - bars use UNIFORM 2D grid - same spacing in X and Z (no aspect ratio)
         // Note: Position is preserved in recreate() to keep map fixed when bucket size changes
         if (window.terrainMesh) {
-            const bucketMultiplier = window.params.bucketSize;
-            window.terrainMesh.position.x = -(width - 1) * bucketMultiplier / 2;
-            window.terrainMesh.position.z = -(height - 1) * bucketMultiplier / 2; // NO aspect ratio scaling!
-            console.log(`Bars centered: uniform grid ${width}x${height}, tile size ${bucketMultiplier}, offset (${window.terrainMesh.position.x.toFixed(1)}, ${window.terrainMesh.position.z.toFixed(1)})`);
+            const bucketMultiplier = gridCellSize();
+            if (worldOrigin) {
+                window.terrainMesh.position.x = worldOrigin.x;
+                window.terrainMesh.position.z = worldOrigin.z;
+            } else {
+                window.terrainMesh.position.x = -(width - 1) * bucketMultiplier / 2;
+                window.terrainMesh.position.z = -(height - 1) * bucketMultiplier / 2; // NO aspect ratio scaling!
+            }
+            console.log(`Bars ${worldOrigin ? 'placed' : 'centered'}: uniform grid ${width}x${height}, tile size ${bucketMultiplier}, offset (${window.terrainMesh.position.x.toFixed(1)}, ${window.terrainMesh.position.z.toFixed(1)})`);
         }
 
         const t1 = performance.now();
@@ -128,9 +148,9 @@
             window.terrainStats.bucketedVertices = width * height;
         }
 
-        // Update camera scheme with terrain bounds for F key reframing
-        if (window.controls && window.controls.activeScheme && window.controls.activeScheme.setTerrainBounds) {
-            const bucketMultiplier = window.params.bucketSize;
+        // Update camera scheme with terrain bounds for F key reframing (whole region, not a tile view)
+        if (!worldOrigin && window.controls && window.controls.activeScheme && window.controls.activeScheme.setTerrainBounds) {
+            const bucketMultiplier = gridCellSize();
             const halfWidth = (width - 1) * bucketMultiplier / 2;
             const halfDepth = (height - 1) * bucketMultiplier / 2;
             window.controls.activeScheme.setTerrainBounds(-halfWidth, halfWidth, -halfDepth, halfDepth);
@@ -139,7 +159,8 @@
         // PRODUCT REQUIREMENT: Edge markers must stay fixed when vertical exaggeration changes
         // ALWAYS create edge markers when terrain is created (new region loaded)
         // Arrays were cleared above when terrainGroup was destroyed
-        if (typeof createEdgeMarkers === 'function') {
+        // (Tile views show part of the region; its edges are recreated with the full grid)
+        if (!worldOrigin && typeof createEdgeMarkers === 'function') {
             createEdgeMarkers();
         }
         // Update compass rose when markers are created
@@ -157,7 +178,7 @@
     /**
      * Create bars terrain (instanced meshes)
      */
-    function createBars(width, height, elevation, scale) {
+    function createBars(width, height, elevationValues, scale) {
         // PURE 2D GRID APPROACH:
         // Treat the input data as a perfect 2D grid with uniform square tiles.
         // This is the correct approach because:
@@ -168,7 +189,7 @@
         // Use shared dummy object for instancing transforms to avoid reallocations
 
         // Bucket multiplier determines tile size (larger = more chunky visualization)
-        const bucketMultiplier = window.params.bucketSize;
+        const bucketMultiplier = gridCellSize();
 
         // Create SQUARE bars for uniform 2D grid (no stretching or distortion)
         // Tile gap always 0% (tiles touching)
@@ -184,14 +205,9 @@
 
         // First pass: count valid (non-null) samples to preallocate buffers
         let barCount = 0;
-        for (let i = 0; i < height; i++) {
-            const row = elevation[i];
-            if (!row) continue;
-            for (let j = 0; j < width; j++) {
-                const z = row[j];
-                if (z === null || z === undefined) continue;
-                barCount++;
-            }
+        for (let k = 0; k < width * height; k++) {
+            const z = elevationValues[k];
+            if (z === z) barCount++; // NaN = no data
         }
         // Always use Natural (Lambert) shading
         const material = new THREE.MeshLambertMaterial({ vertexColors: true });
@@ -211,11 +227,10 @@
 
         let idx = 0;
         for (let i = 0; i < height; i++) {
-            const row = elevation[i];
-            if (!row) continue;
+            const rowStart = i * width;
             for (let j = 0; j < width; j++) {
-                let z = row[j];
-                if (z === null || z === undefined) continue;
+                const z = elevationValues[rowStart + j];
+                if (!(z === z)) continue; // NaN = no data
 
                 const elev = Math.max(z * window.params.verticalExaggeration, 0.1);
                 const xPos = j * bucketMultiplier;
@@ -362,7 +377,9 @@
         let oldTerrainGroupRotation = null;
 
         if (preserveTransform) {
-            if (window.terrainMesh) {
+            // Tile views are placed absolutely; switching to or from one never keeps the old offset
+            const placedAbsolutely = lastCreatedAtOrigin || (window.processedData && window.processedData.worldOrigin);
+            if (window.terrainMesh && !placedAbsolutely) {
                 oldTerrainPos = window.terrainMesh.position.clone();
             }
             if (window.terrainGroup) {
@@ -0,0 +1,195 @@
+/**
+ * Tile Streaming
+ * Loads quadtree tiles written by src/tile_export.py for regions whose manifest
+ * entry has "tiles": {index, tile_size, max_zoom, base_width, base_height}.
+ *
+ * - View rectangles are in base (full-resolution) pixel coordinates
+ * - zoomForView picks the finest zoom whose view fits a pixel budget
+ * - Only tiles intersecting the view (and present in the index) are fetched
+ * - Decoded tiles are kept in an LRU cache; concurrent requests share one fetch
+ * - assembleView mosaics the tiles into the viewer's processedData shape
+ *
+ * Depends on: decodeBinaryElevation (elevation-format.js)
+ */
+
+// Decoded tiles kept in memory (256 x 256 float32 = 256 KB each)
+const TILE_CACHE_MAX_TILES = 256;
+
+/**
+ * Fetch a gzip file and return its decompressed bytes
+ * @param {string} url - URL of a .gz file
+ * @returns {Promise<ArrayBuffer>} Decompressed contents
+ */
+async function fetchGzipArrayBuffer(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`HTTP ${response.status} ${response.statusText} for ${url}`);
+    }
+    const stream = new DecompressionStream('gzip');
+    const writer = stream.writable.getWriter();
+    writer.write(new Uint8Array(await response.arrayBuffer()));
+    writer.close();
+    return new Response(stream.readable).arrayBuffer();
+}
+
+class TileStreamer {
+    /**
+     * @param {string} baseUrl - Tile directory URL (contains index.json.gz and {z}/ folders)
+     * @param {Object} index - Parsed tile index
+     * @param {number} [maxTiles] - LRU cache capacity
+     */
+    constructor(baseUrl, index, maxTiles = TILE_CACHE_MAX_TILES) {
+        this.baseUrl = baseUrl;
+        this.index = index;
+        this.maxTiles = maxTiles;
+        this.cache = new Map();     // key "z/x_y" -> decoded tile (insertion order = LRU order)
+        this.inFlight = new Map();  // key -> Promise
+        this.available = index.levels.map(level => new Set(level.tiles));
+    }
+
+    /**
+     * Open the tile set listed in a manifest entry
+     * @param {Object} regionInfo - Manifest entry with a "tiles" field
+     * @param {string} [root='generated/regions'] - URL of the manifest directory
+     * @returns {Promise<TileStreamer>} Streamer for the region
+     */
+    static async open(regionInfo, root = 'generated/regions') {
+        const indexPath = regionInfo.tiles.index;
+        const baseUrl = `${root}/${indexPath.substring(0, indexPath.lastIndexOf('/'))}`;
+        const text = new TextDecoder('utf-8').decode(await fetchGzipArrayBuffer(`${root}/${indexPath}.gz`));
+        return new TileStreamer(baseUrl, JSON.parse(text));
+    }
+
+    /**
+     * Downsampling factor of a zoom level relative to the base raster
+     * @param {number} z - Zoom level
+     * @returns {number} Factor (1 at max zoom)
+     */
+    factorForZoom(z) {
+        return Math.pow(2, this.index.max_zoom - z);
+    }
+
+    /**
+     * Finest zoom at which the view fits the pixel budget
+     * @param {Object} view - {x0, y0, x1, y1} in base pixels
+     * @param {number} maxPixels - Maximum pixels in the assembled grid
+     * @returns {number} Zoom level
+     */
+    zoomForView(view, maxPixels) {
+        const w = Math.max(1, view.x1 - view.x0);
+        const h = Math.max(1, view.y1 - view.y0);
+        for (let z = this.index.max_zoom; z > 0; z--) {
+            const f = this.factorForZoom(z);
+            if (Math.ceil(w / f) * Math.ceil(h / f) <= maxPixels) return z;
+        }
+        return 0;
+    }
+
+    /**
+     * Tiles intersecting the view at a zoom level (only those present in the index)
+     * @param {number} z - Zoom level
+     * @param {Object} view - {x0, y0, x1, y1} in base pixels
+     * @returns {Array<{x: number, y: number}>} Tile coordinates
+     */
+    tilesForView(z, view) {
+        const span = this.index.tile_size * this.factorForZoom(z);
+        const level = this.index.levels[z];
+        const tx0 = Math.max(0, Math.floor(view.x0 / span));
+        const ty0 = Math.max(0, Math.floor(view.y0 / span));
+        const tx1 = Math.min(level.cols - 1, Math.floor((view.x1 - 1) / span));
+        const ty1 = Math.min(level.rows - 1, Math.floor((view.y1 - 1) / span));
+        const tiles = [];
+        for (let y = ty0; y <= ty1; y++) {
+            for (let x = tx0; x <= tx1; x++) {
+                if (this.available[z].has(`${x}_${y}`)) tiles.push({ x, y });
+            }
+        }
+        return tiles;
+    }
+
+    /**
+     * Get a decoded tile (cached, fetched once)
+     * @param {number} z - Zoom level
+     * @param {number} x - Tile column
+     * @param {number} y - Tile row
+     * @returns {Promise<Object>} Decoded tile ({width, height, elevationValues, ...})
+     */
+    async getTile(z, x, y) {
+        const key = `${z}/${x}_${y}`;
+        const cached = this.cache.get(key);
+        if (cached) {
+            // Refresh LRU position
+            this.cache.delete(key);
+            this.cache.set(key, cached);
+            return cached;
+        }
+        if (this.inFlight.has(key)) return this.inFlight.get(key);
+
+        const promise = fetchGzipArrayBuffer(`${this.baseUrl}/${key}.bin.gz`)
+            .then(buffer => {
+                const tile = decodeBinaryElevation(buffer);
+                this.cache.set(key, tile);
+                while (this.cache.size > this.maxTiles) {
+                    this.cache.delete(this.cache.keys().next().value);
+                }
+                return tile;
+            })
+            .finally(() => this.inFlight.delete(key));
+        this.inFlight.set(key, promise);
+        return promise;
+    }
+
+    /**
+     * Load the tiles in view and mosaic them into one grid
+     * @param {Object} view - {x0, y0, x1, y1} in base pixels
+     * @param {number} maxPixels - Maximum pixels in the assembled grid
+     * @returns {Promise<Object>} Processed data ({width, height, elevationValues, stats,
+     *   bucketSizeMetersX, bucketSizeMetersY, zoom, view})
+     */
+    async assembleView(view, maxPixels) {
+        const z = this.zoomForView(view, maxPixels);
+        const f = this.factorForZoom(z);
+        const size = this.index.tile_size;
+        const level = this.index.levels[z];
+
+        // View in level pixels
+        const lx0 = Math.floor(view.x0 / f);
+        const ly0 = Math.floor(view.y0 / f);
+        const width = Math.max(1, Math.ceil(view.x1 / f) - lx0);
+        const height = Math.max(1, Math.ceil(view.y1 / f) - ly0);
+        const values = new Float32Array(width * height).fill(NaN);
+
+        const coords = this.tilesForView(z, view);
+        const tiles = await Promise.all(coords.map(c => this.getTile(z, c.x, c.y)));
+        coords.forEach((c, i) => {
+            const tileValues = tiles[i].elevationValues;
+            const ox = c.x * size - lx0;
+            const oy = c.y * size - ly0;
+            const x0 = Math.max(0, ox), x1 = Math.min(width, ox + size);
+            const y0 = Math.max(0, oy), y1 = Math.min(height, oy + size);
+            for (let y = y0; y < y1; y++) {
+                const src = (y - oy) * size;
+                const dst = y * width;
+                for (let x = x0; x < x1; x++) {
+                    values[dst + x] = tileValues[src + x - ox];
+                }
+            }
+        });
+
+        return {
+            width: width,
+            height: height,
+            elevationValues: values,
+            stats: this.index.stats,
+            bucketSizeMetersX: level.meters_per_pixel_x,
+            bucketSizeMetersY: level.meters_per_pixel_y,
+            zoom: z,
+            view: view
+        };
+    }
+}
+
+window.TileStreaming = {
+    TileStreamer: TileStreamer,
+    fetchGzipArrayBuffer: fetchGzipArrayBuffer
+};
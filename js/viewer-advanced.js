@@ -72,6 +72,21 @@ let trueScaleValue = null;
 // Cache for bucketed data by bucket size (key: bucketSize, value: processedData object)
 // This allows instant bucket size changes without recomputation
 let bucketedDataCache = {};
+// Pyramid levels are fetched on demand (key: factor, value: Promise of processedData)
+let pyramidLevelRequests = {};
+// Factors whose level failed to load; those sizes are bucketed on the client instead
+let failedPyramidLevels = new Set();
+// Full base grid download (null until first needed; regions with pyramid levels start without it)
+let baseGridPromise = null;
+// Quadtree tile streamer for regions exported with tiles (null otherwise)
+let tileStreamer = null;
+// Tile view currently shown instead of the bucketed grid (null when showing the whole region)
+let tiledView = null;
+let tileViewLoading = false;
+let lastTileViewCheck = 0;
+const TILE_VIEW_CHECK_INTERVAL_MS = 500;
+// Loaded tile views extend this far past the visible footprint (fraction of its size per side)
+const TILE_VIEW_MARGIN = 0.5;
 
 // Expose data state on window for modules
 window.processedData = null; // Will be set when data loads
@@ -416,14 +431,23 @@ async function loadElevationData(url) {
     writer.write(new Uint8Array(arrayBuffer));
     writer.close();
     const decompressedResponse = new Response(stream.readable);
-    const text = await decompressedResponse.text();
-    const data = JSON.parse(text);
+    let data;
+    if (gzUrl.endsWith('.bin.gz')) {
+        // Binary export_v3: header + typed payload, no JSON parse of the grid
+        data = decodeBinaryElevation(await decompressedResponse.arrayBuffer());
+    } else {
+        const text = await decompressedResponse.text();
+        data = JSON.parse(text);
+        // export_v2: nested rows -> the same row-major typed grid as export_v3
+        data.elevationValues = rowsToValues(data.elevation, data.width, data.height);
+        delete data.elevation;
+    }
 
-    const versionMatch = filename.match(/_v(\d+)\.json/);
+    const versionMatch = filename.match(/_v(\d+)\.(json|bin)/);
     const fileVersion = versionMatch ? versionMatch[1] : 'unknown';
     appendActivityLog(`[OK] Data format v${fileVersion} from filename`);
 
-    try { window.ActivityLog.logResourceTiming(gzUrl, 'Loaded JSON', tStart, performance.now()); } catch (e) { }
+    try { window.ActivityLog.logResourceTiming(gzUrl, gzUrl.endsWith('.bin.gz') ? 'Loaded binary' : 'Loaded JSON', tStart, performance.now()); } catch (e) { }
     return data;
 }
 
@@ -918,15 +942,34 @@ async function loadRegion(regionId) {
         }
         const dataUrl = `generated/regions/${filename}`;
 
-        rawElevationData = await loadElevationData(dataUrl);
+        // Clear bucketed data cache and pending level fetches before loading the new region
+        bucketedDataCache = {};
+        pyramidLevelRequests = {};
+        failedPyramidLevels = new Set();
+        baseGridPromise = null;
+        tiledView = null;
+        console.log('[BUCKETING] Cleared cache for new region');
+
+        // Regions with pyramid levels start from the coarsest level; finer levels and
+        // the full grid are fetched when a bucket size needs them (rebucketData)
+        const levels = getRegionPyramidLevels(regionId);
+        rawElevationData = null;
+        if (levels.length > 0) {
+            try {
+                rawElevationData = await loadCoarsestPyramidLevel(levels[0]);
+            } catch (error) {
+                console.warn(`[BUCKETING] Could not load pyramid level ${levels[0].factor}x, loading full grid: ${error.message}`);
+                bucketedDataCache = {};
+                failedPyramidLevels.add(levels[0].factor);
+            }
+        }
+        if (!rawElevationData) {
+            rawElevationData = await loadElevationData(dataUrl);
+        }
         window.rawElevationData = rawElevationData; // Sync to window
         currentRegionId = regionId;
         updateRegionInfo(regionId);
 
-        // Clear bucketed data cache when loading new region
-        bucketedDataCache = {};
-        console.log('[BUCKETING] Cleared cache for new region');
-
         // Calculate true scale for this data
         // CRITICAL: Preserve the user's multiplier choice across region changes
         // Store the current multiplier before recalculating trueScaleValue
@@ -1008,11 +1051,17 @@ async function loadRegion(regionId) {
         autoAdjustBucketSize(false);
         console.log(`autoAdjustBucketSize: ${(performance.now() - stepStart).toFixed(1)}ms (includes rebucket + terrain creation)`);
 
+        // Open the tile set (if any) so zoomed-in views can stream full-resolution tiles
+        openTileStreamer(regionId);
+
         // Pregenerate common bucket sizes for instant switching (after initial bucketing)
         // Do this asynchronously so it doesn't block the UI
-        setTimeout(() => {
-            pregenerateCommonBucketSizes();
-        }, 100);
+        // (Without the full grid this happens once ensureBaseGrid() has loaded it)
+        if (rawElevationData.elevationValues) {
+            setTimeout(() => {
+                pregenerateCommonBucketSizes();
+            }, 100);
+        }
 
         updateLoadingProgress(70, 1, 1, 'Applying colors...');
         stepStart = performance.now();
@@ -1160,25 +1209,23 @@ function syncUIControls() {
 
 // Compute percentile-based auto stretch bounds from current bucketed elevation
 function computeAutoStretchStats() {
-    if (!processedData || !processedData.elevation) return;
+    if (!processedData || !processedData.elevationValues) return;
     if (!params.autoStretchEnabled) { if (processedData.stats) { delete processedData.stats.autoLow; delete processedData.stats.autoHigh; } return; }
     const lowPct = Math.max(0, Math.min(100, params.autoStretchLowPct || 2));
     const highPct = Math.max(0, Math.min(100, params.autoStretchHighPct || 98));
-    const values = [];
-    const elev = processedData.elevation;
-    for (let i = 0; i < elev.length; i++) {
-        const row = elev[i];
-        for (let j = 0; j < row.length; j++) {
-            const v = row[j];
-            if (v !== null && v !== undefined && isFinite(v)) values.push(v);
-        }
+    const elev = processedData.elevationValues;
+    const values = new Float32Array(elev.length);
+    let n = 0;
+    for (let k = 0; k < elev.length; k++) {
+        const v = elev[k];
+        if (isFinite(v)) values[n++] = v;
     }
     if (!processedData.stats) processedData.stats = {};
-    if (values.length < 10) { delete processedData.stats.autoLow; delete processedData.stats.autoHigh; return; }
-    values.sort((a, b) => a - b);
+    if (n < 10) { delete processedData.stats.autoLow; delete processedData.stats.autoHigh; return; }
+    const sorted = values.subarray(0, n).sort(); // typed array sort is numeric
     const p = (q) => {
-        const idx = Math.max(0, Math.min(values.length - 1, Math.round((q / 100) * (values.length - 1))));
-        return values[idx];
+        const idx = Math.max(0, Math.min(n - 1, Math.round((q / 100) * (n - 1))));
+        return sorted[idx];
     };
     processedData.stats.autoLow = p(lowPct);
     processedData.stats.autoHigh = p(highPct);
@@ -1193,7 +1240,8 @@ function computeAutoStretchStats() {
  * @returns {Object} Processed data with bucketed elevation grid
  */
 function computeBucketedData(bucketSize) {
-    const { width, height, elevation } = rawElevationData;
+    const { width, height, elevationValues } = rawElevationData;
+    if (!elevationValues) return null; // Full grid not loaded yet (see ensureBaseGrid)
 
     // Calculate real-world scale
     const scale = calculateRealWorldScale();
@@ -1206,16 +1254,12 @@ function computeBucketedData(bucketSize) {
     const bucketSizeMetersX = scale.metersPerPixelX * bucketSize;
     const bucketSizeMetersY = scale.metersPerPixelY * bucketSize;
 
-    // Pre-allocate array for better performance
-    const bucketedElevation = new Array(bucketedHeight);
-
-    // Pre-allocate buffer for collecting values
-    const maxBucketPixels = Math.ceil(bucketSize * bucketSize * 1.5); // 1.5x safety margin
-    const buffer = new Float32Array(maxBucketPixels);
+    // Row-major output grid (NaN = no data), same layout as the raw grid
+    const bucketedValues = new Float32Array(bucketedWidth * bucketedHeight);
+    const maxPossiblePixels = bucketSize * bucketSize;
+    let noneCount = 0;
 
     for (let by = 0; by < bucketedHeight; by++) {
-        const row = new Array(bucketedWidth);
-
         for (let bx = 0; bx < bucketedWidth; bx++) {
             // Calculate pixel range for this bucket (now always integer aligned)
             const pixelX0 = bx * bucketSize;
@@ -1223,13 +1267,16 @@ function computeBucketedData(bucketSize) {
             const pixelY0 = by * bucketSize;
             const pixelY1 = (by + 1) * bucketSize;
 
-            // Collect all values in this bucket (bucketSize x bucketSize pixels)
+            // Scan the bucket (bucketSize x bucketSize pixels): valid count and max
             let count = 0;
+            let max = -Infinity;
             for (let py = pixelY0; py < pixelY1 && py < height; py++) {
+                const rowStart = py * width;
                 for (let px = pixelX0; px < pixelX1 && px < width; px++) {
-                    const val = elevation[py] && elevation[py][px];
-                    if (val !== null && val !== undefined) {
-                        buffer[count++] = val;
+                    const val = elevationValues[rowStart + px];
+                    if (val === val) { // not NaN
+                        count++;
+                        if (val > max) max = val;
                     }
                 }
             }
@@ -1237,37 +1284,19 @@ function computeBucketedData(bucketSize) {
             // Always use 'max' aggregation (highest point in bucket)
             // BOUNDARY PRESERVATION: Only create a bar if enough pixels in the bucket are valid
             // This preserves clipped state/country boundaries during bucketing
-            let value = null;
-            const maxPossiblePixels = bucketSize * bucketSize;
-            const validPixelRatio = count / maxPossiblePixels;
-            
             // Require at least 50% of bucket pixels to be valid (not None/nodata)
             // This prevents "healing" of clipped boundaries where edge buckets
             // would otherwise fill in with aggregated values from sparse valid pixels
-            if (validPixelRatio >= 0.5) {
-                value = buffer[0];
-                for (let i = 1; i < count; i++) {
-                    if (buffer[i] > value) value = buffer[i];
-                }
-            }
-
-            row[bx] = value;
-        }
-        bucketedElevation[by] = row;
-    }
-
-    // Count None values to verify boundary preservation
-    let noneCount = 0;
-    let validCount = 0;
-    for (let by = 0; by < bucketedHeight; by++) {
-        for (let bx = 0; bx < bucketedWidth; bx++) {
-            if (bucketedElevation[by][bx] === null || bucketedElevation[by][bx] === undefined) {
-                noneCount++;
+            if (count / maxPossiblePixels >= 0.5) {
+                bucketedValues[by * bucketedWidth + bx] = max;
             } else {
-                validCount++;
+                bucketedValues[by * bucketedWidth + bx] = NaN;
+                noneCount++;
             }
         }
     }
+
+    // Report None buckets to verify boundary preservation
     const totalBuckets = bucketedWidth * bucketedHeight;
     const nonePercentage = (100 * noneCount / totalBuckets).toFixed(2);
     
@@ -1276,7 +1305,7 @@ function computeBucketedData(bucketSize) {
     return {
         width: bucketedWidth,
         height: bucketedHeight,
-        elevation: bucketedElevation,
+        elevationValues: bucketedValues,
         stats: rawElevationData.stats,
         bucketSizeMetersX: bucketSizeMetersX,
         bucketSizeMetersY: bucketSizeMetersY
@@ -1321,7 +1350,15 @@ function rebucketData() {
         return;
     }
 
-    // Not in cache - compute it
+    // Not in cache - fetch its pyramid level (or the full grid) if needed, showing the
+    // nearest cached size until it arrives
+    if (needsFetchForBucketSize(bucketSize)) {
+        fetchBucketSize(bucketSize);
+        showNearestCachedBucketSize(bucketSize);
+        return;
+    }
+
+    // Compute it from the full grid
     appendActivityLog(`Bucketing with multiplier ${bucketSize}x (max aggregation)`);
     const { width, height } = rawElevationData;
 
@@ -1362,7 +1399,7 @@ function rebucketData() {
  * Also generates current optimal size if not in common list
  */
 function pregenerateCommonBucketSizes() {
-    if (!rawElevationData) {
+    if (!rawElevationData || !rawElevationData.elevationValues) {
         console.warn('[BUCKETING] Cannot pregenerate: no raw elevation data');
         return;
     }
@@ -1370,8 +1407,13 @@ function pregenerateCommonBucketSizes() {
     const commonSizes = [1, 2, 3, 4, 5, 6, 7, 8, 16, 32];
     const currentSize = params.bucketSize;
 
+    // Sizes served by pyramid levels are fetched instead of computed
+    const pyramidSizes = new Set(getRegionPyramidLevels(currentRegionId).map(level => level.factor));
+
     // Add current size if not in common list
-    const sizesToGenerate = [...new Set([...commonSizes, currentSize])].sort((a, b) => a - b);
+    const sizesToGenerate = [...new Set([...commonSizes, currentSize])]
+        .filter(size => size === currentSize || !pyramidSizes.has(size))
+        .sort((a, b) => a - b);
 
     console.log(`[BUCKETING] Pregenerating ${sizesToGenerate.length} bucket sizes...`);
     const pregenStart = performance.now();
@@ -1391,16 +1433,308 @@ function pregenerateCommonBucketSizes() {
 
     // Estimate memory usage
     const { width, height } = rawElevationData;
-    const rawSizeMB = (width * height * 8) / (1024 * 1024); // Approximate
+    const rawSizeMB = (width * height * 4) / (1024 * 1024); // Float32 grid
     let cachedSizeMB = rawSizeMB; // Start with raw data
     for (const size of sizesToGenerate) {
         const bucketedWidth = Math.floor(width / size);
         const bucketedHeight = Math.floor(height / size);
-        cachedSizeMB += (bucketedWidth * bucketedHeight * 8) / (1024 * 1024);
+        cachedSizeMB += (bucketedWidth * bucketedHeight * 4) / (1024 * 1024);
     }
     console.log(`[BUCKETING] Estimated cache memory: ~${cachedSizeMB.toFixed(2)} MB`);
 }
 
+/**
+ * Get the pyramid levels the manifest lists for a region (coarsest first)
+ * @param {string} regionId - Region identifier
+ * @returns {Array<Object>} Level entries ({factor, file, width, height, bands})
+ */
+function getRegionPyramidLevels(regionId) {
+    if (!window.ElevationPyramid || !regionsManifest || !regionsManifest.regions) return [];
+    return window.ElevationPyramid.getLevels(regionsManifest.regions[regionId]);
+}
+
+/**
+ * Load the coarsest pyramid level of a region as its first view
+ * The level goes into the bucketed data cache; the returned stand-in for the raw data
+ * carries the base grid's size, bounds and stats but no elevation grid
+ * @param {Object} level - Manifest level entry ({factor, file, ...})
+ * @returns {Promise<Object>} Raw data stand-in ({width, height, bounds, stats, elevationValues: null})
+ */
+async function loadCoarsestPyramidLevel(level) {
+    const levelData = await loadElevationData(`generated/regions/${level.file}`);
+    const baseInfo = Object.assign({}, levelData, {
+        width: levelData.base_width,
+        height: levelData.base_height,
+        elevationValues: null,
+        bandValues: null
+    });
+    const scale = calculateRealWorldScale(baseInfo);
+    bucketedDataCache[`${level.factor}`] = window.ElevationPyramid.toBucketedData(levelData, level.factor, scale, baseInfo.stats);
+    pyramidLevelRequests[level.factor] = Promise.resolve(bucketedDataCache[`${level.factor}`]);
+    console.log(`[BUCKETING] Pyramid level ${level.factor}x loaded first (${level.width}x${level.height})`);
+    return baseInfo;
+}
+
+/**
+ * Pyramid level entry for a bucket size, if the region has one that loaded (or may load)
+ * @param {number} bucketSize - Bucket size
+ * @returns {Object|null} Level entry
+ */
+function pyramidLevelForBucketSize(bucketSize) {
+    if (failedPyramidLevels.has(bucketSize)) return null;
+    return getRegionPyramidLevels(currentRegionId).find(level => level.factor === bucketSize) || null;
+}
+
+/**
+ * Whether a bucket size has to be downloaded before it can be shown
+ * True if a pyramid level serves it, or if the full grid it is computed from is not loaded yet
+ * @param {number} bucketSize - Bucket size
+ * @returns {boolean} True if fetchBucketSize() is needed
+ */
+function needsFetchForBucketSize(bucketSize) {
+    return !!pyramidLevelForBucketSize(bucketSize) || !rawElevationData.elevationValues;
+}
+
+/**
+ * Fetch one pyramid level into the bucketed data cache (once per factor)
+ * @param {string} regionId - Region the level belongs to
+ * @param {Object} level - Manifest level entry ({factor, file, ...})
+ * @returns {Promise<Object>} Processed data for the level
+ */
+function fetchPyramidLevel(regionId, level) {
+    if (!pyramidLevelRequests[level.factor]) {
+        pyramidLevelRequests[level.factor] = loadElevationData(`generated/regions/${level.file}`)
+            .then(levelData => {
+                const data = window.ElevationPyramid.toBucketedData(levelData, level.factor, calculateRealWorldScale(), rawElevationData.stats);
+                if (currentRegionId === regionId) {
+                    bucketedDataCache[`${level.factor}`] = data;
+                    console.log(`[BUCKETING] Pyramid level ${level.factor}x loaded (${level.width}x${level.height})`);
+                }
+                return data;
+            });
+    }
+    return pyramidLevelRequests[level.factor];
+}
+
+/**
+ * Load the full base grid of a region (once), replacing the raw data stand-in
+ * Pregenerates the common bucket sizes afterwards, as loadRegion() does for regions
+ * loaded with their full grid
+ * @param {string} regionId - Region identifier
+ * @returns {Promise<void>}
+ */
+function ensureBaseGrid(regionId) {
+    if (!baseGridPromise) {
+        const filename = regionsManifest.regions[regionId].file;
+        baseGridPromise = loadElevationData(`generated/regions/${filename}`).then(data => {
+            if (currentRegionId !== regionId) return;
+            rawElevationData = data;
+            window.rawElevationData = rawElevationData; // Sync to window
+            console.log(`[BUCKETING] Full grid loaded (${data.width}x${data.height})`);
+            setTimeout(() => {
+                if (currentRegionId === regionId) pregenerateCommonBucketSizes();
+            }, 100);
+        });
+    }
+    return baseGridPromise;
+}
+
+/**
+ * Download what a bucket size needs, then show it if it is still the selected size
+ * Uses the size's pyramid level when there is one, else the full grid
+ * @param {number} bucketSize - Bucket size
+ */
+function fetchBucketSize(bucketSize) {
+    const regionId = currentRegionId;
+    const level = pyramidLevelForBucketSize(bucketSize);
+    const request = level
+        ? fetchPyramidLevel(regionId, level).catch(error => {
+            // Non-fatal: compute this size on the client from the full grid instead
+            console.warn(`[BUCKETING] Could not load pyramid level ${level.factor}x: ${error.message}`);
+            failedPyramidLevels.add(level.factor);
+            delete pyramidLevelRequests[level.factor];
+            return ensureBaseGrid(regionId);
+        })
+        : ensureBaseGrid(regionId);
+
+    appendActivityLog(`Loading ${level ? `pyramid level ${bucketSize}x` : 'full resolution grid'}...`);
+    request.then(() => {
+        if (currentRegionId !== regionId || params.bucketSize !== bucketSize || tiledView) return;
+        rebucketData();
+        recreateTerrain();
+        updateStats();
+    }).catch(error => {
+        console.error(`[BUCKETING] Could not load data for ${bucketSize}x: ${error.message}`);
+    });
+}
+
+/**
+ * Show the cached bucket size closest to the requested one
+ * Drawn at its own cell size, so the terrain keeps its extent until the requested size arrives
+ * @param {number} bucketSize - Requested bucket size
+ */
+function showNearestCachedBucketSize(bucketSize) {
+    const sizes = Object.keys(bucketedDataCache).map(Number);
+    if (sizes.length === 0) return;
+    const nearest = sizes.reduce((best, size) =>
+        Math.abs(size - bucketSize) < Math.abs(best - bucketSize) ? size : best);
+    processedData = Object.assign({}, bucketedDataCache[`${nearest}`], { cellSize: nearest });
+    window.processedData = processedData; // Sync to window
+    computeDerivedGrids();
+    computeAutoStretchStats();
+    appendActivityLog(`Showing ${nearest}x until ${bucketSize}x is loaded`);
+    updateResolutionInfo();
+}
+
+/**
+ * Open the quadtree tile set listed for a region (if any)
+ * @param {string} regionId - Region identifier
+ */
+async function openTileStreamer(regionId) {
+    tileStreamer = null;
+    tiledView = null;
+    const regionInfo = regionsManifest?.regions[regionId];
+    if (!regionInfo || !regionInfo.tiles || !window.TileStreaming) return;
+    try {
+        const streamer = await window.TileStreaming.TileStreamer.open(regionInfo);
+        if (currentRegionId !== regionId) return;
+        tileStreamer = streamer;
+        appendActivityLog(`Tiles available: zoom 0-${streamer.index.max_zoom} (${streamer.index.base_width}x${streamer.index.base_height} px)`);
+    } catch (error) {
+        console.warn(`[TILES] Could not open tile index for ${regionId}: ${error.message}`);
+    }
+}
+
+/**
+ * Bar budget for a tile view: as many cells as the bucketed grid currently shows
+ * @returns {number} Maximum pixels in an assembled tile view
+ */
+function tileViewPixelBudget() {
+    const bucketSize = params.bucketSize;
+    return Math.max(1, Math.floor(rawElevationData.width / bucketSize) * Math.floor(rawElevationData.height / bucketSize));
+}
+
+/**
+ * Render a sub-view of the region from streamed tiles
+ * Loads only the tiles intersecting the view, at the finest zoom that keeps the
+ * grid within the current bar budget, and places the bars where the view sits
+ * in the whole region (world units stay base viewer grid pixels)
+ * @param {Object} view - {x0, y0, x1, y1} in full-resolution tile pixel coordinates
+ * @returns {Promise<boolean>} True if the view was rendered from tiles
+ */
+async function loadTiledView(view) {
+    if (!tileStreamer || !rawElevationData) return false;
+    const regionId = currentRegionId;
+    const streamer = tileStreamer;
+    const startTime = performance.now();
+    const assembled = await streamer.assembleView(view, tileViewPixelBudget());
+    if (currentRegionId !== regionId || tileStreamer !== streamer) return false;
+
+    // One tile level pixel in world units (base viewer grid pixels)
+    const { width, height } = rawElevationData;
+    const f = streamer.factorForZoom(assembled.zoom);
+    const cellSize = f * width / streamer.index.base_width;
+    assembled.cellSize = cellSize;
+    assembled.worldOrigin = {
+        x: (Math.floor(view.x0 / f) + 0.5) * cellSize - width / 2,
+        z: (Math.floor(view.y0 / f) + 0.5) * cellSize - height / 2
+    };
+
+    processedData = assembled;
+    window.processedData = processedData; // Sync to window
+    tiledView = processedData;
+    computeDerivedGrids();
+    computeAutoStretchStats();
+    recreateTerrain();
+    updateColors();
+    const duration = (performance.now() - startTime).toFixed(2);
+    appendActivityLog(`Tiles zoom ${processedData.zoom}: ${processedData.width}x${processedData.height} in ${duration}ms`);
+    return true;
+}
+window.loadTiledView = loadTiledView;
+
+/**
+ * Return from a tile view to the bucketed grid of the whole region
+ */
+function exitTiledView() {
+    if (!tiledView) return;
+    tiledView = null;
+    rebucketData();
+    recreateTerrain();
+    updateColors();
+    appendActivityLog('Tiles: back to full region');
+}
+
+/**
+ * Stream tiles for the area around the camera target when zoomed in
+ * Called from the render loop; checks at most every TILE_VIEW_CHECK_INTERVAL_MS and
+ * only after the camera has stopped. Uses tiles when the finest zoom that fits the
+ * bar budget is finer than the bucketed grid, and reloads only when the zoom changes
+ * or the footprint leaves the loaded view.
+ */
+function updateTiledViewForCamera() {
+    if (!tileStreamer || !rawElevationData || !camera || !controls || !window.terrainGroup) return;
+    if (tileViewLoading || cameraIsMoving || activeMouseButtons !== 0) return;
+    const now = performance.now();
+    if (now - lastTileViewCheck < TILE_VIEW_CHECK_INTERVAL_MS) return;
+    lastTileViewCheck = now;
+
+    // Someone else replaced the data (bucket size change, region load): tile view is gone
+    if (tiledView && processedData !== tiledView) tiledView = null;
+
+    // Visible footprint around the target, in world units
+    const distance = camera.position.distanceTo(controls.target);
+    const halfHeight = distance * Math.tan(THREE.MathUtils.degToRad(camera.fov / 2));
+    const halfWidth = halfHeight * camera.aspect;
+    const local = window.terrainGroup.worldToLocal(controls.target.clone());
+
+    // World units -> full-resolution tile pixels
+    const { width, height } = rawElevationData;
+    const index = tileStreamer.index;
+    const sx = index.base_width / width;
+    const sy = index.base_height / height;
+    const cx = (local.x + width / 2) * sx;
+    const cy = (local.z + height / 2) * sy;
+    const footprint = {
+        x0: Math.max(0, cx - halfWidth * sx),
+        y0: Math.max(0, cy - halfHeight * sy),
+        x1: Math.min(index.base_width, cx + halfWidth * sx),
+        y1: Math.min(index.base_height, cy + halfHeight * sy)
+    };
+    if (footprint.x1 <= footprint.x0 || footprint.y1 <= footprint.y0) {
+        exitTiledView();
+        return;
+    }
+
+    // Tiles only pay off when they are finer than the bucketed grid
+    const zoom = tileStreamer.zoomForView(footprint, tileViewPixelBudget());
+    if (tileStreamer.factorForZoom(zoom) / sx >= params.bucketSize) {
+        exitTiledView();
+        return;
+    }
+
+    const loaded = tiledView && tiledView.view;
+    if (tiledView && tiledView.zoom === zoom &&
+        footprint.x0 >= loaded.x0 && footprint.y0 >= loaded.y0 &&
+        footprint.x1 <= loaded.x1 && footprint.y1 <= loaded.y1) {
+        return;
+    }
+
+    // Load with a margin so small pans stay inside the loaded view
+    const mx = (footprint.x1 - footprint.x0) * TILE_VIEW_MARGIN;
+    const my = (footprint.y1 - footprint.y0) * TILE_VIEW_MARGIN;
+    const view = {
+        x0: Math.max(0, Math.floor(footprint.x0 - mx)),
+        y0: Math.max(0, Math.floor(footprint.y0 - my)),
+        x1: Math.min(index.base_width, Math.ceil(footprint.x1 + mx)),
+        y1: Math.min(index.base_height, Math.ceil(footprint.y1 + my))
+    };
+    tileViewLoading = true;
+    loadTiledView(view)
+        .catch(error => console.warn(`[TILES] Could not load tile view: ${error.message}`))
+        .finally(() => { tileViewLoading = false; });
+}
+
 // Edge markers now in edge-markers.js
 function createEdgeMarkers() {
     return window.EdgeMarkers.create();
@@ -2305,23 +2639,28 @@ function computeDerivedGrids() {
     derivedAspectDeg = null;
     window.derivedSlopeDeg = null; // Sync to window
     window.derivedAspectDeg = null; // Sync to window
-    if (!processedData || !processedData.elevation) return;
+    if (!processedData || !processedData.elevationValues) return;
     const w = processedData.width;
     const h = processedData.height;
     const dx = Math.max(1e-6, processedData.bucketSizeMetersX || 1);
     const dy = Math.max(1e-6, processedData.bucketSizeMetersY || 1);
-    const elev = processedData.elevation;
+    const elev = processedData.elevationValues;
+    // Neighbour value, or fallback where it has no data
+    const at = (i, j, fallback) => {
+        const v = elev[i * w + j];
+        return v === v ? v : fallback;
+    };
     const slope = new Array(h);
     const aspect = new Array(h);
     for (let i = 0; i < h; i++) {
         slope[i] = new Array(w);
         aspect[i] = new Array(w);
         for (let j = 0; j < w; j++) {
-            const zc = elev[i][j] ?? 0;
-            const zl = elev[i][Math.max(0, j - 1)] ?? zc;
-            const zr = elev[i][Math.min(w - 1, j + 1)] ?? zc;
-            const zu = elev[Math.max(0, i - 1)][j] ?? zc;
-            const zd = elev[Math.min(h - 1, i + 1)][j] ?? zc;
+            const zc = at(i, j, 0);
+            const zl = at(i, Math.max(0, j - 1), zc);
+            const zr = at(i, Math.min(w - 1, j + 1), zc);
+            const zu = at(Math.max(0, i - 1), j, zc);
+            const zd = at(Math.min(h - 1, i + 1), j, zc);
             const dzdx = (zr - zl) / (2 * dx);
             const dzdy = (zd - zu) / (2 * dy);
             const gradMag = Math.sqrt(dzdx * dzdx + dzdy * dzdy);
@@ -2406,7 +2745,7 @@ function setView(preset) {
     const gridHeight = processedData.height;
 
     // Use pixel-grid extents to preserve proportions established by the pipeline
-    const bucketMultiplier = params.bucketSize;
+    const bucketMultiplier = getGridCellSize();
     const xExtent = (gridWidth - 1) * bucketMultiplier;
     const zExtent = (gridHeight - 1) * bucketMultiplier;
 
@@ -3141,7 +3480,7 @@ function computeDistanceToDataEdgeMeters(worldX, worldZ) {
     const w = processedData.width;
     const h = processedData.height;
     let xMin, xMax, zMin, zMax;
-    const bucket = params.bucketSize;
+    const bucket = getGridCellSize();
     xMin = -(w - 1) * bucket / 2; xMax = (w - 1) * bucket / 2;
     zMin = -(h - 1) * bucket / 2; zMax = (h - 1) * bucket / 2;
     const { mx, mz } = getMetersScalePerWorldUnit();
@@ -3305,6 +3644,9 @@ function animate() {
     
     // Update camera state in URL (debounced to avoid excessive updates)
     updateCameraStateInURL();
+
+    // Stream full-resolution tiles when zoomed in (regions exported with tiles only)
+    updateTiledViewForCamera();
     
     // Update camera and map info display
     if (window.CameraMapInfo && typeof window.CameraMapInfo.update === 'function') {
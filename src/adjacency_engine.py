@@ -0,0 +1,204 @@
+"""
+Spatial-index-driven region adjacency.
+
+compute_adjacency.py used to compare every region with every other region
+(touches/intersects/equals/intersection on raw 10m geometries) and every
+region with every AREA region: O(N^2) exact geometry operations.
+
+Here candidate pairs come from an STRtree (intersects predicate, evaluated on
+prepared geometries), so exact operations only run on regions that actually
+meet. Neighbor search can be spread over a process pool. Results are
+identical to the pairwise loops, including their ordering:
+
+- find_neighbors: per region, (other_id, direction, border_length) in input
+  order; direction is None for point-only touches (e.g. Four Corners)
+- find_contained: per region, (area_id, reason) in AREA input order
+
+Usage:
+    from src.adjacency_engine import find_neighbors, find_contained
+
+    neighbors = find_neighbors({region_id: geometry, ...}, workers=4)
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely import STRtree
+
+
+# Regions per task when neighbor search runs in a process pool
+NEIGHBOR_CHUNK_SIZE = 8
+
+
+def get_cardinal_direction(from_centroid, to_centroid):
+    """
+    Determine cardinal direction from one point to another.
+    Returns: 'north', 'south', 'east', or 'west'
+
+    Each direction gets a 90-degree sector:
+    - East: -45 to 45 degrees
+    - North: 45 to 135 degrees
+    - West: 135 to 225 degrees (or -135 to -225)
+    - South: 225 to 315 degrees (or -45 to -135)
+    """
+    dx = to_centroid.x - from_centroid.x
+    dy = to_centroid.y - from_centroid.y
+
+    # Calculate angle in degrees (0 = east, 90 = north, etc.)
+    angle = math.degrees(math.atan2(dy, dx))
+
+    # Normalize to 0-360
+    if angle < 0:
+        angle += 360
+
+    # Map to cardinal directions (90-degree sectors)
+    # -45 to 45: east, 45 to 135: north, 135 to 225: west, 225 to 315: south
+    if angle >= 315 or angle < 45:
+        return 'east'
+    elif 45 <= angle < 135:
+        return 'north'
+    elif 135 <= angle < 225:
+        return 'west'
+    else:  # 225 <= angle < 315
+        return 'south'
+
+
+class _NeighborSearch:
+    """STRtree over region geometries (built once per process)."""
+
+    def __init__(self, ids: Sequence[str], geometries: Sequence):
+        self.ids = list(ids)
+        self.geometries = np.array(geometries, dtype=object)
+        shapely.prepare(self.geometries)
+        self.centroids = shapely.centroid(self.geometries)
+        self.tree = STRtree(self.geometries)
+
+    def neighbors_of(self, i: int) -> List[Tuple[str, Optional[str], float]]:
+        geom = self.geometries[i]
+        result = []
+        # Same test as touches() or (intersects() and not equals()); touching implies intersecting
+        for j in sorted(self.tree.query(geom, predicate='intersects')):
+            other = self.geometries[j]
+            if j == i or geom.equals(other):
+                continue
+            # Exclude single-point touches (quadripoints like Four Corners)
+            intersection = geom.intersection(other)
+            if intersection.geom_type in ['Point', 'MultiPoint']:
+                result.append((self.ids[j], None, 0.0))
+                continue
+            border_length = intersection.length if hasattr(intersection, 'length') else 0
+            direction = get_cardinal_direction(self.centroids[i], self.centroids[j])
+            result.append((self.ids[j], direction, border_length))
+        return result
+
+
+# Per-process search state for pool workers
+_worker_search: Optional[_NeighborSearch] = None
+
+
+def _init_worker(ids: Sequence[str], geometries: Sequence) -> None:
+    global _worker_search
+    _worker_search = _NeighborSearch(ids, geometries)
+
+
+def _neighbors_chunk(indices: Sequence[int]) -> List[List[Tuple[str, Optional[str], float]]]:
+    return [_worker_search.neighbors_of(i) for i in indices]
+
+
+def find_neighbors(
+    region_geometries: Dict[str, object],
+    workers: int = 1,
+    subset: Optional[Sequence[str]] = None
+) -> Dict[str, List[Tuple[str, Optional[str], float]]]:
+    """
+    Find the regions sharing a border with each region.
+
+    Args:
+        region_geometries: region_id -> shapely geometry (insertion order is kept)
+        workers: Processes to use (1 = run in this process)
+        subset: Only find the neighbors of these region ids (default: all);
+            candidates are still searched among all regions
+
+    Returns:
+        region_id -> list of (other_id, direction, border_length); direction is
+        None for point-only touches, which are not adjacency
+    """
+    ids = list(region_geometries.keys())
+    geometries = list(region_geometries.values())
+    position = {region_id: i for i, region_id in enumerate(ids)}
+    targets = [position[region_id] for region_id in (subset if subset is not None else ids)]
+
+    if workers <= 1 or len(targets) <= NEIGHBOR_CHUNK_SIZE:
+        search = _NeighborSearch(ids, geometries)
+        results = [search.neighbors_of(i) for i in targets]
+    else:
+        chunks = [targets[k:k + NEIGHBOR_CHUNK_SIZE] for k in range(0, len(targets), NEIGHBOR_CHUNK_SIZE)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(ids, geometries)) as pool:
+            results = [r for chunk_result in pool.map(_neighbors_chunk, chunks) for r in chunk_result]
+
+    return {ids[i]: result for i, result in zip(targets, results)}
+
+
+def find_contained(
+    region_geometries: Dict[str, object],
+    region_bounds: Dict[str, Tuple[float, float, float, float]],
+    area_geometries: Dict[str, object]
+) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Find the AREA regions contained in each region.
+
+    An area counts as contained when its centroid is inside the region, its box
+    overlaps the region (more than touching), or its box lies within the
+    region's configured bounds (fallback for small islands/water features).
+
+    Args:
+        region_geometries: region_id -> shapely geometry
+        region_bounds: region_id -> configured (west, south, east, north)
+        area_geometries: area_id -> bounding box geometry (insertion order is kept)
+
+    Returns:
+        region_id -> list of (area_id, reason); reason is 'centroid + overlap',
+        'centroid', 'intersects' or 'bounds check'
+    """
+    area_ids = list(area_geometries.keys())
+    areas = np.array(list(area_geometries.values()), dtype=object)
+    if len(areas) == 0:
+        return {region_id: [] for region_id in region_geometries}
+    area_centroids = shapely.centroid(areas)
+    area_bounds = shapely.bounds(areas)
+    tree = STRtree(areas)
+
+    contained = {}
+    for region_id, geom in region_geometries.items():
+        shapely.prepare(geom)
+
+        # Geometric tests only for areas meeting the region (a centroid inside also means they meet)
+        centroid_inside = np.zeros(len(areas), dtype=bool)
+        bbox_intersects = np.zeros(len(areas), dtype=bool)
+        for k in tree.query(geom, predicate='intersects'):
+            centroid_inside[k] = geom.contains(area_centroids[k])
+            bbox_intersects[k] = not geom.touches(areas[k])
+
+        bounds_contained = np.zeros(len(areas), dtype=bool)
+        if region_id in region_bounds:
+            reg_west, reg_south, reg_east, reg_north = region_bounds[region_id]
+            bounds_contained = ((area_bounds[:, 0] >= reg_west) & (area_bounds[:, 2] <= reg_east) &
+                                (area_bounds[:, 1] >= reg_south) & (area_bounds[:, 3] <= reg_north))
+
+        result = []
+        for k in np.flatnonzero(centroid_inside | bbox_intersects | bounds_contained):
+            if centroid_inside[k] and bbox_intersects[k]:
+                reason = 'centroid + overlap'
+            elif centroid_inside[k]:
+                reason = 'centroid'
+            elif bbox_intersects[k]:
+                reason = 'intersects'
+            else:
+                reason = 'bounds check'
+            result.append((area_ids[k], reason))
+        contained[region_id] = result
+    return contained
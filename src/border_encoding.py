@@ -0,0 +1,128 @@
+"""
+Compact encoding of border polylines for the viewer (borders_v2).
+
+Border rings used to be written as full-precision float "lon"/"lat" lists.
+Each ring is now one string:
+
+1. Coordinates are quantized to integers on a grid of `scale` units from
+   `origin` (the processed raster's bottom-left corner), with scale a small
+   fraction of the raster pixel size, so quantization is invisible.
+2. Quantized x/y are interleaved and delta-encoded (the first pair is
+   relative to the origin).
+3. Deltas are zigzag-encoded (small negatives -> small positives), written as
+   unsigned LEB128 varints and base64-encoded.
+
+Decoding (js/border-format.js, decode_ring here):
+    x = origin_x + cumsum(dx) * scale,  y = origin_y + cumsum(dy) * scale
+
+Usage:
+    from src.border_encoding import border_encoding, encode_ring
+
+    encoding = border_encoding(bounds, pixel_size)
+    segment = encode_ring(x_coords, y_coords, encoding)
+"""
+
+import base64
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+# Format tag written into _borders.json
+BORDER_FORMAT = "borders_v2"
+
+# Quantization step as a fraction of the raster pixel size
+BORDER_QUANTIZATION_PIXEL_FRACTION = 1.0 / 16
+
+
+def border_encoding(bounds, pixel_size: float) -> Dict:
+    """
+    Get the encoding parameters for a processed raster.
+
+    Args:
+        bounds: Raster bounds (left, bottom, right, top) in the raster CRS
+        pixel_size: Raster pixel size in CRS units (use the smaller of x/y)
+
+    Returns:
+        Encoding dict written into the borders JSON
+    """
+    return {
+        "type": "delta-zigzag-varint-base64",
+        "scale": abs(float(pixel_size)) * BORDER_QUANTIZATION_PIXEL_FRACTION,
+        "origin": [float(bounds[0]), float(bounds[1])],
+    }
+
+
+def _zigzag(values: np.ndarray) -> np.ndarray:
+    return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+
+def _unzigzag(values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.uint64)
+    return ((values >> np.uint64(1)).astype(np.int64)) ^ -((values & np.uint64(1)).astype(np.int64))
+
+
+def _write_varints(values: np.ndarray) -> bytes:
+    out = bytearray()
+    for value in values.tolist():
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def _read_varints(data: bytes) -> np.ndarray:
+    values = []
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = 0
+            shift = 0
+    return np.array(values, dtype=np.uint64)
+
+
+def encode_ring(x_coords: np.ndarray, y_coords: np.ndarray, encoding: Dict) -> str:
+    """
+    Encode one ring/polyline.
+
+    Args:
+        x_coords: X coordinates in the raster CRS
+        y_coords: Y coordinates in the raster CRS
+        encoding: Encoding dict (see border_encoding)
+
+    Returns:
+        Base64 string
+    """
+    scale = encoding["scale"]
+    origin_x, origin_y = encoding["origin"]
+    qx = np.rint((np.asarray(x_coords, dtype=np.float64) - origin_x) / scale).astype(np.int64)
+    qy = np.rint((np.asarray(y_coords, dtype=np.float64) - origin_y) / scale).astype(np.int64)
+    interleaved = np.empty(qx.size * 2, dtype=np.int64)
+    interleaved[0::2] = np.diff(qx, prepend=0)
+    interleaved[1::2] = np.diff(qy, prepend=0)
+    return base64.b64encode(_write_varints(_zigzag(interleaved))).decode('ascii')
+
+
+def decode_ring(segment: str, encoding: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Decode one ring/polyline written by encode_ring.
+
+    Args:
+        segment: Base64 string
+        encoding: Encoding dict (see border_encoding)
+
+    Returns:
+        Tuple of (x_coords, y_coords)
+    """
+    deltas = _unzigzag(_read_varints(base64.b64decode(segment)))
+    scale = encoding["scale"]
+    origin_x, origin_y = encoding["origin"]
+    x = origin_x + np.cumsum(deltas[0::2]) * scale
+    y = origin_y + np.cumsum(deltas[1::2]) * scale
+    return x, y
@@ -0,0 +1,240 @@
+"""
+Columnar, spatially indexed store of Natural Earth borders.
+
+The borders used to be pickled GeoDataFrames (ne_{res}_countries.pkl,
+ne_{res}_admin_1.pkl): every lookup unpickled the whole table, and only one
+resolution was kept in memory, so alternating 10m/110m reloaded it each time.
+
+Each layer/resolution is now a GeoParquet file written with a bbox covering
+column, a row id column and small row groups:
+
+    data/borders/ne_{res}_countries.parquet
+    data/borders/ne_{res}_admin_1.parquet
+
+Per file, a lightweight index (name columns + bboxes + STRtree) is read
+without touching geometries. Name and bbox lookups resolve row ids on the
+index and read only the row groups holding those rows. Indices and full
+tables are kept in in-process LRUs across resolutions.
+
+Legacy .pkl files are migrated on first use.
+
+Usage:
+    from src.border_store import get_border_store
+
+    store = get_border_store()
+    utah = store.rows('10m', 'admin_1', store.find('10m', 'admin_1', admin='United States of America', name='Utah'))
+"""
+
+import os
+import pickle
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from shapely import STRtree, box
+
+
+# Store location (same directory as the Natural Earth downloads)
+BORDER_STORE_DIR = Path("data/borders")
+
+# Name columns kept in each layer's index
+BORDER_LAYERS = {
+    'countries': ('ADMIN',),
+    'admin_1': ('admin', 'name'),
+}
+
+# Rows per Parquet row group (a lookup reads only the groups holding its rows)
+BORDER_ROW_GROUP_SIZE = 16
+
+# In-process LRU capacities (indices are small; 10m tables are not)
+BORDER_INDEX_CACHE_SIZE = 6
+BORDER_TABLE_CACHE_SIZE = 2
+
+# Row id column written into the store
+ROW_COLUMN = 'store_row'
+
+
+class BorderIndex:
+    """Name columns, bboxes and an STRtree for one layer/resolution."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self.rows = frame[ROW_COLUMN].to_numpy()
+        self.tree = STRtree(box(frame['xmin'], frame['ymin'], frame['xmax'], frame['ymax']))
+
+    def query_bbox(self, bbox: Tuple[float, float, float, float]) -> np.ndarray:
+        """Row ids whose bounding box intersects bbox (left, bottom, right, top)."""
+        return self.rows[self.tree.query(box(*bbox))]
+
+
+class BorderStore:
+    """GeoParquet border tables with per-file indices and multi-resolution LRUs."""
+
+    def __init__(self, store_dir: Path = BORDER_STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self._indices: OrderedDict = OrderedDict()
+        self._tables: OrderedDict = OrderedDict()
+
+    def store_path(self, border_resolution: str, layer: str) -> Path:
+        """Get the GeoParquet path of a layer/resolution."""
+        return self.store_dir / f"ne_{border_resolution}_{layer}.parquet"
+
+    def legacy_path(self, border_resolution: str, layer: str) -> Path:
+        """Get the pickled GeoDataFrame path used before the store existed."""
+        return self.store_dir / f"ne_{border_resolution}_{layer}.pkl"
+
+    def exists(self, border_resolution: str, layer: str) -> bool:
+        """Check whether a layer/resolution is in the store (migrating a legacy pickle if present)."""
+        if self.store_path(border_resolution, layer).exists():
+            return True
+        legacy = self.legacy_path(border_resolution, layer)
+        if legacy.exists():
+            print(f"   - Migrating {legacy.name} to GeoParquet...", flush=True)
+            with open(legacy, 'rb') as f:
+                self.write(pickle.load(f), border_resolution, layer)
+            return True
+        return False
+
+    def write(self, gdf: gpd.GeoDataFrame, border_resolution: str, layer: str) -> Path:
+        """
+        Write a layer/resolution to the store (replacing any existing file).
+
+        Args:
+            gdf: Natural Earth GeoDataFrame (EPSG:4326)
+            border_resolution: Natural Earth border detail level
+            layer: 'countries' or 'admin_1'
+
+        Returns:
+            Path of the GeoParquet file
+        """
+        path = self.store_path(border_resolution, layer)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        gdf = gdf.reset_index(drop=True)
+        gdf[ROW_COLUMN] = np.arange(len(gdf), dtype=np.int32)
+        tmp_path = path.with_suffix('.parquet.tmp')
+        gdf.to_parquet(tmp_path, index=False, write_covering_bbox=True, row_group_size=BORDER_ROW_GROUP_SIZE)
+        os.replace(tmp_path, path)
+
+        key = (border_resolution, layer)
+        self._indices.pop(key, None)
+        self._tables.pop(key, None)
+        return path
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key, value, capacity: int) -> None:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > capacity:
+            cache.popitem(last=False)
+
+    def index(self, border_resolution: str, layer: str) -> BorderIndex:
+        """
+        Get the index of a layer/resolution (name columns, bboxes, STRtree).
+
+        Reads no geometries. The layer must be in the store.
+        """
+        key = (border_resolution, layer)
+        if key in self._indices:
+            self._indices.move_to_end(key)
+            return self._indices[key]
+
+        import pyarrow.parquet as pq
+        table = pq.read_table(self.store_path(border_resolution, layer),
+                              columns=[ROW_COLUMN, 'bbox', *BORDER_LAYERS[layer]])
+        frame = table.drop(['bbox']).to_pandas()
+        bbox = table.column('bbox').combine_chunks()
+        for field in ('xmin', 'ymin', 'xmax', 'ymax'):
+            frame[field] = bbox.field(field).to_numpy(zero_copy_only=False)
+
+        border_index = BorderIndex(frame)
+        self._remember(self._indices, key, border_index, BORDER_INDEX_CACHE_SIZE)
+        return border_index
+
+    def table(self, border_resolution: str, layer: str) -> gpd.GeoDataFrame:
+        """Get a whole layer/resolution as a GeoDataFrame. The layer must be in the store."""
+        key = (border_resolution, layer)
+        if key in self._tables:
+            self._tables.move_to_end(key)
+            return self._tables[key]
+        gdf = gpd.read_parquet(self.store_path(border_resolution, layer)).drop(columns=[ROW_COLUMN])
+        self._remember(self._tables, key, gdf, BORDER_TABLE_CACHE_SIZE)
+        return gdf
+
+    def rows(self, border_resolution: str, layer: str, row_ids: Sequence[int]) -> gpd.GeoDataFrame:
+        """
+        Get the given rows of a layer/resolution, in row order.
+
+        Served from the cached full table when loaded; otherwise only the row
+        groups holding the rows are read.
+        """
+        row_ids = sorted({int(r) for r in row_ids})
+        key = (border_resolution, layer)
+        if key in self._tables:
+            return self._tables[key].iloc[row_ids]
+        if not row_ids:
+            gdf = gpd.read_parquet(self.store_path(border_resolution, layer), filters=[(ROW_COLUMN, '<', 0)])
+        else:
+            gdf = gpd.read_parquet(self.store_path(border_resolution, layer),
+                                   filters=[(ROW_COLUMN, 'in', row_ids)])
+        gdf = gdf.sort_values(ROW_COLUMN)
+        gdf.index = gdf[ROW_COLUMN].to_numpy()
+        return gdf.drop(columns=[ROW_COLUMN])
+
+    def find(self, border_resolution: str, layer: str, match: str = 'exact', **names: str) -> List[int]:
+        """
+        Get the row ids whose name columns match the given values.
+
+        Args:
+            border_resolution: Natural Earth border detail level
+            layer: 'countries' or 'admin_1'
+            match: 'exact', 'lower' (case-insensitive equality) or 'contains'
+                (case-insensitive substring)
+            **names: Column name -> value (columns from BORDER_LAYERS)
+
+        Returns:
+            Row ids in row order
+        """
+        frame = self.index(border_resolution, layer).frame
+        selected = np.ones(len(frame), dtype=bool)
+        for column, value in names.items():
+            values = frame[column]
+            if match == 'contains':
+                selected &= values.str.contains(value, case=False, na=False, regex=False).to_numpy()
+            elif match == 'lower':
+                selected &= (values.str.lower() == value.lower()).to_numpy()
+            else:
+                selected &= (values == value).to_numpy()
+        return frame[ROW_COLUMN][selected].tolist()
+
+    def query_bbox(self, border_resolution: str, layer: str,
+                   bbox: Tuple[float, float, float, float]) -> gpd.GeoDataFrame:
+        """
+        Get the rows whose geometry intersects a bounding box.
+
+        Candidates come from the STRtree; only those rows are read and tested exactly.
+
+        Args:
+            border_resolution: Natural Earth border detail level
+            layer: 'countries' or 'admin_1'
+            bbox: (left, bottom, right, top) in lon/lat
+
+        Returns:
+            GeoDataFrame of intersecting rows
+        """
+        candidates = self.rows(border_resolution, layer, self.index(border_resolution, layer).query_bbox(bbox))
+        return candidates[candidates.intersects(box(*bbox))]
+
+
+# Global instance
+_border_stores: Dict[str, BorderStore] = {}
+
+
+def get_border_store(store_dir: Optional[Path] = None) -> BorderStore:
+    """Get or create the border store for a directory (default BORDER_STORE_DIR)."""
+    key = str(Path(store_dir or BORDER_STORE_DIR))
+    if key not in _border_stores:
+        _border_stores[key] = BorderStore(Path(key))
+    return _border_stores[key]
@@ -6,7 +6,6 @@ CRITICAL: All methods use **border_resolution** parameter (NOT "resolution").
 This refers to Natural Earth boundary detail level (10m/50m/110m), which is
 COMPLETELY SEPARATE from elevation data resolution (10m/30m/90m).
 """
-import pickle
 from pathlib import Path
 from typing import Optional, Union, List, Tuple
 import numpy as np
@@ -29,12 +28,33 @@ class BorderManager:
         Args:
             cache_dir: Directory for cached Natural Earth border data (canonical reference data)
         """
+        from src.border_store import get_border_store
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._world_data = None
-        self._resolution = None
-        self._state_data = None
-        self._state_resolution = None
+        self.store = get_border_store(self.cache_dir)
+    
+    def _ensure_layer(self, layer: str, border_resolution: str, force_reload: bool = False) -> None:
+        """
+        Make sure a Natural Earth layer is in the border store, downloading it if needed.
+        
+        Args:
+            layer: 'countries' (admin_0) or 'admin_1' (states/provinces)
+            border_resolution: Natural Earth border detail level ('10m', '50m', or '110m')
+            force_reload: Force re-download even if cached
+        """
+        if not force_reload and self.store.exists(border_resolution, layer):
+            return
+        
+        if layer == 'countries':
+            print(f"   - Downloading Natural Earth {border_resolution} borders...")
+            ne_url = f"https://naciscdn.org/naturalearth/{border_resolution}/cultural/ne_{border_resolution}_admin_0_countries.zip"
+        else:
+            print(f"   - Downloading Natural Earth {border_resolution} admin_1 (states/provinces)...")
+            ne_url = f"https://naciscdn.org/naturalearth/{border_resolution}/cultural/ne_{border_resolution}_admin_1_states_provinces.zip"
+        
+        # Cache for future use
+        cache_file = self.store.write(gpd.read_file(ne_url), border_resolution, layer)
+        print(f"   - Cached borders to: {cache_file}")
         
     def load_borders(self, border_resolution: str = '110m', force_reload: bool = False) -> gpd.GeoDataFrame:
         """
@@ -50,36 +70,15 @@ class BorderManager:
         Returns:
             GeoDataFrame with country borders
         """
-        cache_file = self.cache_dir / f"ne_{border_resolution}_countries.pkl"
-        
-        # Return cached data if available and not forcing reload
-        if not force_reload and cache_file.exists():
-            if self._world_data is not None and self._resolution == border_resolution:
-                return self._world_data
-            
-            print(f"   - Loading borders from cache: {cache_file}")
-            with open(cache_file, 'rb') as f:
-                self._world_data = pickle.load(f)
-                self._resolution = border_resolution
-                return self._world_data
-        
-        # Download from Natural Earth
-        print(f"   - Downloading Natural Earth {border_resolution} borders...")
-        ne_url = f"https://naciscdn.org/naturalearth/{border_resolution}/cultural/ne_{border_resolution}_admin_0_countries.zip"
-        self._world_data = gpd.read_file(ne_url)
-        self._resolution = border_resolution
-        
-        # Cache for future use
-        with open(cache_file, 'wb') as f:
-            pickle.dump(self._world_data, f)
-        print(f"   - Cached borders to: {cache_file}")
-        
-        return self._world_data
+        self._ensure_layer('countries', border_resolution, force_reload)
+        return self.store.table(border_resolution, 'countries')
     
     def get_country(self, country_name: str, border_resolution: str = '110m') -> Optional[gpd.GeoDataFrame]:
         """
         Get border data for a specific country.
         
+        Only the matching rows are read from the border store.
+        
         Args:
             country_name: Country name (e.g., 'United States of America', 'Canada', 'Mexico')
             border_resolution: Natural Earth border detail level ('10m', '50m', or '110m')
@@ -87,23 +86,23 @@ class BorderManager:
         Returns:
             GeoDataFrame for the country, or None if not found
         """
-        world = self.load_borders(border_resolution)
+        self._ensure_layer('countries', border_resolution)
         
         # Try exact match first
-        country = world[world.ADMIN == country_name]
+        rows = self.store.find(border_resolution, 'countries', ADMIN=country_name)
         
         # Try case-insensitive partial match if exact match fails
-        if country.empty:
-            country = world[world.ADMIN.str.contains(country_name, case=False, na=False)]
+        if not rows:
+            rows = self.store.find(border_resolution, 'countries', match='contains', ADMIN=country_name)
         
-        if country.empty:
-            available = sorted(world.ADMIN.unique())
+        if not rows:
+            available = self.list_countries(border_resolution)
             print(f"\n[!] Country '{country_name}' not found.")
             print(f"    Available countries: {', '.join(available[:10])}...")
             print(f"    (showing first 10 of {len(available)} countries)")
             return None
         
-        return country
+        return self.store.rows(border_resolution, 'countries', rows)
     
     def list_countries(self, border_resolution: str = '110m') -> List[str]:
         """
@@ -115,14 +114,16 @@ class BorderManager:
         Returns:
             Sorted list of country names
         """
-        world = self.load_borders(border_resolution)
-        return sorted(world.ADMIN.unique())
+        self._ensure_layer('countries', border_resolution)
+        return sorted(self.store.index(border_resolution, 'countries').frame.ADMIN.unique())
     
     def get_countries_in_bbox(self, bbox: Tuple[float, float, float, float], 
                             border_resolution: str = '110m') -> gpd.GeoDataFrame:
         """
         Get all countries that intersect with a bounding box.
         
+        Candidates come from the border store's spatial index; only those are read.
+        
         Args:
             bbox: Bounding box as (left, bottom, right, top) in lon/lat
             border_resolution: Natural Earth border detail level ('10m', '50m', or '110m')
@@ -130,15 +131,8 @@ class BorderManager:
         Returns:
             GeoDataFrame with countries in the bbox
         """
-        from shapely.geometry import box
-        
-        world = self.load_borders(border_resolution)
-        bbox_geom = box(*bbox)
-        
-        # Find countries that intersect the bbox
-        intersecting = world[world.intersects(bbox_geom)]
-        
-        return intersecting
+        self._ensure_layer('countries', border_resolution)
+        return self.store.query_bbox(border_resolution, 'countries', bbox)
     
     def mask_raster_to_country(self, raster_src: rasterio.DatasetReader, 
                               country_name: Union[str, List[str]], 
@@ -159,6 +153,15 @@ class BorderManager:
         if isinstance(country_name, str):
             country_name = [country_name]
         
+        # Single country: rasterized mask is reused from the mask store
+        if len(country_name) == 1 and not invert:
+            from src.mask_store import mask_dataset_to_boundary
+            result = mask_dataset_to_boundary(raster_src, country_name[0], "country", border_resolution)
+            if result is None:
+                raise ValueError(f"No valid countries found from: {country_name}")
+            out_image, out_transform = result
+            return out_image.astype(np.float32).filled(np.nan)[0], out_transform
+        
         # Get country geometries
         countries = []
         for name in country_name:
@@ -264,36 +267,15 @@ class BorderManager:
         Returns:
             GeoDataFrame with state/province borders
         """
-        cache_file = self.cache_dir / f"ne_{border_resolution}_admin_1.pkl"
-        
-        # Return cached data if available and not forcing reload
-        if not force_reload and cache_file.exists():
-            if self._state_data is not None and self._state_resolution == border_resolution:
-                return self._state_data
-            
-            print(f"   - Loading state borders from cache: {cache_file}")
-            with open(cache_file, 'rb') as f:
-                self._state_data = pickle.load(f)
-                self._state_resolution = border_resolution
-                return self._state_data
-        
-        # Download from Natural Earth
-        print(f"   - Downloading Natural Earth {border_resolution} admin_1 (states/provinces)...")
-        ne_url = f"https://naciscdn.org/naturalearth/{border_resolution}/cultural/ne_{border_resolution}_admin_1_states_provinces.zip"
-        self._state_data = gpd.read_file(ne_url)
-        self._state_resolution = border_resolution
-        
-        # Cache for future use
-        with open(cache_file, 'wb') as f:
-            pickle.dump(self._state_data, f)
-        print(f"   - Cached state borders to: {cache_file}")
-        
-        return self._state_data
+        self._ensure_layer('admin_1', border_resolution, force_reload)
+        return self.store.table(border_resolution, 'admin_1')
     
     def get_state(self, country_name: str, state_name: str, border_resolution: str = '110m') -> Optional[gpd.GeoDataFrame]:
         """
         Get border data for a specific state/province.
         
+        Only the matching rows are read from the border store.
+        
         Args:
             country_name: Country name (e.g., 'United States of America')
             state_name: State/province name (e.g., 'Tennessee', 'California')
@@ -302,20 +284,19 @@ class BorderManager:
         Returns:
             GeoDataFrame for the state, or None if not found
         """
-        states = self.load_state_borders(border_resolution)
+        self._ensure_layer('admin_1', border_resolution)
         
         # Try exact match first
-        state = states[(states['admin'] == country_name) & (states['name'] == state_name)]
+        rows = self.store.find(border_resolution, 'admin_1', admin=country_name, name=state_name)
         
         # Try case-insensitive match if exact match fails
-        if state.empty:
-            state = states[
-                (states['admin'].str.lower() == country_name.lower()) & 
-                (states['name'].str.lower() == state_name.lower())
-            ]
+        if not rows:
+            rows = self.store.find(border_resolution, 'admin_1', match='lower',
+                                   admin=country_name, name=state_name)
         
-        if state.empty:
+        if not rows:
             # Show available states in this country
+            states = self.store.index(border_resolution, 'admin_1').frame
             available_states = states[states['admin'].str.contains(country_name, case=False, na=False)]['name'].tolist()
             if available_states:
                 print(f"\n[!] State '{state_name}' not found in '{country_name}'.")
@@ -325,7 +306,7 @@ class BorderManager:
                 print(f"\n[!] Country '{country_name}' not found in state database.")
             return None
         
-        return state
+        return self.store.rows(border_resolution, 'admin_1', rows)
     
     def list_states_in_country(self, country_name: str, border_resolution: str = '110m') -> List[str]:
         """
@@ -338,7 +319,8 @@ class BorderManager:
         Returns:
             Sorted list of state/province names
         """
-        states = self.load_state_borders(border_resolution)
+        self._ensure_layer('admin_1', border_resolution)
+        states = self.store.index(border_resolution, 'admin_1').frame
         
         # Filter by country (case-insensitive)
         country_states = states[states['admin'].str.lower() == country_name.lower()]
@@ -361,28 +343,14 @@ class BorderManager:
         Returns:
             Tuple of (masked_array, transform)
         """
-        # Get state geometry
-        state = self.get_state(country_name, state_name, border_resolution)
-        
-        if state is None or state.empty:
+        # Rasterized mask is reused from the mask store
+        from src.mask_store import mask_dataset_to_boundary
+        result = mask_dataset_to_boundary(raster_src, f"{country_name}/{state_name}", "state", border_resolution)
+        if result is None:
             raise ValueError(f"State '{state_name}' not found in '{country_name}'")
         
-        # Reproject to raster CRS
-        state_reproj = state.to_crs(raster_src.crs)
-        
-        # Convert to geometries
-        geoms = [mapping(geom) for geom in state_reproj.geometry]
-        
-        # Mask the raster and crop to actual state bounds
-        out_image, out_transform = rasterio_mask(
-            raster_src, 
-            geoms, 
-            crop=True,  # Crop to minimum bounding box containing the state
-            nodata=np.nan,
-            invert=False
-        )
-        
-        return out_image[0], out_transform
+        out_image, out_transform = result
+        return out_image.astype(np.float32).filled(np.nan)[0], out_transform
 
 
 def get_border_manager() -> BorderManager:
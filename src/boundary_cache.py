@@ -0,0 +1,223 @@
+"""
+Persistent cache of prepared boundary geometries.
+
+Clipping, the fused warp and border export all turn a Natural Earth boundary
+into the same thing: the geometry reprojected to the raster CRS, unioned, and
+(optionally) simplified. With 10m detail a country can have hundreds of
+thousands of vertices, so this work is done once per key and stored as WKB:
+
+    key = (boundary_name, boundary_type, border_resolution, target CRS, tolerance,
+           Natural Earth source file identity)
+
+The source file identity (size, mtime_ns, inode of the border store file the
+boundary is read from) makes entries written before `download_borders.py
+--force` miss afterwards instead of serving the old borders. A boundary whose
+reprojection fails is returned unprojected but never cached.
+
+The tolerance is tied to the raster pixel size (tolerance_for_pixel_size), so
+a boundary is never simplified by more than the raster can resolve, and
+repeated clips/exports of the same raster hit the same cache entry.
+
+Usage:
+    from src.boundary_cache import get_prepared_boundary, tolerance_for_pixel_size
+
+    geom = get_prepared_boundary("United States of America/Utah", "state", "10m",
+                                 src.crs, tolerance_for_pixel_size(src.res[0]))
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from shapely import wkb
+from shapely.ops import unary_union
+
+
+# Cache location (WKB files, one per key)
+BOUNDARY_CACHE_DIR = Path("data/.cache/boundaries")
+
+# Bump when the preparation steps change (invalidates all cached geometries)
+BOUNDARY_CACHE_VERSION = 1
+
+# Simplification tolerance as a fraction of the raster pixel size
+BOUNDARY_SIMPLIFY_PIXEL_FRACTION = 0.5
+
+
+def tolerance_for_pixel_size(pixel_size: float) -> float:
+    """
+    Get the simplification tolerance for a raster pixel size.
+
+    Args:
+        pixel_size: Pixel size in target CRS units (use the smaller of x/y)
+
+    Returns:
+        Tolerance in target CRS units
+    """
+    return abs(float(pixel_size)) * BOUNDARY_SIMPLIFY_PIXEL_FRACTION
+
+
+def _crs_key(target_crs) -> str:
+    from rasterio.crs import CRS
+    return CRS.from_user_input(target_crs).to_string()
+
+
+def boundary_source_identity(boundary_type: str, border_resolution: str) -> Optional[List[int]]:
+    """
+    Get the identity of the Natural Earth store file a boundary is read from.
+
+    Args:
+        boundary_type: "country" or "state"
+        border_resolution: Natural Earth border resolution ('10m', '50m', '110m')
+
+    Returns:
+        [size, mtime_ns, inode], or None if the layer has not been downloaded
+    """
+    from src.border_store import get_border_store
+    from src.file_hash import file_identity
+    layer = 'admin_1' if boundary_type == "state" else 'countries'
+    try:
+        return list(file_identity(get_border_store().store_path(border_resolution, layer)))
+    except OSError:
+        return None
+
+
+class BoundaryGeometryCache:
+    """WKB files of prepared boundaries, plus an in-process memo."""
+
+    def __init__(self, cache_dir: Path = BOUNDARY_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._memory: Dict[str, object] = {}
+
+    def cache_path(self, boundary_name: str, boundary_type: str, border_resolution: str,
+                   target_crs, tolerance: float) -> Path:
+        """Get the WKB path for a cache key."""
+        key = json.dumps({
+            "version": BOUNDARY_CACHE_VERSION,
+            "boundary_name": boundary_name,
+            "boundary_type": boundary_type,
+            "border_resolution": border_resolution,
+            "crs": _crs_key(target_crs),
+            "tolerance": f"{tolerance:.6g}",
+            "source": boundary_source_identity(boundary_type, border_resolution),
+        }, sort_keys=True)
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+        slug = re.sub(r'[^a-z0-9]+', '_', boundary_name.lower()).strip('_')
+        return self.cache_dir / f"{slug}_{border_resolution}_{digest}.wkb"
+
+    def get(
+        self,
+        boundary_name: str,
+        boundary_type: str,
+        border_resolution: str,
+        target_crs,
+        tolerance: float = 0.0,
+        boundary_required: bool = False
+    ):
+        """
+        Get a boundary reprojected to target_crs, unioned and simplified.
+
+        Args:
+            boundary_name: Boundary name ("Country" or "Country/State")
+            boundary_type: "country" or "state"
+            border_resolution: Natural Earth border resolution ('10m', '50m', '110m')
+            target_crs: CRS of the raster the boundary is applied to
+            tolerance: Simplification tolerance in target CRS units (0 = none)
+            boundary_required: Raise PipelineError instead of returning None when not found
+
+        Returns:
+            Shapely geometry, or None if the boundary was not found
+        """
+        path = self.cache_path(boundary_name, boundary_type, border_resolution, target_crs, tolerance)
+        key = path.name
+        if key in self._memory:
+            return self._memory[key]
+        if path.exists():
+            try:
+                geom = wkb.loads(path.read_bytes())
+                self._memory[key] = geom
+                return geom
+            except Exception:
+                # Corrupted entry - prepare again
+                pass
+
+        from src.pipeline import load_boundary_geometry
+        geometry_gdf = load_boundary_geometry(boundary_name, boundary_type, border_resolution, boundary_required)
+        if geometry_gdf is None:
+            return None
+
+        print(f"  Preparing boundary geometry ({_crs_key(target_crs)}, tolerance {tolerance:.6g})...", flush=True)
+        try:
+            geometry_gdf = geometry_gdf.to_crs(target_crs)
+            reprojected = True
+        except Exception as e:
+            print(f"  Warning: Could not reproject boundary to {_crs_key(target_crs)} ({e}); not caching it", flush=True)
+            reprojected = False
+        geom = unary_union(geometry_gdf.geometry)
+        if tolerance > 0:
+            geom = geom.simplify(tolerance, preserve_topology=True)
+        if not reprojected:
+            return geom
+
+        # Loading may have downloaded the source layer: key on its identity now
+        path = self.cache_path(boundary_name, boundary_type, border_resolution, target_crs, tolerance)
+        key = path.name
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.wkb.tmp')
+        tmp_path.write_bytes(wkb.dumps(geom))
+        os.replace(tmp_path, path)
+        self._memory[key] = geom
+        return geom
+
+
+# Global instance
+_boundary_cache = None
+
+
+def get_boundary_cache() -> BoundaryGeometryCache:
+    """Get or create the global boundary geometry cache."""
+    global _boundary_cache
+    if _boundary_cache is None:
+        _boundary_cache = BoundaryGeometryCache()
+    return _boundary_cache
+
+
+def get_prepared_boundary(
+    boundary_name: str,
+    boundary_type: str,
+    border_resolution: str,
+    target_crs,
+    tolerance: float = 0.0,
+    boundary_required: bool = False
+):
+    """Get a prepared boundary from the global cache (see BoundaryGeometryCache.get)."""
+    return get_boundary_cache().get(boundary_name, boundary_type, border_resolution,
+                                    target_crs, tolerance, boundary_required)
+
+
+def geometry_rings(geom) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Get the exterior and interior rings of a (Multi)Polygon as coordinate arrays.
+
+    Args:
+        geom: Shapely Polygon, MultiPolygon or GeometryCollection
+
+    Returns:
+        List of (x_coords, y_coords) tuples, one per ring
+    """
+    if geom.geom_type == 'Polygon':
+        polygons = [geom]
+    elif geom.geom_type in ('MultiPolygon', 'GeometryCollection'):
+        polygons = [g for g in geom.geoms if g.geom_type == 'Polygon']
+    else:
+        return []
+
+    rings = []
+    for poly in polygons:
+        for ring in [poly.exterior, *poly.interiors]:
+            x, y = ring.xy
+            rings.append((np.array(x), np.array(y)))
+    return rings
@@ -10,3 +10,41 @@ This is the single source of truth for default values.
 # For non-square regions, dimensions are calculated to preserve aspect ratio while targeting this total
 # Higher = more detail but larger files and slower rendering
 DEFAULT_TARGET_TOTAL_PIXELS = 3* 1024**2  # 1,048,576 pixels
+
+# Peak memory budget (MB) for mosaicking tiles in merge_tiles
+# The merged output is written in fixed-size windows sized to fit this budget,
+# reading only the overlapping window of each source tile per output window
+DEFAULT_MERGE_MEMORY_BUDGET_MB = 512
+
+# Run pipeline Stages 6-8 (crop/clip, reproject, downsample) as one fused warp
+# from raw data straight to the target-size metric grid, skipping the
+# intermediate clipped/reprojected GeoTIFFs. Set False for the staged path.
+DEFAULT_FUSED_WARP = True
+
+# Viewer export format written by run_pipeline
+# 'export_v3': binary .bin.gz (JSON header + int16 payload, see src/export_binary.py)
+# 'export_v2': nested-array JSON + .json.gz
+DEFAULT_EXPORT_FORMAT = "export_v3"
+
+# Pyramid levels written next to export_v3 files (bucket factors of the base grid,
+# e.g. 2048px base -> 1024, 512, 256). Empty tuple disables the pyramid.
+DEFAULT_PYRAMID_FACTORS = (2, 4, 8)
+
+# Tile width/height (pixels) for the quadtree tile export (run_pipeline tiled_export=True)
+DEFAULT_TILE_SIZE = 256
+
+# Tiles downloaded concurrently by download_tiles_for_region
+# (per-source caps: SourceCapability.max_in_flight; OpenTopography spacing: rate_limit.py)
+DEFAULT_DOWNLOAD_WORKERS = 8
+
+# Shared tile cache refresh policy (src/tile_cache.py): cached source tiles older
+# than this many days are re-downloaded. None = keep until checksum fails or
+# download_tiles_for_region(refresh=True) is used (DEM releases rarely change).
+TILE_CACHE_MAX_AGE_DAYS = None
+
+# Negative tile cache (src/tile_cache.py): a source that had no data for a tile
+# (404 - ocean/void) is not asked for it again for this many days.
+NEGATIVE_TILE_CACHE_TTL_DAYS = 30
+
+# Skip 1-degree tiles with no land in the Natural Earth land mask (src/land_mask.py)
+LAND_MASK_PREFILTER = True
@@ -23,7 +23,6 @@ from typing import Optional, Dict, Any, List, Literal
 from datetime import datetime
 from pathlib import Path
 import json
-import hashlib
 import numpy as np
 
 
@@ -581,17 +580,17 @@ def compute_file_hash(filepath: Path) -> str:
     """
     Compute SHA256 hash of a file.
     
+    Uses the shared hashing service (src/file_hash.py) so unchanged files
+    are served from the persistent hash index.
+    
     Args:
         filepath: Path to the file
         
     Returns:
         Hex string of the hash
     """
-    sha256_hash = hashlib.sha256()
-    with open(filepath, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    from src.file_hash import compute_file_hash as cached_file_hash
+    return cached_file_hash(filepath, 'sha256')
 
 
 # ============================================================================
@@ -12,6 +12,8 @@ Quality: Often superior to SRTM, especially in mountainous terrain
 from pathlib import Path
 from typing import Tuple
 import requests
+from src.downloaders.resumable import download_resumable
+from src.tile_cache import TileNotAvailableError
 import time
 
 from src.downloaders.rate_limit import (
@@ -31,7 +33,8 @@ def download_aw3d30_tile(
     tile_bounds: Tuple[float, float, float, float],
     output_path: Path,
     api_key: str = None,
-    timeout: int = 120
+    timeout: int = 120,
+    raise_on_missing: bool = False
 ) -> bool:
     """
     Download a single 1×1 degree AW3D30 tile via OpenTopography.
@@ -41,6 +44,7 @@ def download_aw3d30_tile(
         output_path: Where to save the tile
         api_key: OpenTopography API key (loads from settings if not provided)
         timeout: Download timeout in seconds
+        raise_on_missing: Raise TileNotAvailableError on 404 instead of returning False
         
     Returns:
         True if successful, False otherwise
@@ -74,7 +78,9 @@ def download_aw3d30_tile(
         # Add small delay to avoid hammering API
         time.sleep(0.5)
         
-        response = requests.get(url, params=params, stream=True, timeout=timeout)
+        # Download to a temporary file first (partial transfers resume)
+        temp_path = output_path.with_suffix('.tmp')
+        response = download_resumable(url, temp_path, params=params, timeout=timeout)
         
         # Handle rate limiting
         if response.status_code == 401:
@@ -89,25 +95,18 @@ def download_aw3d30_tile(
         if response.status_code == 404:
             # Tile doesn't exist (outside coverage area or ocean)
             print(f"    Tile not available (404)")
+            if raise_on_missing:
+                raise TileNotAvailableError(f"404: AW3D30 {tile_bounds}")
             return False
         
         if response.status_code >= 500:
             print(f"    ERROR: Server error ({response.status_code})")
             return False
         
-        if response.status_code != 200:
+        if not response.ok:
             print(f"    ERROR: Unexpected status {response.status_code}")
             return False
         
-        # Save to temporary file first
-        temp_path = output_path.with_suffix('.tmp')
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(temp_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-        
         # Verify file
         if temp_path.stat().st_size < 1000:
             print(f"    ERROR: File too small ({temp_path.stat().st_size} bytes)")
@@ -130,7 +129,7 @@ def download_aw3d30_tile(
         record_successful_request()
         return True
         
-    except AW3D30RateLimitError:
+    except (AW3D30RateLimitError, TileNotAvailableError):
         raise
     except requests.Timeout:
         print(f"    ERROR: Timeout after {timeout}s")
@@ -11,12 +11,36 @@ Coverage:
 - GLO-10: Europe only (38°N to 60°N, 13°W to 32°E)
 - GLO-30: Global
 - GLO-90: Global
+
+Windowed fetch: when a region covers only a small part of a tile (narrow AREA
+regions), download_copernicus_s3_window reads the COG over HTTP with GDAL's
+/vsicurl/ - ranged GETs for the header/IFD and only the internal tiles that
+intersect the bounds - and writes a compact sub-tile. A few-km region then
+transfers kilobytes instead of the whole 1×1 degree file.
 """
 
+import hashlib
+import os
 from pathlib import Path
 from typing import Tuple, Optional
 import requests
-from src.tile_geometry import tile_filename_from_bounds
+from src.downloaders.resumable import download_resumable
+from src.tile_cache import TileNotAvailableError
+from src.tile_geometry import pixel_window_for_bounds, tile_filename_from_bounds
+
+
+# Use a windowed fetch when the region covers less than this fraction of a tile
+COG_WINDOW_MAX_FRACTION = 0.25
+
+# GDAL settings for reading COGs over HTTP (no directory listing, merged ranges, retries)
+COG_GDAL_OPTIONS = {
+    'GDAL_DISABLE_READDIR_ON_OPEN': 'EMPTY_DIR',
+    'CPL_VSIL_CURL_ALLOWED_EXTENSIONS': '.tif',
+    'GDAL_HTTP_MERGE_CONSECUTIVE_RANGES': 'YES',
+    'GDAL_HTTP_MULTIPLEX': 'YES',
+    'GDAL_HTTP_MAX_RETRY': '4',
+    'GDAL_HTTP_RETRY_DELAY': '1',
+}
 
 
 def format_lat_band(lat: float) -> str:
@@ -103,7 +127,8 @@ def download_copernicus_s3_tile(
     tile_bounds: Tuple[float, float, float, float],
     resolution: int,
     output_path: Path,
-    timeout: int = 120
+    timeout: int = 120,
+    raise_on_missing: bool = False
 ) -> bool:
     """
     Download a single 1×1 degree Copernicus tile from S3.
@@ -113,6 +138,7 @@ def download_copernicus_s3_tile(
         resolution: 10, 30, or 90 meters
         output_path: Where to save the tile
         timeout: Download timeout in seconds
+        raise_on_missing: Raise TileNotAvailableError on 404 instead of returning False
         
     Returns:
         True if successful, False otherwise
@@ -121,13 +147,16 @@ def download_copernicus_s3_tile(
     url = construct_copernicus_url(tile_bounds, resolution)
     
     try:
-        # Download with streaming to handle large files
-        response = requests.get(url, stream=True, timeout=timeout)
+        # Download to a temporary file first (partial transfers resume)
+        temp_path = output_path.with_suffix('.tmp')
+        response = download_resumable(url, temp_path, timeout=timeout)
         
         # Handle different response codes
         if response.status_code == 404:
             # Tile doesn't exist (ocean, no data) - this is expected for some tiles
             print(f"    Tile not available (404): {url}")
+            if raise_on_missing:
+                raise TileNotAvailableError(f"404: {url}")
             return False
         
         if response.status_code == 403:
@@ -140,20 +169,10 @@ def download_copernicus_s3_tile(
             print(f"    ERROR: Server error ({response.status_code}): {url}")
             return False
         
-        if response.status_code != 200:
+        if not response.ok:
             print(f"    ERROR: Unexpected status {response.status_code}: {url}")
             return False
         
-        # Save to temporary file first
-        temp_path = output_path.with_suffix('.tmp')
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Write file in chunks
-        with open(temp_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-        
         # Verify file is valid (basic size check)
         if temp_path.stat().st_size < 1000:
             print(f"    ERROR: Downloaded file too small ({temp_path.stat().st_size} bytes)")
@@ -177,6 +196,8 @@ def download_copernicus_s3_tile(
         
         return True
         
+    except TileNotAvailableError:
+        raise
     except requests.Timeout:
         print(f"    ERROR: Download timeout after {timeout}s")
         return False
@@ -188,11 +209,119 @@ def download_copernicus_s3_tile(
         return False
 
 
+def window_tile_filename(
+    tile_bounds: Tuple[float, float, float, float],
+    window_bounds: Tuple[float, float, float, float],
+    resolution: int
+) -> str:
+    """
+    Filename for a sub-tile of a 1×1 degree tile (stable for the same window).
+    
+    Example: N40_W112_30m_sub_3f9a1c2e.tif
+    """
+    stem = tile_filename_from_bounds(tile_bounds, f"{resolution}m")[:-len('.tif')]
+    key = ','.join(f"{value:.6f}" for value in window_bounds)
+    return f"{stem}_sub_{hashlib.blake2b(key.encode(), digest_size=4).hexdigest()}.tif"
+
+
+def region_window(
+    tile_bounds: Tuple[float, float, float, float],
+    region_bounds: Tuple[float, float, float, float]
+) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Part of a tile to fetch with a windowed read, if the region covers little of it.
+    
+    Args:
+        tile_bounds: (west, south, east, north) of the 1×1 degree tile
+        region_bounds: (west, south, east, north) of the region
+        
+    Returns:
+        (west, south, east, north) of the covered part if it is less than
+        COG_WINDOW_MAX_FRACTION of the tile, else None (download the whole tile)
+    """
+    window_bounds = (max(region_bounds[0], tile_bounds[0]), max(region_bounds[1], tile_bounds[1]),
+                     min(region_bounds[2], tile_bounds[2]), min(region_bounds[3], tile_bounds[3]))
+    tile_area = (tile_bounds[2] - tile_bounds[0]) * (tile_bounds[3] - tile_bounds[1])
+    covered = (window_bounds[2] - window_bounds[0]) * (window_bounds[3] - window_bounds[1]) / tile_area
+    if window_bounds[0] >= window_bounds[2] or window_bounds[1] >= window_bounds[3]:
+        return None
+    return window_bounds if covered < COG_WINDOW_MAX_FRACTION else None
+
+
+def download_copernicus_s3_window(
+    tile_bounds: Tuple[float, float, float, float],
+    resolution: int,
+    window_bounds: Tuple[float, float, float, float],
+    output_path: Path,
+    url: Optional[str] = None,
+    raise_on_missing: bool = False
+) -> bool:
+    """
+    Fetch only the part of a Copernicus COG tile covering window_bounds.
+    
+    GDAL reads the header and the intersecting internal tiles with HTTP range
+    requests; the window (expanded to whole pixels) is written as a compact
+    GeoTIFF.
+    
+    Args:
+        tile_bounds: (west, south, east, north) of the 1×1 degree tile
+        resolution: 30 or 90 meters
+        window_bounds: (west, south, east, north) to fetch
+        output_path: Where to save the sub-tile
+        url: COG URL (defaults to the public S3 object for the tile)
+        raise_on_missing: Raise TileNotAvailableError on 404 instead of returning False
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    import rasterio
+    from rasterio.errors import RasterioIOError
+    
+    if url is None:
+        url = construct_copernicus_url(tile_bounds, resolution)
+    
+    try:
+        with rasterio.Env(**COG_GDAL_OPTIONS):
+            with rasterio.open(f"/vsicurl/{url}") as src:
+                window = pixel_window_for_bounds(window_bounds, src.transform, src.width, src.height)
+                data = src.read(1, window=window)
+                profile = src.profile.copy()
+                profile.update(
+                    driver='GTiff',
+                    width=int(window.width),
+                    height=int(window.height),
+                    transform=src.window_transform(window),
+                    compress='deflate',
+                    predictor=2,
+                    tiled=False,
+                )
+                for key in ('blockxsize', 'blockysize', 'interleave'):
+                    profile.pop(key, None)
+        
+        temp_path = output_path.with_suffix('.tmp')
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with rasterio.open(temp_path, 'w', **profile) as dst:
+            dst.write(data, 1)
+        os.replace(temp_path, output_path)
+        return True
+    
+    except RasterioIOError as e:
+        # Missing object (ocean tile) or unreachable server
+        print(f"    Tile not available for windowed read: {url} ({e})")
+        if raise_on_missing and '404' in str(e):
+            raise TileNotAvailableError(f"404: {url}")
+        return False
+    except Exception as e:
+        print(f"    ERROR: Windowed read failed: {type(e).__name__}: {e}")
+        return False
+
+
 def download_copernicus_s3_tiles(
     region_id: str,
     bounds: Tuple[float, float, float, float],
     resolution: int,
-    tiles_dir: Path
+    tiles_dir: Path,
+    windowed: bool = True
 ) -> list[Path]:
     """
     Download multiple Copernicus tiles from S3 for a region.
@@ -200,11 +329,15 @@ def download_copernicus_s3_tiles(
     This is called by the tile manager - just downloads individual tiles.
     Merging is handled separately.
     
+    Tiles the region covers less than COG_WINDOW_MAX_FRACTION of are fetched
+    as sub-tiles (download_copernicus_s3_window) when windowed is True.
+    
     Args:
         region_id: Region identifier (for logging)
         bounds: (west, south, east, north) for region
         resolution: 10, 30, or 90 meters
         tiles_dir: Directory to store tiles
+        windowed: Fetch only the covered part of sparsely covered tiles
         
     Returns:
         List of successfully downloaded tile paths
@@ -223,9 +356,17 @@ def download_copernicus_s3_tiles(
         # Skip tile reuse - always download fresh region-specific data
         # (Tile directories remain for reference but are not reused)
         
-        print(f"  [{idx}/{len(tiles)}] Downloading: {tile_filename}", end=" ", flush=True)
+        window_bounds = region_window(tile_bounds, bounds) if windowed else None
+        
+        if window_bounds is not None:
+            tile_path = tiles_dir / window_tile_filename(tile_bounds, window_bounds, resolution)
+            print(f"  [{idx}/{len(tiles)}] Windowed read: {tile_path.name}", end=" ", flush=True)
+            success = download_copernicus_s3_window(tile_bounds, resolution, window_bounds, tile_path)
+        else:
+            print(f"  [{idx}/{len(tiles)}] Downloading: {tile_filename}", end=" ", flush=True)
+            success = download_copernicus_s3_tile(tile_bounds, resolution, tile_path)
         
-        if download_copernicus_s3_tile(tile_bounds, resolution, tile_path):
+        if success:
             file_size_mb = tile_path.stat().st_size / (1024 * 1024)
             print(f"[OK] ({file_size_mb:.1f} MB)")
             downloaded_paths.append(tile_path)
@@ -14,20 +14,23 @@ Direct download URLs from USGS:
 The downloader:
 1. Downloads global grid (cached for reuse)
 2. Extracts from ZIP
-3. Clips to tile bounds
-4. Saves as standard tile format
+3. Converts it (block by block) to a tiled COG with overviews in data/.cache/gmted2010/
+4. Cuts tiles out with windowed reads
+5. Saves as standard tile format
 """
 
-import requests
+from src.downloaders.resumable import download_resumable
+import os
 import zipfile
-import tempfile
 import shutil
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 import rasterio
-from rasterio.mask import mask as rasterio_mask
 import time
 
+from src.config import DEFAULT_MERGE_MEMORY_BUDGET_MB
+from src.tile_geometry import pixel_window_for_bounds
+
 
 # GMTED2010 URL patterns
 GMTED2010_BASE_URL = "https://edcintl.cr.usgs.gov/downloads/sciweb1/shared/topo/downloads/GMTED/Grid_ZipFiles/"
@@ -42,6 +45,9 @@ RESOLUTION_TO_ARCSEC = {
 # Product code (md = median, most commonly used)
 DEFAULT_PRODUCT = "md"  # Median statistic
 
+# Internal block size of the cached global grid COG
+GMTED2010_BLOCK_SIZE = 512
+
 
 def construct_gmted2010_url(resolution: int, product: str = DEFAULT_PRODUCT) -> str:
     """
@@ -62,6 +68,68 @@ def construct_gmted2010_url(resolution: int, product: str = DEFAULT_PRODUCT) ->
     return f"{GMTED2010_BASE_URL}{filename}"
 
 
+def convert_to_cog(source_path: Path, output_path: Path) -> None:
+    """
+    Convert a raster (e.g. the ArcGrid global grid) to a tiled COG with overviews.
+    
+    GDAL's COG driver copies the source block by block, so memory stays within
+    GDAL_CACHEMAX (DEFAULT_MERGE_MEMORY_BUDGET_MB) however large the grid is.
+    
+    Args:
+        source_path: Raster readable by GDAL (ArcGrid .adf, GeoTIFF, BIL)
+        output_path: Where to write the COG (written atomically)
+    """
+    from rasterio.shutil import copy as rio_copy
+    
+    tmp_path = output_path.with_suffix('.tmp.tif')
+    with rasterio.Env(GDAL_CACHEMAX=DEFAULT_MERGE_MEMORY_BUDGET_MB):
+        rio_copy(
+            str(source_path),
+            str(tmp_path),
+            driver='COG',
+            blocksize=GMTED2010_BLOCK_SIZE,
+            compress='DEFLATE',
+            predictor='YES',
+            overview_resampling='AVERAGE',
+            bigtiff='IF_SAFER',
+            num_threads='ALL_CPUS',
+        )
+    os.replace(tmp_path, output_path)
+
+
+def extract_gmted2010_tile(
+    global_grid_path: Path,
+    tile_bounds: Tuple[float, float, float, float],
+    output_path: Path
+) -> None:
+    """
+    Cut a tile out of the global grid with a windowed read.
+    
+    Only the internal blocks intersecting the tile are read.
+    
+    Args:
+        global_grid_path: Global grid COG
+        tile_bounds: (west, south, east, north) in degrees
+        output_path: Where to save the tile
+    """
+    with rasterio.open(global_grid_path) as src:
+        window = pixel_window_for_bounds(tile_bounds, src.transform, src.width, src.height)
+        data = src.read(window=window)
+        
+        out_meta = src.meta.copy()
+        out_meta.update({
+            "driver": "GTiff",
+            "height": data.shape[1],
+            "width": data.shape[2],
+            "transform": src.window_transform(window),
+            "compress": "lzw"
+        })
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with rasterio.open(output_path, "w", **out_meta) as dest:
+        dest.write(data)
+
+
 def download_gmted2010_tile(
     tile_bounds: Tuple[float, float, float, float],
     resolution: int,
@@ -84,32 +152,37 @@ def download_gmted2010_tile(
         cache_dir.mkdir(parents=True, exist_ok=True)
         
         # Download global grid if not cached
-        global_grid_path = cache_dir / f"gmted2010_{resolution}m_global.tif"
+        global_grid_path = cache_dir / f"gmted2010_{resolution}m_global_cog.tif"
+        legacy_grid_path = cache_dir / f"gmted2010_{resolution}m_global.tif"
+        if not global_grid_path.exists() and legacy_grid_path.exists():
+            # Strip-organised grid from an earlier version - re-layout, no download
+            print(f"    Converting cached GMTED2010 {resolution}m global grid to tiled COG...", end=" ", flush=True)
+            convert_to_cog(legacy_grid_path, global_grid_path)
+            legacy_grid_path.unlink()
+            print("[OK]")
+        
         if not global_grid_path.exists():
             print(f"    Downloading GMTED2010 {resolution}m global grid...", end=" ", flush=True)
             url = construct_gmted2010_url(resolution)
             print(f"\n    URL: {url}", flush=True)
             
-            # Download ZIP to temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_zip:
-                tmp_zip_path = Path(tmp_zip.name)
+            # Download ZIP into the cache so an interrupted transfer resumes
+            zip_path = cache_dir / f"gmted2010_{resolution}m_grd.zip"
             
             try:
                 download_start_time = time.time()
-                response = requests.get(url, stream=True, timeout=300)
-                response.raise_for_status()
                 
-                # Download with progress
-                total_size = int(response.headers.get('Content-Length', 0))
-                downloaded = 0
-                with open(tmp_zip_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            if downloaded % (10 * 1024 * 1024) == 0:  # Print every 10MB
-                                print(f"{percent:.1f}%", end=" ", flush=True)
+                # Download with progress (print every 10MB)
+                def report(downloaded: int, total_size: Optional[int]) -> None:
+                    step = 10 * 1024 * 1024
+                    if total_size and downloaded // step != report.last_step:
+                        report.last_step = downloaded // step
+                        print(f"{(downloaded / total_size) * 100:.1f}%", end=" ", flush=True)
+                report.last_step = 0
+                
+                response = download_resumable(url, zip_path, timeout=300, progress=report)
+                response.raise_for_status()
+                downloaded = zip_path.stat().st_size
                 
                 download_end_time = time.time()
                 download_duration = download_end_time - download_start_time
@@ -141,7 +214,7 @@ def download_gmted2010_tile(
                 extract_dir = cache_dir / f"gmted2010_{resolution}m_extracted"
                 extract_dir.mkdir(exist_ok=True)
                 
-                with zipfile.ZipFile(tmp_zip_path, 'r') as zip_ref:
+                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                     zip_ref.extractall(extract_dir)
                 
                 # Find the extracted grid file (ArcGrid format)
@@ -157,61 +230,28 @@ def download_gmted2010_tile(
                 # Use first found grid file (usually there's one main grid)
                 source_grid = grid_files[0]
                 
-                # Convert ArcGrid to GeoTIFF if needed
-                if source_grid.suffix == '.adf' or source_grid.suffix == '':
-                    # Open ArcGrid and save as GeoTIFF
-                    with rasterio.open(str(source_grid)) as src:
-                        # Read data
-                        data = src.read(1)
-                        profile = src.profile.copy()
-                        profile.update(driver='GTiff', compress='lzw')
-                        
-                        # Save as GeoTIFF
-                        with rasterio.open(global_grid_path, 'w', **profile) as dst:
-                            dst.write(data, 1)
-                else:
-                    # Already GeoTIFF or other format, copy
-                    shutil.copy2(source_grid, global_grid_path)
+                # Convert to tiled COG (streams block by block)
+                convert_to_cog(source_grid, global_grid_path)
                 
                 print("[OK]")
                 
-                # Cleanup temp files
-                tmp_zip_path.unlink()
+                # Cleanup download and extracted files
+                zip_path.unlink()
                 shutil.rmtree(extract_dir, ignore_errors=True)
                 
             except Exception as e:
                 print(f"[FAIL] {e}")
-                if tmp_zip_path.exists():
-                    tmp_zip_path.unlink()
+                # A complete but unusable ZIP is removed; a partial transfer
+                # (zip_path.part) is kept so the next attempt resumes it
+                if zip_path.exists():
+                    zip_path.unlink()
                 return False
         else:
             print(f"    Using cached GMTED2010 {resolution}m global grid", flush=True)
         
-        # Clip global grid to tile bounds
+        # Clip global grid to tile bounds (windowed read)
         print(f"    Clipping to tile bounds...", end=" ", flush=True)
-        
-        with rasterio.open(global_grid_path) as src:
-            # Create geometry for tile bounds
-            from shapely.geometry import box
-            tile_geom = box(tile_bounds[0], tile_bounds[1], tile_bounds[2], tile_bounds[3])
-            
-            # Clip
-            out_image, out_transform = rasterio_mask(src, [tile_geom], crop=True, filled=False)
-            
-            # Update metadata
-            out_meta = src.meta.copy()
-            out_meta.update({
-                "driver": "GTiff",
-                "height": out_image.shape[1],
-                "width": out_image.shape[2],
-                "transform": out_transform,
-                "compress": "lzw"
-            })
-            
-            # Save clipped tile
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with rasterio.open(output_path, "w", **out_meta) as dest:
-                dest.write(out_image)
+        extract_gmted2010_tile(global_grid_path, tile_bounds, output_path)
         
         print("[OK]")
         return True
@@ -0,0 +1,125 @@
+"""
+Shared HTTP session for all downloaders.
+
+Downloaders used to call a bare requests.get per tile, paying a new TCP+TLS
+handshake every time and failing a tile on the first transient error. They
+now route through http_get(), backed by one process-wide requests.Session:
+
+- Connection pooling with keep-alive: one urllib3 pool per host
+  (HTTP_POOL_HOSTS pools, HTTP_POOL_MAXSIZE connections each, enough for
+  DEFAULT_DOWNLOAD_WORKERS concurrent tiles).
+- Retry policy: connection errors and HTTP_RETRY_STATUSES (429, 5xx) are
+  retried up to HTTP_RETRIES times with exponential backoff plus random jitter;
+  a Retry-After header from the server takes precedence over the backoff.
+  Other statuses (401 rate limits, 404 missing tiles) are returned
+  immediately so downloaders keep handling them themselves.
+
+Usage:
+    from src.downloaders.http_session import http_get
+
+    response = http_get(url, params=params, stream=True, timeout=300)
+"""
+
+import random
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Retries per request (connection errors and retryable statuses)
+HTTP_RETRIES = 4
+
+# Exponential backoff: factor * 2^(retry - 1) seconds, capped by urllib3 (120s)
+HTTP_BACKOFF_FACTOR = 1.0
+
+# Random jitter (seconds) added to each backoff so concurrent downloads don't retry in lockstep
+HTTP_BACKOFF_JITTER = 1.0
+
+# Statuses worth retrying (rate limiting / transient server errors)
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Connection pools kept (one per host) and connections per pool
+HTTP_POOL_HOSTS = 16
+HTTP_POOL_MAXSIZE = 16
+
+
+class JitteredRetry(Retry):
+    """urllib3 Retry with random jitter added to the exponential backoff."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, HTTP_BACKOFF_JITTER)
+
+
+def retry_policy(retries: int = HTTP_RETRIES) -> Retry:
+    """
+    Build the retry policy used by the shared session.
+
+    Args:
+        retries: Maximum retries per request
+
+    Returns:
+        urllib3 Retry instance
+    """
+    return JitteredRetry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        # Return the last response instead of raising, so callers see the status
+        raise_on_status=False,
+    )
+
+
+def create_session(retries: int = HTTP_RETRIES) -> requests.Session:
+    """
+    Create a session with pooled keep-alive connections and the retry policy.
+
+    Args:
+        retries: Maximum retries per request
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                          max_retries=retry_policy(retries))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Global instance
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Get or create the shared download session."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """
+    GET through the shared session (same arguments as requests.get).
+
+    Args:
+        url: Request URL
+        **kwargs: params, stream, timeout, headers, ...
+
+    Returns:
+        requests.Response
+    """
+    return get_session().get(url, **kwargs)
@@ -7,6 +7,7 @@ Downloads SRTM and Copernicus DEM data via OpenTopography's Global DEM API.
 from pathlib import Path
 from typing import Tuple, Optional
 import requests
+from src.downloaders.resumable import download_resumable, tqdm_progress
 from tqdm import tqdm
 
 from load_settings import get_opentopography_api_key
@@ -89,7 +90,20 @@ def download_srtm(
     print(f" Size: {width:.2f}deg x {height:.2f}deg", flush=True)
 
     try:
-        response = requests.get(url, params=params, stream=True, timeout=300)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        import time
+        start_time = time.time()
+
+        with tqdm(
+            unit='B', 
+            unit_scale=True, 
+            unit_divisor=1024,
+            desc=f" Downloading",
+            bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
+        ) as pbar:
+            response = download_resumable(url, output_path, params=params, timeout=300,
+                                          progress=tqdm_progress(pbar))
         
         # Check for 401 (Unauthorized) - rate limit or quota exceeded
         if response.status_code == 401:
@@ -105,26 +119,6 @@ def download_srtm(
         
         response.raise_for_status()
 
-        total_size = int(response.headers.get('content-length', 0))
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        import time
-        start_time = time.time()
-
-        with open(output_path, 'wb') as f:
-            with tqdm(
-                total=total_size, 
-                unit='B', 
-                unit_scale=True, 
-                unit_divisor=1024,
-                desc=f" Downloading",
-                bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
-            ) as pbar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        pbar.update(len(chunk))
-
         elapsed_time = time.time() - start_time
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
         download_speed = file_size_mb / elapsed_time if elapsed_time > 0 else 0
@@ -219,7 +213,20 @@ def download_copernicus(
     print(f" Downloading Copernicus DEM ({resolution})...", flush=True)
 
     try:
-        response = requests.get(url, params=params, stream=True, timeout=300)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        import time
+        start_time = time.time()
+
+        with tqdm(
+            unit='B', 
+            unit_scale=True, 
+            unit_divisor=1024,
+            desc=f" Downloading",
+            bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
+        ) as pbar:
+            response = download_resumable(url, output_path, params=params, timeout=300,
+                                          progress=tqdm_progress(pbar))
         
         # Check for 401 (Unauthorized) - rate limit or quota exceeded
         if response.status_code == 401:
@@ -235,26 +242,6 @@ def download_copernicus(
         
         response.raise_for_status()
 
-        total_size = int(response.headers.get('content-length', 0))
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        import time
-        start_time = time.time()
-
-        with open(output_path, 'wb') as f:
-            with tqdm(
-                total=total_size, 
-                unit='B', 
-                unit_scale=True, 
-                unit_divisor=1024,
-                desc=f" Downloading",
-                bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
-            ) as pbar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        pbar.update(len(chunk))
-
         elapsed_time = time.time() - start_time
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
         download_speed = file_size_mb / elapsed_time if elapsed_time > 0 else 0
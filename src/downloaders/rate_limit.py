@@ -8,7 +8,8 @@ with the OpenTopography API.
 Simple exponential backoff strategy:
 - Initial backoff: 10 minutes after 401
 - Exponential backoff: Doubles for each consecutive 401
-- Request spacing: 0.5s delay between requests (avoid bursts)
+- Request spacing: 0.5s delay between requests (avoid bursts), also enforced
+  between threads of one process (concurrent tile downloads)
 
 Usage:
     from src.downloaders.rate_limit import check_rate_limit, record_rate_limit_hit
@@ -27,6 +28,7 @@ Usage:
 """
 
 import json
+import threading
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -43,6 +45,11 @@ INITIAL_BACKOFF_SECONDS = 600       # 10 minutes initial wait after 401
 BACKOFF_MULTIPLIER = 2.0            # Double wait time for each subsequent 401
 REQUEST_DELAY_SECONDS = 0.5         # Small delay between requests to avoid bursts
 
+# Request starts within this process (the shared state only records completed requests,
+# so concurrent download threads would otherwise all pass the spacing check at once)
+_request_spacing_lock = threading.Lock()
+_last_request_start = 0.0
+
 
 def _ensure_state_dir():
     """Ensure the state file directory exists."""
@@ -140,16 +147,23 @@ def check_rate_limit() -> Tuple[bool, Optional[str]]:
             # Don't reset consecutive_violations yet - only on successful request
             _write_state(state)
     
-    # Check minimum delay between requests (avoid bursts)
-    if state.get('last_request_time'):
-        last_request = datetime.fromisoformat(state['last_request_time'])
-        now = datetime.now()
-        time_since_last = (now - last_request).total_seconds()
+    # Check minimum delay between requests (avoid bursts); one thread at a time
+    global _last_request_start
+    with _request_spacing_lock:
+        if state.get('last_request_time'):
+            last_request = datetime.fromisoformat(state['last_request_time'])
+            now = datetime.now()
+            time_since_last = (now - last_request).total_seconds()
+            
+            if time_since_last < REQUEST_DELAY_SECONDS:
+                # Small delay to avoid bursts
+                sleep_time = REQUEST_DELAY_SECONDS - time_since_last
+                time.sleep(sleep_time)
         
-        if time_since_last < REQUEST_DELAY_SECONDS:
-            # Small delay to avoid bursts
-            sleep_time = REQUEST_DELAY_SECONDS - time_since_last
-            time.sleep(sleep_time)
+        since_local_start = time.monotonic() - _last_request_start
+        if since_local_start < REQUEST_DELAY_SECONDS:
+            time.sleep(REQUEST_DELAY_SECONDS - since_local_start)
+        _last_request_start = time.monotonic()
     
     return True, None
 
@@ -0,0 +1,239 @@
+"""
+Resumable HTTP downloads.
+
+Large transfers (the GMTED2010 global ZIPs, OpenTopography/USGS rasters,
+Copernicus tiles) used to restart from byte zero after a dropped connection.
+download_resumable() keeps the partial transfer instead:
+
+- Data is streamed into `{output}.part`; `{output}.part.json` records the
+  request (hashed URL + params), the server's ETag / Last-Modified and the
+  expected size.
+- After a connection error (in this call, or in an earlier process) the
+  transfer continues with `Range: bytes={offset}-` and `If-Range` set to the
+  recorded validator. A 200 reply (range unsupported, or the resource changed)
+  restarts from zero; a 206 reply is appended.
+- The file is moved into place (os.replace) only after its size matches the
+  expected size, so a truncated transfer never looks complete.
+
+Non-2xx responses are returned without touching the output, so callers keep
+their own status handling (401 rate limits, 404 missing tiles).
+
+Usage:
+    from src.downloaders.resumable import download_resumable
+
+    response = download_resumable(url, output_path, params=params, timeout=300)
+    if response.status_code == 404:
+        ...
+    response.raise_for_status()   # output_path is complete
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+
+from src.downloaders.http_session import http_get
+
+
+# Resumes within one call after the transfer breaks off
+RESUME_ATTEMPTS = 3
+
+# Wait before resuming (multiplied by the attempt number)
+RESUME_BACKOFF_SECONDS = 2.0
+
+# Bytes per streamed chunk (at most this much is re-fetched after a break)
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
+# Errors after which the transfer is resumed
+RESUMABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.Timeout,
+)
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+class IncompleteDownloadError(requests.exceptions.RequestException):
+    """Transfer could not be completed after all resume attempts."""
+
+
+def part_paths(output_path: Path) -> Tuple[Path, Path]:
+    """
+    Get the partial-transfer paths of a download.
+
+    Args:
+        output_path: Final download path
+
+    Returns:
+        Tuple of (.part data file, .part.json state file)
+    """
+    output_path = Path(output_path)
+    return (output_path.with_name(output_path.name + '.part'),
+            output_path.with_name(output_path.name + '.part.json'))
+
+
+def tqdm_progress(pbar) -> Callable[[int, Optional[int]], None]:
+    """Progress callback driving a tqdm bar (total is set once known)."""
+    def update(downloaded: int, total: Optional[int]) -> None:
+        if total and pbar.total != total:
+            pbar.total = total
+        pbar.update(downloaded - pbar.n)
+    return update
+
+
+def _request_key(url: str, params: Optional[Dict]) -> str:
+    # Hashed so API keys in the query string are not written to disk
+    prepared = requests.Request('GET', url, params=params).prepare().url
+    return hashlib.sha256(prepared.encode('utf-8')).hexdigest()
+
+
+def _load_state(state_path: Path, request_key: str) -> Optional[Dict]:
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    return state if state.get('request') == request_key else None
+
+
+def _save_state(state_path: Path, state: Dict) -> None:
+    tmp_path = state_path.with_name(state_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(tmp_path, state_path)
+
+
+def _discard(*paths: Path) -> None:
+    for path in paths:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _finish(part_path: Path, state_path: Path, output_path: Path) -> None:
+    os.replace(part_path, output_path)
+    _discard(state_path)
+
+
+def download_resumable(
+    url: str,
+    output_path: Path,
+    params: Optional[Dict] = None,
+    timeout: float = 300,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    attempts: int = RESUME_ATTEMPTS
+) -> requests.Response:
+    """
+    Download a URL to a file, resuming partial transfers with Range requests.
+
+    Args:
+        url: Request URL
+        output_path: Final file path (written atomically when complete)
+        params: Query parameters
+        timeout: Connect/read timeout per request in seconds
+        progress: Called as progress(bytes_downloaded, total_bytes_or_None)
+        attempts: Resumes within this call after the transfer breaks off
+
+    Returns:
+        Response of the last request; if it is 2xx, output_path is complete
+
+    Raises:
+        IncompleteDownloadError: Transfer still incomplete after all resumes
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path, state_path = part_paths(output_path)
+    request_key = _request_key(url, params)
+    last_error = None
+
+    for attempt in range(attempts + 1):
+        if attempt:
+            time.sleep(RESUME_BACKOFF_SECONDS * attempt)
+
+        state = _load_state(state_path, request_key)
+        offset = part_path.stat().st_size if state and part_path.exists() else 0
+        if state is None:
+            _discard(part_path, state_path)
+        elif state.get('total_size') is not None and offset >= state['total_size']:
+            if offset == state['total_size']:
+                # Completed earlier but not moved into place
+                _finish(part_path, state_path, output_path)
+                return _completed_response(url)
+            _discard(part_path, state_path)
+            state, offset = None, 0
+
+        # Identity encoding keeps byte offsets and Content-Length meaningful
+        headers = {'Accept-Encoding': 'identity'}
+        if offset:
+            headers['Range'] = f"bytes={offset}-"
+            validator = state.get('etag') or state.get('last_modified')
+            if validator:
+                headers['If-Range'] = validator
+
+        try:
+            response = http_get(url, params=params, headers=headers, stream=True, timeout=timeout)
+            if response.status_code == 416 and offset:
+                # Range no longer valid for this resource - start over
+                response.close()
+                _discard(part_path, state_path)
+                continue
+            if not response.ok:
+                return response
+
+            mode = 'wb'
+            if response.status_code == 206:
+                match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                if match is None or int(match.group(1)) != offset:
+                    response.close()
+                    _discard(part_path, state_path)
+                    continue
+                mode = 'ab'
+            else:
+                offset = 0
+                content_length = response.headers.get('Content-Length')
+                state = {
+                    'request': request_key,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'total_size': int(content_length) if content_length is not None else None,
+                }
+                _save_state(state_path, state)
+
+            total = state.get('total_size')
+            downloaded = offset
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                    if chunk:
+                        f.write(chunk)
+                        downloaded += len(chunk)
+                        if progress is not None:
+                            progress(downloaded, total)
+        except RESUMABLE_ERRORS as e:
+            last_error = e
+            print(f"    Transfer interrupted ({type(e).__name__}), resuming...", flush=True)
+            continue
+
+        # Verify completion before the atomic rename
+        size = part_path.stat().st_size
+        if total is not None and size != total:
+            last_error = IncompleteDownloadError(f"received {size} of {total} bytes")
+            continue
+        _finish(part_path, state_path, output_path)
+        return response
+
+    raise IncompleteDownloadError(
+        f"Download of {output_path.name} incomplete after {attempts} resume attempts: {last_error}")
+
+
+def _completed_response(url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    return response
@@ -6,76 +6,253 @@ This is the entry point for tile downloads. It:
 2. Tries each source in order
 3. Stops on first success
 4. Reports which source succeeded
+
+Tiles of a region are downloaded concurrently (download_tiles_for_region
+workers). Each tile still tries its sources in priority order; a SourceLimiter
+caps in-flight downloads per source (SourceCapability.max_in_flight, shared by
+sources behind the same API key). OpenTopography request spacing and backoff
+are enforced by rate_limit.check_rate_limit in every download.
+
+Source tiles are kept in data/raw/<source.tile_dir>/tiles/ and reused across
+regions and reruns through the checksum-verified tile cache (src/tile_cache.py);
+refresh=True re-downloads them.
+
+Copernicus S3 tiles the region covers only a small part of are fetched as
+sub-tiles with a windowed COG read (copernicus_s3.region_window); sub-tiles
+are cached under their window bounds, separately from whole tiles.
+
+Tiles without data are not fetched: 1-degree cells with no land in the Natural
+Earth land mask (src/land_mask.py) are skipped outright, and a source that
+answered 404 for a tile is not asked again until its negative cache entry
+expires. Such tiles report NO_DATA_SOURCE instead of failing the region.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+from src.config import DEFAULT_DOWNLOAD_WORKERS, LAND_MASK_PREFILTER
 from src.downloaders.source_registry import (
     get_sources_for_download,
     SourceCapability
 )
+from src.land_mask import get_land_mask
+from src.tile_cache import TileNotAvailableError, get_tile_cache
 
 
-def download_tile_with_sources(
+# Result for tiles with no data anywhere (open ocean, or every source answered 404)
+NO_DATA_SOURCE = 'no_data'
+
+
+class SourceLimiter:
+    """Per-source cap on concurrent downloads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+    def _semaphore(self, source: SourceCapability) -> threading.BoundedSemaphore:
+        # Sources behind one API key share that key's request budget
+        key = source.auth_key_name or source.source_id
+        with self._lock:
+            if key not in self._semaphores:
+                self._semaphores[key] = threading.BoundedSemaphore(max(1, source.max_in_flight))
+            return self._semaphores[key]
+
+    @contextmanager
+    def slot(self, source: SourceCapability):
+        """Hold one of the source's download slots."""
+        semaphore = self._semaphore(source)
+        with semaphore:
+            yield
+
+
+def source_tile_path(
+    source: SourceCapability,
     tile_bounds: Tuple[float, float, float, float],
-    resolution_m: int,
-    output_path: Path,
-    region_bounds: Tuple[float, float, float, float],
-    verbose: bool = True
-) -> Optional[str]:
+    window_bounds: Optional[Tuple[float, float, float, float]] = None
+) -> Path:
     """
-    Try downloading a tile from available sources in priority order.
+    Get where a source stores a tile (shared across regions).
     
     Args:
-        tile_bounds: (west, south, east, north) for this specific tile (1×1 degree standard)
-        resolution_m: Required resolution in meters
-        output_path: Where to save the tile (with standard naming)
-        region_bounds: (west, south, east, north) for entire region (for source selection)
-        verbose: Whether to print progress
+        source: Source capability
+        tile_bounds: (west, south, east, north) for the tile
+        window_bounds: Part of the tile fetched as a sub-tile (see source_window), or None
         
     Returns:
-        source_id of successful source, or None if all failed
+        Path like data/raw/srtm_30m/tiles/N40_W112_30m.tif
+        (or .../N40_W112_30m_sub_3f9a1c2e.tif for a sub-tile)
     """
-    # Get ordered list of sources to try
-    sources = get_sources_for_download(resolution_m, region_bounds)
+    from src.tile_geometry import tile_filename_from_bounds
+    if window_bounds is not None:
+        from src.downloaders.copernicus_s3 import window_tile_filename
+        tile_filename = window_tile_filename(tile_bounds, window_bounds, source.resolution_m)
+    else:
+        tile_filename = tile_filename_from_bounds(tile_bounds, f"{source.resolution_m}m")
+    return Path(f"data/raw/{source.tile_dir}/tiles") / tile_filename
+
+
+def source_window(
+    source: SourceCapability,
+    tile_bounds: Tuple[float, float, float, float],
+    region_bounds: Optional[Tuple[float, float, float, float]]
+) -> Optional[Tuple[float, float, float, float]]:
+    """
+    Get the part of a tile to fetch from a source, if only a window is needed.
     
-    if not sources:
-        if verbose:
-            print(f"    ERROR: No sources available for {resolution_m}m at {tile_bounds}")
+    Only Copernicus S3 (cloud-optimized GeoTIFFs) supports windowed reads.
+    
+    Args:
+        source: Source capability
+        tile_bounds: (west, south, east, north) for the tile
+        region_bounds: (west, south, east, north) for the region, or None
+        
+    Returns:
+        Window bounds for sparsely covered tiles, None to fetch the whole tile
+    """
+    if region_bounds is None or not source.source_id.startswith('copernicus_s3'):
         return None
+    from src.downloaders.copernicus_s3 import region_window
+    return region_window(tile_bounds, region_bounds)
+
+
+def _try_sources(
+    tile_bounds: Tuple[float, float, float, float],
+    sources: List[SourceCapability],
+    output_path: Path,
+    limiter: Optional[SourceLimiter] = None,
+    verbose: bool = True,
+    refresh: bool = False,
+    region_bounds: Optional[Tuple[float, float, float, float]] = None
+) -> Tuple[Optional[str], List[Tuple[str, str]]]:
+    """
+    Use a cached copy of the tile, or try sources in priority order until one downloads it.
     
-    # Try each source in order
+    Sources known to have no data for the tile are skipped; ocean tiles (land
+    mask) are not requested at all. With region_bounds, sources that support
+    it fetch only the covered window of sparsely covered tiles (source_window).
+    
+    Returns:
+        (source_id of successful source, NO_DATA_SOURCE, or None,
+         [(source name, error message)])
+    """
     errors = []  # Track all errors for detailed reporting
+    cache = get_tile_cache()
+    
+    if not refresh:
+        for source in sources:
+            window = source_window(source, tile_bounds, region_bounds)
+            if cache.lookup(source.source_id, window or tile_bounds, source.resolution_m,
+                            source_tile_path(source, tile_bounds, window)):
+                if verbose:
+                    print(f"    -> Cached: {source.name}")
+                return source.source_id, errors
+    
+    if LAND_MASK_PREFILTER and not get_land_mask().tile_has_land(tile_bounds):
+        if verbose:
+            print(f"    -> No land in tile (land mask), skipping download")
+        return NO_DATA_SOURCE, errors
     
+    no_data_count = 0
     for source in sources:
+        if not refresh and cache.is_known_missing(source.source_id, tile_bounds, source.resolution_m):
+            if verbose:
+                print(f"    -> {source.name}: no data (cached)")
+            errors.append((source.name, "No data for tile (cached)"))
+            no_data_count += 1
+            continue
+        
         if verbose:
             print(f"    -> Trying {source.name}...", end=" ", flush=True)
         
+        window = source_window(source, tile_bounds, region_bounds)
         try:
-            success, error_msg = _download_from_source(tile_bounds, source, output_path)
+            if limiter is not None:
+                with limiter.slot(source):
+                    success, error_msg = _download_from_source(tile_bounds, source, output_path, window)
+            else:
+                success, error_msg = _download_from_source(tile_bounds, source, output_path, window)
+            tile_path = source_tile_path(source, tile_bounds, window)
+            if success and tile_path.exists() and not cache.record(
+                    source.source_id, window or tile_bounds, source.resolution_m, tile_path):
+                success, error_msg = False, "Downloaded tile failed integrity check"
             if success:
                 if verbose:
                     print("[OK]")
-                return source.source_id
+                return source.source_id, errors
             else:
                 if verbose:
                     print("[FAIL]")
                 errors.append((source.name, error_msg))
+        except TileNotAvailableError as e:
+            cache.record_missing(source.source_id, tile_bounds, source.resolution_m, str(e))
+            if verbose:
+                print("[NO DATA]")
+            errors.append((source.name, f"No data for tile ({e})"))
+            no_data_count += 1
         except Exception as e:
             error_msg = f"{type(e).__name__}: {e}"
             if verbose:
                 print(f"[FAIL] ({type(e).__name__})")
             errors.append((source.name, error_msg))
     
+    if sources and no_data_count == len(sources):
+        return NO_DATA_SOURCE, errors
+    return None, errors
+
+
+def _print_tile_errors(tile_bounds: Tuple[float, float, float, float], errors: List[Tuple[str, str]]) -> None:
+    print(f"\n    {'='*60}")
+    print(f"    ALL SOURCES FAILED FOR TILE")
+    print(f"    Tile: {tile_bounds} (1×1 degree standard tile)")
+    print(f"    Errors by source:")
+    for source_name, error_msg in errors:
+        print(f"      - {source_name}: {error_msg}")
+    print(f"    {'='*60}")
+
+
+def download_tile_with_sources(
+    tile_bounds: Tuple[float, float, float, float],
+    resolution_m: int,
+    output_path: Path,
+    region_bounds: Tuple[float, float, float, float],
+    verbose: bool = True,
+    refresh: bool = False
+) -> Optional[str]:
+    """
+    Try downloading a tile from available sources in priority order.
+    
+    Args:
+        tile_bounds: (west, south, east, north) for this specific tile (1×1 degree standard)
+        resolution_m: Required resolution in meters
+        output_path: Where to save the tile (with standard naming)
+        region_bounds: (west, south, east, north) for entire region (for source selection)
+        verbose: Whether to print progress
+        refresh: Re-download even if a verified cached tile exists
+        
+    Returns:
+        source_id of successful source, NO_DATA_SOURCE if the tile has no data
+        (ocean), or None if all failed
+    """
+    # Get ordered list of sources to try
+    sources = get_sources_for_download(resolution_m, region_bounds)
+    
+    if not sources:
+        if verbose:
+            print(f"    ERROR: No sources available for {resolution_m}m at {tile_bounds}")
+        return None
+    
+    # Try each source in order
+    source_id, errors = _try_sources(tile_bounds, sources, output_path, verbose=verbose, refresh=refresh,
+                                     region_bounds=region_bounds)
+    if source_id:
+        return source_id
+    
     # All sources failed - print detailed errors
     if verbose:
-        print(f"\n    {'='*60}")
-        print(f"    ALL SOURCES FAILED FOR TILE")
-        print(f"    Tile: {tile_bounds} (1×1 degree standard tile)")
-        print(f"    Errors by source:")
-        for source_name, error_msg in errors:
-            print(f"      - {source_name}: {error_msg}")
-        print(f"    {'='*60}")
+        _print_tile_errors(tile_bounds, errors)
     
     return None
 
@@ -83,29 +260,23 @@ def download_tile_with_sources(
 def _download_from_source(
     tile_bounds: Tuple[float, float, float, float],
     source: SourceCapability,
-    output_path: Path
+    output_path: Path,
+    window_bounds: Optional[Tuple[float, float, float, float]] = None
 ) -> Tuple[bool, str]:
     """
     Download tile from a specific source.
     
-    Routes to appropriate downloader based on source_id.
+    Routes to appropriate downloader based on source_id. With window_bounds
+    (see source_window), only that part of the tile is fetched.
     
     Returns:
         (success: bool, error_message: str)
     """
     import traceback
     
-    # Create source-specific tile directory (kept for reference, not reused)
-    source_tile_dir = Path(f"data/raw/{source.tile_dir}/tiles")
-    source_tile_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Create source-specific output path
-    from src.tile_geometry import tile_filename_from_bounds
-    resolution_str = f"{source.resolution_m}m"
-    tile_filename = tile_filename_from_bounds(tile_bounds, resolution_str)
-    source_output_path = source_tile_dir / tile_filename
-    
-    # Skip tile reuse - always download fresh region-specific data
+    # Source-specific tile path (shared across regions via the tile cache)
+    source_output_path = source_tile_path(source, tile_bounds, window_bounds)
+    source_output_path.parent.mkdir(parents=True, exist_ok=True)
     
     try:
         # Route to appropriate downloader
@@ -139,8 +310,14 @@ def _download_from_source(
             return success, "Success" if success else "Download failed (check logs above)"
         
         elif source.source_id.startswith('copernicus_s3'):
-            from src.downloaders.copernicus_s3 import download_copernicus_s3_tile
-            success = download_copernicus_s3_tile(tile_bounds, source.resolution_m, source_output_path)
+            from src.downloaders.copernicus_s3 import download_copernicus_s3_tile, download_copernicus_s3_window
+            if window_bounds is not None:
+                # Sparsely covered tile: ranged reads of the covered part of the COG only
+                success = download_copernicus_s3_window(tile_bounds, source.resolution_m, window_bounds,
+                                                        source_output_path, raise_on_missing=True)
+                return success, "Success" if success else "Windowed read failed"
+            success = download_copernicus_s3_tile(tile_bounds, source.resolution_m, source_output_path,
+                                                  raise_on_missing=True)
             return success, "Success" if success else "Tile not available (404 or download error)"
         
         elif source.source_id == 'aw3d30':
@@ -150,7 +327,8 @@ def _download_from_source(
                 api_key = get_api_key()  # No argument - returns opentopography key
             except Exception as e:
                 return False, f"No API key configured: {e}"
-            success = download_aw3d30_tile(tile_bounds, source_output_path, api_key=api_key)
+            success = download_aw3d30_tile(tile_bounds, source_output_path, api_key=api_key,
+                                           raise_on_missing=True)
             return success, "Success" if success else "Download failed (check logs above)"
         
         elif source.source_id.startswith('gmted2010'):
@@ -165,7 +343,10 @@ def _download_from_source(
         
         else:
             return False, f"Unknown source_id: {source.source_id}"
-            
+    
+    except TileNotAvailableError:
+        # Negative result - recorded by _try_sources
+        raise
     except Exception as e:
         # Full traceback for debugging
         error_msg = f"{type(e).__name__}: {e}\n"
@@ -173,25 +354,92 @@ def _download_from_source(
         return False, error_msg
 
 
+def download_tiles_concurrently(
+    tiles: List[Tuple[float, float, float, float]],
+    tile_paths: List[Path],
+    sources: List[SourceCapability],
+    workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    refresh: bool = False,
+    region_bounds: Optional[Tuple[float, float, float, float]] = None
+) -> List[Optional[str]]:
+    """
+    Download tiles on a thread pool, each trying its sources in priority order.
+    
+    In-flight downloads per source are capped by SourceLimiter. After the first
+    tile fails on every source, no new tiles are started (tiles already in
+    flight finish). Tiles without data (NO_DATA_SOURCE) do not count as failed.
+    
+    Args:
+        tiles: Tile bounds (west, south, east, north)
+        tile_paths: Output path per tile
+        sources: Sources in priority order
+        workers: Maximum tiles in flight
+        refresh: Re-download tiles even if verified cached copies exist
+        region_bounds: Region extent, lets sparsely covered tiles be fetched as windows
+        
+    Returns:
+        source_id (or NO_DATA_SOURCE) per tile (None if it failed or was not started)
+    """
+    limiter = SourceLimiter()
+    stop = threading.Event()
+    progress_lock = threading.Lock()
+    total = len(tiles)
+    progress = {'done': 0, 'failed': 0}
+    results: List[Optional[str]] = [None] * total
+    names = {source.source_id: source.name for source in sources}
+    names[NO_DATA_SOURCE] = "no data (ocean)"
+    
+    def download(idx: int) -> None:
+        if stop.is_set():
+            return
+        source_id, errors = _try_sources(tiles[idx], sources, tile_paths[idx], limiter,
+                                         verbose=False, refresh=refresh, region_bounds=region_bounds)
+        results[idx] = source_id
+        with progress_lock:
+            progress['done'] += 1
+            if not source_id:
+                progress['failed'] += 1
+                stop.set()
+            status = names.get(source_id, source_id) if source_id else "FAILED"
+            print(f"  [{progress['done']}/{total}] {tile_paths[idx].name} <- {status} "
+                  f"({progress['failed']} failed)", flush=True)
+            if not source_id:
+                _print_tile_errors(tiles[idx], errors)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, total or 1))) as executor:
+        for future in as_completed([executor.submit(download, idx) for idx in range(total)]):
+            future.result()
+    
+    if stop.is_set() and progress['done'] < total:
+        print(f"  Stopped after a tile failed: {total - progress['done']} tile(s) not attempted", flush=True)
+    return results
+
+
 def download_tiles_for_region(
     region_id: str,
     region_bounds: Tuple[float, float, float, float],
     resolution_m: int,
-    tiles_dir: Path
+    tiles_dir: Path,
+    workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    refresh: bool = False
 ) -> list[Path]:
     """
     Download all tiles needed for a region, trying sources in priority order.
     
-    Uses standard 1×1 degree tiles for maximum reuse across regions.
+    Uses standard 1×1 degree tiles for maximum reuse across regions: tiles
+    already in the tile cache (checksum-verified) are not downloaded again.
+    Tiles are downloaded concurrently; per-source limits still apply.
     
     Args:
         region_id: Region identifier (for logging)
         region_bounds: (west, south, east, north)
         resolution_m: Required resolution in meters
         tiles_dir: Directory to store final tiles
+        workers: Tiles downloaded at the same time (1 = one after another)
+        refresh: Re-download tiles even if verified cached copies exist
         
     Returns:
-        List of successfully downloaded tile paths
+        List of successfully downloaded tile paths (in tile order)
     """
     from src.tile_geometry import calculate_1degree_tiles, tile_filename_from_bounds
     
@@ -238,9 +486,9 @@ def download_tiles_for_region(
     
     print(f"{'='*60}\n")
     
-    print(f"Downloading {len(tiles)} tiles at {resolution_m}m resolution")
+    print(f"Downloading {len(tiles)} tiles at {resolution_m}m resolution ({workers} at a time)")
     print(f"Tile size: 1×1 degree (standard reusable grid)")
-    print(f"Storage: data/raw/{{source}}/tiles/ (content-based reuse)")
+    print(f"Storage: data/raw/{{source}}/tiles/ (checksum-verified reuse{', refreshing' if refresh else ''})")
     print(f"\nAvailable sources (will try in order):")
     for idx, source in enumerate(sources, 1):
         auth_str = " (requires API key)" if source.requires_auth else ""
@@ -248,44 +496,41 @@ def download_tiles_for_region(
     
     # Track which sources were used
     source_usage = {}
-    downloaded_paths = []
     tiles_dir.mkdir(parents=True, exist_ok=True)
     
-    for idx, tile_bounds in enumerate(tiles, 1):
-        resolution_str = f"{resolution_m}m"
-        tile_filename = tile_filename_from_bounds(tile_bounds, resolution_str)
-        tile_path = tiles_dir / tile_filename
-        
-        # Skip tile reuse - always download fresh region-specific data
-        # (Tile directories remain for reference but are not reused)
-        
-        print(f"  [{idx}/{len(tiles)}] {tile_filename}")
-        
-        # Try sources in order
-        source_id = download_tile_with_sources(
-            tile_bounds,
-            resolution_m,
-            tile_path,
-            region_bounds,
-            verbose=True
-        )
-        
-        if source_id:
+    tile_paths = [tiles_dir / tile_filename_from_bounds(tile_bounds, f"{resolution_m}m") for tile_bounds in tiles]
+    results = download_tiles_concurrently(tiles, tile_paths, sources, workers, refresh, region_bounds)
+    
+    sources_by_id = {source.source_id: source for source in sources}
+    downloaded_paths = []
+    no_data_count = 0
+    for tile_bounds, tile_path, source_id in zip(tiles, tile_paths, results):
+        if source_id == NO_DATA_SOURCE:
+            no_data_count += 1
+        elif source_id:
+            # Sub-tiles keep their own name (the whole tile was never downloaded)
+            window = source_window(sources_by_id[source_id], tile_bounds, region_bounds)
+            if window is not None:
+                tile_path = source_tile_path(sources_by_id[source_id], tile_bounds, window)
             downloaded_paths.append(tile_path)
             source_usage[source_id] = source_usage.get(source_id, 0) + 1
-        else:
-            # CRITICAL FAILURE: No source could download this tile
-            print(f"\n{'='*60}")
-            print(f"ERROR: All sources failed for tile {tile_filename}")
-            print(f"Bounds: {tile_bounds}")
-            print(f"This is a critical error - cannot continue without this tile.")
-            print(f"{'='*60}\n")
-            
-            # Return what we have so far (will fail in merge stage)
-            return downloaded_paths
+    
+    if len(downloaded_paths) + no_data_count < len(tiles):
+        # CRITICAL FAILURE: some tile could not be downloaded from any source
+        failed = [path.name for path, source_id in zip(tile_paths, results) if not source_id]
+        print(f"\n{'='*60}")
+        print(f"ERROR: {len(failed)} tile(s) not downloaded: {', '.join(failed[:10])}"
+              f"{' ...' if len(failed) > 10 else ''}")
+        print(f"This is a critical error - cannot continue without these tiles.")
+        print(f"{'='*60}\n")
+        
+        # Return what we have (will fail in merge stage)
+        return downloaded_paths
     
     # Summary
     print(f"\nDownload complete: {len(downloaded_paths)}/{len(tiles)} tiles")
+    if no_data_count:
+        print(f"Skipped {no_data_count} tile(s) without data (ocean/void)")
     if source_usage:
         print(f"Sources used:")
         for source_id, count in source_usage.items():
@@ -26,6 +26,7 @@ class SourceCapability:
     requires_auth: bool               # Whether API key or authentication needed
     auth_key_name: Optional[str]      # Key name in settings.json if requires_auth
     notes: str = ""                   # Additional information
+    max_in_flight: int = 4            # Concurrent downloads allowed (sources sharing auth_key_name share the limit)
     
     def covers_region(self, bounds: Tuple[float, float, float, float]) -> bool:
         """Check if this source covers the given bounds (west, south, east, north)."""
@@ -84,7 +85,8 @@ SOURCE_REGISTRY: List[SourceCapability] = [
         merged_dir='srtm_30m',
         requires_auth=True,
         auth_key_name='opentopography.api_key',
-        notes='SRTM data via OpenTopography API'
+        notes='SRTM data via OpenTopography API',
+        max_in_flight=2
     ),
     
     SourceCapability(
@@ -97,7 +99,8 @@ SOURCE_REGISTRY: List[SourceCapability] = [
         merged_dir='srtm_30m',
         requires_auth=True,
         auth_key_name='opentopography.api_key',
-        notes='Copernicus DEM via OpenTopography API'
+        notes='Copernicus DEM via OpenTopography API',
+        max_in_flight=2
     ),
     
     # TEMPORARILY DISABLED - Other 30m sources
@@ -138,7 +141,8 @@ SOURCE_REGISTRY: List[SourceCapability] = [
         merged_dir='srtm_90m',
         requires_auth=True,
         auth_key_name='opentopography.api_key',
-        notes='SRTM 90m via OpenTopography API'
+        notes='SRTM 90m via OpenTopography API',
+        max_in_flight=2
     ),
     
     SourceCapability(
@@ -151,7 +155,8 @@ SOURCE_REGISTRY: List[SourceCapability] = [
         merged_dir='srtm_90m',
         requires_auth=True,
         auth_key_name='opentopography.api_key',
-        notes='Copernicus 90m via OpenTopography API'
+        notes='Copernicus 90m via OpenTopography API',
+        max_in_flight=2
     ),
     
     # TEMPORARILY DISABLED - Other 90m sources
@@ -13,7 +13,7 @@ Features:
 
 from pathlib import Path
 from typing import Tuple, Optional
-import requests
+from src.downloaders.resumable import download_resumable, tqdm_progress
 from tqdm import tqdm
 
 from src.downloaders.rate_limit import check_rate_limit, record_rate_limit_hit, record_successful_request
@@ -71,7 +71,18 @@ def download_chunk_90m(
     }
     
     try:
-        response = requests.get(url, params=params, stream=True, timeout=300)
+        import time
+        start_time = time.time()
+        
+        with tqdm(
+            desc=f"Chunk {width:.0f}x{height:.0f}deg",
+            unit='B',
+            unit_scale=True,
+            unit_divisor=1024,
+            bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
+        ) as pbar:
+            response = download_resumable(url, output_path, params=params, timeout=300,
+                                          progress=tqdm_progress(pbar))
         
         # Check for 401 (Unauthorized) - rate limit or quota exceeded
         if response.status_code == 401:
@@ -87,25 +98,6 @@ def download_chunk_90m(
         
         response.raise_for_status()
         
-        total_size = int(response.headers.get('content-length', 0))
-        
-        import time
-        start_time = time.time()
-        
-        with open(output_path, 'wb') as f:
-            with tqdm(
-                desc=f"Chunk {width:.0f}x{height:.0f}deg",
-                total=total_size,
-                unit='B',
-                unit_scale=True,
-                unit_divisor=1024,
-                bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
-            ) as pbar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        pbar.update(len(chunk))
-        
         elapsed_time = time.time() - start_time
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
         download_speed = file_size_mb / elapsed_time if elapsed_time > 0 else 0
@@ -177,7 +169,18 @@ def download_single_tile_90m(
     }
     
     try:
-        response = requests.get(url, params=params, stream=True, timeout=300)
+        import time
+        start_time = time.time()
+        
+        with tqdm(
+            desc="Downloading",
+            unit='B',
+            unit_scale=True,
+            unit_divisor=1024,
+            bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
+        ) as pbar:
+            response = download_resumable(url, output_path, params=params, timeout=300,
+                                          progress=tqdm_progress(pbar))
         
         # Check for 401 (Unauthorized) - rate limit or quota exceeded
         if response.status_code == 401:
@@ -193,25 +196,6 @@ def download_single_tile_90m(
         
         response.raise_for_status()
         
-        total_size = int(response.headers.get('content-length', 0))
-        
-        import time
-        start_time = time.time()
-        
-        with open(output_path, 'wb') as f:
-            with tqdm(
-                desc="Downloading",
-                total=total_size,
-                unit='B',
-                unit_scale=True,
-                unit_divisor=1024,
-                bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
-            ) as pbar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        pbar.update(len(chunk))
-        
         elapsed_time = time.time() - start_time
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
         download_speed = file_size_mb / elapsed_time if elapsed_time > 0 else 0
@@ -0,0 +1,209 @@
+"""
+Binary viewer export format (export_v3).
+
+A compact alternative to the export_v2 JSON: a small JSON header followed by
+a little-endian int16 (quantized) or float16 payload, gzip-wrapped so the
+viewer's existing DecompressionStream path still applies.
+
+File layout (after gzip decompression):
+    offset 0   4 bytes   magic b'AMX3'
+    offset 4   uint32    header length in bytes (little-endian)
+    offset 8   header    UTF-8 JSON, space-padded so the payload starts 8-byte aligned
+    payload              bands x height x width values, row-major, little-endian
+
+Header fields mirror export_v2 (version, region_id, source, name, width,
+height, bounds, stats) plus:
+    "bands":    band names in payload order (e.g. ["elevation"])
+    "encoding": {"dtype": "int16" | "float16", "scale", "offset", "nodata"}
+
+Decoding: value = raw * scale + offset; raw == nodata (int16) or NaN (float16)
+means no data. The matching viewer decoder is js/elevation-format.js.
+"""
+
+import gzip
+import json
+import struct
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+EXPORT_V3_MAGIC = b'AMX3'
+EXPORT_V3_SUFFIX = '.bin.gz'
+
+# int16 sentinel for missing data; valid codes are -32767..32767
+INT16_NODATA = -32768
+INT16_MAX_CODE = 32767
+
+# Smallest quantization step (m) - keeps flat regions from dividing by zero
+MIN_INT16_SCALE = 0.001
+
+# gzip level: payload is already compact, level 6 is near-optimal and much faster than 9
+EXPORT_V3_GZIP_LEVEL = 6
+
+SUPPORTED_DTYPES = ('int16', 'float16')
+
+
+def encode_band(values: np.ndarray, dtype: str = 'int16') -> Tuple[np.ndarray, Dict]:
+    """
+    Encode a float grid (NaN = no data) into the export_v3 payload dtype.
+
+    Args:
+        values: 2D float array, NaN marks missing data
+        dtype: 'int16' (quantized with scale/offset) or 'float16'
+
+    Returns:
+        Tuple of (encoded little-endian array, encoding dict for the header)
+    """
+    values = np.asarray(values, dtype=np.float32)
+    valid = ~np.isnan(values)
+
+    if dtype == 'float16':
+        encoded = values.astype('<f2')
+        return encoded, {"dtype": "float16", "scale": 1.0, "offset": 0.0, "nodata": None}
+
+    if dtype != 'int16':
+        raise ValueError(f"Unknown export_v3 dtype: {dtype} (must be one of {SUPPORTED_DTYPES})")
+
+    if valid.any():
+        vmin = float(values[valid].min())
+        vmax = float(values[valid].max())
+    else:
+        vmin = vmax = 0.0
+    offset = (vmin + vmax) / 2.0
+    scale = max((vmax - vmin) / (2 * INT16_MAX_CODE), MIN_INT16_SCALE)
+
+    encoded = np.full(values.shape, INT16_NODATA, dtype='<i2')
+    codes = np.rint((values[valid] - offset) / scale)
+    encoded[valid] = np.clip(codes, -INT16_MAX_CODE, INT16_MAX_CODE)
+    return encoded, {"dtype": "int16", "scale": scale, "offset": offset, "nodata": INT16_NODATA}
+
+
+def decode_band(encoded: np.ndarray, encoding: Dict) -> np.ndarray:
+    """
+    Decode an export_v3 payload band back to float32 (NaN = no data).
+
+    Args:
+        encoded: Encoded 2D array as stored in the payload
+        encoding: Encoding dict from the header
+
+    Returns:
+        float32 array
+    """
+    values = encoded.astype(np.float32) * np.float32(encoding["scale"]) + np.float32(encoding["offset"])
+    if encoding["dtype"] == 'int16':
+        values[encoded == encoding["nodata"]] = np.nan
+    return values
+
+
+def _build_prefix(header: Dict) -> bytes:
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    # Pad with spaces so the payload starts 8-byte aligned (typed array views in JS)
+    pad = (-(8 + len(header_bytes))) % 8
+    header_bytes += b' ' * pad
+    return EXPORT_V3_MAGIC + struct.pack('<I', len(header_bytes)) + header_bytes
+
+
+def write_export_v3(
+    output_path: Path,
+    header: Dict,
+    bands: List[np.ndarray],
+    band_names: List[str],
+    dtype: str = 'int16'
+) -> Dict:
+    """
+    Write an export_v3 file.
+
+    Args:
+        output_path: Destination (*.bin.gz)
+        header: Header fields (region_id, source, name, bounds, stats, ...)
+        bands: 2D float arrays (NaN = no data), all the same shape
+        band_names: Name for each band (e.g. ["elevation"])
+        dtype: Payload dtype ('int16' or 'float16')
+
+    Returns:
+        The complete header written to the file
+    """
+    if not bands or len(bands) != len(band_names):
+        raise ValueError("bands and band_names must be non-empty and the same length")
+    height, width = bands[0].shape
+
+    encoded_bands = []
+    encodings = []
+    for band in bands:
+        if band.shape != (height, width):
+            raise ValueError(f"Band shape {band.shape} does not match {(height, width)}")
+        encoded, encoding = encode_band(band, dtype)
+        encoded_bands.append(encoded)
+        encodings.append(encoding)
+
+    full_header = dict(header)
+    full_header.update({
+        "version": "export_v3",
+        "width": int(width),
+        "height": int(height),
+        "bands": list(band_names),
+        # First band's encoding at top level; per-band list when there are several
+        "encoding": encodings[0],
+    })
+    if len(encodings) > 1:
+        full_header["band_encodings"] = encodings
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(output_path, 'wb', compresslevel=EXPORT_V3_GZIP_LEVEL) as f:
+        f.write(_build_prefix(full_header))
+        for encoded in encoded_bands:
+            f.write(encoded.tobytes())
+    return full_header
+
+
+def _read_prefix(f) -> Tuple[Dict, int]:
+    magic = f.read(4)
+    if magic != EXPORT_V3_MAGIC:
+        raise ValueError(f"Not an export_v3 file (magic {magic!r})")
+    (header_len,) = struct.unpack('<I', f.read(4))
+    header = json.loads(f.read(header_len).decode('utf-8'))
+    return header, 8 + header_len
+
+
+def read_export_v3_header(path: Path) -> Dict:
+    """
+    Read only the JSON header of an export_v3 file (no payload decompression).
+
+    Args:
+        path: Path to *.bin.gz export
+
+    Returns:
+        Header dict
+    """
+    with gzip.open(path, 'rb') as f:
+        header, _ = _read_prefix(f)
+    return header
+
+
+def read_export_v3(path: Path) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Read an export_v3 file.
+
+    Args:
+        path: Path to *.bin.gz export
+
+    Returns:
+        Tuple of (header, {band_name: float32 array with NaN for no data})
+    """
+    with gzip.open(path, 'rb') as f:
+        header, _ = _read_prefix(f)
+        payload = f.read()
+
+    width, height = header["width"], header["height"]
+    encodings = header.get("band_encodings", [header["encoding"]])
+    band_values = {}
+    offset = 0
+    for name, encoding in zip(header["bands"], encodings):
+        np_dtype = '<i2' if encoding["dtype"] == 'int16' else '<f2'
+        count = width * height
+        encoded = np.frombuffer(payload, dtype=np_dtype, count=count, offset=offset).reshape(height, width)
+        offset += count * 2
+        band_values[name] = decode_band(encoded, encoding)
+    return header, band_values
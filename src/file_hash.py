@@ -0,0 +1,188 @@
+"""
+Shared file hashing service with a persistent hash index.
+
+Raw and merged GeoTIFFs can be several GB, and the pipeline hashes the same
+inputs on every run (metadata, stage fingerprints). This module hashes each
+file at most once per content change:
+
+- Digests are cached in a persistent index keyed on (path, size, mtime_ns, inode).
+  A cache hit costs one stat() instead of a full file read.
+- Files are read with a large reusable buffer (readinto, no per-chunk allocation).
+- The default digest is BLAKE2b (128-bit), faster than MD5/SHA256 in CPython.
+
+Usage:
+    from src.file_hash import compute_file_hash
+
+    digest = compute_file_hash(path)                  # BLAKE2b, cached
+    digest = compute_file_hash(path, 'sha256')        # other algorithms also cached
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import filelock
+
+
+# Index location (shared across all processes)
+HASH_INDEX_PATH = Path("data/.cache/file_hash_index.json")
+
+# Default digest: BLAKE2b with 16-byte output (same hex length as MD5)
+DEFAULT_HASH_ALGORITHM = 'blake2b'
+
+# Read buffer size for hashing (large sequential reads)
+HASH_READ_BUFFER_BYTES = 8 * 1024 * 1024
+
+
+def file_identity(filepath: Path) -> Tuple[int, int, int]:
+    """
+    Get the identity of a file's current contents from a single stat().
+
+    Args:
+        filepath: Path to file
+
+    Returns:
+        Tuple of (size, mtime_ns, inode)
+    """
+    stat = os.stat(filepath)
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def _new_hasher(algorithm: str):
+    if algorithm == 'blake2b':
+        return hashlib.blake2b(digest_size=16)
+    if algorithm in ('md5', 'sha1', 'sha256'):
+        return hashlib.new(algorithm)
+    raise ValueError(f"Unknown hash algorithm: {algorithm} (must be 'blake2b', 'md5', 'sha1' or 'sha256')")
+
+
+def hash_file_contents(filepath: Path, algorithm: str = DEFAULT_HASH_ALGORITHM) -> str:
+    """
+    Hash a file's contents (always reads the file; no index).
+
+    Args:
+        filepath: Path to file
+        algorithm: 'blake2b', 'md5', 'sha1' or 'sha256'
+
+    Returns:
+        Hex digest
+    """
+    hasher = _new_hasher(algorithm)
+    buffer = bytearray(HASH_READ_BUFFER_BYTES)
+    view = memoryview(buffer)
+    with open(filepath, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+class FileHashIndex:
+    """Persistent map of file path -> identity and digests."""
+
+    def __init__(self, index_path: Path = HASH_INDEX_PATH):
+        self.index_path = index_path
+        self.lock_path = index_path.with_suffix('.lock')
+        self._entries: Optional[Dict[str, Dict]] = None
+
+    def _key(self, filepath: Path) -> str:
+        return Path(filepath).resolve().as_posix()
+
+    def _read_index(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('files', {})
+        except (json.JSONDecodeError, OSError):
+            # Corrupted index - start over (files will be re-hashed)
+            return {}
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = self._read_index()
+        return self._entries
+
+    def get(self, filepath: Path, algorithm: str) -> Optional[str]:
+        """
+        Get a cached digest if the file is unchanged since it was hashed.
+
+        Args:
+            filepath: Path to file
+            algorithm: Digest algorithm
+
+        Returns:
+            Hex digest, or None on miss
+        """
+        entry = self._load().get(self._key(filepath))
+        if entry is None:
+            return None
+        if tuple(entry.get('identity', ())) != file_identity(filepath):
+            return None
+        return entry.get('digests', {}).get(algorithm)
+
+    def put(self, filepath: Path, identity: Tuple[int, int, int], algorithm: str, digest: str) -> None:
+        """
+        Record a digest for a file identity.
+
+        Args:
+            filepath: Path to file
+            identity: (size, mtime_ns, inode) observed before hashing
+            algorithm: Digest algorithm
+            digest: Hex digest
+        """
+        key = self._key(filepath)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with filelock.FileLock(str(self.lock_path), timeout=30):
+            # Merge with entries written by other processes since we loaded
+            entries = self._read_index()
+            entry = entries.get(key)
+            if entry is None or tuple(entry.get('identity', ())) != identity:
+                entry = {'identity': list(identity), 'digests': {}}
+            entry['digests'][algorithm] = digest
+            entries[key] = entry
+            tmp_path = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'files': entries}, f)
+            os.replace(tmp_path, self.index_path)
+        self._entries = entries
+
+
+# Global instance
+_hash_index = None
+
+
+def get_hash_index() -> FileHashIndex:
+    """Get or create the global file hash index."""
+    global _hash_index
+    if _hash_index is None:
+        _hash_index = FileHashIndex()
+    return _hash_index
+
+
+def compute_file_hash(filepath: Path, algorithm: str = DEFAULT_HASH_ALGORITHM) -> str:
+    """
+    Compute hash of a file, reusing the persistent index when the file is unchanged.
+
+    Args:
+        filepath: Path to file
+        algorithm: 'blake2b' (default), 'md5', 'sha1' or 'sha256'
+
+    Returns:
+        Hex digest of file contents
+    """
+    index = get_hash_index()
+    cached = index.get(filepath, algorithm)
+    if cached is not None:
+        return cached
+
+    identity = file_identity(filepath)
+    digest = hash_file_contents(filepath, algorithm)
+    # Only record if the file did not change while we were reading it
+    if file_identity(filepath) == identity:
+        index.put(filepath, identity, algorithm, digest)
+    return digest
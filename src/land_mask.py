@@ -0,0 +1,144 @@
+"""
+1-degree land mask for skipping ocean tiles before any download.
+
+Open-ocean 1x1 degree tiles have no DEM data: Copernicus/AW3D30 answer 404 and
+the source coordinator used to try every source for them on every run. The
+mask marks each 1-degree cell touched by a Natural Earth land or minor-island
+polygon (all_touched rasterization, so small islands and coastlines count as
+land); tiles whose cells are all water are skipped.
+
+The mask is built once from the Natural Earth 10m physical layers and cached
+as data/.cache/land_mask_1deg.npy (180 x 360 booleans, row 0 = 90S..89S,
+column 0 = 180W..179W). If it cannot be built (e.g. offline), every tile is
+treated as land and nothing is skipped.
+
+Usage:
+    from src.land_mask import get_land_mask
+
+    if not get_land_mask().tile_has_land(tile_bounds):
+        ...  # ocean tile - nothing to download
+"""
+
+import math
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+
+# Cached mask location
+LAND_MASK_PATH = Path("data/.cache/land_mask_1deg.npy")
+
+# Natural Earth physical layers rasterized into the mask
+NATURAL_EARTH_LAND_URLS = (
+    "https://naciscdn.org/naturalearth/10m/physical/ne_10m_land.zip",
+    "https://naciscdn.org/naturalearth/10m/physical/ne_10m_minor_islands.zip",
+)
+
+
+def build_land_mask(geometries: Iterable) -> np.ndarray:
+    """
+    Rasterize land polygons (EPSG:4326) onto the 1-degree grid.
+
+    Args:
+        geometries: Shapely geometries of land areas
+
+    Returns:
+        Boolean array (180, 360); row 0 is the southernmost band
+    """
+    from rasterio.features import rasterize
+    from rasterio.transform import from_origin
+
+    # Rasterize north-up, then flip so row index = south latitude + 90
+    burned = rasterize(
+        ((geom, 1) for geom in geometries),
+        out_shape=(180, 360),
+        transform=from_origin(-180.0, 90.0, 1.0, 1.0),
+        fill=0,
+        all_touched=True,
+        dtype='uint8',
+    )
+    return np.flipud(burned).astype(bool)
+
+
+class LandMask:
+    """1-degree land/water grid."""
+
+    def __init__(self, mask: Optional[np.ndarray]):
+        """
+        Args:
+            mask: Boolean (180, 360) grid, or None to treat everything as land
+        """
+        self.mask = mask
+
+    def tile_has_land(self, tile_bounds: Tuple[float, float, float, float]) -> bool:
+        """
+        Check whether any 1-degree cell overlapping the bounds contains land.
+
+        Args:
+            tile_bounds: (west, south, east, north) in degrees
+
+        Returns:
+            False only if every overlapping cell is water
+        """
+        if self.mask is None:
+            return True
+        west, south, east, north = tile_bounds
+        row0 = max(0, math.floor(south) + 90)
+        row1 = min(180, math.ceil(north) + 90)
+        col0 = max(0, math.floor(west) + 180)
+        col1 = min(360, math.ceil(east) + 180)
+        if row0 >= row1 or col0 >= col1:
+            return True
+        return bool(self.mask[row0:row1, col0:col1].any())
+
+
+def load_land_mask(mask_path: Path = LAND_MASK_PATH) -> LandMask:
+    """
+    Load the cached land mask, building it from Natural Earth on first use.
+
+    Args:
+        mask_path: Cache file location
+
+    Returns:
+        LandMask (treats everything as land if the mask cannot be built)
+    """
+    if mask_path.exists():
+        try:
+            return LandMask(np.load(mask_path))
+        except (OSError, ValueError):
+            pass  # Corrupted cache - rebuild
+
+    try:
+        import geopandas as gpd
+
+        print("  Building 1-degree land mask from Natural Earth...", flush=True)
+        geometries = []
+        for url in NATURAL_EARTH_LAND_URLS:
+            geometries.extend(gpd.read_file(url).to_crs('EPSG:4326').geometry.dropna())
+        mask = build_land_mask(geometries)
+    except Exception as e:
+        print(f"  WARNING: Land mask unavailable ({type(e).__name__}: {e}); ocean tiles will not be skipped",
+              flush=True)
+        return LandMask(None)
+
+    mask_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = mask_path.with_suffix('.tmp.npy')
+    np.save(tmp_path, mask)
+    tmp_path.replace(mask_path)
+    return LandMask(mask)
+
+
+# Global instance
+_land_mask = None
+_land_mask_lock = threading.Lock()
+
+
+def get_land_mask() -> LandMask:
+    """Get or load the global land mask."""
+    global _land_mask
+    with _land_mask_lock:
+        if _land_mask is None:
+            _land_mask = load_land_mask()
+        return _land_mask
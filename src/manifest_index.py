@@ -0,0 +1,266 @@
+"""
+Persistent index of per-export manifest records.
+
+update_regions_manifest needs a few fields per export (region_id, file,
+bounds, stats, source, plus pyramid/tile details). Reading them from the
+exports themselves means parsing multi-MB elevation JSON. Instead:
+
+- Every export writes a small manifest record into its _meta.json sidecar
+  (create_export_metadata(manifest_record=...)), stamped with the export's
+  identity; a sidecar whose identity no longer matches is ignored.
+- This index caches one record per export file, keyed on the file's identity
+  (size, mtime_ns, inode). Building the manifest lists generated/regions and
+  only reads records for exports that are new or changed since the last run,
+  so a pipeline run re-reads just the region it produced.
+- Files without a sidecar record (older exports) fall back to reading the
+  export itself (v3 header only; v2 JSON in full), once per change.
+
+Record fields:
+    kind        'export', 'pyramid' or 'tiles'
+    file        path relative to generated/regions
+    region_id, source, format, bounds, stats (when known)
+    pyramid:    factor, width, height, bands, base_file
+    tiles:      index, tile_size, max_zoom, base_width, base_height
+
+Usage:
+    from src.manifest_index import get_manifest_index
+
+    records = get_manifest_index().records(Path("generated/regions"))
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import filelock
+
+from src.file_hash import file_identity
+
+
+# Index location (shared across all processes)
+MANIFEST_INDEX_PATH = Path("data/.cache/manifest_index.json")
+
+# Filename suffixes of legacy v2 exports written before region_id was stored in the JSON
+LEGACY_V2_SUFFIXES = ['_srtm_30m_2048px_v2', '_srtm_30m_800px_v2', '_srtm_30m_v2', '_bbox_30m', '_usa_3dep_2048px_v2']
+
+
+def export_manifest_record(
+    export_path: Path,
+    region_id: str,
+    source: str,
+    export_format: str,
+    bounds: Dict,
+    stats: Dict
+) -> Dict:
+    """
+    Build the manifest record stored in an export's metadata sidecar.
+
+    Args:
+        export_path: Path to the export file (already written)
+        region_id: Region identifier
+        source: Data source
+        export_format: 'export_v2' or 'export_v3'
+        bounds: Bounds dict (left, right, top, bottom) in EPSG:4326
+        stats: Stats dict (min, max, mean)
+
+    Returns:
+        Record dict
+    """
+    return {
+        "kind": "export",
+        "file": export_path.name,
+        "file_identity": list(file_identity(export_path)),
+        "region_id": region_id,
+        "source": source,
+        "format": export_format,
+        "bounds": bounds,
+        "stats": stats,
+    }
+
+
+def _sidecar_record(path: Path) -> Optional[Dict]:
+    from src.metadata import get_metadata_path
+    meta_path = get_metadata_path(path)
+    if not meta_path.exists():
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            record = json.load(f).get('manifest')
+    except (json.JSONDecodeError, OSError):
+        return None
+    # A sidecar left over from an earlier export of the same name (or older
+    # sidecars recording only the size) is ignored
+    if not record or record.get('file_identity') != list(file_identity(path)):
+        return None
+    return record
+
+
+def _legacy_v2_record(path: Path) -> Optional[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    region_id = data.get("region_id")
+    if not region_id:
+        # Fallback: infer from filename (for old files during migration)
+        for suffix in LEGACY_V2_SUFFIXES:
+            if path.stem.endswith(suffix):
+                region_id = path.stem[:-len(suffix)]
+                break
+    if not region_id:
+        return None
+    record = {"kind": "export", "file": path.name, "region_id": region_id, "format": data.get("version")}
+    for key in ("bounds", "stats", "source"):
+        if key in data:
+            record[key] = data[key]
+    return record
+
+
+def _v3_header_record(path: Path) -> Optional[Dict]:
+    from src.export_binary import read_export_v3_header
+    header = read_export_v3_header(path)
+    if header.get("pyramid_factor"):
+        return {
+            "kind": "pyramid",
+            "file": path.name,
+            "region_id": header.get("region_id"),
+            "base_file": header.get("base_file"),
+            "factor": header["pyramid_factor"],
+            "width": header["width"],
+            "height": header["height"],
+            "bands": header["bands"],
+        }
+    if not header.get("region_id"):
+        return None
+    record = {"kind": "export", "file": path.name, "region_id": header["region_id"], "format": "export_v3"}
+    for key in ("bounds", "stats", "source"):
+        if key in header:
+            record[key] = header[key]
+    return record
+
+
+def _tiles_record(path: Path, generated_dir: Path) -> Optional[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    if not index.get("region_id"):
+        return None
+    return {
+        "kind": "tiles",
+        "file": path.relative_to(generated_dir).as_posix(),
+        "region_id": index["region_id"],
+        "source": index.get("source"),
+        "tile_size": index["tile_size"],
+        "max_zoom": index["max_zoom"],
+        "base_width": index["base_width"],
+        "base_height": index["base_height"],
+    }
+
+
+def read_manifest_record(path: Path, generated_dir: Path) -> Optional[Dict]:
+    """
+    Read the manifest record for one file in generated/regions.
+
+    Args:
+        path: Export file, pyramid level or tile index
+        generated_dir: Manifest directory (records use paths relative to it)
+
+    Returns:
+        Record dict, or None if the file is not a usable export
+    """
+    if path.name == "index.json" and path.parent.parent.name == "tiles":
+        return _tiles_record(path, generated_dir)
+    record = _sidecar_record(path)
+    if record is not None:
+        return record
+    if path.name.endswith('_v3.bin.gz'):
+        return _v3_header_record(path)
+    return _legacy_v2_record(path)
+
+
+def _candidate_files(generated_dir: Path) -> List[Path]:
+    files = []
+    for path in generated_dir.glob("*.json"):
+        stem = path.stem
+        if stem.endswith('_meta') or stem.endswith('_borders') or 'manifest' in stem:
+            continue
+        files.append(path)
+    files.extend(generated_dir.glob("*_v3.bin.gz"))
+    files.extend(generated_dir.glob("tiles/*/index.json"))
+    return sorted(files)
+
+
+class ManifestIndex:
+    """Persistent map of export file -> identity and manifest record."""
+
+    def __init__(self, index_path: Path = MANIFEST_INDEX_PATH):
+        self.index_path = index_path
+        self.lock_path = index_path.with_suffix('.lock')
+
+    def _read_index(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('files', {})
+        except (json.JSONDecodeError, OSError):
+            # Corrupted index - start over (records will be re-read)
+            return {}
+
+    def records(self, generated_dir: Path) -> List[Dict]:
+        """
+        Get the manifest records of all exports in a directory.
+
+        Only new or changed files are read; records of removed files are dropped.
+
+        Args:
+            generated_dir: Manifest directory (generated/regions)
+
+        Returns:
+            Records in sorted file order
+        """
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with filelock.FileLock(str(self.lock_path), timeout=30):
+            entries = self._read_index()
+            updated = {}
+            changed = False
+            records = []
+            for path in _candidate_files(generated_dir):
+                key = path.resolve().as_posix()
+                identity = list(file_identity(path))
+                entry = entries.get(key)
+                if entry is None or entry.get('identity') != identity:
+                    try:
+                        record = read_manifest_record(path, generated_dir)
+                    except Exception:
+                        record = None
+                    entry = {'identity': identity, 'record': record}
+                    changed = True
+                updated[key] = entry
+                if entry['record'] is not None:
+                    records.append(entry['record'])
+
+            # Keep entries of other directories; drop removed files of this one
+            prefix = generated_dir.resolve().as_posix() + '/'
+            for key, entry in entries.items():
+                if not key.startswith(prefix):
+                    updated[key] = entry
+                elif key not in updated:
+                    changed = True
+
+            if changed:
+                tmp_path = self.index_path.with_suffix('.json.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'files': updated}, f)
+                os.replace(tmp_path, self.index_path)
+        return records
+
+
+# Global instance
+_manifest_index = None
+
+
+def get_manifest_index() -> ManifestIndex:
+    """Get or create the global manifest index."""
+    global _manifest_index
+    if _manifest_index is None:
+        _manifest_index = ManifestIndex()
+    return _manifest_index
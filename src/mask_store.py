@@ -0,0 +1,302 @@
+"""
+Store of rasterized boundary masks.
+
+Rasterizing a detailed boundary onto a full-resolution grid is expensive and
+was repeated on every clip. This store keeps each rasterized mask as a
+bit-packed, compressed array (np.packbits + savez_compressed, 1 bit/pixel)
+keyed by:
+
+    (boundary_name, boundary_type, border_resolution, CRS, grid transform, shape,
+     Natural Earth source file identity)
+
+Lookups, in order:
+1. Exact key hit: unpack and return.
+2. A stored finer mask of the same boundary and CRS covering the grid: the
+   coarse mask is derived from it (area average, inside if >= 50% covered).
+3. Otherwise rasterize the prepared boundary (src/boundary_cache.py). If a
+   reference grid is given (e.g. the full-resolution grid of a warp), the mask
+   is rasterized there once and the requested grid is derived from it, so
+   later requests at other resolutions never rasterize again. Reference grids
+   are coarsened to at most MASK_MAX_REFERENCE_PIXELS; if that is no finer
+   than the requested grid, the requested grid is rasterized directly.
+
+Masks are True inside the boundary.
+
+Usage:
+    from src.mask_store import get_boundary_mask
+
+    inside = get_boundary_mask("United States of America/Utah", "state", "10m",
+                               dst_crs, out_transform, (height, width))
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import filelock
+import numpy as np
+
+from src.boundary_cache import boundary_source_identity, get_prepared_boundary, tolerance_for_pixel_size
+
+
+# Store location (one .npz per mask, plus index.json describing each grid)
+MASK_STORE_DIR = Path("data/.cache/masks")
+
+# Largest reference grid rasterized (pixels); bigger grids are coarsened by powers of 2.
+# Bounds memory to ~1 byte/pixel for the mask plus 4 bytes/pixel of the output grid
+MASK_MAX_REFERENCE_PIXELS = 8 * 1024 * 1024
+
+# A derived pixel is inside when at least this fraction of it is covered by the finer mask
+DERIVED_MASK_THRESHOLD = 0.5
+
+
+def _crs_key(crs) -> str:
+    from rasterio.crs import CRS
+    return CRS.from_user_input(crs).to_string()
+
+
+def _boundary_key(boundary_name: str, boundary_type: str, border_resolution: str, crs) -> str:
+    return json.dumps([boundary_name, boundary_type, border_resolution, _crs_key(crs),
+                       boundary_source_identity(boundary_type, border_resolution)])
+
+
+def _grid_key(transform, shape: Tuple[int, int]) -> list:
+    return [round(float(v), 9) for v in list(transform)[:6]] + [int(shape[0]), int(shape[1])]
+
+
+def _grid_bounds(transform, shape: Tuple[int, int]) -> Tuple[float, float, float, float]:
+    height, width = shape
+    xs = [transform.c, transform.c + transform.a * width]
+    ys = [transform.f, transform.f + transform.e * height]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class BoundaryMaskStore:
+    """Bit-packed boundary masks on disk, indexed by boundary and grid."""
+
+    def __init__(self, store_dir: Path = MASK_STORE_DIR):
+        self.store_dir = store_dir
+        self.index_path = store_dir / "index.json"
+        self.lock_path = store_dir / "index.lock"
+
+    def _read_index(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('masks', {})
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _load_mask(self, filename: str, shape: Tuple[int, int]) -> Optional[np.ndarray]:
+        try:
+            with np.load(self.store_dir / filename) as data:
+                bits = data['bits']
+        except (OSError, KeyError, ValueError):
+            return None
+        count = shape[0] * shape[1]
+        return np.unpackbits(bits, count=count).reshape(shape).astype(bool)
+
+    def _save_mask(self, boundary_key: str, transform, shape: Tuple[int, int], mask: np.ndarray) -> None:
+        grid = _grid_key(transform, shape)
+        digest = hashlib.sha256(json.dumps([boundary_key, grid]).encode('utf-8')).hexdigest()[:16]
+        slug = re.sub(r'[^a-z0-9]+', '_', json.loads(boundary_key)[0].lower()).strip('_')
+        filename = f"{slug}_{digest}.npz"
+
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.store_dir / f"{filename}.tmp.npz"
+        np.savez_compressed(tmp_path, bits=np.packbits(mask.ravel()))
+        os.replace(tmp_path, self.store_dir / filename)
+
+        with filelock.FileLock(str(self.lock_path), timeout=30):
+            entries = self._read_index()
+            entries[filename] = {'boundary': boundary_key, 'grid': grid}
+            tmp_index = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_index, 'w', encoding='utf-8') as f:
+                json.dump({'masks': entries}, f)
+            os.replace(tmp_index, self.index_path)
+
+    def _find(self, boundary_key: str, transform, shape: Tuple[int, int]):
+        """Find an exact mask, else the coarsest stored finer mask covering the grid."""
+        grid = _grid_key(transform, shape)
+        west, south, east, north = _grid_bounds(transform, shape)
+        best = None
+        for filename, entry in self._read_index().items():
+            if entry['boundary'] != boundary_key:
+                continue
+            if entry['grid'] == grid:
+                return 'exact', filename, entry
+            a, b, c, d, e, f, height, width = entry['grid']
+            if abs(a) > abs(transform.a) or abs(e) > abs(transform.e) or b or d:
+                continue
+            from rasterio import Affine
+            f_west, f_south, f_east, f_north = _grid_bounds(Affine(a, b, c, d, e, f), (height, width))
+            eps = abs(a) / 2
+            if f_west > west + eps or f_south > south + eps or f_east < east - eps or f_north < north - eps:
+                continue
+            if best is None or height * width < best[2]['grid'][6] * best[2]['grid'][7]:
+                best = ('finer', filename, entry)
+        return best
+
+    def _derive(self, fine: np.ndarray, fine_transform, crs, transform, shape: Tuple[int, int]) -> np.ndarray:
+        from rasterio.warp import reproject, Resampling
+        coverage = np.zeros(shape, dtype=np.float32)
+        reproject(
+            source=fine.view(np.uint8),
+            destination=coverage,
+            src_transform=fine_transform,
+            src_crs=crs,
+            dst_transform=transform,
+            dst_crs=crs,
+            resampling=Resampling.average
+        )
+        return coverage >= DERIVED_MASK_THRESHOLD
+
+    def _rasterize(self, boundary_name: str, boundary_type: str, border_resolution: str,
+                   crs, transform, shape: Tuple[int, int]) -> Optional[np.ndarray]:
+        from rasterio.features import geometry_mask
+        from shapely.geometry import mapping
+        pixel_size = min(abs(transform.a), abs(transform.e))
+        geom = get_prepared_boundary(boundary_name, boundary_type, border_resolution, crs,
+                                     tolerance_for_pixel_size(pixel_size))
+        if geom is None:
+            return None
+        print(f"  Rasterizing boundary mask ({shape[1]} x {shape[0]} pixels)...", flush=True)
+        return geometry_mask([mapping(geom)], out_shape=shape, transform=transform, invert=True)
+
+    def get(
+        self,
+        boundary_name: str,
+        boundary_type: str,
+        border_resolution: str,
+        crs,
+        transform,
+        shape: Tuple[int, int],
+        reference: Optional[Tuple] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Get the boundary mask for a grid (True inside the boundary).
+
+        Args:
+            boundary_name: Boundary name ("Country" or "Country/State")
+            boundary_type: "country" or "state"
+            border_resolution: Natural Earth border resolution
+            crs: Grid CRS
+            transform: Grid affine transform
+            shape: Grid (height, width)
+            reference: Optional (transform, shape) of a finer grid covering this one to
+                rasterize at instead, so other resolutions can be derived from it later
+
+        Returns:
+            Boolean mask, or None if the boundary was not found
+        """
+        from rasterio import Affine
+        boundary_key = _boundary_key(boundary_name, boundary_type, border_resolution, crs)
+        shape = (int(shape[0]), int(shape[1]))
+
+        found = self._find(boundary_key, transform, shape)
+        if found is not None:
+            kind, filename, entry = found
+            a, b, c, d, e, f, height, width = entry['grid']
+            stored = self._load_mask(filename, (height, width))
+            if stored is not None:
+                if kind == 'exact':
+                    return stored
+                mask = self._derive(stored, Affine(a, b, c, d, e, f), crs, transform, shape)
+                self._save_mask(boundary_key, transform, shape, mask)
+                return mask
+
+        if reference is not None:
+            ref_transform, ref_shape = reference
+            ref_height, ref_width = int(ref_shape[0]), int(ref_shape[1])
+            # Coarsen oversized reference grids by powers of 2
+            factor = 1
+            while (ref_height // factor) * (ref_width // factor) > MASK_MAX_REFERENCE_PIXELS:
+                factor *= 2
+            ref_transform = ref_transform * Affine.scale(factor)
+            ref_shape = (-(-ref_height // factor), -(-ref_width // factor))
+            if abs(ref_transform.a) < abs(transform.a) or abs(ref_transform.e) < abs(transform.e):
+                fine = self._rasterize(boundary_name, boundary_type, border_resolution, crs, ref_transform, ref_shape)
+                if fine is None:
+                    return None
+                # Rasterizing may have downloaded the source layer: key on its identity now
+                boundary_key = _boundary_key(boundary_name, boundary_type, border_resolution, crs)
+                self._save_mask(boundary_key, ref_transform, ref_shape, fine)
+                mask = self._derive(fine, ref_transform, crs, transform, shape)
+                self._save_mask(boundary_key, transform, shape, mask)
+                return mask
+
+        mask = self._rasterize(boundary_name, boundary_type, border_resolution, crs, transform, shape)
+        if mask is not None:
+            boundary_key = _boundary_key(boundary_name, boundary_type, border_resolution, crs)
+            self._save_mask(boundary_key, transform, shape, mask)
+        return mask
+
+
+# Global instance
+_mask_store = None
+
+
+def get_mask_store() -> BoundaryMaskStore:
+    """Get or create the global boundary mask store."""
+    global _mask_store
+    if _mask_store is None:
+        _mask_store = BoundaryMaskStore()
+    return _mask_store
+
+
+def get_boundary_mask(
+    boundary_name: str,
+    boundary_type: str,
+    border_resolution: str,
+    crs,
+    transform,
+    shape: Tuple[int, int],
+    reference: Optional[Tuple] = None
+) -> Optional[np.ndarray]:
+    """Get a boundary mask from the global store (see BoundaryMaskStore.get)."""
+    return get_mask_store().get(boundary_name, boundary_type, border_resolution,
+                                crs, transform, shape, reference)
+
+
+def mask_dataset_to_boundary(
+    src,
+    boundary_name: str,
+    boundary_type: str,
+    border_resolution: str,
+    boundary_required: bool = False
+):
+    """
+    Mask an open raster to a boundary, cropped to the boundary's window.
+
+    Equivalent to rasterio.mask.mask(src, [boundary], crop=True, filled=False),
+    with the rasterized mask served from the store.
+
+    Args:
+        src: Open rasterio dataset
+        boundary_name: Boundary name ("Country" or "Country/State")
+        boundary_type: "country" or "state"
+        border_resolution: Natural Earth border resolution
+        boundary_required: Raise PipelineError instead of returning None when not found
+
+    Returns:
+        Tuple of (masked array (bands, height, width), window transform), or None
+    """
+    from rasterio.features import geometry_window
+    from shapely.geometry import mapping
+
+    geom = get_prepared_boundary(boundary_name, boundary_type, border_resolution, src.crs,
+                                 tolerance_for_pixel_size(min(src.res)), boundary_required)
+    if geom is None:
+        return None
+    window = geometry_window(src, [mapping(geom)])
+    transform = src.window_transform(window)
+    shape = (int(window.height), int(window.width))
+
+    inside = get_boundary_mask(boundary_name, boundary_type, border_resolution, src.crs, transform, shape)
+    data = src.read(window=window, masked=True)
+    data.mask = np.ma.getmaskarray(data) | ~inside[np.newaxis, :, :]
+    return data, transform
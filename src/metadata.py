@@ -11,41 +11,44 @@ Each data file in the pipeline has an accompanying JSON metadata file that track
 from typing import Dict, Optional, Tuple, Any
 from pathlib import Path
 import json
-import hashlib
 from datetime import datetime
 import rasterio
 import numpy as np
 
 from .versioning import get_current_version
+from . import file_hash
 
 
-def compute_file_hash(filepath: Path, algorithm: str = 'md5') -> str:
+# Digest stored in metadata (file_hash, source_file_hash). Stays MD5: metadata
+# written by earlier versions is compared against it (validate_source_file).
+METADATA_HASH_ALGORITHM = 'md5'
+
+
+def compute_file_hash(filepath: Path, algorithm: str = METADATA_HASH_ALGORITHM) -> str:
     """
     Compute hash of a file for cache validation.
     
+    Delegates to the shared hashing service (src/file_hash.py), which caches
+    digests in a persistent index so unchanged files are not re-read.
+    
     Args:
         filepath: Path to file
-        algorithm: Hash algorithm ('md5' or 'sha256')
+        algorithm: Hash algorithm ('md5', 'blake2b' or 'sha256')
         
     Returns:
         Hex digest of file hash
     """
-    hash_func = hashlib.md5() if algorithm == 'md5' else hashlib.sha256()
-    
-    with open(filepath, 'rb') as f:
-        # Read in chunks for large files
-        for chunk in iter(lambda: f.read(8192), b''):
-            hash_func.update(chunk)
-    
-    return hash_func.hexdigest()
+    return file_hash.compute_file_hash(filepath, algorithm)
 
 
-def extract_raster_info(filepath: Path) -> Dict[str, Any]:
+def extract_raster_info(filepath: Path, raster_stats: Optional[Dict] = None) -> Dict[str, Any]:
     """
     Extract metadata from a GeoTIFF file.
     
     Args:
         filepath: Path to GeoTIFF file
+        raster_stats: Full-raster stats (src/raster_stats.py); when given, the
+            elevation range comes from them instead of a sample read
         
     Returns:
         Dictionary with raster metadata
@@ -62,9 +65,13 @@ def extract_raster_info(filepath: Path) -> Dict[str, Any]:
         res_y = height_meters / src.height
         avg_resolution = round((res_x + res_y) / 2)
         
-        # Read sample to get elevation range
-        sample_size = min(1000, src.height, src.width)
-        sample = src.read(1, window=((0, sample_size), (0, sample_size)))
+        if raster_stats is not None and raster_stats.get("valid_count"):
+            elevation_range = [float(raster_stats["min"]), float(raster_stats["max"])]
+        else:
+            # Read sample to get elevation range
+            sample_size = min(1000, src.height, src.width)
+            sample = src.read(1, window=((0, sample_size), (0, sample_size)))
+            elevation_range = [float(np.nanmin(sample)), float(np.nanmax(sample))]
         
         return {
             "width": src.width,
@@ -77,12 +84,17 @@ def extract_raster_info(filepath: Path) -> Dict[str, Any]:
             },
             "crs": str(src.crs),
             "resolution_meters": avg_resolution,
-            "elevation_range": [float(np.nanmin(sample)), float(np.nanmax(sample))],
+            "elevation_range": elevation_range,
             "dtype": str(src.dtypes[0]),
             "nodata": src.nodata
         }
 
 
+def _stats_for_file(raster_stats: Dict, tif_path: Path) -> Dict:
+    """Tie raster stats to the file they describe (checked by load_stage_stats)."""
+    return {**raster_stats, "file_identity": list(file_hash.file_identity(tif_path))}
+
+
 def create_raw_metadata(
     tif_path: Path,
     region_id: str,
@@ -132,7 +144,8 @@ def create_clipped_metadata(
     source_file: Path,
     source_file_hash: str,
     clip_boundary: str,
-    clip_source: str = "natural_earth_10m"
+    clip_source: str = "natural_earth_10m",
+    raster_stats: Optional[Dict] = None
 ) -> Dict:
     """
     Create metadata for clipped/masked data.
@@ -144,11 +157,12 @@ def create_clipped_metadata(
         source_file_hash: Hash of source file (for validation)
         clip_boundary: Boundary name (e.g., 'California', 'United States of America')
         clip_source: Source of boundary data
+        raster_stats: Stats computed while writing the raster (src/raster_stats.py)
         
     Returns:
         Metadata dictionary
     """
-    raster_info = extract_raster_info(tif_path)
+    raster_info = extract_raster_info(tif_path, raster_stats)
     file_hash = compute_file_hash(tif_path)
     
     metadata = {
@@ -166,6 +180,9 @@ def create_clipped_metadata(
         **raster_info
     }
     
+    if raster_stats is not None:
+        metadata["raster_stats"] = _stats_for_file(raster_stats, tif_path)
+    
     return metadata
 
 
@@ -175,7 +192,8 @@ def create_processed_metadata(
     source_file: Path,
     source_file_hash: str,
     target_total_pixels: int,
-    processing_params: Optional[Dict] = None
+    processing_params: Optional[Dict] = None,
+    raster_stats: Optional[Dict] = None
 ) -> Dict:
     """
     Create metadata for processed/downsampled data.
@@ -187,11 +205,12 @@ def create_processed_metadata(
         source_file_hash: Hash of source file
         target_total_pixels: Target total pixel count (width × height)
         processing_params: Additional processing parameters
+        raster_stats: Stats computed while writing the raster (src/raster_stats.py)
         
     Returns:
         Metadata dictionary
     """
-    raster_info = extract_raster_info(tif_path)
+    raster_info = extract_raster_info(tif_path, raster_stats)
     file_hash = compute_file_hash(tif_path)
     
     metadata = {
@@ -211,6 +230,9 @@ def create_processed_metadata(
     if processing_params:
         metadata["processing_params"] = processing_params
     
+    if raster_stats is not None:
+        metadata["raster_stats"] = _stats_for_file(raster_stats, tif_path)
+    
     return metadata
 
 
@@ -220,7 +242,9 @@ def create_export_metadata(
     source: str,
     source_file: Path,
     resolution_meters: int,
-    export_params: Optional[Dict] = None
+    export_params: Optional[Dict] = None,
+    version_stage: str = 'export',
+    manifest_record: Optional[Dict] = None
 ) -> Dict:
     """
     Create metadata for exported JSON data.
@@ -232,6 +256,8 @@ def create_export_metadata(
         source_file: Path to source processed file
         resolution_meters: Resolution in meters
         export_params: Export parameters
+        version_stage: Versioning stage of the export format ('export' or 'export_binary')
+        manifest_record: Record for the regions manifest (see src/manifest_index.py)
         
     Returns:
         Metadata dictionary
@@ -239,7 +265,7 @@ def create_export_metadata(
     file_hash = compute_file_hash(json_path)
     
     metadata = {
-        "version": get_current_version('export'),
+        "version": get_current_version(version_stage),
         "stage": "export",
         "region_id": region_id,
         "source": source,
@@ -254,6 +280,9 @@ def create_export_metadata(
     if export_params:
         metadata["export_params"] = export_params
     
+    if manifest_record:
+        metadata["manifest"] = manifest_record
+    
     return metadata
 
 
@@ -318,7 +347,10 @@ def get_metadata_path(data_path: Path) -> Path:
     Returns:
         Path to metadata JSON file
     """
-    if data_path.suffix == '.json' and not data_path.stem.endswith('_meta'):
+    if data_path.name.endswith('.bin.gz'):
+        # Binary export (*.bin.gz): add _meta.json to the bare name
+        return data_path.with_name(data_path.name[:-len('.bin.gz')] + '_meta.json')
+    elif data_path.suffix == '.json' and not data_path.stem.endswith('_meta'):
         # Data file is already JSON, add _meta suffix
         return data_path.with_stem(data_path.stem + '_meta')
     else:
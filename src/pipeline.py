@@ -42,7 +42,6 @@ from rasterio.mask import mask as rasterio_mask
 from rasterio.merge import merge
 from rasterio.windows import Window
 import numpy as np
-from shapely.ops import unary_union
 from shapely.geometry import mapping as shapely_mapping
 
 from src.metadata import (
@@ -51,8 +50,16 @@ from src.metadata import (
 )
 from src.tile_geometry import abstract_filename_from_raw, tile_filename_from_bounds, get_bounds_from_raw_file
 from src.versioning import get_current_version
+from src.stage_cache import compute_stage_fingerprint, get_stage_cache
 from src.borders import get_border_manager
 from src.types import RegionType
+from src.config import (
+    DEFAULT_MERGE_MEMORY_BUDGET_MB, DEFAULT_FUSED_WARP, DEFAULT_EXPORT_FORMAT, DEFAULT_PYRAMID_FACTORS,
+    DEFAULT_TILE_SIZE
+)
+
+# Block size (pixels) of the tiled GeoTIFF written by merge_tiles
+MERGE_BLOCK_SIZE = 512
 
 # Alias for backward compatibility
 bbox_filename_from_bounds = tile_filename_from_bounds
@@ -63,13 +70,23 @@ class PipelineError(Exception):
     pass
 
 
-def merge_tiles(tile_paths: list[Path], output_path: Path) -> bool:
+def merge_tiles(
+    tile_paths: list[Path],
+    output_path: Path,
+    memory_budget_mb: int = DEFAULT_MERGE_MEMORY_BUDGET_MB
+) -> bool:
     """
     Merge multiple GeoTIFF tiles into a single file.
     
+    The mosaic is streamed to disk in fixed-size output windows rather than
+    assembled in memory: for each window only the overlapping window of each
+    source tile is read, so peak memory stays near memory_budget_mb regardless
+    of region size. Pixel output is identical to an in-memory method='first' merge.
+    
     Args:
         tile_paths: List of tile file paths to merge
         output_path: Output merged file path
+        memory_budget_mb: Peak memory budget per output window (MB)
         
     Returns:
         True if successful
@@ -81,7 +98,7 @@ def merge_tiles(tile_paths: list[Path], output_path: Path) -> bool:
         print(f"Already merged: {output_path.name} ({file_size_mb:.1f} MB)", flush=True)
         return True
     
-    print(f"Merging {len(tile_paths)} tiles...", flush=True)
+    print(f"Merging {len(tile_paths)} tiles (memory budget {memory_budget_mb} MB)...", flush=True)
     merge_start = time.time()
     
     src_files = []
@@ -105,35 +122,24 @@ def merge_tiles(tile_paths: list[Path], output_path: Path) -> bool:
         nodata_values = [s.nodata for s in src_files if s.nodata is not None]
         out_nodata = nodata_values[0] if nodata_values else -9999.0
 
-        # Merge tiles
-        mosaic, out_transform = merge(
+        # Merge tiles window by window straight into the output file
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        merge(
             src_files,
             nodata=out_nodata,
             dtype=out_dtype,
-            method='first'
+            method='first',
+            dst_path=output_path,
+            dst_kwds={
+                "driver": "GTiff",
+                "tiled": True,
+                "blockxsize": MERGE_BLOCK_SIZE,
+                "blockysize": MERGE_BLOCK_SIZE,
+                "BIGTIFF": "IF_SAFER"
+            },
+            mem_limit=memory_budget_mb
         )
 
-        # Handle masked arrays
-        if np.ma.isMaskedArray(mosaic):
-            mosaic = mosaic.filled(out_nodata)
-
-        # Get metadata from first tile
-        out_meta = src_files[0].meta.copy()
-        out_meta.update({
-            "driver": "GTiff",
-            "height": mosaic.shape[1],
-            "width": mosaic.shape[2],
-            "transform": out_transform,
-            "dtype": out_dtype,
-            "count": mosaic.shape[0],
-            "nodata": out_nodata
-        })
-
-        # Write merged file
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with rasterio.open(output_path, "w", **out_meta) as dest:
-            dest.write(mosaic)
-
         merge_time = time.time() - merge_start
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
         print(f"Merged: {output_path.name} ({file_size_mb:.1f} MB, {merge_time:.1f}s)", flush=True)
@@ -247,6 +253,68 @@ def crop_to_bounds(
         return False
 
 
+def load_boundary_geometry(
+    boundary_name: str,
+    boundary_type: str = "country",
+    border_resolution: str = "10m",
+    boundary_required: bool = False
+):
+    """
+    Load an administrative boundary as a GeoDataFrame (EPSG:4326).
+    
+    Args:
+        boundary_name: Boundary to load
+            - If boundary_type="country": "United States of America"
+            - If boundary_type="state": "United States of America/Tennessee"
+        boundary_type: "country" or "state"
+        border_resolution: Natural Earth border resolution ('10m', '50m', '110m')
+        boundary_required: Raise PipelineError instead of returning None when not found
+        
+    Returns:
+        GeoDataFrame with boundary geometry, or None if not found/invalid
+    """
+    print(f"  Loading {boundary_type} boundary geometry for {boundary_name}...")
+
+    # Get boundary geometry based on type
+    if boundary_type == "country":
+        # Use GeoDataFrame so we can reproject reliably
+        border_manager = get_border_manager()
+        geometry_gdf = border_manager.get_country(boundary_name, border_resolution=border_resolution)
+    elif boundary_type == "state":
+        # Parse "Country/State" format
+        if "/" not in boundary_name:
+            print(f"  Error: State boundary requires 'Country/State' format")
+            print(f"  Got: {boundary_name}")
+            return None
+
+        country, state = boundary_name.split("/", 1)
+        border_manager = get_border_manager()
+        geometry_gdf = border_manager.get_state(country, state, border_resolution=border_resolution)
+
+        if geometry_gdf is None or geometry_gdf.empty:
+            if boundary_required:
+                error_msg = f"State '{state}' boundary not found in '{country}' and boundary is required."
+                print(f"  Error: {error_msg}")
+                raise PipelineError(error_msg)
+            else:
+                print(f"  Warning: State '{state}' not found in '{country}'. Skipping clipping step...")
+            return None
+    else:
+        print(f"  Error: Invalid boundary_type '{boundary_type}' (must be 'country' or 'state')")
+        return None
+
+    if geometry_gdf is None or geometry_gdf.empty:
+        if boundary_required:
+            error_msg = f"Could not find boundary '{boundary_name}' and boundary is required."
+            print(f"  Error: {error_msg}")
+            raise PipelineError(error_msg)
+        else:
+            print(f"  Warning: Could not find boundary '{boundary_name}'. Skipping clipping step...")
+        return None
+
+    return geometry_gdf
+
+
 def clip_to_boundary(
     raw_tif_path: Path,
     region_id: str,
@@ -300,75 +368,14 @@ def clip_to_boundary(
             except Exception as del_e:
                 print(f"  Could not delete: {del_e}")
 
-    # If we're regenerating the clipped file, delete dependent processed and generated files
-    # This ensures the entire pipeline uses consistent data
-    # Use abstract naming to find dependent files
-    processed_dir = Path('data/processed') / source
-    generated_dir = Path('generated/regions')
-    
-    deleted_deps = []
-    
-    # Get bounds from raw file to generate abstract filenames for dependent files
-    raw_bounds = get_bounds_from_raw_file(raw_tif_path)
-    if raw_bounds:
-        # Generate abstract filenames
-        # NOTE: This is elevation_data_resolution (10m/30m/90m), NOT border_resolution (10m/50m/110m)
-        elevation_resolution = '30m' if '30m' in source else '90m' if '90m' in source else '10m'
-        base_part = bbox_filename_from_bounds(raw_bounds, source, elevation_resolution)[5:-4]
-        
-        # Delete processed files by abstract name
-        if processed_dir.exists():
-            for f in processed_dir.glob(f'{base_part}_processed_*px_v2.tif'):
-                f.unlink()
-                deleted_deps.append(f"processed/{f.name}")
-        
-        # Delete exported JSON files by abstract name
-        if generated_dir.exists():
-            for f in generated_dir.glob(f'{base_part}_*px_v2.json'):
-                if '_meta' not in f.stem and '_borders' not in f.stem:
-                    f.unlink()
-                    deleted_deps.append(f"generated/{f.name}")
-
-    if deleted_deps:
-        print(f"  Deleted {len(deleted_deps)} dependent file(s) (will be regenerated)")
-
-    print(f"  Loading {boundary_type} boundary geometry for {boundary_name}...")
-
-    # Get boundary geometry based on type
-    if boundary_type == "country":
-        # Use GeoDataFrame so we can reproject reliably
-        border_manager = get_border_manager()
-        geometry_gdf = border_manager.get_country(boundary_name, border_resolution=border_resolution)
-    elif boundary_type == "state":
-        # Parse "Country/State" format
-        if "/" not in boundary_name:
-            print(f"  Error: State boundary requires 'Country/State' format")
-            print(f"  Got: {boundary_name}")
-            return False
-
-        country, state = boundary_name.split("/", 1)
-        border_manager = get_border_manager()
-        geometry_gdf = border_manager.get_state(country, state, border_resolution=border_resolution)
-
-        if geometry_gdf is None or geometry_gdf.empty:
-            if boundary_required:
-                error_msg = f"State '{state}' boundary not found in '{country}' and boundary is required."
-                print(f"  Error: {error_msg}")
-                raise PipelineError(error_msg)
-            else:
-                print(f"  Warning: State '{state}' not found in '{country}'. Skipping clipping step...")
-            return False
-    else:
-        print(f"  Error: Invalid boundary_type '{boundary_type}' (must be 'country' or 'state')")
-        return False
-
-    if geometry_gdf is None or geometry_gdf.empty:
-        if boundary_required:
-            error_msg = f"Could not find boundary '{boundary_name}' and boundary is required."
-            print(f"  Error: {error_msg}")
-            raise PipelineError(error_msg)
-        else:
-            print(f"  Warning: Could not find boundary '{boundary_name}'. Skipping clipping step...")
+    # Boundary prepared in the raster CRS (cached), simplified to the pixel size
+    from src.boundary_cache import get_prepared_boundary, tolerance_for_pixel_size
+    from src.mask_store import mask_dataset_to_boundary
+    with rasterio.open(raw_tif_path) as src:
+        src_crs, src_res = src.crs, src.res
+    union_geom = get_prepared_boundary(boundary_name, boundary_type, border_resolution, src_crs,
+                                       tolerance_for_pixel_size(min(src_res)), boundary_required)
+    if union_geom is None:
         return False
 
     print(f"  Clipping to {boundary_type} boundary...")
@@ -378,21 +385,10 @@ def clip_to_boundary(
             print(f"  Input dimensions: {src.width} x {src.height} pixels")
             print(f"  Input size: {raw_tif_path.stat().st_size / (1024*1024):.1f} MB")
 
-            # Prepare boundary geometry in raster CRS and GeoJSON mapping
-            try:
-                geometry_reproj = geometry_gdf.to_crs(src.crs)
-            except Exception:
-                geometry_reproj = geometry_gdf
-            union_geom = unary_union(geometry_reproj.geometry)
-            geoms = [shapely_mapping(union_geom)]
-
-            # Clip the raster to the boundary
+            # Clip the raster to the boundary (rasterized mask reused from the mask store)
             print(f"  Applying geometric mask...")
-            out_image, out_transform = rasterio_mask(
-                src,
-                geoms,
-                crop=True,
-                filled=False
+            out_image, out_transform = mask_dataset_to_boundary(
+                src, boundary_name, boundary_type, border_resolution
             )
             out_meta = src.meta.copy()
 
@@ -422,10 +418,12 @@ def clip_to_boundary(
 
             # Reprojection moved to Stage 7: reproject_to_metric_crs()
 
-            # VALIDATION: Check elevation range to catch corruption
-            from src.validation import validate_elevation_range
-            min_elev, max_elev, elev_range, is_valid = validate_elevation_range(
-                out_image[0], min_sensible_range=50.0, warn_only=False
+            # VALIDATION: Check elevation range to catch corruption (stats are kept for later stages)
+            from src.raster_stats import array_stats
+            from src.validation import validate_stats_range
+            raster_stats = array_stats(out_image[0], nodata=out_meta.get('nodata'))
+            min_elev, max_elev, elev_range, is_valid = validate_stats_range(
+                raster_stats, min_sensible_range=50.0, warn_only=False
             )
             if not is_valid:
                 raise ValueError(f"Elevation corruption detected! Range: {elev_range:.1f}m")
@@ -444,7 +442,8 @@ def clip_to_boundary(
                 region_id=region_id,
                 source_file=raw_tif_path,
                 source_file_hash=source_hash,
-                clip_boundary=boundary_name
+                clip_boundary=boundary_name,
+                raster_stats=raster_stats
             )
             save_metadata(metadata, get_metadata_path(output_path))
 
@@ -459,6 +458,21 @@ def clip_to_boundary(
         return False
 
 
+def select_metric_crs(avg_lat: float) -> str:
+    """
+    Choose the metric CRS used for viewer data at a given latitude.
+    
+    Args:
+        avg_lat: Average latitude of the data (degrees)
+        
+    Returns:
+        EPSG code string: Web Mercator, or polar stereographic above 85 degrees
+    """
+    if abs(avg_lat) < 85:
+        return 'EPSG:3857'  # Web Mercator
+    return 'EPSG:3413' if avg_lat > 0 else 'EPSG:3031'  # Polar stereographic
+
+
 def reproject_to_metric_crs(
     input_tif_path: Path,
     region_id: str,
@@ -501,28 +515,6 @@ def reproject_to_metric_crs(
             except Exception:
                 pass
     
-    # Delete dependent files if regenerating (using abstract naming)
-    # Get bounds from input file to generate abstract filenames
-    raw_bounds = get_bounds_from_raw_file(input_tif_path)
-    if raw_bounds:
-        # NOTE: This is elevation_data_resolution (10m/30m/90m), NOT border_resolution (10m/50m/110m)
-        elevation_resolution = '30m' if '30m' in source else '90m' if '90m' in source else '10m'
-        base_part = bbox_filename_from_bounds(raw_bounds, source, elevation_resolution)[5:-4]
-        
-        processed_dir = Path('data/processed') / source
-        generated_dir = Path('generated/regions')
-        
-        # Delete processed files by abstract name
-        if processed_dir.exists():
-            for f in processed_dir.glob(f'{base_part}_processed_*px_v2.tif'):
-                f.unlink()
-        
-        # Delete exported JSON files by abstract name
-        if generated_dir.exists():
-            for f in generated_dir.glob(f'{base_part}_*px_v2.json'):
-                if '_meta' not in f.stem and '_borders' not in f.stem:
-                    f.unlink()
-    
     try:
         with rasterio.open(input_tif_path) as src:
             # Check if reprojection is needed
@@ -553,10 +545,7 @@ def reproject_to_metric_crs(
             from rasterio.warp import calculate_default_transform, reproject, Resampling
             
             # Choose appropriate projection
-            if abs(avg_lat) < 85:
-                dst_crs = 'EPSG:3857'  # Web Mercator
-            else:
-                dst_crs = 'EPSG:3413' if avg_lat > 0 else 'EPSG:3031'  # Polar stereographic
+            dst_crs = select_metric_crs(avg_lat)
             
             # Calculate transform for reprojection
             transform, width, height = calculate_default_transform(
@@ -602,9 +591,10 @@ def reproject_to_metric_crs(
             )
             
             # Validate elevation range
-            from src.validation import validate_elevation_range
-            min_elev, max_elev, elev_range, is_valid = validate_elevation_range(
-                reprojected[0], min_sensible_range=50.0, warn_only=False
+            from src.raster_stats import array_stats
+            from src.validation import validate_stats_range
+            min_elev, max_elev, elev_range, is_valid = validate_stats_range(
+                array_stats(reprojected[0], nodata=out_meta['nodata']), min_sensible_range=50.0, warn_only=False
             )
             if not is_valid:
                 raise ValueError(f"Elevation corruption detected after reprojection! Range: {elev_range:.1f}m")
@@ -671,12 +661,6 @@ def downsample_for_viewer(
             except Exception:
                 pass
     
-    # Delete dependent generated files
-    generated_dir = Path('generated/regions')
-    if generated_dir.exists():
-        for f in generated_dir.glob(f'{region_id}_*'):
-            f.unlink()
-    
     print(f"  Downsampling to target resolution ({target_total_pixels:,} total pixels)...")
     
     try:
@@ -710,9 +694,11 @@ def downsample_for_viewer(
                 'transform': out_transform
             })
             
-            # Validate elevation range (fail hard on hyperflat)
-            from src.validation import validate_elevation_range
-            _min, _max, _range, _ok = validate_elevation_range(elevation, min_sensible_range=50.0, warn_only=False)
+            # Validate elevation range (fail hard on hyperflat); stats are reused by export
+            from src.raster_stats import array_stats
+            from src.validation import validate_stats_range
+            raster_stats = array_stats(elevation, nodata=out_meta.get('nodata'))
+            _min, _max, _range, _ok = validate_stats_range(raster_stats, min_sensible_range=50.0, warn_only=False)
             
             print(f"  Target: {dst_width} x {dst_height} pixels")
             
@@ -731,7 +717,8 @@ def downsample_for_viewer(
                 region_id=region_id,
                 source_file=input_tif_path,
                 source_file_hash=source_hash,
-                target_total_pixels=target_total_pixels
+                target_total_pixels=target_total_pixels,
+                raster_stats=raster_stats
             )
             save_metadata(metadata, get_metadata_path(output_path))
             
@@ -746,6 +733,312 @@ def downsample_for_viewer(
         return False
 
 
+def full_resolution_metric_grid(src, bounds=None, boundary_geom=None) -> Tuple:
+    """
+    Get the full-resolution metric grid of a raster's crop/clip extent.
+    
+    Args:
+        src: Open rasterio dataset (any CRS)
+        bounds: Rectangular crop bounds (west, south, east, north) in EPSG:4326, or None
+        boundary_geom: Boundary geometry in the source CRS (narrows the extent), or None
+        
+    Returns:
+        (dst_crs, transform, width, height); geographic inputs get a metric CRS
+        (select_metric_crs), metric inputs keep theirs
+    """
+    from rasterio.warp import calculate_default_transform, transform_bounds
+    from rasterio.windows import from_bounds
+    
+    # Extent in source CRS: raster bounds, narrowed by crop bounds and boundary
+    west, south, east, north = src.bounds
+    extents = []
+    if bounds:
+        extents.append(transform_bounds('EPSG:4326', src.crs, *bounds))
+    if boundary_geom is not None:
+        extents.append(boundary_geom.bounds)
+    for ext_w, ext_s, ext_e, ext_n in extents:
+        west, south = max(west, ext_w), max(south, ext_s)
+        east, north = min(east, ext_e), min(north, ext_n)
+    if west >= east or south >= north:
+        raise ValueError("Crop/clip extent does not overlap input raster")
+    
+    # Choose metric CRS (geographic inputs are reprojected, metric inputs kept)
+    crs_str = str(src.crs) if src.crs is not None else ""
+    if 'EPSG:4326' in crs_str.upper():
+        lon_lat_bounds = (west, south, east, north)
+    else:
+        lon_lat_bounds = transform_bounds(src.crs, 'EPSG:4326', west, south, east, north)
+    avg_lat = (lon_lat_bounds[1] + lon_lat_bounds[3]) / 2
+    dst_crs = select_metric_crs(avg_lat) if 'EPSG:4326' in crs_str.upper() else src.crs
+    
+    src_window = from_bounds(west, south, east, north, src.transform)
+    transform, width, height = calculate_default_transform(
+        src.crs, dst_crs,
+        max(1, int(round(src_window.width))), max(1, int(round(src_window.height))),
+        west, south, east, north
+    )
+    return dst_crs, transform, width, height
+
+
+def warp_to_viewer_grid(
+    input_tif_path: Path,
+    region_id: str,
+    output_path: Path,
+    target_total_pixels: int,
+    bounds: Optional[Tuple[float, float, float, float]] = None,
+    boundary_name: Optional[str] = None,
+    boundary_type: str = "country",
+    border_resolution: str = "10m",
+    boundary_required: bool = False
+) -> bool:
+    """
+    Stages 6-8 fused: crop/clip, reproject and downsample in a single warp.
+    
+    Warps the raw (or merged) raster straight onto the final target-size grid
+    in metric CRS, reading only the source pixels that cover the output extent.
+    The boundary mask is rasterized at output resolution instead of full
+    resolution. No intermediate clipped or reprojected GeoTIFFs are written;
+    output file and metadata are the same as downsample_for_viewer().
+    
+    Args:
+        input_tif_path: Path to raw/merged TIF (any CRS)
+        region_id: Region identifier
+        output_path: Where to save processed TIF
+        target_total_pixels: Target total pixel count (width × height) (required)
+        bounds: Rectangular crop bounds (west, south, east, north) in EPSG:4326, or None
+        boundary_name: Administrative boundary to clip to, or None
+        boundary_type: "country" or "state"
+        border_resolution: Natural Earth border resolution ('10m', '50m', '110m')
+        boundary_required: Raise PipelineError if the boundary cannot be found
+        
+    Returns:
+        True if successful
+    """
+    if not input_tif_path.exists():
+        print(f"  Input file not found: {input_tif_path}")
+        return False
+    
+    # Check if output exists and is valid
+    if output_path.exists():
+        try:
+            with rasterio.open(output_path) as src:
+                if src.width > 0 and src.height > 0:
+                    _ = src.read(1, window=((0, min(10, src.height)), (0, min(10, src.width))))
+                    crs_str = str(src.crs) if src.crs is not None else ""
+                    is_latlon = ('EPSG:4326' in crs_str.upper()) or ('WGS84' in crs_str.upper())
+                    if is_latlon:
+                        print(f"  Processed file uses geographic CRS; regenerating...")
+                        raise RuntimeError("processed_file_crs_is_latlon")
+                    print(f"  Already processed (validated): {output_path.name}")
+                    return True
+        except Exception as e:
+            print(f"  Existing file invalid: {e}")
+            try:
+                output_path.unlink()
+            except Exception:
+                pass
+    
+    # Boundary prepared in the source CRS (cached) - used to narrow the extent
+    from src.boundary_cache import get_prepared_boundary, tolerance_for_pixel_size
+    boundary_geom = None
+    if boundary_name:
+        with rasterio.open(input_tif_path) as src:
+            src_crs, src_res = src.crs, src.res
+        boundary_geom = get_prepared_boundary(boundary_name, boundary_type, border_resolution, src_crs,
+                                              tolerance_for_pixel_size(min(src_res)), boundary_required)
+        if boundary_geom is None:
+            return False
+    
+    print(f"  Warping to viewer grid ({target_total_pixels:,} total pixels)...")
+    
+    try:
+        from rasterio import Affine
+        from rasterio.warp import reproject, Resampling
+        from src.tile_geometry import calculate_dimension_from_total_pixels
+        
+        with rasterio.open(input_tif_path) as src:
+            print(f"  Input: {src.width} x {src.height} pixels")
+            
+            # Full-resolution metric grid of the crop/clip extent, scaled down to the target size
+            dst_crs, full_transform, full_width, full_height = full_resolution_metric_grid(
+                src, bounds, boundary_geom)
+            aspect = full_width / full_height if full_height != 0 else 1.0
+            dst_width, dst_height = calculate_dimension_from_total_pixels(target_total_pixels, aspect)
+            out_transform = full_transform * Affine.scale(full_width / dst_width, full_height / dst_height)
+            
+            # Output nodata
+            nodata = src.nodata
+            if nodata is None:
+                if np.issubdtype(src.dtypes[0], np.floating):
+                    nodata = -9999.0
+                else:
+                    nodata = np.iinfo(src.dtypes[0]).min
+            
+            # Single warp from source pixels straight to the output grid
+            elevation = np.full((dst_height, dst_width), nodata, dtype=src.dtypes[0])
+            reproject(
+                source=rasterio.band(src, 1),
+                destination=elevation,
+                dst_transform=out_transform,
+                dst_crs=dst_crs,
+                resampling=Resampling.bilinear,
+                src_nodata=nodata,
+                dst_nodata=nodata
+            )
+            
+            # Boundary mask at output resolution
+            if boundary_geom is not None:
+                print(f"  Applying boundary mask at output resolution...")
+                # Rasterized once on the full-resolution grid (coarsened to MASK_MAX_REFERENCE_PIXELS,
+                # or the output grid itself if that is finer); other target sizes derive from it
+                from src.mask_store import get_boundary_mask
+                inside = get_boundary_mask(
+                    boundary_name, boundary_type, border_resolution, dst_crs,
+                    out_transform, (dst_height, dst_width),
+                    reference=(full_transform, (full_height, full_width))
+                )
+                elevation[~inside] = nodata
+            
+            # Validate elevation range (fail hard on hyperflat); stats are reused by export
+            from src.raster_stats import array_stats
+            from src.validation import validate_stats_range
+            raster_stats = array_stats(elevation, nodata=nodata)
+            _min, _max, _range, _ok = validate_stats_range(raster_stats, min_sensible_range=50.0, warn_only=False)
+            if not _ok:
+                raise ValueError(f"Elevation corruption detected! Range: {_range:.1f}m")
+            
+            print(f"  Target: {dst_width} x {dst_height} pixels ({dst_crs})")
+            
+            out_meta = src.meta.copy()
+            out_meta.update({
+                'driver': 'GTiff',
+                'crs': dst_crs,
+                'width': dst_width,
+                'height': dst_height,
+                'transform': out_transform,
+                'nodata': nodata
+            })
+            
+            # Write processed data
+            print(f"  Writing processed raster...")
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with rasterio.open(output_path, "w", **out_meta) as dest:
+                dest.write(elevation, 1)
+        
+        # Create metadata
+        source_hash = compute_file_hash(input_tif_path)
+        metadata = create_processed_metadata(
+            output_path,
+            region_id=region_id,
+            source_file=input_tif_path,
+            source_file_hash=source_hash,
+            target_total_pixels=target_total_pixels,
+            processing_params={
+                'fused_warp': True,
+                'crop_bounds': list(bounds) if bounds else None,
+                'clip_boundary': boundary_name,
+                'border_resolution': border_resolution if boundary_name else None
+            },
+            raster_stats=raster_stats
+        )
+        save_metadata(metadata, get_metadata_path(output_path))
+        
+        file_size_mb = output_path.stat().st_size / (1024 * 1024)
+        print(f"  Processed: {output_path.name} ({file_size_mb:.1f} MB)")
+        return True
+        
+    except PipelineError:
+        raise
+    except Exception as e:
+        print(f"  Processing failed: {e}")
+        if output_path.exists():
+            output_path.unlink()
+        return False
+
+
+# Rows read per block when streaming the viewer export
+EXPORT_ROW_BLOCK = 64
+
+# Elevations outside this range (m) are treated as nodata in viewer exports
+EXPORT_MIN_ELEVATION = -500
+EXPORT_MAX_ELEVATION = 9000
+
+
+def _export_bounds_4326(src):
+    """
+    Get a raster's bounds in EPSG:4326 (lat/lon) for consistent export.
+    
+    Args:
+        src: Open rasterio dataset
+        
+    Returns:
+        BoundingBox in EPSG:4326
+    """
+    bounds = src.bounds
+    from rasterio.warp import transform_bounds
+    if src.crs and src.crs != 'EPSG:4326':
+        print(f"  Converting bounds from {src.crs} to EPSG:4326...", flush=True)
+        bounds_4326 = transform_bounds(src.crs, 'EPSG:4326',
+            bounds.left, bounds.bottom,
+            bounds.right, bounds.top)
+        from rasterio.coords import BoundingBox
+        bounds = BoundingBox(bounds_4326[0], bounds_4326[1],
+            bounds_4326[2], bounds_4326[3])
+    return bounds
+
+
+def _clean_export_values(elevation: np.ndarray) -> np.ndarray:
+    """Convert to float32 with out-of-range elevations set to NaN."""
+    elevation_clean = elevation.astype(np.float32)
+    elevation_clean[(elevation_clean < EXPORT_MIN_ELEVATION) | (elevation_clean > EXPORT_MAX_ELEVATION)] = np.nan
+    return elevation_clean
+
+
+def _read_export_grid(processed_tif_path: Path, validate_output: bool = True):
+    """
+    Read a processed TIF as a cleaned float grid for viewer export.
+    
+    Args:
+        processed_tif_path: Path to processed TIF (metric CRS, downsampled)
+        validate_output: If True, validate coverage
+        
+    Returns:
+        Tuple of (float32 elevation with NaN for invalid values, bounds in EPSG:4326,
+        raster stats), or None if there is no valid elevation data
+    """
+    from src.raster_stats import array_stats, load_stage_stats
+    from src.validation import validate_stats_coverage, validate_stats_range
+    
+    with rasterio.open(processed_tif_path) as src:
+        print(f"  Reading raster: {src.width} x {src.height}", flush=True)
+        elevation = src.read(1)
+        bounds = _export_bounds_4326(src)
+        nodata = src.nodata
+    
+    # Stats recorded when the processed raster was written; rescan only if missing/stale
+    stats = load_stage_stats(processed_tif_path) or array_stats(elevation, nodata=nodata)
+    
+    # Validate coverage
+    if validate_output:
+        try:
+            coverage_pct, is_valid = validate_stats_coverage(stats, min_coverage_pct=20.0)
+            print(f"  Validation passed: coverage={coverage_pct:.1f}%")
+        except Exception as e:
+            print(f"  Validation warning: {e}")
+    
+    if stats["valid_count"] == 0:
+        print(f"  Error: No valid elevation data")
+        return None
+    
+    # Validate elevation range (fail hard on hyperflat)
+    validate_stats_range(stats, min_sensible_range=50.0, warn_only=False)
+    
+    # Filter bad values
+    elevation_clean = _clean_export_values(elevation)
+    
+    return elevation_clean, bounds, stats
+
+
 def export_for_viewer(
     processed_tif_path: Path,
     region_id: str,
@@ -791,106 +1084,196 @@ def export_for_viewer(
     print(f"  Exporting to JSON...")
     
     try:
+        from src.raster_stats import RasterStatsAccumulator, coverage_pct, export_stats, load_stage_stats
+        from src.streaming_export import StreamingJsonWriter, encode_elevation_row
+        from src.validation import validate_stats_range
+        
+        # Stats recorded when the processed raster was written (None if missing/stale)
+        stored_stats = load_stage_stats(processed_tif_path)
+        
         with rasterio.open(processed_tif_path) as src:
-            print(f"  Reading raster: {src.width} x {src.height}", flush=True)
-            elevation = src.read(1)
-            bounds = src.bounds
-            
-            # Transform bounds to EPSG:4326 (lat/lon) for consistent export
-            from rasterio.warp import transform_bounds
-            if src.crs and src.crs != 'EPSG:4326':
-                print(f"  Converting bounds from {src.crs} to EPSG:4326...", flush=True)
-                bounds_4326 = transform_bounds(src.crs, 'EPSG:4326',
-                    bounds.left, bounds.bottom,
-                    bounds.right, bounds.top)
-                from rasterio.coords import BoundingBox
-                bounds = BoundingBox(bounds_4326[0], bounds_4326[1],
-                    bounds_4326[2], bounds_4326[3])
-            
-            # Validate coverage
-            if validate_output:
-                from src.validation import validate_non_null_coverage
-                try:
-                    coverage_pct, is_valid = validate_non_null_coverage(elevation, min_coverage_pct=20.0)
-                    print(f"  Validation passed: coverage={coverage_pct:.1f}%")
-                except Exception as e:
-                    print(f"  Validation warning: {e}")
-            
-            # Filter bad values
-            elevation_clean = elevation.astype(np.float32)
-            elevation_clean[(elevation_clean < -500) | (elevation_clean > 9000)] = np.nan
+            width, height = src.width, src.height
+            print(f"  Reading raster: {width} x {height}", flush=True)
+            bounds = _export_bounds_4326(src)
             
-            valid_count = np.sum(~np.isnan(elevation_clean))
-            if valid_count == 0:
-                print(f"  Error: No valid elevation data")
-                return False
-            
-            # Validate elevation range (fail hard on hyperflat)
-            from src.validation import validate_elevation_range
-            _min, _max, _range, _ok = validate_elevation_range(elevation_clean, min_sensible_range=50.0, warn_only=False)
-            
-            # Convert to list - VECTORIZED for performance (~28x faster)
-            print(f"  Converting to JSON format...", flush=True)
-            # Convert NaN to None using vectorized operations
-            mask = np.isnan(elevation_clean)
-            elevation_object = elevation_clean.astype(object)
-            elevation_object[mask] = None
-            elevation_list = elevation_object.tolist()
-            
-            # Create export data
-            export_data = {
+            # Fields before the grid; key order matches the export_v2 layout
+            head = {
                 "version": "export_v2",  # CRITICAL: Required for manifest validation
                 "region_id": region_id,
                 "source": source,
                 "name": region_id.replace('_', ' ').title(),
-                "width": int(src.width),
-                "height": int(src.height),
-                "elevation": elevation_list,
-                "bounds": {
-                    "left": float(bounds.left),
-                    "right": float(bounds.right),
-                    "top": float(bounds.top),
-                    "bottom": float(bounds.bottom)
-                },
-                "stats": {
-                    "min": float(np.nanmin(elevation_clean)),
-                    "max": float(np.nanmax(elevation_clean)),
-                    "mean": float(np.nanmean(elevation_clean))
-                }
+                "width": int(width),
+                "height": int(height),
             }
             
-            # Write JSON
-            print(f"  Writing JSON to disk...")
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(export_data, f, separators=(',', ':'))
-            
-            # Stage 10: Gzip compression
-            print(f"  Compressing with gzip...")
-            import gzip
-            gzip_path = output_path.with_suffix('.json.gz')
-            with open(output_path, 'rb') as f_in:
-                with gzip.open(gzip_path, 'wb', compresslevel=9) as f_out:
-                    f_out.writelines(f_in)
-            
-            gzip_size_mb = gzip_path.stat().st_size / (1024 * 1024)
-            compression_ratio = (1 - gzip_path.stat().st_size / output_path.stat().st_size) * 100
-            print(f"  Compressed: {gzip_path.name} ({gzip_size_mb:.1f} MB, {compression_ratio:.1f}% smaller)")
-            
-            # Create metadata
-            metadata = create_export_metadata(
-                output_path,
-                region_id=region_id,
-                source=source,
-                source_file=processed_tif_path,
-                resolution_meters=30  # Default
-            )
-            save_metadata(metadata, get_metadata_path(output_path))
-            
-            file_size_mb = output_path.stat().st_size / (1024 * 1024)
-            print(f"  Exported: {output_path.name} ({file_size_mb:.1f} MB)", flush=True)
-            return True
+            # With stored stats, a bad grid is rejected before anything is written
+            if stored_stats is not None:
+                if stored_stats["valid_count"] == 0:
+                    raise ValueError("No valid elevation data")
+                validate_stats_range(stored_stats, min_sensible_range=50.0, warn_only=False)
             
+            # Stream rows straight into .json.gz (+ plain twin); without stored
+            # stats they are accumulated on the way so the grid is never held in memory
+            print(f"  Streaming JSON + gzip to disk...", flush=True)
+            accumulator = RasterStatsAccumulator(nodata=src.nodata) if stored_stats is None else None
+            with StreamingJsonWriter(output_path, write_plain=True) as out:
+                out.write(json.dumps(head, separators=(',', ':'))[:-1] + ',"elevation":[')
+                for row_start in range(0, height, EXPORT_ROW_BLOCK):
+                    rows = min(EXPORT_ROW_BLOCK, height - row_start)
+                    block = src.read(1, window=Window(0, row_start, width, rows))
+                    if accumulator is not None:
+                        accumulator.update(block)
+                    
+                    block = _clean_export_values(block)
+                    for i, row in enumerate(block):
+                        out.write((',' if row_start + i else '') + encode_elevation_row(row))
+                
+                stats = stored_stats if stored_stats is not None else accumulator.result()
+                if validate_output:
+                    grid_coverage_pct = coverage_pct(stats)
+                    if grid_coverage_pct < 20.0:
+                        print(f"  WARNING: Low data coverage: {grid_coverage_pct:.1f}% (min: 20.0%)")
+                    print(f"  Validation passed: coverage={grid_coverage_pct:.1f}%")
+                
+                # Raising here discards the partial outputs
+                if stats["valid_count"] == 0:
+                    raise ValueError("No valid elevation data")
+                validate_stats_range(stats, min_sensible_range=50.0, warn_only=False)
+                
+                tail = {
+                    "bounds": {
+                        "left": float(bounds.left),
+                        "right": float(bounds.right),
+                        "top": float(bounds.top),
+                        "bottom": float(bounds.bottom)
+                    },
+                    "stats": export_stats(stats)
+                }
+                out.write('],' + json.dumps(tail, separators=(',', ':'))[1:])
+        
+        gzip_path = out.gzip_path
+        gzip_size_mb = gzip_path.stat().st_size / (1024 * 1024)
+        compression_ratio = (1 - gzip_path.stat().st_size / output_path.stat().st_size) * 100
+        print(f"  Compressed: {gzip_path.name} ({gzip_size_mb:.1f} MB, {compression_ratio:.1f}% smaller)")
+        
+        # Create metadata (with the record update_regions_manifest reads)
+        from src.manifest_index import export_manifest_record
+        metadata = create_export_metadata(
+            output_path,
+            region_id=region_id,
+            source=source,
+            source_file=processed_tif_path,
+            resolution_meters=30,  # Default
+            manifest_record=export_manifest_record(
+                output_path, region_id, source, "export_v2", tail["bounds"], tail["stats"])
+        )
+        save_metadata(metadata, get_metadata_path(output_path))
+        
+        file_size_mb = output_path.stat().st_size / (1024 * 1024)
+        print(f"  Exported: {output_path.name} ({file_size_mb:.1f} MB)", flush=True)
+        return True
+        
+    except Exception as e:
+        import traceback
+        print(f"  Export failed: {e}", flush=True)
+        traceback.print_exc()
+        if output_path.exists():
+            output_path.unlink()
+        return False
+
+
+def _export_v3_header(stats: Dict, bounds, region_id: str, source: str) -> Dict:
+    """Build the export_v3 header fields shared by the base export and its pyramid levels."""
+    from src.raster_stats import export_stats
+    return {
+        "region_id": region_id,
+        "source": source,
+        "name": region_id.replace('_', ' ').title(),
+        "bounds": {
+            "left": float(bounds.left),
+            "right": float(bounds.right),
+            "top": float(bounds.top),
+            "bottom": float(bounds.bottom)
+        },
+        "stats": export_stats(stats)
+    }
+
+
+def export_for_viewer_v3(
+    processed_tif_path: Path,
+    region_id: str,
+    source: str,
+    output_path: Path,
+    validate_output: bool = True,
+    dtype: str = 'int16'
+) -> bool:
+    """
+    Stage 9 (binary): Export processed TIF in the export_v3 binary format.
+    
+    Writes a gzip-wrapped JSON header plus int16 (quantized) or float16 payload
+    (see src/export_binary.py). The viewer decodes it straight into a typed array.
+    
+    Args:
+        processed_tif_path: Path to processed TIF (metric CRS, downsampled)
+        region_id: Region identifier
+        source: Data source (e.g., 'srtm_30m', 'usa_3dep')
+        output_path: Where to save the export (*_v3.bin.gz)
+        validate_output: If True, validate coverage
+        dtype: Payload dtype ('int16' or 'float16')
+        
+    Returns:
+        True if successful
+    """
+    from src.export_binary import write_export_v3, read_export_v3_header
+    
+    if not processed_tif_path.exists():
+        print(f"  Input file not found: {processed_tif_path}")
+        return False
+    
+    # Check if output exists and is valid (header only - payload is not decompressed)
+    if output_path.exists():
+        try:
+            header = read_export_v3_header(output_path)
+            if header.get('region_id') and header.get('width', 0) > 0 and header.get('height', 0) > 0:
+                print(f"  Already exported (validated): {output_path.name}")
+                return True
+            output_path.unlink()
+        except Exception:
+            try:
+                output_path.unlink()
+            except Exception:
+                pass
+    
+    print(f"  Exporting to binary ({dtype})...")
+    
+    try:
+        grid = _read_export_grid(processed_tif_path, validate_output)
+        if grid is None:
+            return False
+        elevation_clean, bounds, stats = grid
+        
+        header = _export_v3_header(stats, bounds, region_id, source)
+        write_export_v3(output_path, header, [elevation_clean], ["elevation"], dtype=dtype)
+        
+        # Create metadata (with the record update_regions_manifest reads)
+        from src.manifest_index import export_manifest_record
+        metadata = create_export_metadata(
+            output_path,
+            region_id=region_id,
+            source=source,
+            source_file=processed_tif_path,
+            resolution_meters=30,  # Default
+            export_params={"format": "export_v3", "dtype": dtype},
+            version_stage='export_binary',
+            manifest_record=export_manifest_record(
+                output_path, region_id, source, "export_v3", header["bounds"], header["stats"])
+        )
+        save_metadata(metadata, get_metadata_path(output_path))
+        
+        file_size_mb = output_path.stat().st_size / (1024 * 1024)
+        print(f"  Exported: {output_path.name} ({file_size_mb:.2f} MB)", flush=True)
+        return True
+        
     except Exception as e:
         import traceback
         print(f"  Export failed: {e}", flush=True)
@@ -900,6 +1283,156 @@ def export_for_viewer(
         return False
 
 
+def export_pyramid_level(
+    grid,
+    region_id: str,
+    source: str,
+    base_export_path: Path,
+    factor: int,
+    output_path: Path
+) -> bool:
+    """
+    Stage 9 (pyramid): Export one pre-aggregated pyramid level of a binary export.
+    
+    The level holds max/mean/min bands of factor x factor buckets of the base
+    grid (see src/pyramid.py), so the viewer can fetch it instead of bucketing.
+    
+    Args:
+        grid: Tuple from _read_export_grid() (cleaned elevation, bounds in EPSG:4326, stats)
+        region_id: Region identifier
+        source: Data source (e.g., 'srtm_30m', 'usa_3dep')
+        base_export_path: Base export_v3 file the level belongs to
+        factor: Bucket factor
+        output_path: Where to save the level (see pyramid_level_filename)
+        
+    Returns:
+        True if successful
+    """
+    from src.pyramid import write_pyramid_level
+    
+    if grid is None:
+        return False
+    elevation_clean, bounds, stats = grid
+    height, width = elevation_clean.shape
+    if height // factor == 0 or width // factor == 0:
+        print(f"  Skipping pyramid level x{factor}: grid {width} x {height} too small")
+        return True
+    
+    try:
+        header = _export_v3_header(stats, bounds, region_id, source)
+        level_header = write_pyramid_level(elevation_clean, header, factor, base_export_path.name, output_path)
+        file_size_kb = output_path.stat().st_size / 1024
+        print(f"  Pyramid level x{factor}: {output_path.name} "
+              f"({level_header['width']} x {level_header['height']}, {file_size_kb:.1f} KB)", flush=True)
+        return True
+    except Exception as e:
+        print(f"  Pyramid level x{factor} failed: {e}", flush=True)
+        if output_path.exists():
+            output_path.unlink()
+        return False
+
+
+def export_tiles_for_viewer(
+    input_tif_path: Path,
+    region_id: str,
+    source: str,
+    tile_dir: Path,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    bounds: Optional[Tuple[float, float, float, float]] = None,
+    boundary_name: Optional[str] = None,
+    boundary_type: str = "country",
+    border_resolution: str = "10m"
+) -> bool:
+    """
+    Stage 9 (tiled): Export the full-resolution raster as a quadtree of viewer tiles.
+    
+    See src/tile_export.py for the layout. The raw raster is read through a
+    WarpedVRT on the full-resolution metric grid of the crop/clip extent (the
+    grid Stages 6-7 would produce), so every tile is warped window by window
+    and the boundary mask is rasterized per tile; nothing is held at full size.
+    The tile index (tile_dir/index.json) is written last, so it only exists for
+    a complete tile set.
+    
+    Args:
+        input_tif_path: Path to raw/merged TIF (any CRS)
+        region_id: Region identifier
+        source: Data source (e.g., 'srtm_30m', 'usa_3dep')
+        tile_dir: Output directory for tiles and index
+        tile_size: Tile width/height in pixels
+        bounds: Rectangular crop bounds (west, south, east, north) in EPSG:4326, or None
+        boundary_name: Administrative boundary to clip to, or None
+        boundary_type: "country" or "state"
+        border_resolution: Natural Earth border resolution ('10m', '50m', '110m')
+        
+    Returns:
+        True if successful
+    """
+    from rasterio.vrt import WarpedVRT
+    from rasterio.warp import Resampling
+    from src.boundary_cache import get_prepared_boundary, tolerance_for_pixel_size
+    from src.tile_export import export_tile_quadtree
+    
+    if not input_tif_path.exists():
+        print(f"  Input file not found: {input_tif_path}")
+        return False
+    
+    try:
+        with rasterio.open(input_tif_path) as src:
+            boundary_geom = None
+            if boundary_name:
+                boundary_geom = get_prepared_boundary(boundary_name, boundary_type, border_resolution, src.crs,
+                                                      tolerance_for_pixel_size(min(src.res)), True)
+            dst_crs, transform, width, height = full_resolution_metric_grid(src, bounds, boundary_geom)
+            
+            nodata = src.nodata
+            if nodata is None:
+                if np.issubdtype(src.dtypes[0], np.floating):
+                    nodata = -9999.0
+                else:
+                    nodata = np.iinfo(src.dtypes[0]).min
+            
+            inside = None
+            if boundary_name:
+                from rasterio.features import geometry_mask
+                from shapely.geometry import mapping
+                tile_geom = mapping(get_prepared_boundary(
+                    boundary_name, boundary_type, border_resolution, dst_crs,
+                    tolerance_for_pixel_size(min(abs(transform.a), abs(transform.e))), True))
+                
+                def inside(window_transform, shape):
+                    return geometry_mask([tile_geom], out_shape=shape, transform=window_transform, invert=True)
+            
+            with WarpedVRT(src, crs=dst_crs, transform=transform, width=width, height=height,
+                           resampling=Resampling.bilinear, src_nodata=nodata, nodata=nodata) as vrt:
+                print(f"  Tiling {width} x {height} raster into {tile_size}px tiles...", flush=True)
+                export_bounds = _export_bounds_4326(vrt)
+                header = {
+                    "region_id": region_id,
+                    "source": source,
+                    "name": region_id.replace('_', ' ').title(),
+                    "bounds": {
+                        "left": float(export_bounds.left),
+                        "right": float(export_bounds.right),
+                        "top": float(export_bounds.top),
+                        "bottom": float(export_bounds.bottom)
+                    }
+                }
+                index = export_tile_quadtree(vrt, tile_dir, header, tile_size, _clean_export_values,
+                                             inside=inside)
+        
+        tile_count = sum(len(level["tiles"]) for level in index["levels"])
+        print(f"  Tiles: {tile_count} across zoom 0-{index['max_zoom']} in {tile_dir}", flush=True)
+        return True
+        
+    except Exception as e:
+        import traceback
+        print(f"  Tile export failed: {e}", flush=True)
+        traceback.print_exc()
+        import shutil
+        shutil.rmtree(tile_dir, ignore_errors=True)
+        return False
+
+
 def export_borders_for_viewer(
     processed_tif_path: Path,
     region_id: str,
@@ -912,7 +1445,9 @@ def export_borders_for_viewer(
     Export border visualization data for the web viewer.
     
     Creates a separate _borders.json file containing border line coordinates
-    for rendering yellow boundary lines in the 3D viewer.
+    for rendering yellow boundary lines in the 3D viewer. Rings are simplified
+    to the processed pixel size and stored in the compact borders_v2 encoding
+    (src/border_encoding.py).
     
     Args:
         processed_tif_path: Path to processed TIF (to get bounds/CRS)
@@ -932,55 +1467,45 @@ def export_borders_for_viewer(
     try:
         print(f"  Exporting border visualization data...", flush=True)
         
-        border_manager = get_border_manager()
-        
-        # Get bounds and CRS from processed TIF
+        # Get bounds, CRS and pixel size from processed TIF
         with rasterio.open(processed_tif_path) as src:
             bounds = src.bounds
             crs = src.crs
+            pixel_size = min(src.res)
         
-        # Get border geometry based on type
-        if boundary_type == "state":
-            # Parse "Country/State" format
-            if "/" not in boundary_name:
-                print(f"  Warning: State boundary requires 'Country/State' format, got: {boundary_name}")
-                return False
-            
-            country, state = boundary_name.split("/", 1)
-            geometry_gdf = border_manager.get_state(country, state, border_resolution=border_resolution)
-        elif boundary_type == "country":
-            geometry_gdf = border_manager.get_country(boundary_name, border_resolution=border_resolution)
-        else:
+        if boundary_type == "state" and "/" not in boundary_name:
+            print(f"  Warning: State boundary requires 'Country/State' format, got: {boundary_name}")
+            return False
+        if boundary_type not in ("country", "state"):
             print(f"  Warning: Unknown boundary_type '{boundary_type}'")
             return False
         
-        if geometry_gdf is None or geometry_gdf.empty:
+        # Boundary prepared in the processed CRS (cached), simplified to the pixel size
+        from src.boundary_cache import get_prepared_boundary, tolerance_for_pixel_size, geometry_rings
+        boundary_geom = get_prepared_boundary(boundary_name, boundary_type, border_resolution, crs,
+                                              tolerance_for_pixel_size(pixel_size))
+        if boundary_geom is None or boundary_geom.is_empty:
             print(f"  Warning: Could not find boundary '{boundary_name}'")
             return False
         
         # Get border coordinates
-        border_coords = border_manager.get_border_coordinates(
-            boundary_name if boundary_type == "country" else [boundary_name],
-            target_crs=crs,
-            border_resolution=border_resolution
-        )
+        border_coords = geometry_rings(boundary_geom)
         
         if not border_coords:
             print(f"  Warning: No border coordinates found")
             return False
         
-        # Convert to JSON format
+        # Quantized, delta/zigzag/varint-encoded rings (decoded by js/border-format.js)
+        from src.border_encoding import BORDER_FORMAT, border_encoding, encode_ring
+        encoding = border_encoding(bounds, pixel_size)
         segments = []
         total_points = 0
-        for lon_coords, lat_coords in border_coords:
-            segment = {
-                "lon": [float(x) for x in lon_coords],
-                "lat": [float(y) for y in lat_coords]
-            }
-            segments.append(segment)
-            total_points += len(lon_coords)
+        for x_coords, y_coords in border_coords:
+            segments.append(encode_ring(x_coords, y_coords, encoding))
+            total_points += len(x_coords)
         
         borders_data = {
+            "format": BORDER_FORMAT,
             "bounds": {
                 "left": float(bounds.left),
                 "right": float(bounds.right),
@@ -988,6 +1513,7 @@ def export_borders_for_viewer(
                 "bottom": float(bounds.bottom)
             },
             "resolution": border_resolution,
+            "encoding": encoding,
             "countries": [{
                 "name": boundary_name,
                 "segments": segments,
@@ -995,17 +1521,9 @@ def export_borders_for_viewer(
             }]
         }
         
-        # Write JSON
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            json.dump(borders_data, f, separators=(',', ':'))
-        
-        # Gzip compress
-        import gzip
-        gzip_path = output_path.with_suffix('.json.gz')
-        with open(output_path, 'rb') as f_in:
-            with gzip.open(gzip_path, 'wb', compresslevel=9) as f_out:
-                f_out.writelines(f_in)
+        # Write JSON + gzip in one pass
+        from src.streaming_export import write_json_artifact
+        gzip_path = write_json_artifact(borders_data, output_path, separators=(',', ':'))
         
         file_size_kb = gzip_path.stat().st_size / 1024
         print(f"  Border data: {gzip_path.name} ({file_size_kb:.1f} KB, {len(segments)} segments, {total_points:,} points)")
@@ -1028,7 +1546,8 @@ def update_regions_manifest(generated_dir: Path) -> bool:
     2. ALL regions MUST have a region_type parameter (enforced)
     3. Region info (name, description, regionType) comes ONLY from region_config
     4. JSON manifest uses camelCase "regionType" (not snake_case "region_type")
-    5. JSON files only provide: file path, bounds, stats, source
+    5. Exports only provide: file path, bounds, stats, source (via their manifest
+       records, see src/manifest_index.py; only new or changed exports are read)
     6. Regions without data files are SKIPPED (not included in manifest)
     
     Args:
@@ -1046,35 +1565,35 @@ def update_regions_manifest(generated_dir: Path) -> bool:
             "regions": {}
         }
         
-        # Build index of JSON files by region_id for quick lookup
-        json_files_by_region: Dict[str, List[Path]] = {}
-        for json_file in sorted(generated_dir.glob("*.json")):
-            if (json_file.stem.endswith('_meta') or
-                json_file.stem.endswith('_borders') or
-                'manifest' in json_file.stem):
-                continue
-            
-            try:
-                with open(json_file) as f:
-                    data = json.load(f)
-                
-                # Extract region_id from JSON metadata
-                region_id = data.get("region_id")
-                if not region_id:
-                    # Fallback: try to infer from filename (for old files during migration)
-                    stem = json_file.stem
-                    for suffix in ['_srtm_30m_2048px_v2', '_srtm_30m_800px_v2', '_srtm_30m_v2', '_bbox_30m', '_usa_3dep_2048px_v2']:
-                        if stem.endswith(suffix):
-                            stem = stem[:-len(suffix)]
-                            region_id = stem
-                            break
-                
-                if region_id:
-                    if region_id not in json_files_by_region:
-                        json_files_by_region[region_id] = []
-                    json_files_by_region[region_id].append(json_file)
-            except Exception:
-                continue
+        # Per-export records from the persistent manifest index: only exports that are
+        # new or changed since the last update are read (from their _meta.json sidecar)
+        from src.manifest_index import get_manifest_index
+        records = get_manifest_index().records(generated_dir)
+        
+        # Candidate exports by region_id: binary (export_v3) preferred over JSON
+        exports_by_region: Dict[str, List[Dict]] = {}
+        binary_by_region: Dict[str, List[Dict]] = {}
+        # Pyramid levels are indexed by the base export they were derived from
+        pyramid_by_base: Dict[str, List[Dict]] = {}
+        tiles_by_region: Dict[str, Dict] = {}
+        for record in records:
+            if record["kind"] == "pyramid":
+                pyramid_by_base.setdefault(record.get("base_file"), []).append({
+                    key: record[key] for key in ("factor", "file", "width", "height", "bands")
+                })
+            elif record["kind"] == "tiles":
+                tiles_by_region[record["region_id"]] = {
+                    "index": record["file"],
+                    "source": record.get("source"),
+                    "tile_size": record["tile_size"],
+                    "max_zoom": record["max_zoom"],
+                    "base_width": record["base_width"],
+                    "base_height": record["base_height"],
+                }
+            elif record["file"].endswith('.bin.gz'):
+                binary_by_region.setdefault(record["region_id"], []).insert(0, record)
+            else:
+                exports_by_region.setdefault(record["region_id"], []).append(record)
         
         # Iterate ONLY through regions configured in region_config.py
         for region_id, cfg in sorted(ALL_REGIONS.items()):
@@ -1083,23 +1602,13 @@ def update_regions_manifest(generated_dir: Path) -> bool:
                 print(f"  [SKIP] Region '{region_id}' missing region_type in region_config - skipping")
                 continue
             
-            # Find matching JSON file(s) - use first available
-            json_file = None
-            json_data = None
-            if region_id in json_files_by_region:
-                for candidate_file in json_files_by_region[region_id]:
-                    try:
-                        with open(candidate_file) as f:
-                            candidate_data = json.load(f)
-                        json_file = candidate_file
-                        json_data = candidate_data
-                        break
-                    except Exception:
-                        continue
+            # Find matching export - use first available
+            candidates = binary_by_region.get(region_id, []) + exports_by_region.get(region_id, [])
             
             # SKIP regions without data files - only include regions with actual data
-            if not json_file or not json_data:
+            if not candidates:
                 continue
+            record = candidates[0]
             
             # Build entry using ONLY info from region_config
             entry = {
@@ -1108,35 +1617,29 @@ def update_regions_manifest(generated_dir: Path) -> bool:
                 "regionType": str(cfg.region_type),  # FROM CONFIG ONLY, REQUIRED (camelCase for JSON)
             }
             
-            # Attach file/bounds/stats/source from JSON (guaranteed to exist since we skip if missing)
-            entry["file"] = str(json_file.name)
-            if "bounds" in json_data:
-                entry["bounds"] = json_data["bounds"]
-            if "stats" in json_data:
-                entry["stats"] = json_data["stats"]
-            if "source" in json_data:
-                entry["source"] = json_data["source"]
+            # Attach file/bounds/stats/source from the export record
+            entry["file"] = record["file"]
+            for key in ("bounds", "stats", "source"):
+                if key in record:
+                    entry[key] = record[key]
+            if record["file"] in pyramid_by_base:
+                entry["pyramid"] = sorted(pyramid_by_base[record["file"]], key=lambda level: level["factor"])
+            if region_id in tiles_by_region:
+                entry["tiles"] = tiles_by_region[region_id]
             
             manifest["regions"][region_id] = entry
         
-        # Write manifest (JSON)
+        # Write manifest JSON and the gzip version (required for web viewer) in one pass
+        from src.streaming_export import write_json_artifact
         manifest_path = generated_dir / "regions_manifest.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-        
-        # Also write gzip-compressed version (required for web viewer)
-        try:
-            import gzip
-            gzip_path = manifest_path.with_suffix('.json.gz')
-            with open(manifest_path, 'rb') as f_in:
-                with gzip.open(gzip_path, 'wb', compresslevel=9) as f_out:
-                    f_out.writelines(f_in)
-            print(f"  Gzipped manifest: {gzip_path.name}")
-        except Exception as gz_err:
-            print(f"  Warning: Could not write gzip manifest: {gz_err}")
+        gzip_path = write_json_artifact(manifest, manifest_path, indent=2)
+        print(f"  Gzipped manifest: {gzip_path.name}")
         
         print(f"  Manifest updated ({len(manifest['regions'])} regions with data files)")
         
+        from src.status_index import get_status_index
+        get_status_index().record_manifest(manifest_path, manifest["regions"])
+        
         # Automatically update adjacency data if needed
         try:
             import sys
@@ -1160,6 +1663,36 @@ def update_regions_manifest(generated_dir: Path) -> bool:
         return False
 
 
+def _run_cached_stage(stage: str, fingerprint: str, output_path: Path, run_stage) -> bool:
+    """
+    Run a pipeline stage unless its artifact is already cached for this fingerprint.
+    
+    An existing output recorded under a different fingerprint (or not recorded
+    at all) is stale: it is deleted and the stage is rerun.
+    
+    Args:
+        stage: Pipeline stage name ('clipped', 'processed', 'export')
+        fingerprint: Fingerprint from compute_stage_fingerprint()
+        output_path: Artifact path the stage writes
+        run_stage: Callable running the stage, returning True on success
+        
+    Returns:
+        True if the artifact is current (cached or regenerated)
+    """
+    cache = get_stage_cache()
+    if cache.is_current(fingerprint, output_path):
+        print(f"  Up to date (fingerprint {fingerprint[:12]}): {output_path.name}")
+        return True
+    if output_path.exists():
+        print(f"  Inputs, parameters or version changed; regenerating {output_path.name}")
+        output_path.unlink()
+    if not run_stage():
+        return False
+    if output_path.exists():
+        cache.record(fingerprint, stage, output_path)
+    return True
+
+
 def run_pipeline(
     raw_tif_path: Path,
     region_id: str,
@@ -1170,7 +1703,12 @@ def run_pipeline(
     skip_clip: bool = False,
     border_resolution: str = "10m",
     bounds: Optional[Tuple[float, float, float, float]] = None,
-    region_type: Optional['RegionType'] = None
+    region_type: Optional['RegionType'] = None,
+    fused_warp: bool = DEFAULT_FUSED_WARP,
+    export_format: str = DEFAULT_EXPORT_FORMAT,
+    pyramid_factors: Tuple[int, ...] = DEFAULT_PYRAMID_FACTORS,
+    tiled_export: bool = False,
+    tile_size: int = DEFAULT_TILE_SIZE
 ) -> tuple[bool, dict]:
     """
     Unified pipeline (Stages 6-11). Assumes raw download already completed.
@@ -1190,6 +1728,12 @@ def run_pipeline(
         border_resolution: Natural Earth border resolution ('10m', '50m', '110m')
         bounds: Rectangular bounds (west, south, east, north) for cropping
         region_type: RegionType enum - used to determine if AREA regions always crop
+        fused_warp: Run Stages 6-8 as a single warp (no intermediate clipped/reprojected files)
+        export_format: 'export_v3' (binary .bin.gz) or 'export_v2' (JSON + .json.gz)
+        pyramid_factors: Bucket factors for pre-aggregated pyramid levels (export_v3 only)
+        tiled_export: Also export the full-resolution raster as quadtree tiles (for regions
+            that need more detail than one grid), warped from the raw raster tile by tile
+        tile_size: Tile width/height in pixels for tiled_export
     """
     
     print(f"\n{'='*70}")
@@ -1211,111 +1755,252 @@ def run_pipeline(
     processed_dir = data_root / "processed" / source
     generated_dir = Path("generated/regions")
 
-    # Stage 6: crop/clip
-    # Two distinct operations:
-    # - CROP: Reduce raw downloaded tiles to rectangular bounding box (area of interest)
-    # - CLIP: Apply geometric mask using administrative boundary shape (state/country polygon)
-    #
-    # Processing rules by region type:
-    # - USA_STATE/COUNTRY: Clip to boundary (may also crop first if needed)
-    # - AREA: ALWAYS crop to rectangular bounds, then optionally clip if clip_boundary=True
-    #
-    # Step 1: Crop to rectangular bounds (if needed)
-    # AREA regions ALWAYS crop; others crop only if not clipping
-    should_crop_first = (region_type == RegionType.AREA) or (bounds and (skip_clip or not boundary_name))
-    cropped_path = raw_tif_path
-    
-    if should_crop_first and bounds:
-        print(f"[STAGE 6a/10] Cropping to bounding box (rectangular region)")
-        cropped_filename = abstract_filename_from_raw(raw_tif_path, 'clipped', source, 'bbox')
-        if cropped_filename is None:
-            raise ValueError(f"Could not generate abstract filename for cropped file - bounds extraction failed for {raw_tif_path}")
-        cropped_path = clipped_dir / cropped_filename
-        if not crop_to_bounds(raw_tif_path, bounds, cropped_path, source):
-            print(f"\n[STAGE 6a/10] FAILED: Cropping to bounds failed.")
-            return False, result_paths
-    
-    # Step 2: Clip to boundary shape (if requested)
-    # AREA regions: Only if clip_boundary=True
-    # USA_STATE/COUNTRY: Always (unless skip_clip=True)
-    if boundary_name and not skip_clip:
-        print(f"[STAGE 6b/10] Clipping to {boundary_type} boundary: {boundary_name} ({border_resolution})")
-        # Generate abstract filename based on raw file bounds (no region_id)
-        clipped_filename = abstract_filename_from_raw(cropped_path, 'clipped', source, boundary_name)
-        if clipped_filename is None:
-            raise ValueError(f"Could not generate abstract filename for clipped file - bounds extraction failed for {cropped_path}")
-        clipped_path = clipped_dir / clipped_filename
+    import math
+    base_dimension = int(round(math.sqrt(target_total_pixels)))
+
+    # Every artifact below is keyed by a fingerprint of its inputs (raw file hash
+    # or upstream fingerprint), the parameters that affect it and the stage version
+    raw_hash = compute_file_hash(raw_tif_path)
+
+    if fused_warp:
+        # Stages 6-8 fused: crop/clip, reproject and downsample in one warp
+        # straight from raw data to the target-size metric grid (no intermediates)
+        should_crop_first = (region_type == RegionType.AREA) or (bounds and (skip_clip or not boundary_name))
+        clip_boundary_name = boundary_name if (boundary_name and not skip_clip) else None
+        print(f"[STAGE 6-8/10] Crop/clip, reproject and downsample (single warp)...")
+        processed_filename = abstract_filename_from_raw(raw_tif_path, 'processed', source, target_total_pixels=target_total_pixels)
+        if processed_filename is None:
+            raise ValueError(f"Could not generate abstract filename for processed file - bounds extraction failed for {raw_tif_path}")
+        processed_path = processed_dir / processed_filename
+        crop_bounds = bounds if should_crop_first else None
+        processed_fp = compute_stage_fingerprint('processed', [raw_hash], {
+            'op': 'fused_warp',
+            'bounds': list(crop_bounds) if crop_bounds else None,
+            'boundary_name': clip_boundary_name,
+            'boundary_type': boundary_type if clip_boundary_name else None,
+            'border_resolution': border_resolution if clip_boundary_name else None,
+            'target_total_pixels': target_total_pixels
+        })
         try:
-            if not clip_to_boundary(
-                cropped_path, region_id, boundary_name, clipped_path,
-                source, boundary_type, border_resolution, boundary_required=bool(boundary_name)
-            ):
-                print(f"\n[STAGE 6b/10] FAILED: Clipping failed and boundary was required ({boundary_name}).")
+            if not _run_cached_stage('processed', processed_fp, processed_path, lambda: warp_to_viewer_grid(
+                raw_tif_path, region_id, processed_path, target_total_pixels,
+                bounds=crop_bounds,
+                boundary_name=clip_boundary_name,
+                boundary_type=boundary_type,
+                border_resolution=border_resolution,
+                boundary_required=bool(clip_boundary_name)
+            )):
+                print(f"\n[STAGE 6-8/10] FAILED: Warping to viewer grid failed.")
                 return False, result_paths
         except PipelineError as e:
-            print(f"\n[STAGE 6b/10] FAILED: {e}")
+            print(f"\n[STAGE 6-8/10] FAILED: {e}")
             return False, result_paths
+        result_paths["clipped"] = raw_tif_path
+        result_paths["processed"] = processed_path
     else:
-        # No boundary clipping - use cropped (or raw) data
-        clipped_path = cropped_path
-        if not boundary_name and not bounds:
-            print(f"[STAGE 6/10] Skipping crop/clip (using raw data)")
+        # Stage 6: crop/clip
+        # Two distinct operations:
+        # - CROP: Reduce raw downloaded tiles to rectangular bounding box (area of interest)
+        # - CLIP: Apply geometric mask using administrative boundary shape (state/country polygon)
+        #
+        # Processing rules by region type:
+        # - USA_STATE/COUNTRY: Clip to boundary (may also crop first if needed)
+        # - AREA: ALWAYS crop to rectangular bounds, then optionally clip if clip_boundary=True
+        #
+        # Step 1: Crop to rectangular bounds (if needed)
+        # AREA regions ALWAYS crop; others crop only if not clipping
+        should_crop_first = (region_type == RegionType.AREA) or (bounds and (skip_clip or not boundary_name))
+        cropped_path = raw_tif_path
+        upstream_fp = raw_hash
+    
+        if should_crop_first and bounds:
+            print(f"[STAGE 6a/10] Cropping to bounding box (rectangular region)")
+            cropped_filename = abstract_filename_from_raw(raw_tif_path, 'clipped', source, 'bbox')
+            if cropped_filename is None:
+                raise ValueError(f"Could not generate abstract filename for cropped file - bounds extraction failed for {raw_tif_path}")
+            cropped_path = clipped_dir / cropped_filename
+            upstream_fp = compute_stage_fingerprint('clipped', [raw_hash], {'op': 'crop', 'bounds': list(bounds)})
+            if not _run_cached_stage('clipped', upstream_fp, cropped_path,
+                                     lambda: crop_to_bounds(raw_tif_path, bounds, cropped_path, source)):
+                print(f"\n[STAGE 6a/10] FAILED: Cropping to bounds failed.")
+                return False, result_paths
+    
+        # Step 2: Clip to boundary shape (if requested)
+        # AREA regions: Only if clip_boundary=True
+        # USA_STATE/COUNTRY: Always (unless skip_clip=True)
+        if boundary_name and not skip_clip:
+            print(f"[STAGE 6b/10] Clipping to {boundary_type} boundary: {boundary_name} ({border_resolution})")
+            # Generate abstract filename based on raw file bounds (no region_id)
+            clipped_filename = abstract_filename_from_raw(cropped_path, 'clipped', source, boundary_name)
+            if clipped_filename is None:
+                raise ValueError(f"Could not generate abstract filename for clipped file - bounds extraction failed for {cropped_path}")
+            clipped_path = clipped_dir / clipped_filename
+            upstream_fp = compute_stage_fingerprint('clipped', [upstream_fp], {
+                'op': 'clip',
+                'boundary_name': boundary_name,
+                'boundary_type': boundary_type,
+                'border_resolution': border_resolution
+            })
+            try:
+                if not _run_cached_stage('clipped', upstream_fp, clipped_path, lambda: clip_to_boundary(
+                    cropped_path, region_id, boundary_name, clipped_path,
+                    source, boundary_type, border_resolution, boundary_required=bool(boundary_name)
+                )):
+                    print(f"\n[STAGE 6b/10] FAILED: Clipping failed and boundary was required ({boundary_name}).")
+                    return False, result_paths
+            except PipelineError as e:
+                print(f"\n[STAGE 6b/10] FAILED: {e}")
+                return False, result_paths
+        else:
+            # No boundary clipping - use cropped (or raw) data
+            clipped_path = cropped_path
+            if not boundary_name and not bounds:
+                print(f"[STAGE 6/10] Skipping crop/clip (using raw data)")
 
-    result_paths["clipped"] = clipped_path
+        result_paths["clipped"] = clipped_path
 
-    # Stage 7: reproject (intermediate file, use abstract naming)
-    # Generate abstract filename based on raw file bounds (no region_id)
-    import math
-    base_dimension = int(round(math.sqrt(target_total_pixels)))
-    reprojected_filename = abstract_filename_from_raw(raw_tif_path, 'processed', source, target_total_pixels=target_total_pixels)
-    if reprojected_filename is None:
-        raise ValueError(f"Could not generate abstract filename for reprojected file - bounds extraction failed for {raw_tif_path}")
-    # Replace processed suffix with reproj suffix
-    # Example: bbox_N041p00_N040p00_W111p00_W112p00_processed_2048px_v2.tif
-    #       -> bbox_N041p00_N040p00_W111p00_W112p00_reproj.tif
-    reprojected_filename = reprojected_filename.replace('_processed_', '_reproj_').replace(f'_{base_dimension}px_v2.tif', '.tif')
-    reprojected_path = processed_dir / reprojected_filename
-    
-    print(f"\n[STAGE 7/10] Reprojecting to metric CRS...")
-    if not reproject_to_metric_crs(clipped_path, region_id, reprojected_path, source):
-        return False, result_paths
-
-    # Stage 8: downsample
-    print(f"\n[STAGE 8/10] Processing for viewer...")
-    # Generate abstract filename based on raw file bounds (no region_id)
-    processed_filename = abstract_filename_from_raw(raw_tif_path, 'processed', source, target_total_pixels=target_total_pixels)
-    if processed_filename is None:
-        raise ValueError(f"Could not generate abstract filename for processed file - bounds extraction failed for {raw_tif_path}")
-    processed_path = processed_dir / processed_filename
-    if not downsample_for_viewer(reprojected_path, region_id, processed_path, target_total_pixels):
-        return False, result_paths
-    result_paths["processed"] = processed_path
+        # Stage 7: reproject (intermediate file, use abstract naming)
+        # Generate abstract filename based on raw file bounds (no region_id)
+        reprojected_filename = abstract_filename_from_raw(raw_tif_path, 'processed', source, target_total_pixels=target_total_pixels)
+        if reprojected_filename is None:
+            raise ValueError(f"Could not generate abstract filename for reprojected file - bounds extraction failed for {raw_tif_path}")
+        # Replace processed suffix with reproj suffix
+        # Example: bbox_N041p00_N040p00_W111p00_W112p00_processed_2048px_v2.tif
+        #       -> bbox_N041p00_N040p00_W111p00_W112p00_reproj.tif
+        reprojected_filename = reprojected_filename.replace('_processed_', '_reproj_').replace(f'_{base_dimension}px_v2.tif', '.tif')
+        reprojected_path = processed_dir / reprojected_filename
+    
+        print(f"\n[STAGE 7/10] Reprojecting to metric CRS...")
+        reprojected_fp = compute_stage_fingerprint('processed', [upstream_fp], {'op': 'reproject'})
+        if not _run_cached_stage('processed', reprojected_fp, reprojected_path,
+                                 lambda: reproject_to_metric_crs(clipped_path, region_id, reprojected_path, source)):
+            return False, result_paths
+
+        # Stage 8: downsample
+        print(f"\n[STAGE 8/10] Processing for viewer...")
+        # Generate abstract filename based on raw file bounds (no region_id)
+        processed_filename = abstract_filename_from_raw(raw_tif_path, 'processed', source, target_total_pixels=target_total_pixels)
+        if processed_filename is None:
+            raise ValueError(f"Could not generate abstract filename for processed file - bounds extraction failed for {raw_tif_path}")
+        processed_path = processed_dir / processed_filename
+        processed_fp = compute_stage_fingerprint('processed', [reprojected_fp], {
+            'op': 'downsample',
+            'target_total_pixels': target_total_pixels
+        })
+        if not _run_cached_stage('processed', processed_fp, processed_path,
+                                 lambda: downsample_for_viewer(reprojected_path, region_id, processed_path, target_total_pixels)):
+            return False, result_paths
+        result_paths["processed"] = processed_path
 
     # Stage 9: export JSON
     print(f"\n[STAGE 9/10] Exporting for web viewer...")
     # Exported JSON files use region_id-based naming (viewer-specific, not reusable data)
     # They're already clipped to specific boundaries and filtered for this viewer
     # Use base dimension for filename (sqrt of total pixels for square regions)
-    exported_filename = f"{region_id}_{source}_{base_dimension}px_v2.json"
-    exported_path = generated_dir / exported_filename
-    if not export_for_viewer(processed_path, region_id, source, exported_path):
-        return False, result_paths
+    if export_format == 'export_v3':
+        exported_filename = f"{region_id}_{source}_{base_dimension}px_v3.bin.gz"
+        exported_path = generated_dir / exported_filename
+        export_fp = compute_stage_fingerprint('export_binary', [processed_fp], {
+            'op': 'export',
+            'region_id': region_id,
+            'source': source
+        })
+        if not _run_cached_stage('export_binary', export_fp, exported_path,
+                                 lambda: export_for_viewer_v3(processed_path, region_id, source, exported_path)):
+            return False, result_paths
+        
+        # Pyramid levels: the processed grid is read at most once, and only if a level is stale
+        from src.pyramid import pyramid_level_filename
+        loaded_grid = {}
+        
+        def export_grid():
+            if 'grid' not in loaded_grid:
+                loaded_grid['grid'] = _read_export_grid(processed_path, validate_output=False)
+            return loaded_grid['grid']
+        
+        for factor in pyramid_factors:
+            level_path = generated_dir / pyramid_level_filename(exported_filename, factor)
+            level_fp = compute_stage_fingerprint('export_binary', [export_fp], {
+                'op': 'pyramid',
+                'factor': factor
+            })
+            # Pyramid failure is non-fatal - the viewer falls back to client-side bucketing
+            _run_cached_stage('export_binary', level_fp, level_path,
+                              lambda factor=factor, level_path=level_path: export_pyramid_level(
+                                  export_grid(), region_id, source, exported_path, factor, level_path))
+    elif export_format == 'export_v2':
+        exported_filename = f"{region_id}_{source}_{base_dimension}px_v2.json"
+        exported_path = generated_dir / exported_filename
+        export_fp = compute_stage_fingerprint('export', [processed_fp], {
+            'op': 'export',
+            'region_id': region_id,
+            'source': source
+        })
+        if not _run_cached_stage('export', export_fp, exported_path,
+                                 lambda: export_for_viewer(processed_path, region_id, source, exported_path)):
+            return False, result_paths
+    else:
+        raise ValueError(f"Unknown export_format: {export_format} (must be 'export_v2' or 'export_v3')")
     result_paths["exported"] = exported_path
     
+    # Stage 9.2: quadtree tiles from the full-resolution raster (if requested)
+    if tiled_export:
+        print(f"\n[STAGE 9/10] Exporting quadtree tiles...")
+        from src.tile_export import TILE_INDEX_NAME, tile_dir_for
+        tile_dir = tile_dir_for(generated_dir, region_id, source)
+        # Same crop/clip as Stage 6, applied per tile while warping from the raw raster
+        should_crop_first = (region_type == RegionType.AREA) or (bounds and (skip_clip or not boundary_name))
+        tile_crop_bounds = bounds if should_crop_first else None
+        tile_boundary_name = boundary_name if (boundary_name and not skip_clip) else None
+        tiles_fp = compute_stage_fingerprint('export_binary', [raw_hash], {
+            'op': 'tiles',
+            'region_id': region_id,
+            'source': source,
+            'tile_size': tile_size,
+            'bounds': list(tile_crop_bounds) if tile_crop_bounds else None,
+            'boundary_name': tile_boundary_name,
+            'boundary_type': boundary_type if tile_boundary_name else None,
+            'border_resolution': border_resolution if tile_boundary_name else None
+        })
+        try:
+            if not _run_cached_stage('export_binary', tiles_fp, tile_dir / TILE_INDEX_NAME,
+                                     lambda: export_tiles_for_viewer(
+                                         raw_tif_path, region_id, source, tile_dir, tile_size,
+                                         bounds=tile_crop_bounds,
+                                         boundary_name=tile_boundary_name,
+                                         boundary_type=boundary_type,
+                                         border_resolution=border_resolution)):
+                return False, result_paths
+        except PipelineError as e:
+            print(f"\n[STAGE 9/10] FAILED: {e}")
+            return False, result_paths
+        result_paths["tiles"] = tile_dir
+    
     # Stage 9.5: export border visualization (if applicable)
     if boundary_name:
+        from src.border_encoding import BORDER_FORMAT
         borders_filename = f"{region_id}_{source}_{base_dimension}px_v2_borders.json"
         borders_path = generated_dir / borders_filename
-        export_borders_for_viewer(
-            processed_path, 
-            region_id, 
+        borders_fp = compute_stage_fingerprint('export', [processed_fp], {
+            'op': 'borders',
+            'format': BORDER_FORMAT,
+            'boundary_name': boundary_name,
+            'boundary_type': boundary_type,
+            'border_resolution': border_resolution
+        })
+        _run_cached_stage('export', borders_fp, borders_path, lambda: export_borders_for_viewer(
+            processed_path,
+            region_id,
             borders_path,
             boundary_name=boundary_name,
             boundary_type=boundary_type,
             border_resolution=border_resolution
-        )
+        ))
         # Note: Border export failure is non-fatal - terrain data is still usable
 
+    from src.status_index import get_status_index
+    get_status_index().record_pipeline(region_id, raw_tif_path, result_paths["processed"], result_paths["exported"])
+    
     # Stage 10: manifest
     print(f"[STAGE 10/10] Updating regions manifest...")
     update_regions_manifest(generated_dir)
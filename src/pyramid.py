@@ -0,0 +1,125 @@
+"""
+Pre-aggregated elevation pyramid levels for the web viewer.
+
+The viewer buckets the base export into NxN blocks (js/viewer-advanced.js
+computeBucketedData) whenever the resolution changes. Pyramid levels store
+those buckets ahead of time: one export_v3 file per bucket factor, with
+"max", "mean" and "min" bands, so the viewer can fetch a level instead of
+aggregating the full-resolution grid on the client.
+
+Aggregation matches the client exactly:
+- Level dimensions are floor(width / factor) x floor(height / factor)
+- A bucket is nodata unless at least half of its factor x factor pixels are valid
+  (preserves clipped boundaries instead of "healing" them)
+
+Level files sit next to the base export as {base_stem}_x{factor}_v3.bin.gz.
+Their header carries "pyramid_factor" and "base_file" so update_regions_manifest
+can attach them to the base export's manifest entry.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+from src.export_binary import write_export_v3
+
+
+# Bands written to every pyramid level, in payload order
+PYRAMID_BANDS = ["max", "mean", "min"]
+
+# Minimum fraction of valid pixels for a bucket to get a value (matches viewer bucketing)
+MIN_VALID_BUCKET_RATIO = 0.5
+
+
+def pyramid_level_filename(base_filename: str, factor: int) -> str:
+    """
+    Get the pyramid level filename for a base export_v3 filename.
+
+    Args:
+        base_filename: Base export name (e.g. 'utah_srtm_30m_2048px_v3.bin.gz')
+        factor: Bucket factor
+
+    Returns:
+        Level filename (e.g. 'utah_srtm_30m_2048px_x4_v3.bin.gz')
+    """
+    suffix = '_v3.bin.gz'
+    if not base_filename.endswith(suffix):
+        raise ValueError(f"Not an export_v3 filename: {base_filename}")
+    return f"{base_filename[:-len(suffix)]}_x{factor}{suffix}"
+
+
+def aggregate_buckets(
+    elevation: np.ndarray,
+    factor: int,
+    min_valid_ratio: float = MIN_VALID_BUCKET_RATIO
+) -> Dict[str, np.ndarray]:
+    """
+    Aggregate a grid into factor x factor buckets.
+
+    Args:
+        elevation: 2D float32 grid (NaN = no data)
+        factor: Bucket size in pixels
+        min_valid_ratio: Minimum valid pixel fraction for a bucket to be kept
+
+    Returns:
+        Dict of band name -> float32 array (NaN = no data), keys PYRAMID_BANDS
+    """
+    if factor < 1:
+        raise ValueError(f"Bucket factor must be >= 1, got {factor}")
+    height, width = elevation.shape
+    out_h, out_w = height // factor, width // factor
+
+    # (out_h, factor, out_w, factor) -> (out_h, out_w, factor * factor)
+    blocks = elevation[:out_h * factor, :out_w * factor].reshape(out_h, factor, out_w, factor)
+    blocks = blocks.transpose(0, 2, 1, 3).reshape(out_h, out_w, factor * factor)
+
+    valid = ~np.isnan(blocks)
+    count = valid.sum(axis=-1)
+    keep = count >= min_valid_ratio * factor * factor
+
+    bucket_max = np.where(valid, blocks, -np.inf).max(axis=-1)
+    bucket_min = np.where(valid, blocks, np.inf).min(axis=-1)
+    bucket_sum = np.where(valid, blocks, 0.0).sum(axis=-1, dtype=np.float64)
+    bucket_mean = bucket_sum / np.maximum(count, 1)
+
+    bands = {}
+    for name, values in (("max", bucket_max), ("mean", bucket_mean), ("min", bucket_min)):
+        values = values.astype(np.float32)
+        values[~keep] = np.nan
+        bands[name] = values
+    return bands
+
+
+def write_pyramid_level(
+    elevation: np.ndarray,
+    header: Dict,
+    factor: int,
+    base_filename: str,
+    output_path: Path,
+    dtype: str = 'int16'
+) -> Dict:
+    """
+    Write one pyramid level as a multi-band export_v3 file.
+
+    Args:
+        elevation: Base export grid (float32, NaN = no data)
+        header: Base header fields (region_id, source, name, bounds, stats)
+        factor: Bucket factor
+        base_filename: Filename of the base export this level is derived from
+        output_path: Destination (see pyramid_level_filename)
+        dtype: Payload dtype ('int16' or 'float16')
+
+    Returns:
+        The complete header written to the file
+    """
+    bands = aggregate_buckets(elevation, factor)
+    level_header = dict(header)
+    level_header.update({
+        "pyramid_factor": int(factor),
+        "base_file": base_filename,
+        "base_width": int(elevation.shape[1]),
+        "base_height": int(elevation.shape[0]),
+    })
+    return write_export_v3(output_path, level_header, [bands[name] for name in PYRAMID_BANDS],
+                           PYRAMID_BANDS, dtype=dtype)
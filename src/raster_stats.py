@@ -0,0 +1,190 @@
+"""
+Single-pass, block-wise raster statistics.
+
+Several stages used to rescan the same elevation grid: range validation
+(nanmin/nanmax) after clipping, reprojection and downsampling, export stats
+(nanmin/nanmax/nanmean), coverage validation, and the post-run status check.
+This kernel computes everything in one vectorized pass over row blocks:
+
+    total_count     all pixels
+    nonnull_count   finite and not nodata (coverage)
+    valid_count     non-null and inside the valid elevation range
+    min, max, mean  over valid pixels
+    histogram       fixed-width bins over the valid elevation range
+
+Stages store the result in their metadata sidecar (create_clipped_metadata /
+create_processed_metadata(raster_stats=...)) together with the raster's file
+identity; later validators and exporters call load_stage_stats() instead of
+rescanning, and fall back to dataset_stats() for rasters without stats.
+
+Usage:
+    from src.raster_stats import array_stats, load_stage_stats
+
+    stats = array_stats(elevation, nodata=src.nodata)
+    stats = load_stage_stats(processed_tif_path) or dataset_stats(src)
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+# Elevations outside this range are treated as invalid (matches the viewer export filter)
+STATS_VALID_RANGE = (-500.0, 9000.0)
+
+# Histogram bin width in meters over STATS_VALID_RANGE
+STATS_HISTOGRAM_BIN_METERS = 50.0
+
+# Rows per block (bounds the temporaries of each vectorized step)
+STATS_BLOCK_ROWS = 256
+
+
+class RasterStatsAccumulator:
+    """Running statistics, updated one block at a time."""
+
+    def __init__(self, nodata=None, valid_range: Optional[Tuple[float, float]] = STATS_VALID_RANGE):
+        self.nodata = nodata
+        self.valid_range = valid_range
+        self.total_count = 0
+        self.nonnull_count = 0
+        self.valid_count = 0
+        self.valid_sum = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        low, high = valid_range if valid_range is not None else STATS_VALID_RANGE
+        self.histogram_range = (float(low), float(high))
+        self.histogram = np.zeros(int(np.ceil((high - low) / STATS_HISTOGRAM_BIN_METERS)), dtype=np.int64)
+
+    def update(self, block: np.ndarray) -> None:
+        """
+        Add a block of pixels.
+
+        Args:
+            block: Elevation values (any shape, any numeric dtype)
+        """
+        self.total_count += block.size
+        if np.issubdtype(block.dtype, np.floating):
+            nonnull = np.isfinite(block)
+        else:
+            nonnull = np.ones(block.shape, dtype=bool)
+        if self.nodata is not None and not np.isnan(self.nodata):
+            nonnull &= block != self.nodata
+        self.nonnull_count += int(np.count_nonzero(nonnull))
+
+        values = block[nonnull]
+        if self.valid_range is not None:
+            values = values[(values >= self.valid_range[0]) & (values <= self.valid_range[1])]
+        if values.size == 0:
+            return
+        self.valid_count += int(values.size)
+        self.valid_sum += float(np.sum(values, dtype=np.float64))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        low, high = self.histogram_range
+        bins = ((values.astype(np.float64) - low) / STATS_HISTOGRAM_BIN_METERS).astype(np.int64)
+        np.clip(bins, 0, self.histogram.size - 1, out=bins)
+        self.histogram += np.bincount(bins, minlength=self.histogram.size)
+
+    def result(self) -> Dict:
+        """
+        Get the statistics.
+
+        Returns:
+            Stats dict (min/max/mean are None when there are no valid pixels)
+        """
+        has_valid = self.valid_count > 0
+        return {
+            "total_count": self.total_count,
+            "nonnull_count": self.nonnull_count,
+            "valid_count": self.valid_count,
+            "min": self.min if has_valid else None,
+            "max": self.max if has_valid else None,
+            "mean": self.valid_sum / self.valid_count if has_valid else None,
+            "histogram": {
+                "range": list(self.histogram_range),
+                "bin_meters": STATS_HISTOGRAM_BIN_METERS,
+                "counts": self.histogram.tolist(),
+            },
+        }
+
+
+def array_stats(elevation: np.ndarray, nodata=None,
+                valid_range: Optional[Tuple[float, float]] = STATS_VALID_RANGE) -> Dict:
+    """
+    Compute statistics of an in-memory elevation array.
+
+    Args:
+        elevation: 2D elevation array
+        nodata: Nodata value (NaN is always treated as nodata)
+        valid_range: (min, max) valid elevation, or None for no range filter
+
+    Returns:
+        Stats dict (see RasterStatsAccumulator.result)
+    """
+    accumulator = RasterStatsAccumulator(nodata, valid_range)
+    if elevation.ndim < 2:
+        accumulator.update(elevation)
+    else:
+        for row_start in range(0, elevation.shape[0], STATS_BLOCK_ROWS):
+            accumulator.update(elevation[row_start:row_start + STATS_BLOCK_ROWS])
+    return accumulator.result()
+
+
+def dataset_stats(src, band: int = 1,
+                  valid_range: Optional[Tuple[float, float]] = STATS_VALID_RANGE) -> Dict:
+    """
+    Compute statistics of an open raster, reading it in row blocks.
+
+    Args:
+        src: Open rasterio dataset
+        band: Band index
+        valid_range: (min, max) valid elevation, or None for no range filter
+
+    Returns:
+        Stats dict (see RasterStatsAccumulator.result)
+    """
+    from rasterio.windows import Window
+    accumulator = RasterStatsAccumulator(src.nodata, valid_range)
+    for row_start in range(0, src.height, STATS_BLOCK_ROWS):
+        rows = min(STATS_BLOCK_ROWS, src.height - row_start)
+        accumulator.update(src.read(band, window=Window(0, row_start, src.width, rows)))
+    return accumulator.result()
+
+
+def coverage_pct(stats: Dict) -> float:
+    """Percentage of non-null pixels."""
+    return stats["nonnull_count"] / max(stats["total_count"], 1) * 100.0
+
+
+def export_stats(stats: Dict) -> Dict:
+    """The min/max/mean subset written into viewer exports."""
+    return {"min": stats["min"], "max": stats["max"], "mean": stats["mean"]}
+
+
+def load_stage_stats(tif_path: Path) -> Optional[Dict]:
+    """
+    Get the statistics stored in a raster's metadata sidecar.
+
+    Args:
+        tif_path: Path to a clipped/processed raster
+
+    Returns:
+        Stats dict, or None if absent or recorded for a different version of the file
+    """
+    from src.file_hash import file_identity
+    from src.metadata import get_metadata_path
+
+    meta_path = get_metadata_path(Path(tif_path))
+    if not meta_path.exists() or not Path(tif_path).exists():
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            stats = json.load(f).get("raster_stats")
+    except (json.JSONDecodeError, OSError):
+        return None
+    if not stats or stats.get("file_identity") != list(file_identity(Path(tif_path))):
+        return None
+    return stats
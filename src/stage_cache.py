@@ -0,0 +1,191 @@
+"""
+Content-addressed cache for pipeline stage artifacts.
+
+Every artifact produced by a pipeline stage is keyed by a fingerprint of:
+- its input hashes (raw file hash, or the fingerprint of the upstream artifact)
+- the stage parameters (bounds, boundary, border_resolution, target_total_pixels, ...)
+- the current stage version from versioning.get_current_version(stage)
+
+An artifact is reused only if the index records exactly this fingerprint for
+the output path. Any change to inputs, parameters or stage version changes the
+fingerprint, so stale artifacts are regenerated without glob-and-unlink
+cascades, and unchanged artifacts are never recomputed.
+
+The index is a single JSON file loaded once per process (O(1) dict lookups)
+and updated under a file lock so concurrent pipeline runs stay consistent.
+
+Upgrading: artifacts written before this index existed (or while it was
+missing/corrupted) have no record, so they are treated as stale. The first
+pipeline run deletes and regenerates each such artifact once and records it;
+later runs reuse it. Artifacts whose size or mtime changed since they were
+recorded are regenerated the same way.
+
+Usage:
+    from src.stage_cache import compute_stage_fingerprint, get_stage_cache
+
+    fingerprint = compute_stage_fingerprint('processed', [raw_hash], {'target_total_pixels': 1048576})
+    cache = get_stage_cache()
+    if not cache.is_current(fingerprint, output_path):
+        ...  # run stage
+        cache.record(fingerprint, 'processed', output_path)
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import filelock
+
+from src.versioning import get_current_version
+
+
+# Index location (shared across all processes)
+STAGE_CACHE_INDEX = Path("data/.cache/stage_cache.json")
+
+
+def compute_stage_fingerprint(stage: str, input_hashes: List[str], params: Dict[str, Any]) -> str:
+    """
+    Compute the fingerprint identifying a stage artifact.
+
+    Args:
+        stage: Pipeline stage ('raw', 'clipped', 'processed', 'export')
+        input_hashes: Hashes of input files or fingerprints of upstream artifacts (order matters)
+        params: Stage parameters that affect the output (must be JSON-serializable)
+
+    Returns:
+        Hex SHA256 fingerprint
+    """
+    payload = {
+        "stage": stage,
+        "version": get_current_version(stage),
+        "inputs": list(input_hashes),
+        "params": params
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class StageCache:
+    """Index mapping artifact paths to the fingerprint they were produced for."""
+
+    def __init__(self, index_path: Path = STAGE_CACHE_INDEX):
+        self.index_path = index_path
+        self.lock_path = index_path.with_suffix('.lock')
+        self._by_path: Optional[Dict[str, Dict]] = None
+
+    def _key(self, path: Path) -> str:
+        return Path(path).resolve().as_posix()
+
+    def _read_index(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('artifacts', {})
+        except (json.JSONDecodeError, OSError):
+            # Corrupted index - start over (artifacts will be regenerated)
+            return {}
+
+    def _write_index(self, entries: Dict[str, Dict]) -> None:
+        # Atomic replace so readers never see a partially written index
+        tmp_path = self.index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"artifacts": entries}, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def _entries(self) -> Dict[str, Dict]:
+        if self._by_path is None:
+            self._by_path = self._read_index()
+        return self._by_path
+
+    def lookup(self, output_path: Path) -> Optional[str]:
+        """
+        Get the fingerprint recorded for an artifact path.
+
+        Args:
+            output_path: Artifact path
+
+        Returns:
+            Fingerprint string, or None if the path is unknown or the file changed on disk
+        """
+        entry = self._entries().get(self._key(output_path))
+        if entry is None:
+            return None
+        try:
+            stat = Path(output_path).stat()
+        except OSError:
+            return None
+        if stat.st_size != entry.get('size') or stat.st_mtime_ns != entry.get('mtime_ns'):
+            return None
+        return entry.get('fingerprint')
+
+    def is_current(self, fingerprint: str, output_path: Path) -> bool:
+        """
+        Check whether output_path holds the artifact for this fingerprint.
+
+        Args:
+            fingerprint: Fingerprint from compute_stage_fingerprint()
+            output_path: Expected artifact path
+
+        Returns:
+            True if the artifact exists unchanged and was produced with this fingerprint
+        """
+        return self.lookup(output_path) == fingerprint
+
+    def record(self, fingerprint: str, stage: str, output_path: Path) -> None:
+        """
+        Record that output_path was produced for fingerprint.
+
+        Args:
+            fingerprint: Fingerprint from compute_stage_fingerprint()
+            stage: Pipeline stage name
+            output_path: Artifact path (must exist)
+        """
+        stat = Path(output_path).stat()
+        entry = {
+            "fingerprint": fingerprint,
+            "stage": stage,
+            "version": get_current_version(stage),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "created": datetime.now().isoformat()
+        }
+        key = self._key(output_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with filelock.FileLock(str(self.lock_path), timeout=30):
+            # Merge with entries written by other processes since we loaded
+            entries = self._read_index()
+            entries[key] = entry
+            self._write_index(entries)
+        self._by_path = entries
+
+    def forget(self, output_path: Path) -> None:
+        """
+        Drop the index entry for an artifact path (e.g. after deleting it).
+
+        Args:
+            output_path: Artifact path
+        """
+        key = self._key(output_path)
+        if key not in self._entries():
+            return
+        with filelock.FileLock(str(self.lock_path), timeout=30):
+            entries = self._read_index()
+            entries.pop(key, None)
+            self._write_index(entries)
+        self._by_path = entries
+
+
+# Global instance
+_stage_cache = None
+
+
+def get_stage_cache() -> StageCache:
+    """Get or create the global stage cache instance."""
+    global _stage_cache
+    if _stage_cache is None:
+        _stage_cache = StageCache()
+    return _stage_cache
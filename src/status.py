@@ -17,7 +17,11 @@ from typing import Tuple, Optional, Dict
 
 from src.region_config import ALL_REGIONS
 from src.versioning import get_current_version
-from src.validation import check_pipeline_complete, find_raw_file, validate_json_export
+from src.validation import check_pipeline_complete, find_raw_file, region_binary_exports, validate_export
+
+
+# Force-reprocess attempts verify_and_auto_fix makes before giving up
+AUTO_FIX_MAX_ATTEMPTS = 1
 
 
 def summarize_pipeline_status(region_id: str, region_type: 'RegionType', region_info: dict) -> None:
@@ -61,22 +65,28 @@ def summarize_pipeline_status(region_id: str, region_type: 'RegionType', region_
 
 def check_export_version(region_id: str) -> Tuple[bool, str, str]:
     """
-    Check if the region's exported JSON exists with current format version in filename.
+    Check if the region's export exists with a current format version in filename.
     
-    Version is tracked in filename (e.g., *_v2.json), not inside the file.
+    Version is tracked in filename (e.g., *_v2.json, *_v3.bin.gz), not inside the file.
 
     Returns:
         (version_ok, found_version, expected_version)
     """
+    from src.status_index import EXPECTED_EXPORT_VERSION
+
     generated_dir = Path("generated/regions")
-    # Current format version from filename pattern
-    expected = "v2"  # Hardcoded - matches _v2.json pattern
+    # Format version run_pipeline currently writes (v2 exports are still supported)
+    expected = EXPECTED_EXPORT_VERSION
     found = "none"
     
     try:
         if not generated_dir.exists():
             return False, found, expected
         
+        # Binary export (export_v3) is current too
+        if region_binary_exports(region_id, generated_dir):
+            return True, "v3", expected
+        
         # Find any JSON files for this region with version in filename
         region_files = list(generated_dir.glob(f"{region_id}_*_v2.json"))
         if not region_files:
@@ -87,18 +97,48 @@ def check_export_version(region_id: str) -> Tuple[bool, str, str]:
                 return False, found, expected
             return False, found, expected
         
-        # Has v2 file - version is current
-        return True, expected, expected
+        # Has v2 file - still a supported version
+        return True, "v2", expected
         
     except Exception:
         return False, "error", expected
 
 
+def region_export_status(region_id: str, index_synced: bool = False) -> Tuple[bool, bool, str, str]:
+    """
+    Check a region's export, answering from the status index when it can.
+    
+    Args:
+        region_id: Region identifier
+        index_synced: True if the status index was synced with the manifest
+            (regions it has never recorded are then reported as not exported)
+    
+    Returns:
+        (has_export, version_ok, found_version, expected_version)
+    """
+    from src.status_index import EXPECTED_EXPORT_VERSION, get_status_index
+    index = get_status_index()
+    status = index.export_status(region_id)
+    if status is not None:
+        return status
+    if index_synced and index.get(region_id) is None:
+        return False, False, "none", EXPECTED_EXPORT_VERSION
+    
+    # Unknown or changed since recorded - check the files directly
+    has_valid = check_pipeline_complete(region_id)
+    version_ok, found, expected = check_export_version(region_id)
+    return has_valid, version_ok, found, expected
+
+
 def verify_and_auto_fix(region_id: str, result_paths: dict, source: str,
-                        region_type: 'RegionType', region_info: dict, border_resolution: str) -> bool:
+                        region_type: 'RegionType', region_info: dict, border_resolution: str,
+                        attempts_left: int = AUTO_FIX_MAX_ATTEMPTS) -> bool:
     """
     Detect compressed/flat altitude outputs and auto-fix by force reprocessing.
     Guarantees valid export when returning True.
+    
+    Gives up (returns False) once attempts_left force reprocesses did not
+    produce a valid export.
     """
     # Import here to avoid circular dependency
     from src.tile_geometry import tile_filename_from_bounds
@@ -119,37 +159,35 @@ def verify_and_auto_fix(region_id: str, result_paths: dict, source: str,
     tif_suspicious_range = False
     if processed_path and Path(processed_path).exists():
         try:
-            with rasterio.open(processed_path) as src:
-                arr = src.read(1)
-                arr = arr.astype(np.float32)
-                nodata = src.nodata
-                if nodata is not None and not np.isnan(nodata):
-                    arr[arr == nodata] = np.nan
-                
-                # Inline validation: check elevation range
-                valid_elev = arr[~np.isnan(arr)]
-                if len(valid_elev) > 0:
-                    min_elev = float(np.min(valid_elev))
-                    max_elev = float(np.max(valid_elev))
-                    elev_range = max_elev - min_elev
-                    if elev_range < 50.0:
-                        # Suspicious range - warn but don't fail (could be legitimate flat region)
-                        print(f"\n  WARNING: Suspicious elevation range in TIF: {min_elev:.1f}m to {max_elev:.1f}m (range: {elev_range:.1f}m)", flush=True)
-                        print(f"  This may indicate reprojection corruption or could be a legitimate flat region", flush=True)
-                        tif_suspicious_range = True
-                        # Don't fail validation for suspicious range alone
-                    tif_ok = True  # File exists and has valid data
-                else:
-                    tif_ok = False  # No valid data - actual corruption
+            from src.raster_stats import dataset_stats, load_stage_stats
+            stats = load_stage_stats(processed_path)
+            if stats is None:
+                with rasterio.open(processed_path) as src:
+                    stats = dataset_stats(src)
+            
+            # Inline validation: check elevation range
+            if stats["valid_count"] > 0:
+                min_elev = stats["min"]
+                max_elev = stats["max"]
+                elev_range = max_elev - min_elev
+                if elev_range < 50.0:
+                    # Suspicious range - warn but don't fail (could be legitimate flat region)
+                    print(f"\n  WARNING: Suspicious elevation range in TIF: {min_elev:.1f}m to {max_elev:.1f}m (range: {elev_range:.1f}m)", flush=True)
+                    print(f"  This may indicate reprojection corruption or could be a legitimate flat region", flush=True)
+                    tif_suspicious_range = True
+                    # Don't fail validation for suspicious range alone
+                tif_ok = True  # File exists and has valid data
+            else:
+                tif_ok = False  # No valid data - actual corruption
         except Exception:
             tif_ok = False  # File read failed - actual corruption
     else:
         tif_ok = False  # File missing - actual problem
 
-    # 2) Validate JSON export (structure + range check already present)
+    # 2) Validate export (JSON or export_v3 binary, by suffix)
     json_ok = False
     if exported_path and Path(exported_path).exists():
-        json_ok = validate_json_export(Path(exported_path))
+        json_ok = validate_export(Path(exported_path))
 
     # Only auto-fix for actual structural issues, not suspicious ranges
     if tif_ok and json_ok:
@@ -161,6 +199,10 @@ def verify_and_auto_fix(region_id: str, result_paths: dict, source: str,
         print("\n  Skipping auto-fix - suspicious elevation range may be legitimate", flush=True)
         return True
 
+    if attempts_left <= 0:
+        print("\n  Output still invalid after auto-fix - giving up", flush=True)
+        return False
+
     print("\n  Detected invalid or corrupted output. Auto-fixing by force reprocess...", flush=True)
     # Clean existing artifacts (using abstract naming)
     # Get bounds from region config to generate abstract filenames
@@ -185,6 +227,14 @@ def verify_and_auto_fix(region_id: str, result_paths: dict, source: str,
                     except Exception:
                         pass
 
+    # Binary exports are named by region, not bounds
+    for export_path in region_binary_exports(region_id):
+        try:
+            export_path.unlink()
+            print(f"  Deleted: {export_path.name}", flush=True)
+        except Exception:
+            pass
+
     # Locate raw again and re-run (accept any valid file for auto-fix)
     raw_path, _ = find_raw_file(region_id, verbose=False, min_required_resolution_meters=None)
     if not raw_path:
@@ -202,5 +252,6 @@ def verify_and_auto_fix(region_id: str, result_paths: dict, source: str,
         return False
 
     # Re-validate
-    return verify_and_auto_fix(region_id, result_paths2, source, region_type, region_info, border_resolution)
+    return verify_and_auto_fix(region_id, result_paths2, source, region_type, region_info, border_resolution,
+                               attempts_left=attempts_left - 1)
 
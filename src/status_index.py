@@ -0,0 +1,277 @@
+"""
+Persistent per-region status index (SQLite).
+
+`ensure_region.py all --check-only` used to glob generated/regions and parse
+JSON for every region, and `--list-regions` reloaded regions_manifest.json
+once per region. The pipeline now records what it writes here instead:
+
+- run_pipeline records each region's raw/processed/export paths and the
+  export's file identity (size, mtime_ns, inode).
+- update_regions_manifest records which regions are in the manifest (and
+  their export files), together with the manifest's own identity.
+
+Readers call sync_manifest() first: if the manifest changed outside the
+pipeline (or the index is new) it is parsed once and the index refreshed.
+Status queries then cost one SQL query plus a stat() of the export file; an
+export whose identity no longer matches the recorded one is reported stale.
+
+Usage:
+    from src.status_index import get_status_index
+
+    index = get_status_index()
+    index.sync_manifest(Path("generated/regions/regions_manifest.json"))
+    status = index.export_status("ohio")   # None if unknown/stale
+"""
+
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.config import DEFAULT_EXPORT_FORMAT
+from src.file_hash import file_identity
+
+
+# Index location (shared across all processes)
+STATUS_INDEX_PATH = Path("data/.cache/region_status.sqlite")
+
+# Schema version - bump to rebuild the index on layout changes
+STATUS_INDEX_VERSION = 1
+
+# Expected export version: the filename version of the format run_pipeline writes
+# ('export_v3' -> 'v3'); reported by check-only and check_export_version
+EXPECTED_EXPORT_VERSION = DEFAULT_EXPORT_FORMAT.rsplit('_', 1)[-1]
+
+# Export versions the viewer still loads (not reported as old format)
+SUPPORTED_EXPORT_VERSIONS = ("v2", "v3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS regions (
+    region_id TEXT PRIMARY KEY,
+    raw_path TEXT,
+    processed_path TEXT,
+    export_path TEXT,
+    export_identity TEXT,
+    in_manifest INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def export_version_from_path(export_path: Path) -> str:
+    """
+    Get the export format version encoded in an export filename.
+
+    Args:
+        export_path: Export file path (*_v3.bin.gz, *_v2.json, ...)
+
+    Returns:
+        'v3', 'v2', 'v1' or 'none'
+    """
+    name = Path(export_path).name
+    for version in ("v3", "v2", "v1"):
+        if name.endswith(f"_{version}.bin.gz") or name.endswith(f"_{version}.json"):
+            return version
+    return "none"
+
+
+def _identity_json(path: Path) -> Optional[str]:
+    try:
+        return json.dumps(list(file_identity(path)))
+    except OSError:
+        return None
+
+
+def _row_export_status(row: Dict) -> Optional[Tuple[bool, bool, str, str]]:
+    if _identity_json(Path(row["export_path"])) != row["export_identity"]:
+        return None
+    found = export_version_from_path(row["export_path"])
+    return True, found in SUPPORTED_EXPORT_VERSIONS, found, EXPECTED_EXPORT_VERSION
+
+
+class RegionStatusIndex:
+    """SQLite table of per-region pipeline artifacts and manifest membership."""
+
+    def __init__(self, db_path: Path = STATUS_INDEX_PATH):
+        self.db_path = db_path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row is None or int(row[0]) != STATUS_INDEX_VERSION:
+                conn.execute("DELETE FROM regions")
+                conn.execute("DELETE FROM meta")
+                conn.execute("INSERT INTO meta (key, value) VALUES ('version', ?)", (str(STATUS_INDEX_VERSION),))
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def record_pipeline(self, region_id: str, raw_path: Optional[Path] = None,
+                        processed_path: Optional[Path] = None, export_path: Optional[Path] = None) -> None:
+        """
+        Record the artifacts a pipeline run produced for a region.
+
+        Args:
+            region_id: Region identifier
+            raw_path: Raw input GeoTIFF
+            processed_path: Processed GeoTIFF
+            export_path: Viewer export (identity is recorded for staleness checks)
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                INSERT INTO regions (region_id, raw_path, processed_path, export_path, export_identity, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(region_id) DO UPDATE SET
+                    raw_path = excluded.raw_path,
+                    processed_path = excluded.processed_path,
+                    export_path = excluded.export_path,
+                    export_identity = excluded.export_identity,
+                    updated_at = excluded.updated_at
+                """,
+                (region_id,
+                 str(raw_path) if raw_path else None,
+                 str(processed_path) if processed_path else None,
+                 str(export_path) if export_path else None,
+                 _identity_json(export_path) if export_path else None,
+                 time.time()))
+
+    def record_manifest(self, manifest_path: Path, regions: Dict[str, Dict]) -> None:
+        """
+        Record manifest membership and each listed region's export file.
+
+        Args:
+            manifest_path: Written regions_manifest.json
+            regions: The manifest's "regions" mapping (region_id -> entry with "file")
+        """
+        generated_dir = Path(manifest_path).parent
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute("UPDATE regions SET in_manifest = 0")
+            for region_id, entry in regions.items():
+                export_path = generated_dir / entry["file"] if entry.get("file") else None
+                conn.execute(
+                    """
+                    INSERT INTO regions (region_id, export_path, export_identity, in_manifest, updated_at)
+                    VALUES (?, ?, ?, 1, ?)
+                    ON CONFLICT(region_id) DO UPDATE SET
+                        export_path = COALESCE(excluded.export_path, export_path),
+                        export_identity = COALESCE(excluded.export_identity, export_identity),
+                        in_manifest = 1,
+                        updated_at = excluded.updated_at
+                    """,
+                    (region_id,
+                     str(export_path) if export_path else None,
+                     _identity_json(export_path) if export_path else None,
+                     now))
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('manifest_identity', ?)",
+                         (_identity_json(manifest_path) or "",))
+
+    def sync_manifest(self, manifest_path: Path) -> bool:
+        """
+        Refresh manifest membership if the manifest changed since it was recorded.
+
+        Args:
+            manifest_path: regions_manifest.json
+
+        Returns:
+            True if the index reflects the manifest (False if it is missing or unreadable)
+        """
+        identity = _identity_json(manifest_path)
+        if identity is None:
+            return False
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'manifest_identity'").fetchone()
+        if row is not None and row[0] == identity:
+            return True
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                regions = json.load(f).get("regions", {})
+        except (json.JSONDecodeError, OSError):
+            return False
+        self.record_manifest(manifest_path, regions)
+        return True
+
+    def get(self, region_id: str) -> Optional[Dict]:
+        """
+        Get the recorded status row of a region.
+
+        Args:
+            region_id: Region identifier
+
+        Returns:
+            Row dict, or None if the region was never recorded
+        """
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM regions WHERE region_id = ?", (region_id,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def manifest_regions(self) -> set:
+        """Region ids recorded as present in the manifest."""
+        with closing(self._connect()) as conn:
+            return {row[0] for row in conn.execute("SELECT region_id FROM regions WHERE in_manifest = 1")}
+
+    def export_status(self, region_id: str) -> Optional[Tuple[bool, bool, str, str]]:
+        """
+        Get a region's export status from the index.
+
+        Args:
+            region_id: Region identifier
+
+        Returns:
+            (has_export, version_ok, found_version, expected_version) like
+            check_pipeline_complete + check_export_version, or None if the index
+            cannot answer (never recorded, or the export changed since it was recorded)
+        """
+        row = self.get(region_id)
+        if row is None or not row["export_path"]:
+            return None
+        return _row_export_status(row)
+
+    def stale_regions(self, region_ids: Iterable[str]) -> List[Tuple[str, str]]:
+        """
+        Find regions whose export is missing, changed or in an old format.
+
+        Args:
+            region_ids: Regions to check
+
+        Returns:
+            List of (region_id, reason), reason one of 'missing_export',
+            'export_changed' or 'old_format(found=..., expected=...)'
+        """
+        stale = []
+        for region_id in region_ids:
+            row = self.get(region_id)
+            if row is None or not row["export_path"]:
+                stale.append((region_id, "missing_export"))
+                continue
+            status = _row_export_status(row)
+            if status is None:
+                stale.append((region_id, "export_changed"))
+            elif not status[1]:
+                stale.append((region_id, f"old_format(found={status[2]}, expected={status[3]})"))
+        return stale
+
+
+# Global instance
+_status_index = None
+
+
+def get_status_index() -> RegionStatusIndex:
+    """Get or create the global region status index."""
+    global _status_index
+    if _status_index is None:
+        _status_index = RegionStatusIndex()
+    return _status_index
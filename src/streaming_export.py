@@ -0,0 +1,153 @@
+"""
+Streaming writer for viewer JSON artifacts.
+
+Viewer artifacts (elevation exports, border files, the regions manifest) are
+served as .json.gz, with a plain .json twin that tools read. Instead of
+writing the JSON, reopening it and gzipping it into a second file, this
+module encodes once and writes both outputs in the same pass:
+
+- Text is encoded straight into the gzip stream (and optionally the plain twin).
+- Large grids are encoded row by row, so peak memory is O(row).
+- Outputs are written to temporary names and renamed on success, so readers
+  never see a half-written artifact.
+
+Usage:
+    from src.streaming_export import write_json_artifact, StreamingJsonWriter
+
+    write_json_artifact(manifest, generated_dir / "regions_manifest.json", indent=2)
+
+    with StreamingJsonWriter(output_path) as out:
+        out.write('{"elevation":[')
+        ...
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, List, Optional
+
+import numpy as np
+
+
+# Matches the compression level previously used for all viewer .json.gz files
+GZIP_COMPRESSLEVEL = 9
+
+# Encoded text is buffered up to this size before hitting the streams
+WRITE_BUFFER_BYTES = 1024 * 1024
+
+
+def gzip_path_for(json_path: Path) -> Path:
+    """Get the .json.gz path for a .json artifact path."""
+    return json_path.with_suffix('.json.gz')
+
+
+class StreamingJsonWriter:
+    """
+    Context manager that writes text to a .json.gz and optionally its plain .json twin.
+
+    Both files are written to temporary paths and atomically renamed when the
+    block exits cleanly; on error the temporary files are removed.
+    """
+
+    def __init__(self, json_path: Path, write_plain: bool = True, compresslevel: int = GZIP_COMPRESSLEVEL):
+        self.json_path = Path(json_path)
+        self.gzip_path = gzip_path_for(self.json_path)
+        self.write_plain = write_plain
+        self.compresslevel = compresslevel
+        self._gz = None
+        self._plain = None
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        self._tmp_gzip = self.gzip_path.with_name(self.gzip_path.name + '.tmp')
+        self._tmp_plain = self.json_path.with_name(self.json_path.name + '.tmp')
+
+    def __enter__(self) -> 'StreamingJsonWriter':
+        self.json_path.parent.mkdir(parents=True, exist_ok=True)
+        self._gz = gzip.open(self._tmp_gzip, 'wb', compresslevel=self.compresslevel)
+        if self.write_plain:
+            self._plain = open(self._tmp_plain, 'wb')
+        return self
+
+    def write(self, text: str) -> None:
+        """Encode text (UTF-8) into the output streams."""
+        data = text.encode('utf-8')
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._pending_size >= WRITE_BUFFER_BYTES:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        chunk = b''.join(self._pending)
+        self._gz.write(chunk)
+        if self._plain is not None:
+            self._plain.write(chunk)
+        self._pending = []
+        self._pending_size = 0
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            if exc_type is None:
+                self._flush()
+        finally:
+            self._gz.close()
+            if self._plain is not None:
+                self._plain.close()
+
+        if exc_type is None:
+            os.replace(self._tmp_gzip, self.gzip_path)
+            if self.write_plain:
+                os.replace(self._tmp_plain, self.json_path)
+        else:
+            for tmp in (self._tmp_gzip, self._tmp_plain):
+                if tmp.exists():
+                    tmp.unlink()
+        return False
+
+
+def write_json_artifact(
+    data: Any,
+    json_path: Path,
+    write_plain: bool = True,
+    indent: Optional[int] = None,
+    separators: Optional[tuple] = None
+) -> Path:
+    """
+    Serialize data once into a .json.gz (and optionally the plain .json twin).
+
+    Args:
+        data: JSON-serializable object
+        json_path: Path of the plain .json artifact (.json.gz is derived)
+        write_plain: Also write the uncompressed .json twin
+        indent: json.dump indent
+        separators: json.dump separators
+
+    Returns:
+        Path to the .json.gz file
+    """
+    with StreamingJsonWriter(json_path, write_plain=write_plain) as out:
+        json.dump(data, out, indent=indent, separators=separators)
+    return gzip_path_for(Path(json_path))
+
+
+def encode_elevation_row(row: np.ndarray) -> str:
+    """
+    Encode one elevation row as a compact JSON array (NaN -> null).
+
+    Produces exactly the text json.dump emits for the same row converted to a
+    Python list with None for NaN.
+
+    Args:
+        row: 1D float32 array
+
+    Returns:
+        JSON array text
+    """
+    mask = np.isnan(row)
+    if mask.any():
+        values = row.astype(object)
+        values[mask] = None
+        return json.dumps(values.tolist(), separators=(',', ':'))
+    return json.dumps(row.tolist(), separators=(',', ':'))
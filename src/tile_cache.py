@@ -0,0 +1,301 @@
+"""
+Checksum-verified shared cache of downloaded source tiles.
+
+Adjacent regions need the same 1x1 degree tiles, and reruns need them again.
+Tiles downloaded by the source coordinator stay in data/raw/<source>/tiles/ and
+are recorded in a manifest keyed by (source_id, tile bounds, resolution) with
+the file's size, identity and content digest:
+
+- A tile is reused while its identity (size, mtime_ns, inode) matches the
+  manifest (one stat()). If the identity changed, the digest is recomputed and
+  the tile is reused only if the contents still match.
+- Tiles are recorded only after every block reads back (a truncated GeoTIFF is
+  deleted instead). Tiles found on disk without a manifest entry (downloaded
+  before the manifest existed) pass the same check before they are adopted.
+- Refresh policy: tiles older than TILE_CACHE_MAX_AGE_DAYS (src/config.py, None
+  = no expiry) are re-downloaded; download_tiles_for_region(refresh=True)
+  bypasses the cache for one run and re-records what it downloads.
+- Negative results: a source that has no data for a tile (404 for ocean/void
+  tiles, reported as TileNotAvailableError) is recorded in the manifest's
+  'missing' section and not asked again for NEGATIVE_TILE_CACHE_TTL_DAYS.
+
+Usage:
+    from src.tile_cache import get_tile_cache
+
+    cache = get_tile_cache()
+    if not cache.lookup(source_id, tile_bounds, resolution_m, tile_path):
+        download(tile_path)
+        cache.record(source_id, tile_bounds, resolution_m, tile_path)
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import filelock
+
+from src.config import NEGATIVE_TILE_CACHE_TTL_DAYS, TILE_CACHE_MAX_AGE_DAYS
+from src.file_hash import DEFAULT_HASH_ALGORITHM, file_identity, hash_file_contents
+
+
+# Manifest location (shared across all processes)
+TILE_MANIFEST_PATH = Path("data/.cache/tile_manifest.json")
+
+# Manifest sections: verified tiles and (source, tile) pairs without data
+MANIFEST_SECTIONS = ('tiles', 'missing')
+
+
+class TileNotAvailableError(Exception):
+    """Source has no data for a tile (e.g. 404 for an ocean or void tile)."""
+
+
+def tile_cache_key(source_id: str, tile_bounds: Tuple[float, float, float, float], resolution_m: int) -> str:
+    """
+    Get the manifest key of a source tile.
+
+    Args:
+        source_id: Source identifier (SourceCapability.source_id)
+        tile_bounds: (west, south, east, north) in degrees
+        resolution_m: Source resolution in meters
+
+    Returns:
+        Key string, e.g. 'opentopo_srtm_30m:30m:-112,40,-111,41'
+    """
+    bounds = ','.join(f"{value:g}" for value in tile_bounds)
+    return f"{source_id}:{resolution_m}m:{bounds}"
+
+
+def verify_tile_readable(tile_path: Path) -> bool:
+    """
+    Check that every block of a GeoTIFF tile can be read (catches truncated files).
+
+    Args:
+        tile_path: Path to tile
+
+    Returns:
+        True if the tile opens and all blocks decode
+    """
+    import rasterio
+
+    try:
+        with rasterio.open(tile_path) as src:
+            for _, window in src.block_windows(1):
+                src.read(window=window)
+        return True
+    except Exception:
+        return False
+
+
+class TileCache:
+    """Persistent manifest of source tiles -> path, identity and digest."""
+
+    def __init__(self, manifest_path: Path = TILE_MANIFEST_PATH):
+        self.manifest_path = manifest_path
+        self.lock_path = manifest_path.with_suffix('.lock')
+        self._manifest: Optional[Dict[str, Dict[str, Dict]]] = None
+
+    def _read_manifest(self) -> Dict[str, Dict[str, Dict]]:
+        manifest = {section: {} for section in MANIFEST_SECTIONS}
+        if not self.manifest_path.exists():
+            return manifest
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            # Corrupted manifest - start over (tiles are re-verified on use)
+            return manifest
+        for section in MANIFEST_SECTIONS:
+            manifest[section] = stored.get(section, {})
+        return manifest
+
+    def _load(self, section: str = 'tiles') -> Dict[str, Dict]:
+        if self._manifest is None:
+            self._manifest = self._read_manifest()
+        return self._manifest[section]
+
+    def _write(self, mutate: Callable[[Dict[str, Dict]], None], section: str = 'tiles') -> None:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with filelock.FileLock(str(self.lock_path), timeout=30):
+            # Merge with entries written by other processes since we loaded
+            manifest = self._read_manifest()
+            mutate(manifest[section])
+            tmp_path = self.manifest_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, self.manifest_path)
+        self._manifest = manifest
+
+    def lookup(
+        self,
+        source_id: str,
+        tile_bounds: Tuple[float, float, float, float],
+        resolution_m: int,
+        tile_path: Path,
+        max_age_days: Optional[float] = TILE_CACHE_MAX_AGE_DAYS
+    ) -> bool:
+        """
+        Check whether a verified copy of a source tile is on disk.
+
+        Stale or corrupted tiles are deleted so the next download starts clean.
+
+        Args:
+            source_id: Source identifier
+            tile_bounds: (west, south, east, north) in degrees
+            resolution_m: Source resolution in meters
+            tile_path: Where the source stores this tile
+            max_age_days: Re-download tiles recorded longer ago (None = no expiry)
+
+        Returns:
+            True if tile_path can be reused
+        """
+        tile_path = Path(tile_path)
+        key = tile_cache_key(source_id, tile_bounds, resolution_m)
+        entry = self._load().get(key)
+
+        if entry is None or entry.get('path') != tile_path.resolve().as_posix():
+            # Tile from before the manifest (or moved): adopt it only if it reads back
+            return tile_path.exists() and self.record(source_id, tile_bounds, resolution_m, tile_path)
+
+        try:
+            identity = file_identity(tile_path)
+        except OSError:
+            self._write(lambda entries: entries.pop(key, None))
+            return False
+
+        if max_age_days is not None and time.time() - entry.get('recorded', 0) > max_age_days * 86400:
+            self.discard(source_id, tile_bounds, resolution_m, tile_path)
+            return False
+
+        if tuple(entry.get('identity', ())) == identity:
+            return True
+
+        # File touched since it was recorded - trust it only if the contents match
+        if identity[0] == entry.get('size') and \
+                hash_file_contents(tile_path, entry.get('algorithm', DEFAULT_HASH_ALGORITHM)) == entry.get('digest'):
+            self._write(lambda entries: entries.get(key, {}).update(identity=list(identity)))
+            return True
+
+        self.discard(source_id, tile_bounds, resolution_m, tile_path)
+        return False
+
+    def record(
+        self,
+        source_id: str,
+        tile_bounds: Tuple[float, float, float, float],
+        resolution_m: int,
+        tile_path: Path
+    ) -> bool:
+        """
+        Verify a downloaded tile and record it in the manifest.
+
+        Args:
+            source_id: Source identifier
+            tile_bounds: (west, south, east, north) in degrees
+            resolution_m: Source resolution in meters
+            tile_path: Downloaded tile
+
+        Returns:
+            True if recorded; False if the tile is unreadable (it is deleted)
+        """
+        tile_path = Path(tile_path)
+        if not verify_tile_readable(tile_path):
+            print(f"    Tile failed integrity check, discarding: {tile_path.name}", flush=True)
+            self.discard(source_id, tile_bounds, resolution_m, tile_path)
+            return False
+
+        identity = file_identity(tile_path)
+        entry = {
+            'path': tile_path.resolve().as_posix(),
+            'size': identity[0],
+            'identity': list(identity),
+            'algorithm': DEFAULT_HASH_ALGORITHM,
+            'digest': hash_file_contents(tile_path, DEFAULT_HASH_ALGORITHM),
+            'recorded': time.time(),
+        }
+        key = tile_cache_key(source_id, tile_bounds, resolution_m)
+        self._write(lambda entries: entries.__setitem__(key, entry))
+        if key in self._load('missing'):
+            self._write(lambda entries: entries.pop(key, None), section='missing')
+        return True
+
+    def record_missing(
+        self,
+        source_id: str,
+        tile_bounds: Tuple[float, float, float, float],
+        resolution_m: int,
+        reason: str = ''
+    ) -> None:
+        """
+        Record that a source has no data for a tile.
+
+        Args:
+            source_id: Source identifier
+            tile_bounds: (west, south, east, north) in degrees
+            resolution_m: Source resolution in meters
+            reason: Short description (e.g. '404')
+        """
+        key = tile_cache_key(source_id, tile_bounds, resolution_m)
+        entry = {'reason': reason, 'recorded': time.time()}
+        self._write(lambda entries: entries.__setitem__(key, entry), section='missing')
+
+    def is_known_missing(
+        self,
+        source_id: str,
+        tile_bounds: Tuple[float, float, float, float],
+        resolution_m: int,
+        ttl_days: Optional[float] = NEGATIVE_TILE_CACHE_TTL_DAYS
+    ) -> bool:
+        """
+        Check whether a source recently had no data for a tile.
+
+        Args:
+            source_id: Source identifier
+            tile_bounds: (west, south, east, north) in degrees
+            resolution_m: Source resolution in meters
+            ttl_days: How long a negative result is trusted (None = forever)
+
+        Returns:
+            True if the source should not be asked for this tile
+        """
+        entry = self._load('missing').get(tile_cache_key(source_id, tile_bounds, resolution_m))
+        if entry is None:
+            return False
+        return ttl_days is None or time.time() - entry.get('recorded', 0) <= ttl_days * 86400
+
+    def discard(
+        self,
+        source_id: str,
+        tile_bounds: Tuple[float, float, float, float],
+        resolution_m: int,
+        tile_path: Path
+    ) -> None:
+        """
+        Delete a cached tile and its manifest entry.
+
+        Args:
+            source_id: Source identifier
+            tile_bounds: (west, south, east, north) in degrees
+            resolution_m: Source resolution in meters
+            tile_path: Tile file
+        """
+        try:
+            Path(tile_path).unlink()
+        except FileNotFoundError:
+            pass
+        key = tile_cache_key(source_id, tile_bounds, resolution_m)
+        if key in self._load():
+            self._write(lambda entries: entries.pop(key, None))
+
+
+# Global instance
+_tile_cache = None
+
+
+def get_tile_cache() -> TileCache:
+    """Get or create the global tile cache."""
+    global _tile_cache
+    if _tile_cache is None:
+        _tile_cache = TileCache()
+    return _tile_cache
@@ -0,0 +1,168 @@
+"""
+Quadtree tile export for large regions.
+
+A single viewer export is capped at DEFAULT_TARGET_TOTAL_PIXELS. For large
+regions the full resolution raster (metric CRS) is instead cut into a quadtree
+of fixed-size tiles so the viewer can load only the tiles in view at the zoom
+it needs. The source is usually a WarpedVRT over the raw raster, so each
+native tile is warped on read and the reprojected raster never exists in
+memory or on disk.
+
+Layout (under generated/regions/tiles/{region_id}_{source}/):
+    index.json(.gz)          tile index (see export_tile_quadtree)
+    {z}/{x}_{y}.bin.gz       export_v3 tile, one "elevation" band
+
+Quadtree:
+- Zoom max_zoom is native resolution: tile (x, y) covers raster pixels
+  [x*tile_size, (x+1)*tile_size) x [y*tile_size, (y+1)*tile_size)
+- Each coarser zoom halves the resolution: a tile is the 2x2 "max" aggregate
+  of its four children (same rule as viewer bucketing and src/pyramid.py)
+- Zoom 0 is a single tile covering the whole raster
+- Every tile is tile_size x tile_size; pixels outside the raster are nodata.
+  Tiles with no valid data are not written (and not listed in the index)
+
+Tiles are built depth-first from the native-resolution reads, so the raster is
+read once, window by window, and memory stays at O(max_zoom) tiles.
+"""
+
+import json
+import math
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.export_binary import write_export_v3
+from src.pyramid import aggregate_buckets
+from src.raster_stats import RasterStatsAccumulator, export_stats
+
+
+TILE_INDEX_VERSION = "tiles_v1"
+TILE_INDEX_NAME = "index.json"
+
+
+def tile_dir_for(generated_dir: Path, region_id: str, source: str) -> Path:
+    """Get the tile directory for a region export."""
+    return generated_dir / "tiles" / f"{region_id}_{source}"
+
+
+def max_zoom_for(width: int, height: int, tile_size: int) -> int:
+    """Smallest zoom at which tile_size * 2**zoom covers the raster."""
+    return max(0, math.ceil(math.log2(max(width, height) / tile_size)))
+
+
+def _tile_exists(z: int, x: int, y: int, max_zoom: int, tile_size: int, width: int, height: int) -> bool:
+    span = tile_size * 2 ** (max_zoom - z)
+    return x * span < width and y * span < height
+
+
+def export_tile_quadtree(
+    src,
+    tile_dir: Path,
+    header: Dict,
+    tile_size: int,
+    clean: Callable[[np.ndarray], np.ndarray],
+    dtype: str = 'int16',
+    inside: Optional[Callable[..., np.ndarray]] = None
+) -> Dict:
+    """
+    Write the quadtree tiles of an open raster and return the tile index.
+
+    Args:
+        src: Open rasterio dataset (metric CRS, full resolution)
+        tile_dir: Output directory (replaced if it exists)
+        header: Header fields copied into every tile (region_id, source, name)
+        tile_size: Tile width/height in pixels
+        clean: Converts a raw window to float32 with NaN for nodata/out-of-range values
+        dtype: Tile payload dtype ('int16' or 'float16')
+        inside: Optional boundary mask: called with (window transform, (height, width))
+            of each native tile, returns True inside the boundary
+
+    Returns:
+        Tile index dict (also written to tile_dir/index.json)
+    """
+    from rasterio.windows import Window
+
+    if tile_dir.exists():
+        shutil.rmtree(tile_dir)
+    tile_dir.mkdir(parents=True)
+
+    width, height = src.width, src.height
+    max_zoom = max_zoom_for(width, height, tile_size)
+    tiles_by_zoom: Dict[int, List[str]] = {z: [] for z in range(max_zoom + 1)}
+    stats = RasterStatsAccumulator(valid_range=None)
+
+    def read_native(x: int, y: int) -> np.ndarray:
+        col, row = x * tile_size, y * tile_size
+        w, h = min(tile_size, width - col), min(tile_size, height - row)
+        data = src.read(1, window=Window(col, row, w, h), masked=True)
+        values = clean(data.astype(np.float32).filled(np.nan))
+        if inside is not None:
+            values[~inside(src.window_transform(Window(col, row, w, h)), (h, w))] = np.nan
+        tile = np.full((tile_size, tile_size), np.nan, dtype=np.float32)
+        tile[:h, :w] = values
+        stats.update(values)
+        return tile
+
+    def build(z: int, x: int, y: int) -> Optional[np.ndarray]:
+        if not _tile_exists(z, x, y, max_zoom, tile_size, width, height):
+            return None
+        if z == max_zoom:
+            tile = read_native(x, y)
+        else:
+            children = np.full((2 * tile_size, 2 * tile_size), np.nan, dtype=np.float32)
+            for dy in (0, 1):
+                for dx in (0, 1):
+                    child = build(z + 1, 2 * x + dx, 2 * y + dy)
+                    if child is not None:
+                        children[dy * tile_size:(dy + 1) * tile_size, dx * tile_size:(dx + 1) * tile_size] = child
+            tile = aggregate_buckets(children, 2)["max"]
+
+        if np.isnan(tile).all():
+            return tile
+        tile_header = dict(header)
+        tile_header.update({"z": z, "x": x, "y": y})
+        write_export_v3(tile_dir / str(z) / f"{x}_{y}.bin.gz", tile_header, [tile], ["elevation"], dtype=dtype)
+        tiles_by_zoom[z].append(f"{x}_{y}")
+        return tile
+
+    build(0, 0, 0)
+
+    transform = src.transform
+    levels = []
+    for z in range(max_zoom + 1):
+        factor = 2 ** (max_zoom - z)
+        span = tile_size * factor
+        levels.append({
+            "z": z,
+            "cols": math.ceil(width / span),
+            "rows": math.ceil(height / span),
+            "meters_per_pixel_x": abs(transform.a) * factor,
+            "meters_per_pixel_y": abs(transform.e) * factor,
+            # Row-major order
+            "tiles": sorted(tiles_by_zoom[z], key=lambda key: tuple(int(v) for v in reversed(key.split('_')))),
+        })
+
+    index = dict(header)
+    index.update({
+        "version": TILE_INDEX_VERSION,
+        "tile_size": tile_size,
+        "max_zoom": max_zoom,
+        "base_width": width,
+        "base_height": height,
+        "crs": str(src.crs),
+        "transform": list(transform)[:6],
+        "stats": export_stats(stats.result()),
+        "levels": levels,
+    })
+
+    from src.streaming_export import write_json_artifact
+    write_json_artifact(index, tile_dir / TILE_INDEX_NAME, separators=(',', ':'))
+    return index
+
+
+def read_tile_index(tile_dir: Path) -> Dict:
+    """Read the tile index of a tile directory."""
+    with open(tile_dir / TILE_INDEX_NAME) as f:
+        return json.load(f)
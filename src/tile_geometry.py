@@ -6,6 +6,7 @@ This module handles all tile-related geometric calculations and filename generat
 - Calculating 1-degree tile coverage
 - Generating tile filenames from bounds
 - Estimating file sizes for downloads
+- Pixel windows covering geographic bounds (windowed reads)
 - Abstract filename generation for pipeline stages
 
 These functions are used across the download pipeline to ensure
@@ -179,6 +180,29 @@ def merged_filename_from_region(region_id: str, bounds: Tuple[float, float, floa
     return f"{region_id}_{bounds_str}_merged_{resolution}"
 
 
+def pixel_window_for_bounds(bounds: Tuple[float, float, float, float], transform, width: int, height: int):
+    """
+    Get the raster window of whole pixels covering bounds, clipped to the raster.
+    
+    Args:
+        bounds: (west, south, east, north) in the raster's CRS
+        transform: Raster affine transform
+        width: Raster width in pixels
+        height: Raster height in pixels
+    
+    Returns:
+        rasterio Window with integer offsets and lengths
+    """
+    from rasterio.windows import Window, from_bounds as window_from_bounds
+    
+    window = window_from_bounds(*bounds, transform=transform)
+    col_off, row_off = math.floor(window.col_off), math.floor(window.row_off)
+    window = Window(col_off, row_off,
+                    math.ceil(window.col_off + window.width) - col_off,
+                    math.ceil(window.row_off + window.height) - row_off)
+    return window.intersection(Window(0, 0, width, height))
+
+
 def estimate_raw_file_size_mb(bounds: Tuple[float, float, float, float], resolution_meters: int) -> float:
     """
     Estimate raw GeoTIFF file size in MB based on bounds and resolution.
@@ -270,8 +294,10 @@ def abstract_filename_from_raw(raw_path: Path, stage: str, source: str,
         return raw_path.name
     elif stage == 'clipped':
         if boundary_name:
-            boundary_hash = hash(boundary_name)
-            boundary_suffix = f"_{abs(boundary_hash) % 1000000:06d}"
+            # Stable digest (built-in hash() is salted per process)
+            import hashlib
+            boundary_hash = int(hashlib.md5(boundary_name.encode('utf-8')).hexdigest(), 16)
+            boundary_suffix = f"_{boundary_hash % 1000000:06d}"
         else:
             boundary_suffix = ""
         return f"{bounds_id}_clipped{boundary_suffix}_v1.tif"
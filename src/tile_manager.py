@@ -102,7 +102,8 @@ def download_and_merge_tiles(
     bounds: Tuple[float, float, float, float],
     output_path: Path = None,
     source: str = 'srtm_30m',
-    api_key: str = None
+    api_key: str = None,
+    refresh: bool = False
 ) -> bool:
     """
     Download 1-degree tiles and merge them for any region.
@@ -120,6 +121,7 @@ def download_and_merge_tiles(
         output_path: Path for merged output file (defaults to data/merged/{source}/{region_id}_merged.tif)
         source: Data source hint ('srtm_30m', 'srtm_90m', 'usa_3dep', etc.) - used for resolution detection
         api_key: OpenTopography API key (deprecated - loaded from settings.json)
+        refresh: Re-download tiles even if verified cached copies exist
         
     Returns:
         True if successful
@@ -152,7 +154,8 @@ def download_and_merge_tiles(
         region_id,
         bounds,
         resolution_m,
-        tiles_dir
+        tiles_dir,
+        refresh=refresh
     )
     
     if not tile_paths:
@@ -13,6 +13,8 @@ Data Sources:
 import sys
 import io
 import requests
+from src.downloaders.http_session import http_get
+from src.downloaders.resumable import download_resumable, tqdm_progress
 from pathlib import Path
 from typing import Tuple, Optional
 import numpy as np
@@ -223,7 +225,7 @@ class USGSElevationDownloader:
 
             # First, check if request will succeed (don't stream yet)
             print(f"\n  Sending initial request to check API response...", flush=True)
-            check_response = requests.get(base_url, params=params, timeout=60)
+            check_response = http_get(base_url, params=params, timeout=60)
             print(f"  Response status: {check_response.status_code}", flush=True)
             print(f"  Response headers: {dict(check_response.headers)}", flush=True)
             print(f"  Response content length: {len(check_response.content)} bytes", flush=True)
@@ -292,29 +294,21 @@ class USGSElevationDownloader:
 
             # Now download with streaming (only if check passed)
             print(f"\n  Starting download stream...", flush=True)
-            response = requests.get(base_url, params=params, stream=True, timeout=300)
-            response.raise_for_status()
-            
-            total_size = int(response.headers.get('content-length', 0))
-            print(f"  Content-Length: {total_size} bytes ({total_size / (1024*1024):.2f} MB)", flush=True)
-            if total_size == 0:
-                print(f"  WARNING: Content-Length is 0 - response may be empty or error", flush=True)
-                print(f"  Response content preview (first 500 chars): {response.content[:500]}", flush=True)
-            
             import time
             start_time = time.time()
 
-            with open(output_path, 'wb') as f, tqdm(
+            with tqdm(
                 desc="Downloading",
-                total=total_size,
                 unit='B',
                 unit_scale=True,
                 unit_divisor=1024,
                 bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'
             ) as pbar:
-                for chunk in response.iter_content(chunk_size=8192):
-                    size = f.write(chunk)
-                    pbar.update(size)
+                response = download_resumable(base_url, output_path, params=params, timeout=300,
+                                              progress=tqdm_progress(pbar))
+            response.raise_for_status()
+            if output_path.stat().st_size == 0:
+                print(f"  WARNING: Downloaded file is empty - response may be an error", flush=True)
 
             elapsed_time = time.time() - start_time
             file_size_mb = output_path.stat().st_size / (1024 * 1024)
@@ -409,14 +403,10 @@ class USGSElevationDownloader:
                 
                 try:
                     print(f"    Sending request...")
-                    response = requests.get(base_url, params=params, stream=True, timeout=300)
+                    response = download_resumable(base_url, chunk_file, params=params, timeout=300)
                     print(f"    Response status: {response.status_code}")
-                    print(f"    Content-Length header: {response.headers.get('content-length', 'unknown')}")
                     response.raise_for_status()
-                    
-                    with open(chunk_file, 'wb') as f:
-                        for chunk_data in response.iter_content(chunk_size=8192):
-                            f.write(chunk_data)
+                    print(f"    Chunk size: {chunk_file.stat().st_size} bytes")
                     
                     chunk_paths.append(chunk_file)
                 except Exception as e:
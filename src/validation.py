@@ -3,7 +3,7 @@ Validation utilities for altitude-maps project.
 
 This module provides validation functions for:
 - GeoTIFF files (raw elevation data)
-- JSON exports (viewer data)
+- Viewer exports (JSON and export_v3 binary)
 - Raw file discovery and quality checking
 - Pipeline completion status
 
@@ -13,9 +13,10 @@ All validation logic is centralized here to enable reuse and independent testing
 import json
 import gzip
 from pathlib import Path
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, List
 
 from src.region_config import ALL_REGIONS
+from src.validation_cache import cached_verdict, get_validation_cache
 
 
 def validate_elevation_range(
@@ -34,20 +35,37 @@ def validate_elevation_range(
     Returns:
         Tuple of (min_elev, max_elev, elev_range, is_valid)
     """
-    import numpy as np
+    from src.raster_stats import array_stats
     
-    # Filter out nodata values
-    valid_data = elevation_data[~np.isnan(elevation_data)]
+    # Filter out nodata values (NaN)
+    return validate_stats_range(array_stats(elevation_data, valid_range=None), min_sensible_range, warn_only)
+
+
+def validate_stats_range(
+    stats: Dict,
+    min_sensible_range: float = 50.0,
+    warn_only: bool = False
+) -> Tuple[float, float, float, bool]:
+    """
+    Validate elevation range from precomputed raster stats (see src/raster_stats.py).
     
-    if len(valid_data) == 0:
+    Args:
+        stats: Stats dict from array_stats/dataset_stats/load_stage_stats
+        min_sensible_range: Minimum sensible elevation range in meters
+        warn_only: If True, only warn; if False, raise exception on failure
+        
+    Returns:
+        Tuple of (min_elev, max_elev, elev_range, is_valid)
+    """
+    if not stats["valid_count"]:
         if warn_only:
             print(f"  WARNING: No valid elevation data found")
             return 0.0, 0.0, 0.0, False
         else:
             raise ValueError("No valid elevation data found")
     
-    min_elev = float(np.min(valid_data))
-    max_elev = float(np.max(valid_data))
+    min_elev = float(stats["min"])
+    max_elev = float(stats["max"])
     elev_range = max_elev - min_elev
     
     # Note: Some coastal cities and flat regions have small elevation ranges (e.g., Helsinki ~49m)
@@ -76,11 +94,24 @@ def validate_non_null_coverage(elevation_data, min_coverage_pct: float = 50.0) -
     Returns:
         Tuple of (coverage_pct, is_valid)
     """
-    import numpy as np
+    from src.raster_stats import array_stats
+    return validate_stats_coverage(array_stats(elevation_data, valid_range=None), min_coverage_pct)
+
+
+def validate_stats_coverage(stats: Dict, min_coverage_pct: float = 50.0) -> Tuple[float, bool]:
+    """
+    Validate non-null coverage from precomputed raster stats (see src/raster_stats.py).
     
-    total_pixels = elevation_data.size
-    valid_pixels = np.sum(~np.isnan(elevation_data))
-    coverage_pct = (valid_pixels / total_pixels) * 100.0
+    Args:
+        stats: Stats dict from array_stats/dataset_stats/load_stage_stats
+        min_coverage_pct: Minimum percentage of non-null data required
+        
+    Returns:
+        Tuple of (coverage_pct, is_valid)
+    """
+    from src.raster_stats import coverage_pct as stats_coverage_pct
+    
+    coverage_pct = stats_coverage_pct(stats)
     
     is_valid = coverage_pct >= min_coverage_pct
     
@@ -175,6 +206,54 @@ def validate_geotiff(file_path: Path, check_data: bool = False) -> bool:
         return False
 
 
+def validate_binary_export(file_path: Path, verbose: bool = True) -> bool:
+    """
+    Validate an exported binary (export_v3) file.
+
+    Args:
+        file_path: Path to *.bin.gz export
+        verbose: If True, print validation messages
+
+    Returns:
+        True if file is valid, False otherwise
+    """
+    if not file_path.exists():
+        return False
+
+    try:
+        import numpy as np
+        from src.export_binary import read_export_v3
+
+        header, bands = read_export_v3(file_path)
+
+        for field in ['region_id', 'width', 'height', 'bounds', 'bands']:
+            if field not in header:
+                if verbose:
+                    print(f"  Missing required header field: {field}")
+                return False
+
+        elevation = bands[header['bands'][0]]
+        if elevation.shape != (header['height'], header['width']) or elevation.size == 0:
+            if verbose:
+                print(f"  Invalid dimensions: {header['width']}x{header['height']}")
+            return False
+
+        valid_elev = elevation[~np.isnan(elevation)]
+        if len(valid_elev) > 0:
+            elev_range = float(valid_elev.max()) - float(valid_elev.min())
+            if elev_range < 20.0:
+                if verbose:
+                    print(f"  Elevation range too small: {elev_range:.1f}m (likely corrupted)")
+                return False
+
+        return True
+
+    except Exception as e:
+        if verbose:
+            print(f"  Binary export validation failed: {e}")
+        return False
+
+
 def validate_json_export(file_path: Path, verbose: bool = True) -> bool:
     """
     Validate an exported JSON file.
@@ -275,6 +354,35 @@ def validate_json_export(file_path: Path, verbose: bool = True) -> bool:
         return False
 
 
+def export_validator_name(file_path: Path) -> str:
+    """
+    Get the validator for a viewer export from its suffix.
+
+    Args:
+        file_path: Path to export (*.json or *.bin.gz)
+
+    Returns:
+        'binary_export' for export_v3 files, 'json_export' otherwise
+    """
+    return 'binary_export' if Path(file_path).name.endswith('.bin.gz') else 'json_export'
+
+
+def validate_export(file_path: Path, verbose: bool = True) -> bool:
+    """
+    Validate a viewer export with the validator matching its format.
+
+    Args:
+        file_path: Path to export (*.json or *.bin.gz)
+        verbose: If True, print validation messages
+
+    Returns:
+        True if file is valid, False otherwise
+    """
+    if export_validator_name(file_path) == 'binary_export':
+        return validate_binary_export(Path(file_path), verbose=verbose)
+    return validate_json_export(Path(file_path), verbose=verbose)
+
+
 def find_raw_file(region_id: str, verbose: bool = True, min_required_resolution_meters: Optional[int] = None) -> Tuple[Optional[Path], Optional[str]]:
     """
     Find existing raw file that meets quality requirements.
@@ -354,7 +462,7 @@ def find_raw_file(region_id: str, verbose: bool = True, min_required_resolution_
         if path.exists():
             if verbose:
                 print(f"  Checking {path.name}...", flush=True)
-            if validate_geotiff(path, check_data=True):
+            if cached_verdict(path, 'geotiff_data', lambda path=path: validate_geotiff(path, check_data=True)):
                 file_resolution = RESOLUTION_MAP[source]
                 
                 # Check if file meets quality requirement
@@ -375,6 +483,7 @@ def find_raw_file(region_id: str, verbose: bool = True, min_required_resolution_
                     print(f"  Invalid or corrupted, cleaning up...", flush=True)
                 try:
                     path.unlink()
+                    get_validation_cache().forget(path)
                     if verbose:
                         print(f"  Deleted corrupted file", flush=True)
                 except Exception as e:
@@ -393,6 +502,36 @@ def find_raw_file(region_id: str, verbose: bool = True, min_required_resolution_
     return None, None
 
 
+def region_binary_exports(region_id: str, generated_dir: Path = Path("generated/regions")) -> List[Path]:
+    """
+    Find a region's binary (export_v3) exports.
+
+    Exports are named {region_id}_{source}_{N}px_v3.bin.gz, so a filename
+    prefix also matches other regions whose id starts with this one (georgia
+    vs. georgia_country). Only files whose header names this region are
+    returned; files with an unreadable header are skipped. Pyramid levels
+    (*_x<factor>_v3.bin.gz) are not exports.
+
+    Args:
+        region_id: Region identifier
+        generated_dir: Export directory
+
+    Returns:
+        Sorted list of export paths
+    """
+    from src.export_binary import read_export_v3_header
+
+    exports = []
+    for path in sorted(generated_dir.glob(f"{region_id}_*px_v3.bin.gz")):
+        try:
+            header = read_export_v3_header(path)
+        except Exception:
+            continue
+        if header.get("region_id") == region_id and not header.get("pyramid_factor"):
+            exports.append(path)
+    return exports
+
+
 def check_pipeline_complete(region_id: str, verbose: bool = True) -> bool:
     """
     Check if all pipeline stages are complete and valid.
@@ -404,7 +543,7 @@ def check_pipeline_complete(region_id: str, verbose: bool = True) -> bool:
         verbose: If True, print validation messages
 
     Returns:
-        True if valid JSON export exists, False otherwise
+        True if a valid export (JSON or export_v3) exists, False otherwise
     """
     # Import here to avoid circular dependency
     from src.tile_geometry import tile_filename_from_bounds
@@ -432,6 +571,7 @@ def check_pipeline_complete(region_id: str, verbose: bool = True) -> bool:
         base_part = tile_name[:-4]  # Remove '.tif' suffix only
         for target_pixels in [512, 1024, 2048, 4096, 800]:
             possible_json_files.append(f"{base_part}_{target_pixels}px_v2.json")
+            possible_json_files.append(f"{base_part}_{target_pixels}px_v3.bin.gz")
     
     # Check for abstract filenames
     json_files = []
@@ -440,6 +580,9 @@ def check_pipeline_complete(region_id: str, verbose: bool = True) -> bool:
         if json_file.exists():
             json_files.append(json_file)
     
+    # Binary exports are named by region (only this region's, by header)
+    json_files.extend(f for f in region_binary_exports(region_id, generated_dir) if f not in json_files)
+    
     json_files = [f for f in json_files if '_borders' not in f.stem and '_meta' not in f.stem]
 
     if len(json_files) == 0:
@@ -449,7 +592,8 @@ def check_pipeline_complete(region_id: str, verbose: bool = True) -> bool:
     for json_file in json_files:
         if verbose:
             print(f"  Checking {json_file.name}...", flush=True)
-        if validate_json_export(json_file, verbose=verbose):
+        if cached_verdict(json_file, export_validator_name(json_file),
+                          lambda json_file=json_file: validate_export(json_file, verbose=verbose)):
             if verbose:
                 print(f"  Valid export found", flush=True)
             return True
@@ -458,6 +602,7 @@ def check_pipeline_complete(region_id: str, verbose: bool = True) -> bool:
                 print(f"  Invalid or incomplete, cleaning up...", flush=True)
             try:
                 json_file.unlink()
+                get_validation_cache().forget(json_file)
                 if verbose:
                     print(f"  Deleted corrupted file", flush=True)
             except Exception as e:
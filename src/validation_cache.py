@@ -0,0 +1,179 @@
+"""
+Persistent cache of file validation verdicts.
+
+find_raw_file validates every candidate GeoTIFF with check_data=True (open the
+file, read five sample windows) on every call, and ensure_region calls it
+several times per region. Verdicts are cached here keyed on the file's
+identity (size, mtime_ns, inode) and the validator's version, so repeat checks
+of unchanged files cost one stat():
+
+- A verdict is reused only while the file identity matches the one observed
+  before validating.
+- Bumping a validator's entry in VALIDATOR_VERSIONS invalidates all of its
+  verdicts (change it whenever the validator's rules change).
+
+Usage:
+    from src.validation_cache import cached_verdict
+
+    ok = cached_verdict(path, 'geotiff_data', lambda: validate_geotiff(path, check_data=True))
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import filelock
+
+from src.file_hash import file_identity
+
+
+# Index location (shared across all processes)
+VALIDATION_INDEX_PATH = Path("data/.cache/validation_index.json")
+
+# Validator versions - bump when a validator's rules change
+VALIDATOR_VERSIONS = {
+    'geotiff_data': 1,   # validate_geotiff(check_data=True)
+    'json_export': 1,    # validate_json_export
+    'binary_export': 1,  # validate_binary_export
+}
+
+
+def _verdict_key(validator: str) -> str:
+    return f"{validator}:{VALIDATOR_VERSIONS[validator]}"
+
+
+class ValidationCache:
+    """Persistent map of file path -> identity and validator verdicts."""
+
+    def __init__(self, index_path: Path = VALIDATION_INDEX_PATH):
+        self.index_path = index_path
+        self.lock_path = index_path.with_suffix('.lock')
+        self._entries: Optional[Dict[str, Dict]] = None
+
+    def _key(self, filepath: Path) -> str:
+        return Path(filepath).resolve().as_posix()
+
+    def _read_index(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('files', {})
+        except (json.JSONDecodeError, OSError):
+            # Corrupted index - start over (files will be re-validated)
+            return {}
+
+    def _load(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._entries = self._read_index()
+        return self._entries
+
+    def _write(self, mutate: Callable[[Dict[str, Dict]], None]) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with filelock.FileLock(str(self.lock_path), timeout=30):
+            # Merge with entries written by other processes since we loaded
+            entries = self._read_index()
+            mutate(entries)
+            tmp_path = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'files': entries}, f)
+            os.replace(tmp_path, self.index_path)
+        self._entries = entries
+
+    def get(self, filepath: Path, validator: str) -> Optional[bool]:
+        """
+        Get a cached verdict if the file is unchanged since it was validated.
+
+        Args:
+            filepath: Path to file
+            validator: Validator name (key of VALIDATOR_VERSIONS)
+
+        Returns:
+            Verdict, or None on miss
+        """
+        entry = self._load().get(self._key(filepath))
+        if entry is None:
+            return None
+        try:
+            if tuple(entry.get('identity', ())) != file_identity(filepath):
+                return None
+        except OSError:
+            return None
+        return entry.get('verdicts', {}).get(_verdict_key(validator))
+
+    def put(self, filepath: Path, identity: Tuple[int, int, int], validator: str, verdict: bool) -> None:
+        """
+        Record a verdict for a file identity.
+
+        Args:
+            filepath: Path to file
+            identity: (size, mtime_ns, inode) observed before validating
+            validator: Validator name (key of VALIDATOR_VERSIONS)
+            verdict: Validation result
+        """
+        key = self._key(filepath)
+
+        def mutate(entries):
+            entry = entries.get(key)
+            if entry is None or tuple(entry.get('identity', ())) != identity:
+                entry = {'identity': list(identity), 'verdicts': {}}
+            entry['verdicts'][_verdict_key(validator)] = bool(verdict)
+            entries[key] = entry
+
+        self._write(mutate)
+
+    def forget(self, filepath: Path) -> None:
+        """
+        Drop all verdicts for a file (e.g. after deleting it).
+
+        Args:
+            filepath: Path to file
+        """
+        key = self._key(filepath)
+        if key not in self._load():
+            return
+        self._write(lambda entries: entries.pop(key, None))
+
+
+# Global instance
+_validation_cache = None
+
+
+def get_validation_cache() -> ValidationCache:
+    """Get or create the global validation cache."""
+    global _validation_cache
+    if _validation_cache is None:
+        _validation_cache = ValidationCache()
+    return _validation_cache
+
+
+def cached_verdict(filepath: Path, validator: str, validate: Callable[[], bool]) -> bool:
+    """
+    Validate a file, reusing the cached verdict when the file is unchanged.
+
+    Args:
+        filepath: Path to file
+        validator: Validator name (key of VALIDATOR_VERSIONS)
+        validate: Runs the actual validation
+
+    Returns:
+        Validation result
+    """
+    cache = get_validation_cache()
+    cached = cache.get(filepath, validator)
+    if cached is not None:
+        return cached
+
+    try:
+        identity = file_identity(filepath)
+    except OSError:
+        return validate()
+    verdict = validate()
+    # Only record if the file did not change while it was being validated
+    try:
+        if file_identity(filepath) == identity:
+            cache.put(filepath, identity, validator, verdict)
+    except OSError:
+        pass
+    return verdict
@@ -15,6 +15,7 @@ RAW_VERSION = "raw_v1"          # Raw downloads (never changes - immutable)
 CLIPPED_VERSION = "clipped_v1"  # Boundary clipping algorithm
 PROCESSED_VERSION = "processed_v2"  # Downsampling/processing  
 EXPORT_VERSION = "export_v2"    # JSON export format
+EXPORT_BINARY_VERSION = "export_v3"  # Binary export format (src/export_binary.py)
 
 # Version history and compatibility
 VERSION_HISTORY = {
@@ -49,6 +50,11 @@ VERSION_HISTORY = {
         "changes": "Added source tracking and bounds metadata to JSON",
         "breaking": True,
         "incompatible_with": ["export_v1"]
+    },
+    "export_v3": {
+        "date": "2026-10-16",
+        "changes": "Binary export: JSON header + int16/float16 payload (gzip-wrapped)",
+        "breaking": False
     }
 }
 
@@ -63,7 +69,7 @@ def get_current_version(stage: str) -> str:
     Get the current version for a pipeline stage.
     
     Args:
-        stage: One of 'raw', 'clipped', 'processed', 'export'
+        stage: One of 'raw', 'clipped', 'processed', 'export', 'export_binary'
         
     Returns:
         Version string (e.g., 'clipped_v1')
@@ -75,7 +81,8 @@ def get_current_version(stage: str) -> str:
         'raw': RAW_VERSION,
         'clipped': CLIPPED_VERSION,
         'processed': PROCESSED_VERSION,
-        'export': EXPORT_VERSION
+        'export': EXPORT_VERSION,
+        'export_binary': EXPORT_BINARY_VERSION
     }
     
     if stage not in stage_versions:
@@ -170,7 +177,8 @@ def save_version_registry(output_path: Path) -> None:
             "raw": RAW_VERSION,
             "clipped": CLIPPED_VERSION,
             "processed": PROCESSED_VERSION,
-            "export": EXPORT_VERSION
+            "export": EXPORT_VERSION,
+            "export_binary": EXPORT_BINARY_VERSION
         },
         "version_history": VERSION_HISTORY
     }
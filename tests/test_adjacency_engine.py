@@ -0,0 +1,101 @@
+"""
+Tests for the spatial-index adjacency engine.
+
+Compares find_neighbors/find_contained with the original pairwise loops on
+a synthetic grid of regions (including a four-corners point touch and a
+duplicate geometry), serially and with a process pool.
+
+Run with: pytest tests/test_adjacency_engine.py -v
+"""
+
+from shapely.geometry import Point, box
+
+from src.adjacency_engine import find_contained, find_neighbors, get_cardinal_direction
+
+
+def _regions():
+    """4x4 grid of unit squares, plus an offset square, a duplicate and a far-away island."""
+    regions = {f"r{x}{y}": box(x, y, x + 1, y + 1) for x in range(4) for y in range(4)}
+    regions["offset"] = box(4, 0.5, 5, 1.5)
+    regions["duplicate"] = box(0, 0, 1, 1)
+    regions["island"] = Point(20, 20).buffer(0.5)
+    return regions
+
+
+def _areas():
+    return {
+        "inside": box(0.2, 0.2, 0.4, 0.4),
+        "straddling": box(1.8, 1.8, 2.2, 2.2),
+        "edge": box(-1, 0, 0, 1),
+        "far": box(50, 50, 51, 51),
+        "in_bounds_only": box(30, 30, 30.5, 30.5),
+    }
+
+
+def _pairwise_neighbors(regions):
+    result = {}
+    for region_id, geom in regions.items():
+        found = []
+        for other_id, other in regions.items():
+            if other_id == region_id:
+                continue
+            if geom.touches(other) or (geom.intersects(other) and not geom.equals(other)):
+                intersection = geom.intersection(other)
+                if intersection.geom_type in ['Point', 'MultiPoint']:
+                    found.append((other_id, None, 0.0))
+                    continue
+                found.append((other_id, get_cardinal_direction(geom.centroid, other.centroid), intersection.length))
+        result[region_id] = found
+    return result
+
+
+def _pairwise_contained(regions, bounds, areas):
+    result = {}
+    for region_id, geom in regions.items():
+        found = []
+        for area_id, area in areas.items():
+            centroid_inside = geom.contains(area.centroid)
+            bbox_intersects = geom.intersects(area) and not geom.touches(area)
+            w, s, e, n = bounds[region_id]
+            aw, as_, ae, an = area.bounds
+            bounds_contained = aw >= w and ae <= e and as_ >= s and an <= n
+            if centroid_inside and bbox_intersects:
+                found.append((area_id, 'centroid + overlap'))
+            elif centroid_inside:
+                found.append((area_id, 'centroid'))
+            elif bbox_intersects:
+                found.append((area_id, 'intersects'))
+            elif bounds_contained:
+                found.append((area_id, 'bounds check'))
+        result[region_id] = found
+    return result
+
+
+class TestAdjacencyEngine:
+    """Test suite for find_neighbors and find_contained."""
+
+    def test_neighbors_match_pairwise_loop(self):
+        regions = _regions()
+        expected = _pairwise_neighbors(regions)
+        assert find_neighbors(regions) == expected
+
+        # Corner-only touch is reported as a point touch, the duplicate is ignored
+        assert ("r11", None, 0.0) in expected["r00"]
+        assert all(other != "duplicate" for other, _, _ in expected["r00"])
+        assert expected["island"] == []
+
+    def test_neighbors_with_process_pool(self):
+        regions = _regions()
+        assert find_neighbors(regions, workers=2) == _pairwise_neighbors(regions)
+
+    def test_contained_matches_pairwise_loop(self):
+        regions = _regions()
+        bounds = {region_id: geom.bounds for region_id, geom in regions.items()}
+        bounds["island"] = (25, 25, 35, 35)
+        areas = _areas()
+
+        contained = find_contained(regions, bounds, areas)
+        assert contained == _pairwise_contained(regions, bounds, areas)
+        assert contained["r00"] == [("inside", "centroid + overlap")]
+        assert ("straddling", "intersects") in contained["r11"]
+        assert contained["island"] == [("in_bounds_only", "bounds check")]
@@ -0,0 +1,103 @@
+"""
+Tests for incremental adjacency updates.
+
+Verifies that after adding, changing or removing regions, the incremental
+update writes exactly what a full recompute writes, while recomputing only
+the changed regions and their neighbors.
+
+Run with: pytest tests/test_adjacency_incremental.py -v
+"""
+
+import json
+
+import pytest
+from shapely.geometry import box
+
+import compute_adjacency
+from src.types import RegionType
+
+
+def _grid(size=4):
+    regions = {}
+    for x in range(size):
+        for y in range(size):
+            regions[f"r{x}{y}"] = {'geometry': box(x, y, x + 1, y + 1), 'name': f"R{x}{y}",
+                                   'type': RegionType.COUNTRY, 'bounds': (x, y, x + 1, y + 1)}
+    return regions
+
+
+def _areas():
+    return {
+        "lake": {'geometry': box(0.2, 0.2, 0.4, 0.4), 'name': "Lake", 'type': RegionType.AREA},
+        "range": {'geometry': box(2.5, 2.5, 3.5, 3.5), 'name': "Range", 'type': RegionType.AREA},
+    }
+
+
+@pytest.fixture
+def world(tmp_path, monkeypatch):
+    """Synthetic regions served to compute_adjacency, with outputs in tmp_path."""
+    current = {'regions': _grid(), 'areas': _areas()}
+    monkeypatch.setattr(compute_adjacency, "collect_region_geometries",
+                        lambda: (dict(current['regions']), dict(current['areas'])))
+    monkeypatch.setattr(compute_adjacency, "ADJACENCY_STATE_PATH", tmp_path / "state.json")
+    monkeypatch.setattr(compute_adjacency, "ADJACENCY_OUTPUT_FILE", tmp_path / "region_adjacency.json")
+
+    subsets = []
+    original = compute_adjacency.find_neighbors
+
+    def recording_find_neighbors(geometries, workers=1, subset=None):
+        subsets.append(None if subset is None else sorted(subset))
+        return original(geometries, workers=workers, subset=subset)
+
+    monkeypatch.setattr(compute_adjacency, "find_neighbors", recording_find_neighbors)
+    return current, subsets, tmp_path / "region_adjacency.json"
+
+
+def _full_output(path):
+    compute_adjacency.compute_adjacency()
+    return path.read_text()
+
+
+class TestIncrementalAdjacency:
+    """Test suite for update_adjacency_incremental."""
+
+    def test_changed_region_recomputes_only_neighbors(self, world):
+        current, subsets, output = world
+        compute_adjacency.compute_adjacency()
+        subsets.clear()
+
+        # Grow r00 so it also reaches r20 (across r10)
+        current['regions']['r00'] = dict(current['regions']['r00'], geometry=box(0, 0, 2.5, 1))
+        assert compute_adjacency.update_adjacency_incremental() is True
+
+        assert subsets[0] == ["r00"]
+        assert set(subsets[1]) == {"r01", "r10", "r11", "r20", "r21"}
+        incremental = output.read_text()
+        assert incremental == _full_output(output)
+        assert "r20" in json.dumps(json.loads(incremental)["r00"])
+
+    def test_added_removed_regions_and_areas(self, world):
+        current, subsets, output = world
+        compute_adjacency.compute_adjacency()
+
+        current['regions']['extra'] = {'geometry': box(4, 0, 5, 1), 'name': "Extra",
+                                       'type': RegionType.COUNTRY, 'bounds': (4, 0, 5, 1)}
+        del current['regions']['r33']
+        current['areas']['range'] = dict(current['areas']['range'], geometry=box(1.2, 1.2, 1.4, 1.4))
+        current['areas']['bay'] = {'geometry': box(4.1, 0.1, 4.2, 0.2), 'name': "Bay", 'type': RegionType.AREA}
+        compute_adjacency.update_adjacency_incremental()
+
+        incremental = output.read_text()
+        assert incremental == _full_output(output)
+        adjacency = json.loads(incremental)
+        assert "r33" not in adjacency and adjacency["bay"] == {"within": "extra"}
+
+    def test_no_changes_leaves_output_untouched(self, world):
+        _, subsets, output = world
+        compute_adjacency.compute_adjacency()
+        before = output.read_text()
+        subsets.clear()
+
+        assert compute_adjacency.update_adjacency_incremental() is False
+        assert output.read_text() == before
+        assert subsets == []
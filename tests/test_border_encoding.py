@@ -0,0 +1,50 @@
+"""
+Tests for the compact borders_v2 polyline encoding.
+
+Verifies rings round-trip within half a quantization step, negative deltas
+and large jumps survive zigzag/varint coding, and the encoding is much
+smaller than float lon/lat lists.
+
+Run with: pytest tests/test_border_encoding.py -v
+"""
+
+import json
+
+import numpy as np
+
+from src.border_encoding import border_encoding, decode_ring, encode_ring
+
+
+class TestBorderEncoding:
+    """Test suite for encode_ring/decode_ring."""
+
+    def test_round_trip_within_quantization(self):
+        encoding = border_encoding((400000.0, 4400000.0, 500000.0, 4500000.0), 30.0)
+        angles = np.linspace(0, 2 * np.pi, 2000)
+        x = 450000.0 + 40000.0 * np.cos(angles)
+        y = 4450000.0 + 30000.0 * np.sin(angles)
+
+        decoded_x, decoded_y = decode_ring(encode_ring(x, y, encoding), encoding)
+
+        assert decoded_x.shape == x.shape
+        assert np.abs(decoded_x - x).max() <= encoding["scale"] / 2 + 1e-6
+        assert np.abs(decoded_y - y).max() <= encoding["scale"] / 2 + 1e-6
+
+    def test_negative_and_large_deltas(self):
+        encoding = border_encoding((-180.0, -90.0, 180.0, 90.0), 0.001)
+        x = np.array([-180.0, 179.9, -179.9, 0.0, 0.0])
+        y = np.array([-90.0, 89.9, -89.9, 0.0001, -0.0001])
+
+        decoded_x, decoded_y = decode_ring(encode_ring(x, y, encoding), encoding)
+        np.testing.assert_allclose(decoded_x, x, atol=encoding["scale"])
+        np.testing.assert_allclose(decoded_y, y, atol=encoding["scale"])
+
+    def test_smaller_than_float_lists(self):
+        encoding = border_encoding((0.0, 0.0, 100000.0, 100000.0), 50.0)
+        rng = np.random.default_rng(1)
+        x = np.cumsum(rng.uniform(-60, 60, 5000)) + 50000.0
+        y = np.cumsum(rng.uniform(-60, 60, 5000)) + 50000.0
+
+        encoded = json.dumps(encode_ring(x, y, encoding))
+        plain = json.dumps({"lon": x.tolist(), "lat": y.tolist()}, separators=(',', ':'))
+        assert len(encoded) * 5 < len(plain)
@@ -0,0 +1,85 @@
+"""
+Tests for the GeoParquet Natural Earth border store.
+
+Verifies legacy pickles are migrated, name and bbox lookups read only the
+matching rows, and BorderManager keeps several resolutions in memory.
+
+Run with: pytest tests/test_border_store.py -v
+"""
+
+import pickle
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import box
+
+from src.border_store import BORDER_ROW_GROUP_SIZE, BorderStore
+from src.borders import BorderManager
+
+
+def _countries(count=40):
+    """A row of 1x1 degree 'countries' along the equator."""
+    return gpd.GeoDataFrame(
+        {"ADMIN": [f"Country {i}" for i in range(count)], "POP_EST": list(range(count))},
+        geometry=[box(i, 0, i + 1, 1) for i in range(count)],
+        crs="EPSG:4326",
+    )
+
+
+def _states():
+    return gpd.GeoDataFrame(
+        {"admin": ["United States of America", "United States of America", "Canada"],
+         "name": ["Utah", "Nevada", "Utah"]},
+        geometry=[box(-114, 37, -109, 42), box(-120, 35, -114, 42), box(-100, 50, -99, 51)],
+        crs="EPSG:4326",
+    )
+
+
+class TestBorderStore:
+    """Test suite for BorderStore and the BorderManager lookups built on it."""
+
+    def test_legacy_pickle_migrated(self, tmp_path):
+        with open(tmp_path / "ne_110m_countries.pkl", 'wb') as f:
+            pickle.dump(_countries(), f)
+
+        manager = BorderManager(str(tmp_path))
+        country = manager.get_country("Country 7", border_resolution='110m')
+
+        assert (tmp_path / "ne_110m_countries.parquet").exists()
+        assert list(country.ADMIN) == ["Country 7"]
+        assert country.geometry.iloc[0].equals(box(7, 0, 8, 1))
+        assert country.crs.to_epsg() == 4326
+        assert "bbox" not in country.columns
+
+    def test_lookups_read_only_matching_row_groups(self, tmp_path, monkeypatch):
+        store = BorderStore(tmp_path)
+        store.write(_countries(), '10m', 'countries')
+
+        import pyarrow.parquet as pq
+        assert pq.ParquetFile(store.store_path('10m', 'countries')).num_row_groups == 40 // BORDER_ROW_GROUP_SIZE + 1
+
+        rows = store.find('10m', 'countries', ADMIN="Country 33")
+        assert rows == [33]
+        found = store.rows('10m', 'countries', rows)
+        assert list(found.POP_EST) == [33]
+
+        in_bbox = store.query_bbox('10m', 'countries', (5.5, 0.2, 7.5, 0.8))
+        assert list(in_bbox.ADMIN) == ["Country 5", "Country 6", "Country 7"]
+        assert len(store.query_bbox('10m', 'countries', (100, 50, 101, 51))) == 0
+
+    def test_manager_keeps_resolutions_and_matches_states(self, tmp_path):
+        store = BorderStore(tmp_path)
+        store.write(_countries(10), '10m', 'countries')
+        store.write(_countries(3), '110m', 'countries')
+        store.write(_states(), '10m', 'admin_1')
+
+        manager = BorderManager(str(tmp_path))
+        assert len(manager.list_countries('10m')) == 10
+        assert len(manager.list_countries('110m')) == 3
+        assert manager.store.index('10m', 'countries') is manager.store.index('10m', 'countries')
+
+        utah = manager.get_state("united states of america", "utah", border_resolution='10m')
+        assert utah.geometry.iloc[0].bounds == (-114, 37, -109, 42)
+        assert manager.list_states_in_country("United States of America", '10m') == ["Nevada", "Utah"]
+        assert manager.get_state("Canada", "Nevada", border_resolution='10m') is None
+        assert list(manager.get_country("country 2", '110m').ADMIN) == ["Country 2"]
@@ -0,0 +1,96 @@
+"""
+Tests for the prepared boundary geometry cache.
+
+Verifies geometries are reprojected, unioned and simplified once per key,
+reused from disk afterwards, that keys separate CRS, tolerance and the
+Natural Earth source file, and that failed reprojections are not cached.
+
+Run with: pytest tests/test_boundary_cache.py -v
+"""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import Point, box
+
+import src.pipeline
+from src.boundary_cache import BoundaryGeometryCache, geometry_rings, tolerance_for_pixel_size
+
+
+@pytest.fixture
+def loader_calls(monkeypatch):
+    """Replace the Natural Earth loader with two overlapping synthetic shapes."""
+    calls = []
+
+    def fake_load(boundary_name, boundary_type="country", border_resolution="10m", boundary_required=False):
+        calls.append(boundary_name)
+        shapes = [Point(-111.5, 40.5).buffer(0.3, quad_segs=256), box(-111.5, 40.2, -111.0, 40.8)]
+        return gpd.GeoDataFrame(geometry=shapes, crs="EPSG:4326")
+
+    monkeypatch.setattr(src.pipeline, "load_boundary_geometry", fake_load)
+    return calls
+
+
+class TestBoundaryCache:
+    """Test suite for BoundaryGeometryCache."""
+
+    def test_prepared_once_then_loaded_from_disk(self, tmp_path, loader_calls):
+        cache = BoundaryGeometryCache(tmp_path)
+        tolerance = tolerance_for_pixel_size(30.0)
+        geom = cache.get("Utah", "state", "10m", "EPSG:32612", tolerance)
+
+        assert loader_calls == ["Utah"]
+        assert geom.geom_type == "Polygon"  # unioned
+        assert geom.bounds[0] > 100000  # reprojected to UTM metres
+
+        reloaded = BoundaryGeometryCache(tmp_path).get("Utah", "state", "10m", "EPSG:32612", tolerance)
+        assert loader_calls == ["Utah"]
+        assert reloaded.equals(geom)
+
+    def test_key_includes_crs_and_tolerance(self, tmp_path, loader_calls):
+        cache = BoundaryGeometryCache(tmp_path)
+        exact = cache.get("Utah", "state", "10m", "EPSG:32612")
+        simplified = cache.get("Utah", "state", "10m", "EPSG:32612", 500.0)
+        geographic = cache.get("Utah", "state", "10m", "EPSG:4326")
+
+        assert len(loader_calls) == 3
+        assert len(list(tmp_path.glob("*.wkb"))) == 3
+        assert len(simplified.exterior.coords) < len(exact.exterior.coords)
+        assert simplified.hausdorff_distance(exact) <= 500.0
+        assert geographic.bounds[0] == pytest.approx(-111.8)
+
+    def test_key_includes_border_source(self, tmp_path, loader_calls, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "data" / "borders" / "ne_10m_admin_1.parquet"
+        source.parent.mkdir(parents=True)
+        source.write_bytes(b"borders")
+        cache = BoundaryGeometryCache(tmp_path / "boundaries")
+        cache.get("Utah", "state", "10m", "EPSG:32612")
+        cache.get("Utah", "state", "10m", "EPSG:32612")
+        assert loader_calls == ["Utah"]
+
+        # download_borders.py --force rewrites the store file
+        source.write_bytes(b"new borders")
+        BoundaryGeometryCache(tmp_path / "boundaries").get("Utah", "state", "10m", "EPSG:32612")
+        assert loader_calls == ["Utah", "Utah"]
+
+    def test_failed_reprojection_is_not_cached(self, tmp_path, monkeypatch):
+        calls = []
+
+        def fake_load(boundary_name, boundary_type="country", border_resolution="10m", boundary_required=False):
+            calls.append(boundary_name)
+            return gpd.GeoDataFrame(geometry=[box(-111.5, 40.2, -111.0, 40.8)])  # no CRS
+
+        monkeypatch.setattr(src.pipeline, "load_boundary_geometry", fake_load)
+        cache = BoundaryGeometryCache(tmp_path)
+        geom = cache.get("Utah", "state", "10m", "EPSG:32612")
+        assert geom.bounds[0] == pytest.approx(-111.5)
+        assert list(tmp_path.glob("*.wkb")) == []
+        cache.get("Utah", "state", "10m", "EPSG:32612")
+        assert calls == ["Utah", "Utah"]
+
+    def test_geometry_rings(self):
+        polygon = box(0, 0, 10, 10).difference(box(2, 2, 4, 4))
+        rings = geometry_rings(polygon.union(box(20, 20, 21, 21)))
+        assert len(rings) == 3
+        assert all(isinstance(x, np.ndarray) and len(x) == len(y) for x, y in rings)
@@ -0,0 +1,192 @@
+"""
+Tests for windowed Copernicus COG reads.
+
+Serves a cloud-optimized GeoTIFF from a local Range-capable HTTP server and
+verifies that a small window is fetched with ranged GETs covering only a
+fraction of the file, that the sub-tile matches the source pixels and
+georeferencing, and that sparsely covered tiles are routed to the windowed
+fetch while well covered tiles are downloaded whole, both by the region
+downloader and by the source coordinator (cached as sub-tiles).
+
+Run with: pytest tests/test_copernicus_window.py -v
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_bounds
+
+from src import tile_cache
+from src.downloaders import copernicus_s3, source_coordinator
+from src.downloaders.source_registry import SourceCapability
+from src.tile_cache import TileCache
+
+
+TILE = (-112.0, 40.0, -111.0, 41.0)
+SIZE = 1024
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def _send_headers(self, status, length, extra=()):
+        self.send_response(status)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(length))
+        for key, value in extra:
+            self.send_header(key, value)
+        self.end_headers()
+
+    def do_HEAD(self):
+        if self.path != '/tile.tif':
+            self._send_headers(404, 0)
+            return
+        self._send_headers(200, len(self.server.body))
+
+    def do_GET(self):
+        if self.path != '/tile.tif':
+            self._send_headers(404, 0)
+            return
+        body = self.server.body
+        range_header = self.headers.get('Range')
+        if range_header:
+            start, end = range_header.split('=')[1].split('-')
+            start, end = int(start), min(int(end) if end else len(body) - 1, len(body) - 1)
+            chunk = body[start:end + 1]
+            self._send_headers(206, len(chunk), [('Content-Range', f"bytes {start}-{end}/{len(body)}")])
+        else:
+            chunk = body
+            self._send_headers(200, len(chunk))
+        with self.server.lock:
+            self.server.served += len(chunk)
+        self.wfile.write(chunk)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def cog(tmp_path_factory):
+    """Random-valued COG (so it does not compress away) and its pixel array."""
+    path = tmp_path_factory.mktemp('cog') / 'tile.tif'
+    data = np.random.default_rng(0).integers(0, 4000, size=(SIZE, SIZE), dtype=np.int16)
+    with rasterio.open(path, 'w', driver='COG', width=SIZE, height=SIZE, count=1, dtype='int16',
+                       crs='EPSG:4326', transform=from_bounds(*TILE, SIZE, SIZE), nodata=-32767,
+                       blocksize=256) as dst:
+        dst.write(data, 1)
+    return path, data
+
+
+@pytest.fixture
+def server(cog):
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _RangeHandler)
+    httpd.body = cog[0].read_bytes()
+    httpd.lock = threading.Lock()
+    httpd.served = 0
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/tile.tif"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestWindowedRead:
+    def test_window_matches_source_and_transfers_little(self, server, cog, tmp_path):
+        _, data = cog
+        window_bounds = (-111.6, 40.5, -111.55, 40.55)
+        output = tmp_path / "sub.tif"
+        assert copernicus_s3.download_copernicus_s3_window(TILE, 30, window_bounds, output, url=server.url)
+
+        with rasterio.open(output) as sub:
+            col = int((window_bounds[0] - TILE[0]) * SIZE)
+            row = int((TILE[3] - window_bounds[3]) * SIZE)
+            expected = data[row:row + sub.height, col:col + sub.width]
+            np.testing.assert_array_equal(sub.read(1), expected)
+            assert sub.bounds.left <= window_bounds[0] and sub.bounds.right >= window_bounds[2]
+            assert sub.bounds.bottom <= window_bounds[1] and sub.bounds.top >= window_bounds[3]
+            assert sub.nodata == -32767
+        assert server.served < len(server.body) * 0.25
+
+    def test_missing_object_returns_false(self, server, tmp_path):
+        output = tmp_path / "sub.tif"
+        url = server.url.replace('tile.tif', 'missing.tif')
+        assert not copernicus_s3.download_copernicus_s3_window(TILE, 30, TILE, output, url=url)
+        assert not output.exists()
+
+    def test_sub_tile_name_is_stable_per_window(self):
+        name = copernicus_s3.window_tile_filename(TILE, (-111.6, 40.5, -111.55, 40.55), 30)
+        assert name.startswith("N40_W112_30m_sub_") and name.endswith(".tif")
+        assert name == copernicus_s3.window_tile_filename(TILE, (-111.6, 40.5, -111.55, 40.55), 30)
+        assert name != copernicus_s3.window_tile_filename(TILE, (-111.6, 40.5, -111.5, 40.55), 30)
+
+
+class TestRegionRouting:
+    @pytest.fixture
+    def calls(self, monkeypatch, server):
+        calls = []
+        monkeypatch.setattr(copernicus_s3, "construct_copernicus_url", lambda bounds, res: server.url)
+
+        def full(tile_bounds, resolution, output_path):
+            calls.append('full')
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(b'tile')
+            return True
+
+        monkeypatch.setattr(copernicus_s3, "download_copernicus_s3_tile", full)
+        return calls
+
+    def test_small_region_uses_windowed_read(self, calls, tmp_path):
+        paths = copernicus_s3.download_copernicus_s3_tiles('area', (-111.6, 40.5, -111.55, 40.55), 30, tmp_path)
+        assert calls == []
+        assert len(paths) == 1 and "_sub_" in paths[0].name
+
+    def test_large_region_downloads_whole_tile(self, calls, tmp_path):
+        paths = copernicus_s3.download_copernicus_s3_tiles('big', (-111.9, 40.1, -111.1, 40.9), 30, tmp_path)
+        assert calls == ['full']
+        assert paths[0].name == "N40_W112_30m.tif"
+
+    def test_windowed_can_be_disabled(self, calls, tmp_path):
+        copernicus_s3.download_copernicus_s3_tiles('area', (-111.6, 40.5, -111.55, 40.55), 30, tmp_path,
+                                                   windowed=False)
+        assert calls == ['full']
+
+
+class TestCoordinatorRouting:
+    SMALL = (-111.6, 40.5, -111.55, 40.55)
+
+    @pytest.fixture
+    def source(self, monkeypatch, server, tmp_path):
+        """Copernicus S3 source served locally, tile cache and tile dirs in tmp_path."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(tile_cache, "_tile_cache", TileCache(tmp_path / "tile_manifest.json"))
+        monkeypatch.setattr(source_coordinator, "LAND_MASK_PREFILTER", False)
+        monkeypatch.setattr(copernicus_s3, "construct_copernicus_url", lambda bounds, res: server.url)
+        return SourceCapability(
+            source_id='copernicus_s3_30m', name='Copernicus S3', resolution_m=30,
+            coverage_lat=(-90.0, 90.0), coverage_lon=None, tile_dir='copernicus_s3_30m',
+            merged_dir='copernicus_s3_30m', requires_auth=False, auth_key_name=None)
+
+    def test_sparse_tile_is_fetched_as_cached_window(self, source, server, tmp_path):
+        window = source_coordinator.source_window(source, TILE, self.SMALL)
+        assert window == self.SMALL
+
+        source_id, errors = source_coordinator._try_sources(TILE, [source], tmp_path / "out.tif",
+                                                            region_bounds=self.SMALL)
+        assert (source_id, errors) == ('copernicus_s3_30m', [])
+        sub_tile = source_coordinator.source_tile_path(source, TILE, window)
+        assert "_sub_" in sub_tile.name and sub_tile.exists()
+        assert not source_coordinator.source_tile_path(source, TILE).exists()
+        served = server.served
+        assert served < len(server.body) * 0.25
+
+        # Second run is served from the tile cache
+        assert source_coordinator._try_sources(TILE, [source], tmp_path / "out.tif",
+                                               region_bounds=self.SMALL)[0] == 'copernicus_s3_30m'
+        assert server.served == served
+
+    def test_well_covered_tile_is_not_windowed(self, source):
+        assert source_coordinator.source_window(source, TILE, (-111.9, 40.1, -111.1, 40.9)) is None
+        assert source_coordinator.source_window(source, TILE, None) is None
@@ -0,0 +1,109 @@
+"""
+Tests for the binary viewer export format (export_v3).
+
+Verifies round-trip accuracy of int16 quantization and float16 encoding,
+nodata handling, header-only reads and payload alignment.
+
+Run with: pytest tests/test_export_binary.py -v
+"""
+
+import gzip
+import struct
+
+import numpy as np
+import pytest
+
+from src.export_binary import (
+    EXPORT_V3_MAGIC, INT16_NODATA,
+    write_export_v3, read_export_v3, read_export_v3_header
+)
+
+
+def _sample_grid(height: int = 120, width: int = 90) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    grid = rng.uniform(-80.0, 4400.0, size=(height, width)).astype(np.float32)
+    grid[::7, ::5] = np.nan
+    return grid
+
+
+HEADER = {
+    "region_id": "test_region",
+    "source": "srtm_30m",
+    "name": "Test Region",
+    "bounds": {"left": -112.0, "right": -111.0, "top": 41.0, "bottom": 40.0},
+    "stats": {"min": -80.0, "max": 4400.0, "mean": 2100.0},
+}
+
+
+class TestExportV3:
+    """Test suite for export_v3 encode/decode."""
+
+    def test_int16_round_trip_within_quantization_step(self, tmp_path):
+        grid = _sample_grid()
+        path = tmp_path / "r_v3.bin.gz"
+        header = write_export_v3(path, HEADER, [grid], ["elevation"])
+
+        read_header, bands = read_export_v3(path)
+        decoded = bands["elevation"]
+
+        assert read_header == header
+        assert decoded.shape == grid.shape
+        assert np.array_equal(np.isnan(decoded), np.isnan(grid))
+        valid = ~np.isnan(grid)
+        step = header["encoding"]["scale"]
+        assert np.max(np.abs(decoded[valid] - grid[valid])) <= step / 2 + 1e-3
+
+    def test_float16_round_trip(self, tmp_path):
+        grid = _sample_grid()
+        path = tmp_path / "r_v3.bin.gz"
+        write_export_v3(path, HEADER, [grid], ["elevation"], dtype='float16')
+
+        _, bands = read_export_v3(path)
+        decoded = bands["elevation"]
+        valid = ~np.isnan(grid)
+        assert np.array_equal(np.isnan(decoded), ~valid)
+        np.testing.assert_allclose(decoded[valid], grid[valid], rtol=1e-3)
+
+    def test_header_and_aligned_payload(self, tmp_path):
+        grid = _sample_grid(10, 11)
+        path = tmp_path / "r_v3.bin.gz"
+        write_export_v3(path, HEADER, [grid], ["elevation"])
+
+        header = read_export_v3_header(path)
+        assert header["version"] == "export_v3"
+        assert header["region_id"] == "test_region"
+        assert (header["width"], header["height"]) == (11, 10)
+
+        raw = gzip.decompress(path.read_bytes())
+        assert raw[:4] == EXPORT_V3_MAGIC
+        (header_len,) = struct.unpack('<I', raw[4:8])
+        payload_start = 8 + header_len
+        assert payload_start % 8 == 0
+        assert len(raw) - payload_start == 10 * 11 * 2
+        payload = np.frombuffer(raw[payload_start:], dtype='<i2').reshape(10, 11)
+        assert np.all(payload[np.isnan(grid)] == INT16_NODATA)
+
+    def test_multiple_bands(self, tmp_path):
+        grid = _sample_grid()
+        path = tmp_path / "r_v3.bin.gz"
+        write_export_v3(path, HEADER, [grid, grid - 100.0], ["max", "min"])
+
+        header, bands = read_export_v3(path)
+        assert header["bands"] == ["max", "min"]
+        valid = ~np.isnan(grid)
+        np.testing.assert_allclose(bands["min"][valid], grid[valid] - 100.0, atol=0.1)
+
+    def test_all_nodata_and_flat_grids(self, tmp_path):
+        path = tmp_path / "r_v3.bin.gz"
+        write_export_v3(path, HEADER, [np.full((4, 4), np.nan, dtype=np.float32)], ["elevation"])
+        _, bands = read_export_v3(path)
+        assert np.all(np.isnan(bands["elevation"]))
+
+        flat = np.full((4, 4), 12.5, dtype=np.float32)
+        write_export_v3(path, HEADER, [flat], ["elevation"])
+        _, bands = read_export_v3(path)
+        np.testing.assert_allclose(bands["elevation"], flat, atol=1e-3)
+
+    def test_rejects_unknown_dtype(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_export_v3(tmp_path / "x.bin.gz", HEADER, [_sample_grid()], ["elevation"], dtype='int8')
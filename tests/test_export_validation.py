@@ -0,0 +1,143 @@
+"""
+Tests for validating viewer exports of either format.
+
+Verifies that export_v3 (*.bin.gz) files are checked with the binary
+validator, that check_pipeline_complete finds binary exports (but not their
+pyramid levels, nor exports of regions whose id merely starts with the same
+prefix), and that verify_and_auto_fix accepts a valid binary export without
+reprocessing, removes a bad one before retrying, and gives up after a bounded
+number of force reprocesses.
+
+Run with: pytest tests/test_export_validation.py -v
+"""
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+import ensure_region
+from src import status, validation, validation_cache
+from src.export_binary import write_export_v3
+
+
+HEADER = {
+    "region_id": "utah",
+    "source": "srtm_30m",
+    "bounds": {"left": -112.0, "right": -111.0, "top": 41.0, "bottom": 40.0},
+}
+
+
+def _write_v3(path, flat=False, region_id="utah"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    grid = np.random.default_rng(1).uniform(1200.0, 3500.0, size=(64, 48)).astype(np.float32)
+    if flat:
+        grid[:] = 1500.0
+    write_export_v3(path, dict(HEADER, region_id=region_id), [grid], ["elevation"])
+    return path
+
+
+def _write_processed(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = np.random.default_rng(2).uniform(1200.0, 3500.0, size=(32, 32)).astype(np.float32)
+    with rasterio.open(path, 'w', driver='GTiff', width=32, height=32, count=1, dtype='float32',
+                       crs='EPSG:4326', transform=from_origin(-112.0, 41.0, 1 / 32, 1 / 32)) as dst:
+        dst.write(data, 1)
+    return path
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in a temp dir with the validation cache pointed at it."""
+    monkeypatch.chdir(tmp_path)
+    cache = validation_cache.ValidationCache(tmp_path / "validation_index.json")
+    monkeypatch.setattr(validation_cache, "_validation_cache", cache)
+    return tmp_path
+
+
+class TestValidateExport:
+    def test_binary_export_uses_binary_validator(self, workdir):
+        path = _write_v3(workdir / "utah_srtm_30m_1024px_v3.bin.gz")
+        assert validation.export_validator_name(path) == 'binary_export'
+        assert validation.validate_export(path, verbose=False)
+        assert not validation.validate_json_export(path, verbose=False)
+
+    def test_flat_binary_export_is_invalid(self, workdir):
+        path = _write_v3(workdir / "utah_srtm_30m_1024px_v3.bin.gz", flat=True)
+        assert not validation.validate_export(path, verbose=False)
+
+    def test_pipeline_complete_finds_binary_export(self, workdir):
+        level = _write_v3(workdir / "generated/regions/utah_srtm_30m_1024px_x4_v3.bin.gz")
+        assert not validation.check_pipeline_complete('utah', verbose=False)
+        assert level.exists()
+        _write_v3(workdir / "generated/regions/utah_srtm_30m_1024px_v3.bin.gz")
+        assert validation.check_pipeline_complete('utah', verbose=False)
+
+
+class TestPrefixCollidingRegions:
+    """georgia is a prefix of georgia_country; neither may see the other's export."""
+
+    def test_other_regions_export_is_not_found(self, workdir):
+        other = _write_v3(workdir / "generated/regions/georgia_country_srtm_30m_1024px_v3.bin.gz",
+                          region_id="georgia_country")
+        assert validation.region_binary_exports("georgia", workdir / "generated/regions") == []
+        assert not validation.check_pipeline_complete("georgia", verbose=False)
+        assert status.check_export_version("georgia")[0] is False
+        assert validation.check_pipeline_complete("georgia_country", verbose=False)
+        assert other.exists()
+
+    def test_other_regions_invalid_export_is_not_deleted(self, workdir):
+        other = _write_v3(workdir / "generated/regions/georgia_country_srtm_30m_1024px_v3.bin.gz",
+                          flat=True, region_id="georgia_country")
+        assert not validation.check_pipeline_complete("georgia", verbose=False)
+        assert other.exists()
+
+
+class TestAutoFix:
+    @pytest.fixture
+    def reprocess(self, workdir, monkeypatch):
+        """Fake process_region that reproduces a flat (invalid) export every time."""
+        calls = []
+        processed = _write_processed(workdir / "processed.tif")
+        exported = workdir / "generated/regions/utah_srtm_30m_1024px_v3.bin.gz"
+
+        def fake(region_id, raw_path, source, force, *args, **kwargs):
+            calls.append(force)
+            _write_v3(exported, flat=True)
+            return True, {'processed': processed, 'exported': exported}
+
+        monkeypatch.setattr(ensure_region, "process_region", fake)
+        monkeypatch.setattr(status, "find_raw_file", lambda *args, **kwargs: (workdir / "raw.tif", 'srtm_30m'))
+        return calls, processed, exported
+
+    def test_valid_binary_export_is_not_reprocessed(self, reprocess):
+        calls, processed, exported = reprocess
+        _write_v3(exported)
+        assert status.verify_and_auto_fix('utah', {'processed': processed, 'exported': exported},
+                                          'srtm_30m', None, {}, '10m')
+        assert calls == []
+
+    def test_bad_export_is_removed_before_retry(self, reprocess, monkeypatch, workdir):
+        calls, processed, exported = reprocess
+        _write_v3(exported, flat=True)
+        other = _write_v3(workdir / "generated/regions/utah_county_srtm_30m_1024px_v3.bin.gz",
+                          flat=True, region_id="utah_county")
+        seen = []
+
+        def fake(region_id, raw_path, source, force, *args, **kwargs):
+            seen.append(exported.exists())
+            _write_v3(exported)
+            return True, {'processed': processed, 'exported': exported}
+
+        monkeypatch.setattr(ensure_region, "process_region", fake)
+        assert status.verify_and_auto_fix('utah', {'processed': processed, 'exported': exported},
+                                          'srtm_30m', None, {}, '10m')
+        assert seen == [False]
+        assert other.exists()
+
+    def test_auto_fix_gives_up(self, reprocess):
+        calls, processed, exported = reprocess
+        _write_v3(exported, flat=True)
+        assert not status.verify_and_auto_fix('utah', {'processed': processed, 'exported': exported},
+                                              'srtm_30m', None, {}, '10m')
+        assert calls == [True] * status.AUTO_FIX_MAX_ATTEMPTS
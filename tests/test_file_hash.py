@@ -0,0 +1,78 @@
+"""
+Tests for the shared file hashing service.
+
+Verifies digests match hashlib, that unchanged files are served from the
+persistent index without re-reading, that modified files are re-hashed, and
+that metadata keeps MD5 so hashes stored by earlier versions still validate.
+
+Run with: pytest tests/test_file_hash.py -v
+"""
+
+import hashlib
+import os
+
+import pytest
+
+from src import file_hash, metadata
+
+
+@pytest.fixture
+def hash_index(tmp_path, monkeypatch):
+    """Point the global hash index at a temporary file."""
+    index = file_hash.FileHashIndex(tmp_path / "index" / "file_hash_index.json")
+    monkeypatch.setattr(file_hash, "_hash_index", index)
+    return index
+
+
+class TestFileHash:
+    """Test suite for compute_file_hash and its persistent index."""
+
+    def test_digests_match_hashlib(self, tmp_path, hash_index):
+        path = tmp_path / "data.bin"
+        payload = os.urandom(3 * 1024 * 1024 + 17)
+        path.write_bytes(payload)
+
+        assert file_hash.compute_file_hash(path, 'sha256') == hashlib.sha256(payload).hexdigest()
+        assert file_hash.compute_file_hash(path, 'md5') == hashlib.md5(payload).hexdigest()
+        assert file_hash.compute_file_hash(path) == hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def test_unchanged_file_is_not_reread(self, tmp_path, hash_index, monkeypatch):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"elevation" * 1000)
+        first = file_hash.compute_file_hash(path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was re-read on a cache hit")
+
+        monkeypatch.setattr(file_hash, "hash_file_contents", fail)
+        assert file_hash.compute_file_hash(path) == first
+
+        # Index persists across processes (fresh instance reads it from disk)
+        monkeypatch.setattr(file_hash, "_hash_index", file_hash.FileHashIndex(hash_index.index_path))
+        assert file_hash.compute_file_hash(path) == first
+
+    def test_modified_file_is_rehashed(self, tmp_path, hash_index):
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"a" * 1000)
+        first = file_hash.compute_file_hash(path)
+
+        path.write_bytes(b"b" * 1001)
+        second = file_hash.compute_file_hash(path)
+
+        assert second != first
+        assert second == hashlib.blake2b(b"b" * 1001, digest_size=16).hexdigest()
+
+
+class TestMetadataHash:
+    """Metadata hashes stay comparable with those stored by earlier versions."""
+
+    def test_stored_md5_source_hash_validates(self, tmp_path, hash_index):
+        path = tmp_path / "raw.tif"
+        path.write_bytes(b"raw elevation" * 100)
+        stored = hashlib.md5(path.read_bytes()).hexdigest()
+
+        assert metadata.compute_file_hash(path) == stored
+        assert metadata.validate_source_file(path, stored)
+
+        path.write_bytes(b"changed" * 100)
+        assert not metadata.validate_source_file(path, stored)
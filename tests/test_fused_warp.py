@@ -0,0 +1,124 @@
+"""
+Tests for the fused crop/clip + reproject + downsample warp.
+
+Verifies warp_to_viewer_grid (the default pipeline path) produces the same
+processed raster as the staged crop/clip -> reproject -> downsample stages on
+a small synthetic raster: same grid shape and transform, elevations within
+resampling tolerance, and the same pixels masked by a boundary.
+
+Run with: pytest tests/test_fused_warp.py -v
+"""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+from shapely.geometry import Point
+
+import src.boundary_cache
+import src.mask_store
+import src.pipeline
+from src import file_hash
+from src.boundary_cache import BoundaryGeometryCache
+from src.mask_store import BoundaryMaskStore
+from src.pipeline import (
+    clip_to_boundary, crop_to_bounds, downsample_for_viewer, reproject_to_metric_crs, warp_to_viewer_grid
+)
+
+
+BOUNDS = (-111.8, 40.2, -111.2, 40.8)
+TARGET_PIXELS = 64 * 64
+
+
+@pytest.fixture
+def raw_tif(tmp_path, monkeypatch):
+    """Smooth synthetic terrain in EPSG:4326, with boundary, mask and hash caches isolated."""
+    def fake_load(boundary_name, boundary_type="country", border_resolution="10m", boundary_required=False):
+        return gpd.GeoDataFrame(geometry=[Point(-111.5, 40.5).buffer(0.25, quad_segs=256)], crs="EPSG:4326")
+
+    monkeypatch.setattr(src.pipeline, "load_boundary_geometry", fake_load)
+    monkeypatch.setattr(src.mask_store, "_mask_store", BoundaryMaskStore(tmp_path / "masks"))
+    monkeypatch.setattr(src.boundary_cache, "_boundary_cache", BoundaryGeometryCache(tmp_path / "boundaries"))
+    monkeypatch.setattr(file_hash, "_hash_index", file_hash.FileHashIndex(tmp_path / "file_hash_index.json"))
+
+    size = 360
+    lon = np.linspace(-112.0, -111.0, size)
+    lat = np.linspace(41.0, 40.0, size)
+    xx, yy = np.meshgrid(lon, lat)
+    elevation = (1500.0 + 600.0 * np.sin(xx * 6.0) + 400.0 * np.cos(yy * 5.0)).astype(np.float32)
+
+    path = tmp_path / "raw.tif"
+    with rasterio.open(path, 'w', driver='GTiff', width=size, height=size, count=1, dtype='float32',
+                       crs='EPSG:4326', transform=from_origin(-112.0, 41.0, 1 / size, 1 / size),
+                       nodata=-9999.0) as dst:
+        dst.write(elevation, 1)
+    return path
+
+
+def _read(path):
+    with rasterio.open(path) as src:
+        values = src.read(1, masked=True)
+        return src.crs, src.transform, values.astype(np.float64).filled(np.nan)
+
+
+def _assert_same_grid(fused_path, staged_path):
+    fused_crs, fused_transform, fused = _read(fused_path)
+    staged_crs, staged_transform, staged = _read(staged_path)
+
+    assert fused_crs == staged_crs
+    assert fused.shape == staged.shape
+    pixel = abs(staged_transform.a)
+    np.testing.assert_allclose(fused_transform[:6], staged_transform[:6], atol=0.01 * pixel)
+    return fused, staged
+
+
+def _edge_ring(mask):
+    """Pixels within one pixel (8-neighbourhood) of the mask's edge."""
+    padded = np.pad(mask, 1, mode='edge')
+    shifted = [padded[1 + dy:1 + dy + mask.shape[0], 1 + dx:1 + dx + mask.shape[1]]
+               for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+    return np.any(shifted, axis=0) & ~np.all(shifted, axis=0)
+
+
+class TestFusedWarp:
+    """Test suite for warp_to_viewer_grid against the staged path."""
+
+    def test_matches_staged_crop(self, tmp_path, raw_tif):
+        fused_path = tmp_path / "fused.tif"
+        assert warp_to_viewer_grid(raw_tif, "r", fused_path, TARGET_PIXELS, bounds=BOUNDS)
+
+        cropped, reprojected, staged_path = tmp_path / "crop.tif", tmp_path / "reproj.tif", tmp_path / "staged.tif"
+        assert crop_to_bounds(raw_tif, BOUNDS, cropped)
+        assert reproject_to_metric_crs(cropped, "r", reprojected)
+        assert downsample_for_viewer(reprojected, "r", staged_path, TARGET_PIXELS)
+
+        fused, staged = _assert_same_grid(fused_path, staged_path)
+        both = np.isfinite(fused) & np.isfinite(staged)
+        assert both.mean() > 0.95
+        # Fused warp samples the source directly; the staged path resamples twice
+        diff = np.abs(fused[both] - staged[both])
+        assert np.median(diff) < 5.0
+        assert diff.max() < 50.0
+
+    def test_matches_staged_boundary_clip(self, tmp_path, raw_tif):
+        fused_path = tmp_path / "fused.tif"
+        assert warp_to_viewer_grid(raw_tif, "r", fused_path, TARGET_PIXELS, boundary_name="Utah",
+                                   boundary_type="state")
+
+        clipped, reprojected, staged_path = tmp_path / "clip.tif", tmp_path / "reproj.tif", tmp_path / "staged.tif"
+        assert clip_to_boundary(raw_tif, "r", "Utah", clipped, boundary_type="state")
+        assert reproject_to_metric_crs(clipped, "r", reprojected)
+        assert downsample_for_viewer(reprojected, "r", staged_path, TARGET_PIXELS)
+
+        fused, staged = _assert_same_grid(fused_path, staged_path)
+        # Same pixels inside the boundary, up to the boundary's edge pixels (masked at output
+        # resolution vs. at source resolution before downsampling)
+        inside = np.isfinite(fused)
+        assert 0.6 < inside.mean() < 0.9  # circle inscribed in the extent
+        mismatch = inside != np.isfinite(staged)
+        assert not (mismatch & ~_edge_ring(inside)).any()
+
+        both = np.isfinite(fused) & np.isfinite(staged)
+        diff = np.abs(fused[both] - staged[both])
+        assert np.median(diff) < 5.0
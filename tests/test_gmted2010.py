@@ -0,0 +1,89 @@
+"""
+Tests for the GMTED2010 global grid cache.
+
+Verifies that the global grid is converted to an internally tiled COG with
+overviews without changing values, that tiles are cut out with windowed reads
+matching the source pixels, and that a strip-organised grid cached by earlier
+versions is converted in place instead of downloaded again.
+
+Run with: pytest tests/test_gmted2010.py -v
+"""
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+from src.downloaders import gmted2010
+
+
+# Coarse stand-in for the global grid (0.1 degree pixels over a 60 x 30 degree area)
+ORIGIN = (-120.0, 50.0)
+PIXEL = 0.1
+WIDTH, HEIGHT = 600, 300
+
+
+def _write_strip_grid(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = np.random.default_rng(0).integers(-400, 6000, size=(HEIGHT, WIDTH), dtype=np.int16)
+    with rasterio.open(path, 'w', driver='GTiff', width=WIDTH, height=HEIGHT, count=1, dtype='int16',
+                       crs='EPSG:4326', transform=from_origin(*ORIGIN, PIXEL, PIXEL), nodata=-32768,
+                       compress='lzw') as dst:
+        dst.write(data, 1)
+    return data
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Use small COG blocks so the test grid gets several blocks and overviews."""
+    monkeypatch.setattr(gmted2010, "GMTED2010_BLOCK_SIZE", 128)
+
+
+class TestGlobalGridCog:
+    def test_conversion_is_tiled_with_overviews(self, tmp_path, small_blocks):
+        source = tmp_path / "grid.tif"
+        data = _write_strip_grid(source)
+        cog = tmp_path / "grid_cog.tif"
+        gmted2010.convert_to_cog(source, cog)
+
+        with rasterio.open(cog) as src:
+            assert src.profile['tiled']
+            assert src.block_shapes[0] == (128, 128)
+            assert src.overviews(1)
+            assert src.nodata == -32768
+            np.testing.assert_array_equal(src.read(1), data)
+        assert not cog.with_suffix('.tmp.tif').exists()
+
+    def test_tile_extraction_matches_source_window(self, tmp_path, small_blocks):
+        source = tmp_path / "grid.tif"
+        data = _write_strip_grid(source)
+        cog = tmp_path / "grid_cog.tif"
+        gmted2010.convert_to_cog(source, cog)
+
+        tile = tmp_path / "tile.tif"
+        gmted2010.extract_gmted2010_tile(cog, (-112.0, 40.0, -111.0, 41.0), tile)
+        with rasterio.open(tile) as out:
+            assert out.width == 10 and out.height == 10
+            assert out.bounds.left == pytest.approx(-112.0)
+            assert out.bounds.top == pytest.approx(41.0)
+            col = round((-112.0 - ORIGIN[0]) / PIXEL)
+            row = round((ORIGIN[1] - 41.0) / PIXEL)
+            np.testing.assert_array_equal(out.read(1), data[row:row + 10, col:col + 10])
+
+    def test_legacy_strip_grid_is_converted_without_download(self, tmp_path, monkeypatch, small_blocks):
+        monkeypatch.chdir(tmp_path)
+        legacy = tmp_path / "data/.cache/gmted2010/gmted2010_1000m_global.tif"
+        data = _write_strip_grid(legacy)
+
+        def no_download(*args, **kwargs):
+            raise AssertionError("global grid should not be downloaded again")
+
+        monkeypatch.setattr(gmted2010, "download_resumable", no_download)
+        tile = tmp_path / "tiles/N40_W112_1000m.tif"
+        assert gmted2010.download_gmted2010_tile((-112.0, 40.0, -111.0, 41.0), 1000, tile)
+
+        assert not legacy.exists()
+        with rasterio.open(legacy.with_name("gmted2010_1000m_global_cog.tif")) as src:
+            assert src.profile['tiled']
+        with rasterio.open(tile) as out:
+            assert out.read(1).shape == (10, 10)
@@ -0,0 +1,105 @@
+"""
+Tests for the shared downloader HTTP session.
+
+Uses a local HTTP server to verify keep-alive connection reuse, retries of
+transient statuses (honouring Retry-After), and that statuses downloaders
+handle themselves (401, 404) are returned without retrying.
+
+Run with: pytest tests/test_http_session.py -v
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.downloaders import http_session
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.clients.add(self.client_address)
+            count = server.requests.count(self.path)
+        status, headers = server.plan(self.path, count)
+        body = b"payload" if status == 200 else b""
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Local HTTP server whose responses follow server.plan(path, nth_request)."""
+    monkeypatch.setattr(http_session, "HTTP_BACKOFF_FACTOR", 0.01)
+    monkeypatch.setattr(http_session, "HTTP_BACKOFF_JITTER", 0.01)
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.clients = set()
+    httpd.plan = lambda path, count: (200, {})
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHttpSession:
+    def test_keep_alive_reuses_connection(self, server):
+        session = http_session.create_session()
+        for i in range(5):
+            response = session.get(f"{server.url}/tile{i}", timeout=10)
+            assert response.content == b"payload"
+        assert len(server.requests) == 5
+        assert len(server.clients) == 1
+
+    def test_transient_status_is_retried(self, server):
+        server.plan = lambda path, count: (503, {}) if count <= 2 else (200, {})
+        response = http_session.create_session().get(f"{server.url}/tile", timeout=10)
+        assert response.status_code == 200
+        assert len(server.requests) == 3
+
+    def test_retry_after_is_honoured(self, server):
+        server.plan = lambda path, count: (429, {'Retry-After': '1'}) if count == 1 else (200, {})
+        start = time.monotonic()
+        response = http_session.create_session().get(f"{server.url}/tile", timeout=10)
+        assert response.status_code == 200
+        assert time.monotonic() - start >= 1.0
+
+    def test_exhausted_retries_return_last_response(self, server):
+        server.plan = lambda path, count: (502, {})
+        response = http_session.create_session(retries=2).get(f"{server.url}/tile", timeout=10)
+        assert response.status_code == 502
+        assert len(server.requests) == 3
+
+    @pytest.mark.parametrize("status", [401, 404])
+    def test_caller_handled_statuses_are_not_retried(self, server, status):
+        server.plan = lambda path, count: (status, {})
+        response = http_session.create_session().get(f"{server.url}/tile", timeout=10)
+        assert response.status_code == status
+        assert len(server.requests) == 1
+
+    def test_backoff_has_jitter(self, monkeypatch):
+        monkeypatch.setattr(http_session, "HTTP_BACKOFF_FACTOR", 1.0)
+        retry = http_session.retry_policy().increment(method='GET', url='/', error=ConnectionError())
+        retry = retry.increment(method='GET', url='/', error=ConnectionError())
+        backoffs = {retry.get_backoff_time() for _ in range(20)}
+        assert len(backoffs) > 1
+        assert all(2.0 <= backoff <= 2.0 + http_session.HTTP_BACKOFF_JITTER for backoff in backoffs)
+
+    def test_shared_session_is_a_singleton(self, monkeypatch):
+        monkeypatch.setattr(http_session, "_session", None)
+        assert http_session.get_session() is http_session.get_session()
@@ -0,0 +1,131 @@
+"""
+Tests for skipping tiles without data.
+
+Verifies the 1-degree land mask (small islands count as land, open ocean does
+not, a missing mask skips nothing), the negative tile cache TTL, and that the
+source coordinator neither re-requests tiles a source reported as missing nor
+requests ocean tiles at all, without treating them as failed.
+
+Run with: pytest tests/test_land_mask.py -v
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from shapely.geometry import box
+
+from src import land_mask, tile_cache
+from src.downloaders import source_coordinator
+from src.downloaders.source_registry import SourceCapability
+from src.land_mask import LandMask, build_land_mask
+from src.tile_cache import TileCache, TileNotAvailableError
+
+
+OCEAN = (-30.0, 10.0, -29.0, 11.0)
+ISLAND = (-26.0, 15.0, -25.0, 16.0)
+
+
+@pytest.fixture
+def mask():
+    # Island a few hundred meters across, well inside one 1-degree cell
+    return LandMask(build_land_mask([box(-25.6, 15.4, -25.5, 15.45)]))
+
+
+class TestLandMask:
+    def test_island_cell_is_land(self, mask):
+        assert mask.tile_has_land(ISLAND)
+        assert mask.mask.sum() == 1
+
+    def test_open_ocean_is_not_land(self, mask):
+        assert not mask.tile_has_land(OCEAN)
+
+    def test_bounds_spanning_island_cell(self, mask):
+        assert mask.tile_has_land((-27.0, 14.0, -25.5, 15.5))
+
+    def test_grid_orientation(self):
+        grid = build_land_mask([box(-180.0, -90.0, -179.0, -89.0)])
+        assert grid[0, 0] and grid.sum() == 1
+
+    def test_missing_mask_treats_everything_as_land(self):
+        assert LandMask(None).tile_has_land(OCEAN)
+
+    def test_cached_mask_is_loaded(self, tmp_path, mask):
+        path = tmp_path / "land_mask_1deg.npy"
+        np.save(path, mask.mask)
+        assert not land_mask.load_land_mask(path).tile_has_land(OCEAN)
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Tile cache with its manifest in a temp dir."""
+    monkeypatch.chdir(tmp_path)
+    cache = TileCache(tmp_path / "tile_manifest.json")
+    monkeypatch.setattr(tile_cache, "_tile_cache", cache)
+    return cache
+
+
+class TestNegativeCache:
+    def test_missing_tile_is_remembered(self, cache):
+        cache.record_missing('src', OCEAN, 30, '404')
+        assert cache.is_known_missing('src', OCEAN, 30)
+        assert TileCache(cache.manifest_path).is_known_missing('src', OCEAN, 30)
+        assert not cache.is_known_missing('other', OCEAN, 30)
+
+    def test_entry_expires_after_ttl(self, cache):
+        cache.record_missing('src', OCEAN, 30, '404')
+        key = tile_cache.tile_cache_key('src', OCEAN, 30)
+        cache._write(lambda entries: entries[key].update(recorded=entries[key]['recorded'] - 2 * 86400),
+                     section='missing')
+        assert cache.is_known_missing('src', OCEAN, 30, ttl_days=3)
+        assert not cache.is_known_missing('src', OCEAN, 30, ttl_days=1)
+
+
+def _source(source_id):
+    return SourceCapability(
+        source_id=source_id, name=source_id, resolution_m=30,
+        coverage_lat=(-90.0, 90.0), coverage_lon=None, tile_dir=source_id, merged_dir=source_id,
+        requires_auth=False, auth_key_name=None)
+
+
+class TestCoordinatorSkipsMissingTiles:
+    @pytest.fixture
+    def downloads(self, cache, monkeypatch, mask):
+        """Fake downloader where every source 404s; the land mask has one island cell."""
+        calls = []
+        monkeypatch.setattr(source_coordinator, "LAND_MASK_PREFILTER", True)
+        monkeypatch.setattr(source_coordinator, "get_land_mask", lambda: mask)
+
+        def fake(tile_bounds, source, output_path, window_bounds=None):
+            calls.append(source.source_id)
+            raise TileNotAvailableError("404")
+
+        monkeypatch.setattr(source_coordinator, "_download_from_source", fake)
+        return calls
+
+    def test_missing_tile_is_not_requested_again(self, downloads, tmp_path):
+        sources = [_source('a'), _source('b')]
+        assert source_coordinator._try_sources(ISLAND, sources, tmp_path / "out.tif")[0] == \
+            source_coordinator.NO_DATA_SOURCE
+        source_id, errors = source_coordinator._try_sources(ISLAND, sources, tmp_path / "out.tif")
+        assert source_id == source_coordinator.NO_DATA_SOURCE
+        assert downloads == ['a', 'b']
+        assert errors == [('a', "No data for tile (cached)"), ('b', "No data for tile (cached)")]
+
+    def test_refresh_asks_again(self, downloads, tmp_path):
+        sources = [_source('a')]
+        source_coordinator._try_sources(ISLAND, sources, tmp_path / "out.tif")
+        source_coordinator._try_sources(ISLAND, sources, tmp_path / "out.tif", refresh=True)
+        assert downloads == ['a', 'a']
+
+    def test_ocean_tile_is_not_requested(self, downloads, tmp_path):
+        source_id, _ = source_coordinator._try_sources(OCEAN, [_source('a')], tmp_path / "out.tif")
+        assert source_id == source_coordinator.NO_DATA_SOURCE
+        assert downloads == []
+
+    def test_no_data_tiles_do_not_stop_region(self, downloads):
+        tiles = [OCEAN] * 3 + [ISLAND]
+        paths = [Path(f"tile_{i}.tif") for i in range(len(tiles))]
+        results = source_coordinator.download_tiles_concurrently(tiles, paths, [_source('a')], workers=1)
+        assert results == [source_coordinator.NO_DATA_SOURCE] * 4
+        assert downloads == ['a']
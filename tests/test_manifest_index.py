@@ -0,0 +1,93 @@
+"""
+Tests for the persistent manifest index.
+
+Verifies records come from export sidecars, unchanged exports are not re-read,
+removed exports drop out, sidecars that no longer match their export's
+identity are ignored, and legacy exports without sidecars still work.
+
+Run with: pytest tests/test_manifest_index.py -v
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src import manifest_index
+from src.export_binary import write_export_v3
+from src.manifest_index import ManifestIndex, export_manifest_record
+from src.metadata import get_metadata_path
+
+
+BOUNDS = {"left": -112.0, "right": -111.0, "top": 41.0, "bottom": 40.0}
+STATS = {"min": 1.0, "max": 2.0, "mean": 1.5}
+
+
+@pytest.fixture
+def generated_dir(tmp_path):
+    directory = tmp_path / "generated" / "regions"
+    directory.mkdir(parents=True)
+    return directory
+
+
+def _write_export_with_sidecar(generated_dir, region_id):
+    path = generated_dir / f"{region_id}_srtm_30m_100px_v3.bin.gz"
+    write_export_v3(path, {"region_id": region_id}, [np.ones((4, 4), dtype=np.float32)], ["elevation"])
+    record = export_manifest_record(path, region_id, "srtm_30m", "export_v3", BOUNDS, STATS)
+    get_metadata_path(path).write_text(json.dumps({"manifest": record}))
+    return path
+
+
+class TestManifestIndex:
+    """Test suite for ManifestIndex.records."""
+
+    def test_records_from_sidecars(self, tmp_path, generated_dir):
+        _write_export_with_sidecar(generated_dir, "utah")
+        records = ManifestIndex(tmp_path / "index.json").records(generated_dir)
+
+        assert len(records) == 1
+        assert records[0]["region_id"] == "utah"
+        assert records[0]["file"] == "utah_srtm_30m_100px_v3.bin.gz"
+        assert records[0]["bounds"] == BOUNDS and records[0]["stats"] == STATS
+
+    def test_unchanged_exports_are_not_reread(self, tmp_path, generated_dir, monkeypatch):
+        _write_export_with_sidecar(generated_dir, "utah")
+        index_path = tmp_path / "index.json"
+        ManifestIndex(index_path).records(generated_dir)
+
+        read_paths = []
+        original = manifest_index.read_manifest_record
+        monkeypatch.setattr(manifest_index, "read_manifest_record",
+                            lambda path, gen_dir: read_paths.append(path.name) or original(path, gen_dir))
+
+        _write_export_with_sidecar(generated_dir, "ohio")
+        records = ManifestIndex(index_path).records(generated_dir)
+        assert read_paths == ["ohio_srtm_30m_100px_v3.bin.gz"]
+        assert sorted(r["region_id"] for r in records) == ["ohio", "utah"]
+
+        (generated_dir / "ohio_srtm_30m_100px_v3.bin.gz").unlink()
+        records = ManifestIndex(index_path).records(generated_dir)
+        assert [r["region_id"] for r in records] == ["utah"]
+
+    def test_sidecar_of_rewritten_export_is_ignored(self, tmp_path, generated_dir):
+        path = _write_export_with_sidecar(generated_dir, "utah")
+        # Same size, rewritten after the sidecar: the record comes from the export header
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        records = ManifestIndex(tmp_path / "index.json").records(generated_dir)
+
+        assert len(records) == 1
+        assert records[0]["region_id"] == "utah"
+        assert "stats" not in records[0]
+
+    def test_legacy_v2_without_sidecar(self, tmp_path, generated_dir):
+        export = {"version": "export_v2", "region_id": "ohio", "source": "srtm_30m",
+                  "elevation": [[1.0]], "bounds": BOUNDS, "stats": STATS}
+        (generated_dir / "ohio_srtm_30m_100px_v2.json").write_text(json.dumps(export))
+        (generated_dir / "ohio_srtm_30m_100px_v2_borders.json").write_text("{}")
+
+        records = ManifestIndex(tmp_path / "index.json").records(generated_dir)
+        assert len(records) == 1
+        assert records[0]["region_id"] == "ohio"
+        assert records[0]["stats"] == STATS
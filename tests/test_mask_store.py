@@ -0,0 +1,126 @@
+"""
+Tests for the bit-packed boundary mask store.
+
+Verifies masks survive the packbits round trip, exact grids are served from
+disk without rasterizing again until the Natural Earth source changes, coarser
+grids are derived from a stored finer mask, and oversized reference grids are
+capped so large warps never rasterize at full source resolution.
+
+Run with: pytest tests/test_mask_store.py -v
+"""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import rasterio
+from rasterio.features import geometry_mask
+from rasterio.transform import from_origin
+from shapely.geometry import Point, mapping
+
+import src.boundary_cache
+import src.mask_store
+import src.pipeline
+from src.boundary_cache import BoundaryGeometryCache
+from src.mask_store import BoundaryMaskStore, mask_dataset_to_boundary
+
+
+CRS = "EPSG:4326"
+
+
+@pytest.fixture
+def rasterize_calls(tmp_path, monkeypatch):
+    """Synthetic boundary, isolated caches, and a log of rasterized grid shapes."""
+    def fake_load(boundary_name, boundary_type="country", border_resolution="10m", boundary_required=False):
+        return gpd.GeoDataFrame(geometry=[Point(-111.5, 40.5).buffer(0.3, quad_segs=256)], crs=CRS)
+
+    monkeypatch.setattr(src.pipeline, "load_boundary_geometry", fake_load)
+    monkeypatch.setattr(src.mask_store, "_mask_store", BoundaryMaskStore(tmp_path / "masks"))
+    monkeypatch.setattr(src.boundary_cache, "_boundary_cache", BoundaryGeometryCache(tmp_path / "boundaries"))
+
+    calls = []
+    original = BoundaryMaskStore._rasterize
+
+    def logging_rasterize(self, *args):
+        calls.append(args[-1])
+        return original(self, *args)
+
+    monkeypatch.setattr(BoundaryMaskStore, "_rasterize", logging_rasterize)
+    return calls
+
+
+class TestBoundaryMaskStore:
+    """Test suite for BoundaryMaskStore."""
+
+    def test_exact_hit_is_loaded_without_rasterizing(self, rasterize_calls):
+        store = src.mask_store.get_mask_store()
+        transform = from_origin(-112.0, 41.0, 0.01, 0.01)
+        first = store.get("Utah", "state", "10m", CRS, transform, (100, 101))
+        again = BoundaryMaskStore(store.store_dir).get("Utah", "state", "10m", CRS, transform, (100, 101))
+
+        assert rasterize_calls == [(100, 101)]
+        assert first.dtype == bool and first.shape == (100, 101)
+        np.testing.assert_array_equal(first, again)
+        assert 0.2 < first.mean() < 0.4
+
+    def test_border_source_change_rasterizes_again(self, tmp_path, rasterize_calls, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "data" / "borders" / "ne_10m_admin_1.parquet"
+        source.parent.mkdir(parents=True)
+        source.write_bytes(b"borders")
+        store = src.mask_store.get_mask_store()
+        transform = from_origin(-112.0, 41.0, 0.01, 0.01)
+        store.get("Utah", "state", "10m", CRS, transform, (100, 101))
+
+        source.write_bytes(b"new borders")
+        store.get("Utah", "state", "10m", CRS, transform, (100, 101))
+        assert rasterize_calls == [(100, 101), (100, 101)]
+
+    def test_coarse_mask_derived_from_reference(self, rasterize_calls):
+        store = src.mask_store.get_mask_store()
+        fine_transform = from_origin(-112.0, 41.0, 0.005, 0.005)
+        coarse_transform = from_origin(-112.0, 41.0, 0.02, 0.02)
+        coarse = store.get("Utah", "state", "10m", CRS, coarse_transform, (50, 50),
+                           reference=(fine_transform, (200, 200)))
+        medium = store.get("Utah", "state", "10m", CRS, from_origin(-112.0, 41.0, 0.01, 0.01), (100, 100))
+
+        # Only the reference grid was rasterized; both other grids were derived
+        assert rasterize_calls == [(200, 200)]
+        circle = Point(-111.5, 40.5).buffer(0.3, quad_segs=256)
+        direct = geometry_mask([mapping(circle)], out_shape=(50, 50), transform=coarse_transform, invert=True)
+        assert np.count_nonzero(coarse != direct) <= 0.05 * direct.sum()
+        assert medium.shape == (100, 100)
+
+    def test_oversized_reference_is_coarsened(self, rasterize_calls, monkeypatch):
+        monkeypatch.setattr(src.mask_store, "MASK_MAX_REFERENCE_PIXELS", 100 * 100)
+        store = src.mask_store.get_mask_store()
+        fine_transform = from_origin(-112.0, 41.0, 0.0025, 0.0025)
+        store.get("Utah", "state", "10m", CRS, from_origin(-112.0, 41.0, 0.02, 0.02), (50, 50),
+                  reference=(fine_transform, (400, 400)))
+        assert rasterize_calls == [(100, 100)]
+
+    def test_reference_no_finer_than_output_is_skipped(self, rasterize_calls, monkeypatch):
+        monkeypatch.setattr(src.mask_store, "MASK_MAX_REFERENCE_PIXELS", 40 * 40)
+        store = src.mask_store.get_mask_store()
+        fine_transform = from_origin(-112.0, 41.0, 0.0025, 0.0025)
+        store.get("Utah", "state", "10m", CRS, from_origin(-112.0, 41.0, 0.02, 0.02), (50, 50),
+                  reference=(fine_transform, (400, 400)))
+        assert rasterize_calls == [(50, 50)]
+
+    def test_mask_dataset_matches_rasterio_mask(self, tmp_path, rasterize_calls):
+        from rasterio.mask import mask as rasterio_mask
+
+        path = tmp_path / "dem.tif"
+        data = np.arange(120 * 130, dtype=np.float32).reshape(120, 130)
+        with rasterio.open(path, 'w', driver='GTiff', width=130, height=120, count=1, dtype='float32',
+                           crs=CRS, transform=from_origin(-112.0, 41.0, 0.008, 0.008)) as dst:
+            dst.write(data, 1)
+
+        with rasterio.open(path) as src:
+            masked, transform = mask_dataset_to_boundary(src, "Utah", "state", "10m")
+            expected, expected_transform = rasterio_mask(
+                src, [mapping(Point(-111.5, 40.5).buffer(0.3, quad_segs=256))], crop=True, filled=False)
+
+        assert transform == expected_transform
+        assert masked.shape == expected.shape
+        mismatch = np.count_nonzero(np.ma.getmaskarray(masked) != np.ma.getmaskarray(expected))
+        assert mismatch <= 0.02 * masked.size
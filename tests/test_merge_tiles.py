@@ -0,0 +1,81 @@
+"""
+Tests for windowed tile mosaicking in merge_tiles.
+
+Verifies that the block-streaming merge produces output identical to an
+in-memory method='first' merge, including overlap and nodata handling.
+
+Run with: pytest tests/test_merge_tiles.py -v
+"""
+
+from pathlib import Path
+
+import numpy as np
+import rasterio
+from rasterio.merge import merge
+from rasterio.transform import from_origin
+
+from src.pipeline import merge_tiles
+
+
+NODATA = -32768
+
+
+def _write_tile(path: Path, west: float, north: float, size: int, seed: int) -> Path:
+    """Write a synthetic int16 tile with a band of nodata pixels."""
+    rng = np.random.default_rng(seed)
+    data = rng.integers(0, 3000, size=(size, size)).astype('int16')
+    data[size // 3, :] = NODATA
+    res = 1.0 / size
+    with rasterio.open(
+        path, 'w', driver='GTiff', width=size, height=size, count=1,
+        dtype='int16', crs='EPSG:4326', nodata=NODATA,
+        transform=from_origin(west, north, res, res)
+    ) as dst:
+        dst.write(data, 1)
+    return path
+
+
+class TestWindowedMerge:
+    """Windowed merge must match an in-memory merge pixel for pixel."""
+
+    def _make_tiles(self, tmp_path: Path) -> list[Path]:
+        size = 400
+        return [
+            _write_tile(tmp_path / "a.tif", -112.0, 41.0, size, 1),
+            _write_tile(tmp_path / "b.tif", -111.0, 41.0, size, 2),
+            _write_tile(tmp_path / "c.tif", -112.0, 40.0, size, 3),
+            # Overlaps a/b/c; 'first' must keep earlier tiles' valid pixels
+            _write_tile(tmp_path / "d.tif", -111.5, 40.5, size, 4),
+        ]
+
+    def test_matches_in_memory_merge(self, tmp_path):
+        tiles = self._make_tiles(tmp_path)
+        output = tmp_path / "merged.tif"
+
+        # 1 MB budget forces many output windows
+        assert merge_tiles(tiles, output, memory_budget_mb=1)
+
+        srcs = [rasterio.open(p) for p in tiles]
+        try:
+            expected, expected_transform = merge(
+                srcs, nodata=NODATA, dtype='float32', method='first'
+            )
+        finally:
+            for s in srcs:
+                s.close()
+
+        with rasterio.open(output) as merged:
+            actual = merged.read()
+            assert merged.transform == expected_transform
+            assert merged.nodata == NODATA
+            assert merged.dtypes[0] == 'float32'
+
+        np.testing.assert_array_equal(actual, expected)
+
+    def test_existing_output_is_reused(self, tmp_path):
+        tiles = self._make_tiles(tmp_path)
+        output = tmp_path / "merged.tif"
+        assert merge_tiles(tiles, output)
+        mtime = output.stat().st_mtime_ns
+        assert merge_tiles(tiles, output)
+        assert output.stat().st_mtime_ns == mtime
@@ -0,0 +1,64 @@
+"""
+Tests for pre-aggregated pyramid levels.
+
+Verifies bucket aggregation matches the viewer's client-side bucketing
+(floor dimensions, 50% valid-pixel rule) and that level files round-trip.
+
+Run with: pytest tests/test_pyramid.py -v
+"""
+
+import numpy as np
+import pytest
+
+from src.export_binary import read_export_v3
+from src.pyramid import aggregate_buckets, pyramid_level_filename, write_pyramid_level
+
+
+def _reference_buckets(elevation, factor):
+    """Straight port of computeBucketedData() in js/viewer-advanced.js, plus mean/min."""
+    height, width = elevation.shape
+    out = {name: np.full((height // factor, width // factor), np.nan) for name in ("max", "mean", "min")}
+    for by in range(height // factor):
+        for bx in range(width // factor):
+            block = elevation[by * factor:(by + 1) * factor, bx * factor:(bx + 1) * factor]
+            values = block[~np.isnan(block)]
+            if len(values) / (factor * factor) >= 0.5:
+                out["max"][by, bx] = values.max()
+                out["mean"][by, bx] = values.mean()
+                out["min"][by, bx] = values.min()
+    return out
+
+
+class TestPyramid:
+    """Test suite for pyramid aggregation and level files."""
+
+    @pytest.mark.parametrize("factor", [1, 2, 3, 4])
+    def test_matches_client_bucketing(self, factor):
+        rng = np.random.default_rng(11)
+        elevation = rng.uniform(0.0, 3000.0, size=(37, 29)).astype(np.float32)
+        elevation[rng.random(elevation.shape) < 0.4] = np.nan
+
+        bands = aggregate_buckets(elevation, factor)
+        expected = _reference_buckets(elevation, factor)
+        for name in ("max", "mean", "min"):
+            assert bands[name].shape == (37 // factor, 29 // factor)
+            np.testing.assert_allclose(bands[name], expected[name], rtol=1e-6, equal_nan=True)
+
+    def test_level_filename(self):
+        assert pyramid_level_filename("utah_srtm_30m_2048px_v3.bin.gz", 4) == "utah_srtm_30m_2048px_x4_v3.bin.gz"
+        with pytest.raises(ValueError):
+            pyramid_level_filename("utah_srtm_30m_2048px_v2.json", 4)
+
+    def test_level_file_round_trip(self, tmp_path):
+        elevation = np.arange(64, dtype=np.float32).reshape(8, 8) * 10.0
+        path = tmp_path / "r_src_8px_x2_v3.bin.gz"
+        write_pyramid_level(elevation, {"region_id": "r"}, 2, "r_src_8px_v3.bin.gz", path)
+
+        header, bands = read_export_v3(path)
+        assert header["pyramid_factor"] == 2
+        assert header["base_file"] == "r_src_8px_v3.bin.gz"
+        assert header["bands"] == ["max", "mean", "min"]
+        assert (header["width"], header["height"]) == (4, 4)
+        assert bands["max"][0, 0] == pytest.approx(90.0, abs=0.01)
+        assert bands["mean"][0, 0] == pytest.approx(45.0, abs=0.01)
+        assert bands["min"][0, 0] == pytest.approx(0.0, abs=0.01)
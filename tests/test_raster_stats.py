@@ -0,0 +1,149 @@
+"""
+Tests for the single-pass raster stats kernel.
+
+Verifies the block-wise accumulator matches whole-array numpy results, nodata
+and out-of-range values are excluded, and stats stored in a stage's metadata
+are reused only while the raster is unchanged.
+
+Run with: pytest tests/test_raster_stats.py -v
+"""
+
+import os
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+from src import file_hash
+from src.metadata import create_processed_metadata, get_metadata_path, save_metadata
+from src.raster_stats import (
+    RasterStatsAccumulator, array_stats, coverage_pct, dataset_stats, export_stats, load_stage_stats
+)
+from src.validation import validate_stats_range
+
+
+def _elevation(shape=(300, 200), seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0.0, 3000.0, size=shape).astype(np.float32)
+
+
+def _write_tif(path, elevation, nodata=None):
+    profile = {
+        'driver': 'GTiff', 'width': elevation.shape[1], 'height': elevation.shape[0],
+        'count': 1, 'dtype': elevation.dtype, 'crs': 'EPSG:3857',
+        'transform': from_origin(0, 0, 100, 100), 'nodata': nodata,
+    }
+    with rasterio.open(path, 'w', **profile) as dst:
+        dst.write(elevation, 1)
+
+
+class TestAccumulator:
+    def test_matches_numpy(self):
+        elevation = _elevation()
+        elevation[10:20, 5:50] = np.nan
+        stats = array_stats(elevation)
+
+        assert stats["total_count"] == elevation.size
+        assert stats["nonnull_count"] == int(np.count_nonzero(~np.isnan(elevation)))
+        assert stats["valid_count"] == stats["nonnull_count"]
+        assert stats["min"] == float(np.nanmin(elevation))
+        assert stats["max"] == float(np.nanmax(elevation))
+        assert np.isclose(stats["mean"], np.nanmean(elevation.astype(np.float64)))
+
+    def test_block_splitting_is_equivalent(self):
+        elevation = _elevation()
+        whole = RasterStatsAccumulator()
+        whole.update(elevation)
+
+        blocks = RasterStatsAccumulator()
+        for row_start in range(0, elevation.shape[0], 7):
+            blocks.update(elevation[row_start:row_start + 7])
+
+        a, b = whole.result(), blocks.result()
+        assert a["histogram"] == b["histogram"]
+        assert a["min"] == b["min"] and a["max"] == b["max"]
+        assert np.isclose(a["mean"], b["mean"])
+
+    def test_nodata_and_range_exclusion(self):
+        elevation = np.full((4, 4), 100, dtype=np.int16)
+        elevation[0, :] = -9999   # nodata
+        elevation[1, 0] = -32000  # out of range, not nodata
+        elevation[1, 1] = 500
+
+        stats = array_stats(elevation, nodata=-9999)
+        assert stats["nonnull_count"] == 12
+        assert stats["valid_count"] == 11
+        assert stats["min"] == 100
+        assert stats["max"] == 500
+        assert coverage_pct(stats) == 75.0
+        assert sum(stats["histogram"]["counts"]) == stats["valid_count"]
+
+        unfiltered = array_stats(elevation, nodata=-9999, valid_range=None)
+        assert unfiltered["valid_count"] == 12
+        assert unfiltered["min"] == -32000
+
+    def test_no_valid_pixels(self):
+        stats = array_stats(np.full((3, 3), np.nan, dtype=np.float32))
+        assert stats["valid_count"] == 0
+        assert stats["min"] is None and stats["mean"] is None
+        assert export_stats(stats) == {"min": None, "max": None, "mean": None}
+
+    def test_dataset_stats_matches_array_stats(self, tmp_path):
+        elevation = _elevation(shape=(600, 50))
+        elevation[:3] = -9999
+        path = tmp_path / "grid.tif"
+        _write_tif(path, elevation, nodata=-9999)
+
+        with rasterio.open(path) as src:
+            from_file = dataset_stats(src)
+        in_memory = array_stats(elevation, nodata=-9999)
+        assert from_file["valid_count"] == in_memory["valid_count"]
+        assert from_file["min"] == in_memory["min"]
+        assert from_file["histogram"] == in_memory["histogram"]
+
+    def test_range_validation_uses_stats(self):
+        stats = array_stats(np.array([[10.0, 12.0], [np.nan, 11.0]], dtype=np.float32))
+        min_elev, max_elev, elev_range, is_valid = validate_stats_range(stats, min_sensible_range=50.0,
+                                                                       warn_only=True)
+        assert (min_elev, max_elev) == (10.0, 12.0)
+        assert not is_valid
+
+
+class TestStageStats:
+    @pytest.fixture(autouse=True)
+    def hash_index(self, tmp_path, monkeypatch):
+        """Point the global hash index at a temporary file (metadata hashes the raster)."""
+        index = file_hash.FileHashIndex(tmp_path / "index" / "file_hash_index.json")
+        monkeypatch.setattr(file_hash, "_hash_index", index)
+        return index
+
+    def _processed(self, tmp_path, elevation):
+        path = tmp_path / "region_processed_1000px_v2.tif"
+        _write_tif(path, elevation)
+        metadata = create_processed_metadata(path, region_id="region", source_file=path,
+                                             source_file_hash="x", target_total_pixels=1000,
+                                             raster_stats=array_stats(elevation))
+        save_metadata(metadata, get_metadata_path(path))
+        return path
+
+    def test_round_trip(self, tmp_path):
+        elevation = _elevation()
+        path = self._processed(tmp_path, elevation)
+
+        stored = load_stage_stats(path)
+        assert stored is not None
+        assert export_stats(stored) == export_stats(array_stats(elevation))
+
+    def test_invalidated_when_raster_changes(self, tmp_path):
+        path = self._processed(tmp_path, _elevation())
+        _write_tif(path, _elevation(seed=1))
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_stage_stats(path) is None
+
+    def test_missing_metadata(self, tmp_path):
+        path = tmp_path / "bare.tif"
+        _write_tif(path, _elevation())
+        assert load_stage_stats(path) is None
@@ -0,0 +1,170 @@
+"""
+Tests for resumable HTTP downloads.
+
+Uses a local Range-capable HTTP server that can cut transfers short, change
+the resource's ETag, or ignore Range headers, to verify that partial files are
+resumed, restarted when the resource changed, and only moved into place once
+complete.
+
+Run with: pytest tests/test_resumable.py -v
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.downloaders import resumable
+from src.downloaders.resumable import IncompleteDownloadError, download_resumable, part_paths
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(dict(self.headers))
+            truncate = server.truncate > 0
+            server.truncate -= 1
+        if self.path.startswith('/missing'):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        content = server.content
+        start = 0
+        range_header = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        if server.honor_range and range_header and if_range in (None, server.etag):
+            start = int(range_header.split('=')[1].rstrip('-'))
+        body = content[start:]
+
+        self.send_response(206 if start else 200)
+        self.send_header('ETag', server.etag)
+        if start:
+            self.send_header('Content-Range', f"bytes {start}-{len(content) - 1}/{len(content)}")
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if truncate:
+            # Send half the body, then drop the connection
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Local HTTP server serving server.content with Range support."""
+    monkeypatch.setattr(resumable, "RESUME_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(resumable, "DOWNLOAD_CHUNK_BYTES", 4096)
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.content = bytes(range(256)) * 400
+    httpd.etag = '"v1"'
+    httpd.truncate = 0
+    httpd.honor_range = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/tile.tif"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _leftovers(output_path):
+    return [p for p in part_paths(output_path) if p.exists()]
+
+
+class TestDownloadResumable:
+    def test_complete_download(self, server, tmp_path):
+        output = tmp_path / "tile.tif"
+        response = download_resumable(server.url, output, timeout=10)
+        assert response.status_code == 200
+        assert output.read_bytes() == server.content
+        assert _leftovers(output) == []
+        assert server.requests[0]['Accept-Encoding'] == 'identity'
+
+    def test_interrupted_transfer_resumes_with_range(self, server, tmp_path):
+        server.truncate = 1
+        output = tmp_path / "tile.tif"
+        response = download_resumable(server.url, output, timeout=10)
+        assert response.status_code == 206
+        assert output.read_bytes() == server.content
+        assert len(server.requests) == 2
+        offset = int(server.requests[1]['Range'].split('=')[1].rstrip('-'))
+        assert 0 < offset <= len(server.content) // 2
+        assert server.requests[1]['If-Range'] == '"v1"'
+        assert _leftovers(output) == []
+
+    def test_partial_file_survives_for_next_run(self, server, tmp_path):
+        server.truncate = 1
+        output = tmp_path / "tile.tif"
+        with pytest.raises(IncompleteDownloadError):
+            download_resumable(server.url, output, timeout=10, attempts=0)
+        assert not output.exists()
+        part_path, state_path = part_paths(output)
+        part_size = part_path.stat().st_size
+        assert 0 < part_size <= len(server.content) // 2
+        assert json.loads(state_path.read_text())['total_size'] == len(server.content)
+
+        download_resumable(server.url, output, timeout=10)
+        assert output.read_bytes() == server.content
+        assert server.requests[-1]['Range'] == f"bytes={part_size}-"
+
+    def test_changed_resource_restarts(self, server, tmp_path):
+        server.truncate = 1
+        output = tmp_path / "tile.tif"
+        with pytest.raises(IncompleteDownloadError):
+            download_resumable(server.url, output, timeout=10, attempts=0)
+        server.content = bytes(reversed(server.content))
+        server.etag = '"v2"'
+
+        response = download_resumable(server.url, output, timeout=10)
+        assert response.status_code == 200
+        assert output.read_bytes() == server.content
+
+    def test_server_ignoring_range_restarts(self, server, tmp_path):
+        server.truncate = 1
+        server.honor_range = False
+        output = tmp_path / "tile.tif"
+        download_resumable(server.url, output, timeout=10)
+        assert output.read_bytes() == server.content
+
+    def test_different_request_discards_partial(self, server, tmp_path):
+        server.truncate = 1
+        output = tmp_path / "tile.tif"
+        with pytest.raises(IncompleteDownloadError):
+            download_resumable(server.url, output, params={'bbox': '1'}, timeout=10, attempts=0)
+        download_resumable(server.url, output, params={'bbox': '2'}, timeout=10)
+        assert 'Range' not in server.requests[-1]
+        assert output.read_bytes() == server.content
+
+    def test_completed_partial_is_finalized_without_request(self, server, tmp_path):
+        output = tmp_path / "tile.tif"
+        download_resumable(server.url, output, timeout=10)
+        part_path, _ = part_paths(output)
+        # Simulate a crash between the last write and the rename
+        output.rename(part_path)
+        resumable._save_state(part_paths(output)[1], {
+            'request': resumable._request_key(server.url, None),
+            'etag': '"v1"', 'last_modified': None, 'total_size': len(server.content),
+        })
+        download_resumable(server.url, output, timeout=10)
+        assert len(server.requests) == 1
+        assert output.read_bytes() == server.content
+
+    def test_error_status_is_returned_untouched(self, server, tmp_path):
+        output = tmp_path / "missing.tif"
+        response = download_resumable(server.url.replace('tile', 'missing'), output, timeout=10)
+        assert response.status_code == 404
+        assert not output.exists()
+        assert _leftovers(output) == []
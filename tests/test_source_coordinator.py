@@ -0,0 +1,146 @@
+"""
+Tests for the concurrent tile download engine.
+
+Verifies per-source in-flight limits (shared by sources behind one API key),
+per-tile source fallback order, tile-ordered results, stopping after a tile
+fails, and OpenTopography request spacing across threads.
+
+Run with: pytest tests/test_source_coordinator.py -v
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.downloaders import rate_limit, source_coordinator
+from src.downloaders.source_registry import SourceCapability
+
+
+@pytest.fixture(autouse=True)
+def no_land_mask(monkeypatch):
+    """Test tiles lie in the Gulf of Guinea; do not skip them as ocean."""
+    monkeypatch.setattr(source_coordinator, "LAND_MASK_PREFILTER", False)
+
+
+def _source(source_id, max_in_flight=4, auth_key_name=None):
+    return SourceCapability(
+        source_id=source_id, name=source_id, resolution_m=30,
+        coverage_lat=(-90.0, 90.0), coverage_lon=None, tile_dir=source_id, merged_dir=source_id,
+        requires_auth=auth_key_name is not None, auth_key_name=auth_key_name,
+        max_in_flight=max_in_flight)
+
+
+def _tiles(count):
+    return [(float(i), 0.0, float(i + 1), 1.0) for i in range(count)]
+
+
+class FakeDownloads:
+    """Stands in for _download_from_source, tracking concurrency per source."""
+
+    def __init__(self, fail=lambda tile, source: False, delay=0.02):
+        self.fail = fail
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.peak = {}
+        self.attempts = []
+
+    def __call__(self, tile_bounds, source, output_path, window_bounds=None):
+        key = source.auth_key_name or source.source_id
+        with self.lock:
+            self.attempts.append((tile_bounds, source.source_id))
+            self.in_flight[key] = self.in_flight.get(key, 0) + 1
+            self.peak[key] = max(self.peak.get(key, 0), self.in_flight[key])
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight[key] -= 1
+        if self.fail(tile_bounds, source):
+            return False, "unavailable"
+        return True, "Success"
+
+
+class TestConcurrentDownloads:
+    def test_per_source_limit(self, monkeypatch):
+        fake = FakeDownloads()
+        monkeypatch.setattr(source_coordinator, "_download_from_source", fake)
+        tiles = _tiles(12)
+        paths = [Path(f"tile_{i}.tif") for i in range(12)]
+
+        results = source_coordinator.download_tiles_concurrently(
+            tiles, paths, [_source("a", max_in_flight=3)], workers=8)
+
+        assert results == ["a"] * 12
+        assert fake.peak["a"] == 3
+
+    def test_shared_api_key_limit(self, monkeypatch):
+        # Every tile fails on the first source and falls back to the second; both share one key
+        fake = FakeDownloads(fail=lambda tile, source: source.source_id == "srtm")
+        monkeypatch.setattr(source_coordinator, "_download_from_source", fake)
+        sources = [_source("srtm", 2, "opentopography.api_key"), _source("cop", 2, "opentopography.api_key")]
+
+        results = source_coordinator.download_tiles_concurrently(
+            _tiles(8), [Path(f"t{i}.tif") for i in range(8)], sources, workers=8)
+
+        assert results == ["cop"] * 8
+        assert fake.peak["opentopography.api_key"] <= 2
+
+    def test_fallback_order_per_tile(self, monkeypatch):
+        fake = FakeDownloads(fail=lambda tile, source: source.source_id == "primary" and tile[0] % 2 == 0)
+        monkeypatch.setattr(source_coordinator, "_download_from_source", fake)
+        tiles = _tiles(6)
+
+        results = source_coordinator.download_tiles_concurrently(
+            tiles, [Path(f"t{i}.tif") for i in range(6)], [_source("primary"), _source("backup")], workers=4)
+
+        assert results == ["backup", "primary"] * 3
+        for tile in tiles:
+            tried = [source_id for tile_bounds, source_id in fake.attempts if tile_bounds == tile]
+            assert tried == (["primary", "backup"] if tile[0] % 2 == 0 else ["primary"])
+
+    def test_stops_after_failed_tile(self, monkeypatch):
+        fake = FakeDownloads(fail=lambda tile, source: tile[0] == 0)
+        monkeypatch.setattr(source_coordinator, "_download_from_source", fake)
+
+        results = source_coordinator.download_tiles_concurrently(
+            _tiles(40), [Path(f"t{i}.tif") for i in range(40)], [_source("a")], workers=2)
+
+        assert results[0] is None
+        assert len(fake.attempts) < 40
+
+    def test_serial_matches_concurrent(self, monkeypatch):
+        fake = FakeDownloads(delay=0)
+        monkeypatch.setattr(source_coordinator, "_download_from_source", fake)
+        tiles = _tiles(5)
+        paths = [Path(f"t{i}.tif") for i in range(5)]
+
+        assert (source_coordinator.download_tiles_concurrently(tiles, paths, [_source("a")], workers=1)
+                == source_coordinator.download_tiles_concurrently(tiles, paths, [_source("a")], workers=5))
+
+
+class TestRequestSpacing:
+    def test_threads_are_spaced(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(rate_limit, "STATE_FILE", tmp_path / "state.json")
+        monkeypatch.setattr(rate_limit, "LOCK_FILE", tmp_path / "state.lock")
+        monkeypatch.setattr(rate_limit, "REQUEST_DELAY_SECONDS", 0.05)
+        monkeypatch.setattr(rate_limit, "_last_request_start", 0.0)
+
+        starts = []
+        lock = threading.Lock()
+
+        def request():
+            ok, _ = rate_limit.check_rate_limit()
+            assert ok
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert min(gaps) >= 0.04
@@ -0,0 +1,129 @@
+"""
+Tests for the content-addressed stage artifact cache.
+
+Verifies fingerprints are stable and change with inputs, parameters and
+stage version, that artifacts are reused only while unchanged on disk, and
+that artifacts without a record (written before the index existed) are
+deleted and regenerated once on the first run.
+
+Run with: pytest tests/test_stage_cache.py -v
+"""
+
+import os
+
+import pytest
+
+import src.stage_cache
+from src.pipeline import _run_cached_stage
+from src.stage_cache import StageCache, compute_stage_fingerprint
+
+
+PARAMS = {"target_total_pixels": 1048576, "bounds": [-112.0, 40.0, -111.0, 41.0]}
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Stage cache with its index in a temp dir."""
+    cache = StageCache(tmp_path / "stage_cache.json")
+    monkeypatch.setattr(src.stage_cache, "_stage_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    path = tmp_path / "region_processed.tif"
+    path.write_bytes(b"processed" * 100)
+    return path
+
+
+class TestFingerprint:
+    def test_stable(self):
+        first = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+        # Key order does not matter; values do
+        assert compute_stage_fingerprint('processed', ["abc"], dict(reversed(list(PARAMS.items())))) == first
+        assert len(first) == 64
+
+    def test_changes_with_inputs_params_and_version(self, monkeypatch):
+        base = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+        assert compute_stage_fingerprint('processed', ["abd"], PARAMS) != base
+        assert compute_stage_fingerprint('processed', ["abc"], {**PARAMS, "target_total_pixels": 4096}) != base
+        assert compute_stage_fingerprint('clipped', ["abc"], PARAMS) != base
+
+        monkeypatch.setattr(src.stage_cache, "get_current_version", lambda stage: "999")
+        assert compute_stage_fingerprint('processed', ["abc"], PARAMS) != base
+
+
+class TestStageCache:
+    def test_hit_and_miss(self, cache, artifact):
+        fingerprint = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+        assert not cache.is_current(fingerprint, artifact)
+
+        cache.record(fingerprint, 'processed', artifact)
+        assert cache.is_current(fingerprint, artifact)
+        assert StageCache(cache.index_path).is_current(fingerprint, artifact)  # persisted
+
+        changed = compute_stage_fingerprint('processed', ["abc"], {**PARAMS, "bounds": None})
+        assert not cache.is_current(changed, artifact)
+
+    def test_invalidated_when_size_changes(self, cache, artifact):
+        fingerprint = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+        cache.record(fingerprint, 'processed', artifact)
+        stat = artifact.stat()
+        artifact.write_bytes(b"truncated")
+        os.utime(artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert cache.lookup(artifact) is None
+
+    def test_invalidated_when_mtime_changes(self, cache, artifact):
+        fingerprint = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+        cache.record(fingerprint, 'processed', artifact)
+        stat = artifact.stat()
+        os.utime(artifact, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert not cache.is_current(fingerprint, artifact)
+
+    def test_forget(self, cache, artifact):
+        fingerprint = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+        cache.record(fingerprint, 'processed', artifact)
+        cache.forget(artifact)
+        assert StageCache(cache.index_path).lookup(artifact) is None
+
+
+class TestRunCachedStage:
+    @pytest.fixture
+    def runs(self, artifact):
+        """Stage runner that logs calls and (re)writes the artifact."""
+        calls = []
+
+        def run():
+            calls.append(artifact.exists())
+            artifact.write_bytes(b"regenerated" * 100)
+            return True
+
+        return calls, run
+
+    def test_unrecorded_artifact_is_regenerated_once(self, cache, artifact, runs):
+        # Upgrade: artifact exists from before the index, with no record
+        calls, run = runs
+        fingerprint = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+
+        assert _run_cached_stage('processed', fingerprint, artifact, run)
+        assert calls == [False]  # stale artifact deleted before the stage ran
+        assert cache.is_current(fingerprint, artifact)
+
+        assert _run_cached_stage('processed', fingerprint, artifact, run)
+        assert calls == [False]  # second run reuses it
+
+    def test_changed_params_rerun_stage(self, cache, artifact, runs):
+        calls, run = runs
+        first = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+        _run_cached_stage('processed', first, artifact, run)
+
+        second = compute_stage_fingerprint('processed', ["abc"], {**PARAMS, "target_total_pixels": 4096})
+        assert _run_cached_stage('processed', second, artifact, run)
+        assert len(calls) == 2
+        assert cache.is_current(second, artifact) and not cache.is_current(first, artifact)
+
+    def test_failed_stage_is_not_recorded(self, cache, artifact):
+        fingerprint = compute_stage_fingerprint('processed', ["abc"], PARAMS)
+        assert not _run_cached_stage('processed', fingerprint, artifact, lambda: False)
+        assert not artifact.exists()
+        assert cache.lookup(artifact) is None
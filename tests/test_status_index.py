@@ -0,0 +1,140 @@
+"""
+Tests for the SQLite region status index.
+
+Verifies pipeline and manifest records answer export status without touching
+generated/regions, that changed or deleted exports are reported stale, and
+that the manifest is re-read only when it changes.
+
+Run with: pytest tests/test_status_index.py -v
+"""
+
+import json
+import os
+
+import pytest
+
+from src import status, status_index
+from src.status_index import RegionStatusIndex, export_version_from_path
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    """Isolated index and working directory."""
+    monkeypatch.chdir(tmp_path)
+    idx = RegionStatusIndex(tmp_path / "cache" / "region_status.sqlite")
+    monkeypatch.setattr(status_index, "_status_index", idx)
+    return idx
+
+
+def _write_manifest(generated_dir, regions):
+    generated_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = generated_dir / "regions_manifest.json"
+    manifest_path.write_text(json.dumps({"regions": regions}))
+    return manifest_path
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestRegionStatusIndex:
+    def test_export_version_from_path(self):
+        assert export_version_from_path("ohio_srtm_30m_2048px_v3.bin.gz") == "v3"
+        assert export_version_from_path("ohio_srtm_30m_2048px_v2.json") == "v2"
+        assert export_version_from_path("ohio_srtm_30m_v1.json") == "v1"
+        assert export_version_from_path("ohio.tif") == "none"
+
+    def test_pipeline_record(self, tmp_path, index):
+        export = tmp_path / "generated" / "regions" / "ohio_srtm_30m_512px_v3.bin.gz"
+        export.parent.mkdir(parents=True)
+        export.write_bytes(b"export")
+
+        assert index.export_status("ohio") is None
+        index.record_pipeline("ohio", tmp_path / "raw.tif", tmp_path / "processed.tif", export)
+        assert index.export_status("ohio") == (True, True, "v3", "v3")
+        assert index.get("ohio")["processed_path"] == str(tmp_path / "processed.tif")
+
+    def test_changed_or_deleted_export_is_stale(self, tmp_path, index):
+        export = tmp_path / "ohio_srtm_30m_512px_v2.json"
+        export.write_text("{}")
+        index.record_pipeline("ohio", export_path=export)
+
+        _touch(export)
+        assert index.export_status("ohio") is None
+        assert index.stale_regions(["ohio", "iowa"]) == [("ohio", "export_changed"), ("iowa", "missing_export")]
+
+        index.record_pipeline("ohio", export_path=export)
+        assert index.stale_regions(["ohio"]) == []
+        export.unlink()
+        assert index.export_status("ohio") is None
+
+    def test_old_format_is_stale(self, tmp_path, index):
+        export = tmp_path / "ohio_srtm_30m_v1.json"
+        export.write_text("{}")
+        index.record_pipeline("ohio", export_path=export)
+        assert index.stale_regions(["ohio"]) == [("ohio", "old_format(found=v1, expected=v3)")]
+
+    def test_expected_version_follows_export_format(self, tmp_path, index):
+        from src.config import DEFAULT_EXPORT_FORMAT
+        assert status_index.EXPECTED_EXPORT_VERSION == DEFAULT_EXPORT_FORMAT.rsplit("_", 1)[-1]
+
+        # v2 exports are still supported, but reported against the current version
+        export = tmp_path / "ohio_srtm_30m_512px_v2.json"
+        export.write_text("{}")
+        index.record_pipeline("ohio", export_path=export)
+        assert index.export_status("ohio") == (True, True, "v2", "v3")
+
+    def test_manifest_sync(self, tmp_path, index, monkeypatch):
+        generated = tmp_path / "generated" / "regions"
+        _write_manifest(generated, {})
+        (generated / "ohio_srtm_30m_512px_v3.bin.gz").write_bytes(b"export")
+        manifest_path = _write_manifest(generated, {"ohio": {"file": "ohio_srtm_30m_512px_v3.bin.gz"}})
+
+        assert index.sync_manifest(manifest_path)
+        assert index.manifest_regions() == {"ohio"}
+        assert index.export_status("ohio") == (True, True, "v3", "v3")
+
+        # Unchanged manifest is not parsed again
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged manifest was re-read")
+        with monkeypatch.context() as patch:
+            patch.setattr(status_index.json, "load", fail)
+            assert index.sync_manifest(manifest_path)
+
+        # Manifest rewritten outside the pipeline: membership follows it
+        manifest_path = _write_manifest(generated, {"iowa": {"file": "iowa_srtm_30m_512px_v3.bin.gz"}})
+        _touch(manifest_path)
+        assert index.sync_manifest(tmp_path / "generated" / "regions" / "regions_manifest.json")
+        assert index.manifest_regions() == {"iowa"}
+
+    def test_missing_manifest(self, tmp_path, index):
+        assert not index.sync_manifest(tmp_path / "regions_manifest.json")
+
+    def test_region_export_status_skips_directory_checks(self, tmp_path, index, monkeypatch):
+        export = tmp_path / "ohio_srtm_30m_512px_v3.bin.gz"
+        export.write_bytes(b"export")
+        index.record_pipeline("ohio", export_path=export)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("directory check ran although the index could answer")
+        monkeypatch.setattr(status, "check_pipeline_complete", fail)
+        monkeypatch.setattr(status, "check_export_version", fail)
+
+        assert status.region_export_status("ohio") == (True, True, "v3", "v3")
+        assert status.region_export_status("iowa", index_synced=True) == (False, False, "none", "v3")
+
+    def test_stale_regions_cli(self, tmp_path, index, monkeypatch, capsys):
+        import ensure_region
+
+        export = tmp_path / "ohio_srtm_30m_512px_v3.bin.gz"
+        export.write_bytes(b"export")
+        index.record_pipeline("ohio", export_path=export)
+        monkeypatch.setattr(ensure_region, "check_venv", lambda: None)
+
+        monkeypatch.setattr("sys.argv", ["ensure_region.py", "ohio", "--stale"])
+        assert ensure_region.main() == 0
+
+        monkeypatch.setattr("sys.argv", ["ensure_region.py", "ohio", "new-hampshire", "--stale"])
+        assert ensure_region.main() == 2
+        assert "new_hampshire: missing_export" in capsys.readouterr().out
@@ -0,0 +1,96 @@
+"""
+Tests for the streaming viewer export writer.
+
+Verifies the .json.gz and plain twin match a regular json.dump, that the
+row-streamed export_v2 grid matches the in-memory encoding, and that failed
+exports leave no partial artifacts behind.
+
+Run with: pytest tests/test_streaming_export.py -v
+"""
+
+import gzip
+import json
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_bounds
+
+from src import file_hash
+from src.pipeline import export_for_viewer
+from src.streaming_export import StreamingJsonWriter, write_json_artifact
+
+
+@pytest.fixture
+def hash_index(tmp_path, monkeypatch):
+    """Point the global hash index at a temporary file (export metadata hashes the input)."""
+    index = file_hash.FileHashIndex(tmp_path / "index" / "file_hash_index.json")
+    monkeypatch.setattr(file_hash, "_hash_index", index)
+    return index
+
+
+def _write_tif(path, elevation):
+    height, width = elevation.shape
+    transform = from_bounds(-112.0, 40.0, -111.0, 41.0, width, height)
+    with rasterio.open(path, 'w', driver='GTiff', width=width, height=height, count=1,
+                       dtype=elevation.dtype, crs='EPSG:4326', transform=transform) as dst:
+        dst.write(elevation, 1)
+
+
+class TestStreamingExport:
+    """Test suite for StreamingJsonWriter and the streamed export_v2."""
+
+    def test_artifact_matches_json_dump(self, tmp_path):
+        data = {"regions": {"a": {"file": "a.json", "stats": [1.5, None]}}, "version": "export_v2"}
+        path = tmp_path / "manifest.json"
+        gz_path = write_json_artifact(data, path, indent=2)
+
+        expected = json.dumps(data, indent=2)
+        assert path.read_text() == expected
+        assert gzip.decompress(gz_path.read_bytes()).decode('utf-8') == expected
+
+    def test_gzip_only(self, tmp_path):
+        path = tmp_path / "borders.json"
+        write_json_artifact([1, 2, 3], path, write_plain=False)
+        assert not path.exists()
+        assert json.loads(gzip.decompress((tmp_path / "borders.json.gz").read_bytes())) == [1, 2, 3]
+
+    def test_error_discards_partial_outputs(self, tmp_path):
+        path = tmp_path / "x.json"
+        with pytest.raises(RuntimeError):
+            with StreamingJsonWriter(path) as out:
+                out.write('{"elevation":[')
+                raise RuntimeError("boom")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_export_v2_matches_in_memory_encoding(self, tmp_path, hash_index):
+        rng = np.random.default_rng(3)
+        elevation = rng.uniform(100.0, 3000.0, size=(150, 37)).astype(np.float32)
+        elevation[::9, ::4] = np.nan
+        elevation[5, 5] = 9500.0  # out of range -> null
+        tif = tmp_path / "processed.tif"
+        _write_tif(tif, elevation)
+
+        output = tmp_path / "region_srtm_30m_37px_v2.json"
+        assert export_for_viewer(tif, "region", "srtm_30m", output)
+
+        data = json.loads(output.read_text())
+        assert gzip.decompress(output.with_suffix('.json.gz').read_bytes()) == output.read_bytes()
+
+        clean = elevation.copy()
+        clean[clean > 9000] = np.nan
+        expected_rows = clean.astype(object)
+        expected_rows[np.isnan(clean)] = None
+        assert data["elevation"] == expected_rows.tolist()
+        assert (data["width"], data["height"]) == (37, 150)
+        assert data["stats"]["min"] == float(np.nanmin(clean))
+        assert data["stats"]["max"] == float(np.nanmax(clean))
+        assert data["stats"]["mean"] == pytest.approx(float(np.nanmean(clean)), rel=1e-5)
+
+    def test_hyperflat_export_leaves_no_files(self, tmp_path):
+        tif = tmp_path / "processed.tif"
+        _write_tif(tif, np.full((20, 20), 10.0, dtype=np.float32))
+        output = tmp_path / "flat_v2.json"
+        assert not export_for_viewer(tif, "flat", "srtm_30m", output)
+        assert not output.exists()
+        assert not output.with_suffix('.json.gz').exists()
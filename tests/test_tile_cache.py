@@ -0,0 +1,175 @@
+"""
+Tests for the checksum-verified shared tile cache.
+
+Verifies that recorded tiles are reused with a stat() only, touched tiles are
+re-checked by digest, truncated or modified tiles are discarded, tiles from
+before the manifest are adopted only if readable, the max-age refresh policy,
+and that the source coordinator skips downloads of cached tiles unless
+refresh=True.
+
+Run with: pytest tests/test_tile_cache.py -v
+"""
+
+import os
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_bounds
+
+from src import tile_cache
+from src.downloaders import source_coordinator
+from src.downloaders.source_registry import SourceCapability
+from src.tile_cache import TileCache
+
+
+TILE = (-112.0, 40.0, -111.0, 41.0)
+
+
+def _write_tile(path, seed=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = np.random.default_rng(seed).integers(0, 3000, size=(64, 64), dtype=np.int16)
+    with rasterio.open(path, 'w', driver='GTiff', width=64, height=64, count=1, dtype='int16',
+                       crs='EPSG:4326', transform=from_bounds(*TILE, 64, 64),
+                       tiled=True, blockxsize=16, blockysize=16) as dst:
+        dst.write(data, 1)
+    return path
+
+
+def _truncate(path):
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Tile cache with its manifest in a temp dir; hashing calls are counted."""
+    monkeypatch.chdir(tmp_path)
+    cache = TileCache(tmp_path / "tile_manifest.json")
+    monkeypatch.setattr(tile_cache, "_tile_cache", cache)
+    cache.hash_calls = 0
+    real_hash = tile_cache.hash_file_contents
+
+    def counting_hash(path, algorithm):
+        cache.hash_calls += 1
+        return real_hash(path, algorithm)
+
+    monkeypatch.setattr(tile_cache, "hash_file_contents", counting_hash)
+    return cache
+
+
+class TestTileCache:
+    def test_recorded_tile_is_reused_without_rehash(self, cache, tmp_path):
+        path = _write_tile(tmp_path / "tiles" / "a.tif")
+        assert cache.record('src', TILE, 30, path)
+        assert cache.hash_calls == 1
+        assert cache.lookup('src', TILE, 30, path)
+        assert cache.hash_calls == 1
+
+    def test_manifest_is_shared_between_instances(self, cache, tmp_path):
+        path = _write_tile(tmp_path / "tiles" / "a.tif")
+        cache.record('src', TILE, 30, path)
+        assert TileCache(cache.manifest_path).lookup('src', TILE, 30, path)
+
+    def test_key_includes_source_and_resolution(self):
+        assert tile_cache.tile_cache_key('src', TILE, 30) != tile_cache.tile_cache_key('other', TILE, 30)
+        assert tile_cache.tile_cache_key('src', TILE, 30) != tile_cache.tile_cache_key('src', TILE, 90)
+
+    def test_truncated_download_is_rejected(self, cache, tmp_path):
+        path = _write_tile(tmp_path / "tiles" / "a.tif")
+        _truncate(path)
+        assert not cache.record('src', TILE, 30, path)
+        assert not path.exists()
+
+    def test_touched_tile_with_same_contents_is_reused(self, cache, tmp_path):
+        path = _write_tile(tmp_path / "tiles" / "a.tif")
+        cache.record('src', TILE, 30, path)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.lookup('src', TILE, 30, path)
+        assert cache.hash_calls == 2
+        # Identity updated - next lookup is a stat() again
+        assert cache.lookup('src', TILE, 30, path)
+        assert cache.hash_calls == 2
+
+    def test_modified_tile_is_discarded(self, cache, tmp_path):
+        path = _write_tile(tmp_path / "tiles" / "a.tif")
+        cache.record('src', TILE, 30, path)
+        _write_tile(path, seed=1)
+        assert not cache.lookup('src', TILE, 30, path)
+        assert not path.exists()
+
+    def test_tile_older_than_max_age_is_refreshed(self, cache, tmp_path):
+        path = _write_tile(tmp_path / "tiles" / "a.tif")
+        cache.record('src', TILE, 30, path)
+        assert cache.lookup('src', TILE, 30, path, max_age_days=1)
+        key = tile_cache.tile_cache_key('src', TILE, 30)
+        cache._write(lambda entries: entries[key].update(recorded=entries[key]['recorded'] - 2 * 86400))
+        assert not cache.lookup('src', TILE, 30, path, max_age_days=1)
+        assert not path.exists()
+
+    def test_unrecorded_tile_is_adopted_if_readable(self, cache, tmp_path):
+        good = _write_tile(tmp_path / "tiles" / "good.tif")
+        bad = _write_tile(tmp_path / "tiles" / "bad.tif")
+        _truncate(bad)
+        assert cache.lookup('src', TILE, 30, good)
+        assert tile_cache.tile_cache_key('src', TILE, 30) in cache._load()
+        assert not cache.lookup('src', (0.0, 0.0, 1.0, 1.0), 30, bad)
+        assert not bad.exists()
+
+    def test_missing_tile_is_a_miss(self, cache, tmp_path):
+        path = _write_tile(tmp_path / "tiles" / "a.tif")
+        cache.record('src', TILE, 30, path)
+        path.unlink()
+        assert not cache.lookup('src', TILE, 30, path)
+
+
+def _source(source_id):
+    return SourceCapability(
+        source_id=source_id, name=source_id, resolution_m=30,
+        coverage_lat=(-90.0, 90.0), coverage_lon=None, tile_dir=source_id, merged_dir=source_id,
+        requires_auth=False, auth_key_name=None)
+
+
+class TestCoordinatorTileReuse:
+    @pytest.fixture
+    def downloads(self, cache, monkeypatch):
+        """Fake downloader writing a valid tile (or a truncated one for 'broken' sources)."""
+        calls = []
+        monkeypatch.setattr(source_coordinator, "LAND_MASK_PREFILTER", False)
+
+        def fake(tile_bounds, source, output_path, window_bounds=None):
+            calls.append(source.source_id)
+            path = _write_tile(source_coordinator.source_tile_path(source, tile_bounds))
+            if source.source_id == 'broken':
+                _truncate(path)
+            return True, "Success"
+
+        monkeypatch.setattr(source_coordinator, "_download_from_source", fake)
+        return calls
+
+    def test_cached_tile_skips_download(self, downloads, tmp_path):
+        sources = [_source('primary')]
+        assert source_coordinator._try_sources(TILE, sources, tmp_path / "out.tif")[0] == 'primary'
+        assert source_coordinator._try_sources(TILE, sources, tmp_path / "out.tif")[0] == 'primary'
+        assert downloads == ['primary']
+
+    def test_lower_priority_cached_tile_is_used(self, downloads, tmp_path):
+        fallback = _source('fallback')
+        source_coordinator._try_sources(TILE, [fallback], tmp_path / "out.tif")
+        source_id, _ = source_coordinator._try_sources(TILE, [_source('primary'), fallback], tmp_path / "out.tif")
+        assert source_id == 'fallback'
+        assert downloads == ['fallback']
+
+    def test_refresh_downloads_again(self, downloads, tmp_path):
+        sources = [_source('primary')]
+        source_coordinator._try_sources(TILE, sources, tmp_path / "out.tif")
+        source_coordinator._try_sources(TILE, sources, tmp_path / "out.tif", refresh=True)
+        assert downloads == ['primary', 'primary']
+
+    def test_truncated_download_falls_through_to_next_source(self, downloads, tmp_path):
+        sources = [_source('broken'), _source('fallback')]
+        source_id, errors = source_coordinator._try_sources(TILE, sources, tmp_path / "out.tif")
+        assert source_id == 'fallback'
+        assert errors == [('broken', "Downloaded tile failed integrity check")]
+        assert not source_coordinator.source_tile_path(sources[0], TILE).exists()
@@ -0,0 +1,106 @@
+"""
+Tests for the quadtree tile export.
+
+Verifies the native zoom reproduces the raster exactly (within int16
+quantization), coarser zooms are 2x2 max aggregates, empty tiles are skipped
+and the index describes every written tile, and that the viewer tile export
+warps a geographic raw raster through a VRT onto the metric export grid.
+
+Run with: pytest tests/test_tile_export.py -v
+"""
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+from src.export_binary import read_export_v3
+from src.pyramid import aggregate_buckets
+from src.tile_export import export_tile_quadtree, max_zoom_for, read_tile_index
+
+
+def _clean(values):
+    values = values.astype(np.float32)
+    values[(values < -500) | (values > 9000)] = np.nan
+    return values
+
+
+@pytest.fixture
+def raster(tmp_path):
+    rng = np.random.default_rng(5)
+    elevation = rng.uniform(0.0, 2000.0, size=(70, 100)).astype(np.float32)
+    elevation[:, 64:] = -9999.0  # right half of the second tile column is nodata
+    path = tmp_path / "reproj.tif"
+    with rasterio.open(path, 'w', driver='GTiff', width=100, height=70, count=1, dtype='float32',
+                       crs='EPSG:32612', transform=from_origin(400000, 4500000, 30, 30), nodata=-9999.0) as dst:
+        dst.write(elevation, 1)
+    return path, elevation
+
+
+class TestTileExport:
+    """Test suite for export_tile_quadtree."""
+
+    def test_quadtree_levels_and_index(self, tmp_path, raster):
+        path, elevation = raster
+        tile_dir = tmp_path / "tiles" / "r_src"
+        with rasterio.open(path) as src:
+            index = export_tile_quadtree(src, tile_dir, {"region_id": "r"}, 32, _clean)
+
+        assert index["max_zoom"] == max_zoom_for(100, 70, 32) == 2
+        native = index["levels"][2]
+        assert (native["cols"], native["rows"]) == (4, 3)
+        # Tile column 2 (pixels 64-95) and 3 are all nodata -> not written
+        assert native["tiles"] == ["0_0", "1_0", "0_1", "1_1", "0_2", "1_2"]
+        assert native["meters_per_pixel_x"] == 30.0
+        assert index["levels"][0]["tiles"] == ["0_0"]
+        assert (tile_dir / "index.json").exists() and (tile_dir / "index.json.gz").exists()
+
+        header, bands = read_export_v3(tile_dir / "2" / "1_0.bin.gz")
+        assert (header["z"], header["x"], header["y"]) == (2, 1, 0)
+        np.testing.assert_allclose(bands["elevation"], elevation[0:32, 32:64], atol=header["encoding"]["scale"])
+
+        # Partial bottom tile is padded with nodata
+        _, bands = read_export_v3(tile_dir / "2" / "0_2.bin.gz")
+        assert np.isnan(bands["elevation"][6:, :]).all()
+        assert not np.isnan(bands["elevation"][:6, :]).any()
+
+    def test_coarser_zoom_is_max_of_children(self, tmp_path, raster):
+        path, elevation = raster
+        tile_dir = tmp_path / "tiles" / "r_src"
+        with rasterio.open(path) as src:
+            export_tile_quadtree(src, tile_dir, {"region_id": "r"}, 32, _clean, dtype='float16')
+
+        grid = np.full((128, 128), np.nan, dtype=np.float32)
+        grid[:70, :100] = _clean(np.where(elevation == -9999.0, np.nan, elevation))
+        expected = aggregate_buckets(aggregate_buckets(grid[:64, :64], 2)["max"], 2)["max"]
+
+        _, bands = read_export_v3(tile_dir / "0" / "0_0.bin.gz")
+        np.testing.assert_allclose(bands["elevation"][:16, :16], expected, rtol=1e-3)
+
+
+class TestTilesForViewer:
+    """Test suite for export_tiles_for_viewer (tiles warped through a VRT)."""
+
+    def test_tiles_from_geographic_raster(self, tmp_path):
+        from src.pipeline import export_tiles_for_viewer, full_resolution_metric_grid
+
+        rng = np.random.default_rng(9)
+        elevation = rng.uniform(100.0, 1500.0, size=(120, 120)).astype(np.float32)
+        path = tmp_path / "raw.tif"
+        with rasterio.open(path, 'w', driver='GTiff', width=120, height=120, count=1, dtype='float32',
+                           crs='EPSG:4326', transform=from_origin(-112.0, 41.0, 1 / 120, 1 / 120)) as dst:
+            dst.write(elevation, 1)
+
+        bounds = (-111.75, 40.25, -111.25, 40.75)
+        tile_dir = tmp_path / "tiles" / "r_src"
+        assert export_tiles_for_viewer(path, "r", "src", tile_dir, tile_size=32, bounds=bounds)
+
+        with rasterio.open(path) as src:
+            _, _, width, height = full_resolution_metric_grid(src, bounds)
+        index = read_tile_index(tile_dir)
+        assert (index["base_width"], index["base_height"]) == (width, height)
+        assert index["levels"][index["max_zoom"]]["tiles"]
+
+        _, bands = read_export_v3(tile_dir / str(index["max_zoom"]) / "0_0.bin.gz")
+        values = bands["elevation"][np.isfinite(bands["elevation"])]
+        assert values.size and values.min() >= 99.0 and values.max() <= 1501.0
@@ -0,0 +1,135 @@
+"""
+Tests for the validation verdict cache.
+
+Verifies unchanged files are not re-validated, that a changed file or a bumped
+validator version triggers validation again, and that find_raw_file serves
+repeat lookups from the cache.
+
+Run with: pytest tests/test_validation_cache.py -v
+"""
+
+import os
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+from src import validation, validation_cache
+from src.region_config import ALL_REGIONS
+from src.tile_geometry import tile_filename_from_bounds
+
+
+@pytest.fixture
+def verdict_cache(tmp_path, monkeypatch):
+    """Point the global validation cache at a temporary file."""
+    cache = validation_cache.ValidationCache(tmp_path / "index" / "validation_index.json")
+    monkeypatch.setattr(validation_cache, "_validation_cache", cache)
+    return cache
+
+
+def _counting_validator(result=True):
+    calls = []
+
+    def validate():
+        calls.append(1)
+        return result
+    return validate, calls
+
+
+def _touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestValidationCache:
+    """Test suite for cached_verdict and its persistent index."""
+
+    def test_unchanged_file_is_not_revalidated(self, tmp_path, verdict_cache, monkeypatch):
+        path = tmp_path / "tile.tif"
+        path.write_bytes(b"x" * 2048)
+        validate, calls = _counting_validator()
+
+        assert validation_cache.cached_verdict(path, 'geotiff_data', validate)
+        assert validation_cache.cached_verdict(path, 'geotiff_data', validate)
+        assert len(calls) == 1
+
+        # Index persists across processes (fresh instance reads it from disk)
+        monkeypatch.setattr(validation_cache, "_validation_cache",
+                            validation_cache.ValidationCache(verdict_cache.index_path))
+        assert validation_cache.cached_verdict(path, 'geotiff_data', validate)
+        assert len(calls) == 1
+
+    def test_negative_verdicts_are_cached(self, tmp_path, verdict_cache):
+        path = tmp_path / "bad.tif"
+        path.write_bytes(b"x" * 10)
+        validate, calls = _counting_validator(result=False)
+
+        assert not validation_cache.cached_verdict(path, 'geotiff_data', validate)
+        assert not validation_cache.cached_verdict(path, 'geotiff_data', validate)
+        assert len(calls) == 1
+
+    def test_changed_file_is_revalidated(self, tmp_path, verdict_cache):
+        path = tmp_path / "tile.tif"
+        path.write_bytes(b"x" * 2048)
+        validate, calls = _counting_validator()
+        validation_cache.cached_verdict(path, 'geotiff_data', validate)
+
+        _touch(path)
+        validation_cache.cached_verdict(path, 'geotiff_data', validate)
+        assert len(calls) == 2
+
+    def test_validator_version_bump_invalidates(self, tmp_path, verdict_cache, monkeypatch):
+        path = tmp_path / "tile.tif"
+        path.write_bytes(b"x" * 2048)
+        validate, calls = _counting_validator()
+        validation_cache.cached_verdict(path, 'geotiff_data', validate)
+
+        monkeypatch.setitem(validation_cache.VALIDATOR_VERSIONS, 'geotiff_data', 2)
+        validation_cache.cached_verdict(path, 'geotiff_data', validate)
+        assert len(calls) == 2
+
+        # Other validators keep their own verdicts
+        validation_cache.cached_verdict(path, 'json_export', validate)
+        assert len(calls) == 3
+
+    def test_forget(self, tmp_path, verdict_cache):
+        path = tmp_path / "tile.tif"
+        path.write_bytes(b"x" * 2048)
+        validate, calls = _counting_validator()
+        validation_cache.cached_verdict(path, 'geotiff_data', validate)
+
+        verdict_cache.forget(path)
+        assert verdict_cache.get(path, 'geotiff_data') is None
+
+
+class TestFindRawFileCache:
+    """find_raw_file validates each candidate once per file version."""
+
+    def test_repeat_lookups_skip_validation(self, tmp_path, verdict_cache, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        region_id = 'alabama'
+        bounds = ALL_REGIONS[region_id].bounds
+        path = tmp_path / "data" / "raw" / "srtm_30m" / tile_filename_from_bounds(bounds, '30m')
+        path.parent.mkdir(parents=True)
+        elevation = np.arange(128 * 128, dtype=np.float32).reshape(128, 128)
+        with rasterio.open(path, 'w', driver='GTiff', width=128, height=128, count=1,
+                           dtype='float32', crs='EPSG:4326',
+                           transform=from_origin(bounds[0], bounds[3], 0.01, 0.01)) as dst:
+            dst.write(elevation, 1)
+
+        calls = []
+        original = validation.validate_geotiff
+
+        def counting_validate(*args, **kwargs):
+            calls.append(args[0])
+            return original(*args, **kwargs)
+        monkeypatch.setattr(validation, "validate_geotiff", counting_validate)
+
+        for res in (10, 30, 90):
+            validation.find_raw_file(region_id, verbose=False, min_required_resolution_meters=res)
+        found, source = validation.find_raw_file(region_id, verbose=False)
+
+        assert source == 'srtm_30m'
+        assert found.name == path.name
+        assert len(calls) == 1